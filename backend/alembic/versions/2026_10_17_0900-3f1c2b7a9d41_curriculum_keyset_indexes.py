@@ -0,0 +1,31 @@
+"""curriculum keyset indexes
+
+Revision ID: 3f1c2b7a9d41
+Revises: 75c172de024e
+Create Date: 2026-10-17 09:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = '3f1c2b7a9d41'
+down_revision: Union[str, Sequence[str], None] = '75c172de024e'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_index('idx_curriculum_visibility_created', 'curriculums', ['visibility', 'created_at', 'id'], unique=False)
+    op.create_index('idx_curriculum_visibility_updated', 'curriculums', ['visibility', 'updated_at', 'id'], unique=False)
+    op.create_index('idx_curriculum_user_created', 'curriculums', ['user_id', 'created_at', 'id'], unique=False)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index('idx_curriculum_user_created', table_name='curriculums')
+    op.drop_index('idx_curriculum_visibility_updated', table_name='curriculums')
+    op.drop_index('idx_curriculum_visibility_created', table_name='curriculums')
@@ -48,10 +48,12 @@ from app.modules.admin.interface.controller.admin_user_controller import (
 from app.modules.admin.interface.controller.admin_curriculum_controller import (
     admin_curriculum_router,
 )
+from app.modules.admin.interface.controller.admin_db_controller import admin_db_router
 
 v1_router = APIRouter(prefix="/api/v1")
 v1_router.include_router(admin_user_router)
 v1_router.include_router(admin_curriculum_router)
+v1_router.include_router(admin_db_router)
 
 v1_router.include_router(auth_router)
 
@@ -1,10 +1,29 @@
 import json
-from typing import Dict, List, Optional, Union
+import secrets
+from typing import Dict, List, Optional, Tuple, Union
 import redis.asyncio as redis
 from app.core.config import get_settings
 
 settings = get_settings()
 
+# 토큰이 일치할 때만 락 해제 (다른 워커의 락을 지우지 않도록)
+RELEASE_LOCK_SCRIPT = """
+if redis.call("get", KEYS[1]) == ARGV[1] then
+    return redis.call("del", KEYS[1])
+else
+    return 0
+end
+"""
+
+# 토큰이 일치할 때만 락 만료 연장 (리더 임대 갱신용)
+EXTEND_LOCK_SCRIPT = """
+if redis.call("get", KEYS[1]) == ARGV[1] then
+    return redis.call("pexpire", KEYS[1], ARGV[2])
+else
+    return 0
+end
+"""
+
 
 class RedisClient:
     def __init__(self):
@@ -21,12 +40,39 @@ class RedisClient:
         if self.redis:
             await self.redis.close()
 
+    @property
+    def is_connected(self) -> bool:
+        """Redis 연결 여부"""
+        return self.redis is not None
+
     async def get(self, key: str) -> Optional[str]:
         """키로 값 조회"""
         if not self.redis:
             return None
         return await self.redis.get(key)
 
+    async def mget(self, keys: List[str]) -> List[Optional[str]]:
+        """여러 키 값을 한 번에 조회"""
+        if not self.redis or not keys:
+            return [None] * len(keys)
+        return await self.redis.mget(keys)
+
+    async def mget_with_zcard(
+        self, keys: List[str], zset_key: str
+    ) -> Tuple[List[Optional[str]], int]:
+        """여러 키 값과 Sorted Set 크기를 한 번의 왕복으로 조회 (pipeline)"""
+        if not self.redis:
+            return [None] * len(keys), 0
+
+        async with self.redis.pipeline(transaction=False) as pipe:
+            if keys:
+                pipe.mget(keys)
+            pipe.zcard(zset_key)
+            results = await pipe.execute()
+
+        values: List[Optional[str]] = results[0] if keys else []
+        return values, int(results[-1])
+
     async def set(
         self, key: str, value: Union[str, Dict, List], ex: Optional[int] = None
     ) -> bool:
@@ -39,12 +85,73 @@ class RedisClient:
 
         return await self.redis.set(key, value, ex=ex)
 
+    async def set_many_with_zadd(
+        self,
+        values: Dict[str, str],
+        zset_key: str,
+        mapping: Dict[str, float],
+        ex: Optional[int] = None,
+        zset_ex: Optional[int] = None,
+    ) -> bool:
+        """여러 키-값과 Sorted Set 멤버를 한 번의 트랜잭션으로 저장 (MULTI/EXEC)
+
+        키에는 ex, Sorted Set에는 zset_ex TTL이 적용된다
+        (zset_ex가 없으면 Sorted Set의 기존 TTL 유지).
+        """
+        if not self.redis:
+            return False
+        if not values and not mapping:
+            return True
+
+        async with self.redis.pipeline(transaction=True) as pipe:
+            for key, value in values.items():
+                pipe.set(key, value, ex=ex)
+            if mapping:
+                pipe.zadd(zset_key, mapping)
+                if zset_ex is not None:
+                    pipe.expire(zset_key, zset_ex)
+            await pipe.execute()
+        return True
+
+    async def replace_sorted_set(
+        self,
+        zset_key: str,
+        mapping: Dict[str, float],
+        values: Optional[Dict[str, str]] = None,
+        ex: Optional[int] = None,
+    ) -> bool:
+        """Sorted Set 전체 교체와 키-값 저장을 한 번의 트랜잭션으로 처리 (MULTI/EXEC)
+
+        읽는 쪽에서는 교체 전 또는 교체 후 상태만 보인다.
+        """
+        if not self.redis:
+            return False
+
+        async with self.redis.pipeline(transaction=True) as pipe:
+            pipe.delete(zset_key)
+            if mapping:
+                pipe.zadd(zset_key, mapping)
+            for key, value in (values or {}).items():
+                pipe.set(key, value, ex=ex)
+            await pipe.execute()
+        return True
+
     async def delete(self, key: str) -> int:
         """키 삭제"""
         if not self.redis:
             return 0
         return await self.redis.delete(key)
 
+    async def delete_pattern(self, pattern: str) -> int:
+        """패턴에 맞는 키 일괄 삭제 (SCAN 기반, KEYS 미사용)"""
+        if not self.redis:
+            return 0
+
+        keys = [key async for key in self.redis.scan_iter(match=pattern, count=500)]
+        if not keys:
+            return 0
+        return await self.redis.delete(*keys)
+
     async def exists(self, key: str) -> bool:
         """키 존재 여부 확인"""
         if not self.redis:
@@ -71,12 +178,114 @@ class RedisClient:
             return 0
         return await self.redis.zrem(key, *members)
 
+    async def trim_sorted_set(self, key: str, max_size: int) -> List[str]:
+        """점수가 낮은 멤버부터 제거해 Sorted Set 크기를 max_size 이하로 유지
+
+        제거된 멤버 목록 반환 (조회와 제거를 한 트랜잭션으로 처리)
+        """
+        if not self.redis:
+            return []
+
+        stop = -(max_size + 1)
+        async with self.redis.pipeline(transaction=True) as pipe:
+            pipe.zrange(key, 0, stop)
+            pipe.zremrangebyrank(key, 0, stop)
+            removed, _ = await pipe.execute()
+        return removed
+
     async def expire(self, key: str, seconds: int) -> bool:
         """키 만료 시간 설정"""
         if not self.redis:
             return False
         return await self.redis.expire(key, seconds)
 
+    async def stream_add(
+        self, stream: str, fields: Dict[str, str], maxlen: Optional[int] = None
+    ) -> Optional[str]:
+        """Stream에 메시지 추가 (XADD), 메시지 ID 반환"""
+        if not self.redis:
+            return None
+        return await self.redis.xadd(stream, fields, maxlen=maxlen, approximate=True)
+
+    async def stream_create_group(self, stream: str, group: str) -> None:
+        """컨슈머 그룹 생성 (이미 있으면 무시)"""
+        if not self.redis:
+            return
+        try:
+            await self.redis.xgroup_create(stream, group, id="0", mkstream=True)
+        except redis.ResponseError as e:
+            if "BUSYGROUP" not in str(e):
+                raise
+
+    async def stream_read_group(
+        self,
+        stream: str,
+        group: str,
+        consumer: str,
+        count: int = 1,
+        block_ms: Optional[int] = None,
+    ) -> List[Tuple[str, Dict[str, str]]]:
+        """컨슈머 그룹으로 새 메시지 읽기 (XREADGROUP)"""
+        if not self.redis:
+            return []
+        response = await self.redis.xreadgroup(
+            group, consumer, {stream: ">"}, count=count, block=block_ms
+        )
+        if not response:
+            return []
+        return list(response[0][1])
+
+    async def stream_claim_stale(
+        self,
+        stream: str,
+        group: str,
+        consumer: str,
+        min_idle_ms: int,
+        count: int = 1,
+    ) -> List[Tuple[str, Dict[str, str]]]:
+        """처리되지 못하고 오래 방치된 메시지 인수 (XAUTOCLAIM)"""
+        if not self.redis:
+            return []
+        response = await self.redis.xautoclaim(
+            stream, group, consumer, min_idle_ms, start_id="0-0", count=count
+        )
+        return [(message_id, fields) for message_id, fields in response[1] if fields]
+
+    async def stream_ack(self, stream: str, group: str, *message_ids: str) -> int:
+        """메시지 처리 완료 (XACK)"""
+        if not self.redis or not message_ids:
+            return 0
+        return await self.redis.xack(stream, group, *message_ids)
+
+    async def acquire_lock(self, key: str, ttl_ms: int) -> Optional[str]:
+        """분산 락 획득 (SET NX PX), 성공 시 해제용 토큰 반환
+
+        Redis 미연결 시에는 공유할 캐시도 없으므로 항상 성공으로 본다.
+        """
+        token = secrets.token_hex(8)
+        if not self.redis:
+            return token
+
+        acquired = await self.redis.set(key, token, nx=True, px=ttl_ms)
+        return token if acquired else None
+
+    async def release_lock(self, key: str, token: str) -> bool:
+        """분산 락 해제 (획득한 토큰일 때만)"""
+        if not self.redis:
+            return False
+        return bool(await self.redis.eval(RELEASE_LOCK_SCRIPT, 1, key, token))
+
+    async def extend_lock(self, key: str, token: str, ttl_ms: int) -> bool:
+        """분산 락 만료 연장 (획득한 토큰일 때만)
+
+        Redis 미연결 시에는 acquire_lock과 같이 항상 성공으로 본다.
+        """
+        if not self.redis:
+            return True
+        return bool(
+            await self.redis.eval(EXTEND_LOCK_SCRIPT, 1, key, token, ttl_ms)
+        )
+
 
 # 싱글톤 인스턴스
 redis_client = RedisClient()
@@ -0,0 +1,94 @@
+import asyncio
+import math
+import random
+import time
+from typing import Any, Awaitable, Callable, Dict, Optional, Tuple, Type, TypeVar
+
+T = TypeVar("T")
+
+
+class _Handover(Exception):
+    """첫 호출의 결과를 나눌 수 없음 (취소 등, 대기자는 다시 시도)"""
+
+
+class SingleFlight:
+    """동일 키에 대한 동시 호출을 하나로 합침 (프로세스 내)
+
+    첫 호출만 실제로 실행하고, 실행 중에 들어온 같은 키의 호출은
+    그 결과(또는 예외)를 함께 받는다. 첫 호출이 취소되거나(클라이언트 연결 끊김 등)
+    ``do`` 의 ``not_shared`` 예외로 실패하면 대기자 중 하나가 이어서 실행한다.
+    """
+
+    def __init__(self) -> None:
+        self._futures: Dict[str, "asyncio.Future[Any]"] = {}
+
+    @property
+    def in_flight(self) -> int:
+        """현재 실행 중인 키 수"""
+        return len(self._futures)
+
+    async def do(
+        self,
+        key: str,
+        fn: Callable[[], Awaitable[T]],
+        not_shared: Tuple[Type[BaseException], ...] = (),
+    ) -> T:
+        """key 로 fn 실행을 합침
+
+        ``not_shared`` 예외는 첫 호출자에게만 해당하는 실패(호출자별 한도 초과 등)로 보고
+        대기자에게 넘기지 않는다.
+        """
+        while True:
+            future = self._futures.get(key)
+            if future is None:
+                break
+            try:
+                return await asyncio.shield(future)
+            except _Handover:
+                # 먼저 깨어난 대기자가 새로 실행하고 나머지는 그 결과를 기다린다
+                continue
+
+        future = asyncio.get_running_loop().create_future()
+        self._futures[key] = future
+        try:
+            result = await fn()
+        except asyncio.CancelledError:
+            # 공유 future 를 취소하면 대기자까지 모두 취소되므로 재시도를 알린다
+            future.set_exception(_Handover())
+            future.exception()
+            raise
+        except Exception as e:
+            future.set_exception(_Handover() if isinstance(e, not_shared) else e)
+            future.exception()  # 대기자가 없어도 경고가 남지 않도록 소비
+            raise
+        else:
+            future.set_result(result)
+            return result
+        finally:
+            if self._futures.get(key) is future:
+                del self._futures[key]
+
+
+def jittered_ttl(ttl: int, jitter: float = 0.1) -> int:
+    """TTL에 ±jitter 비율의 무작위 편차 적용 (동시 만료 방지)"""
+    spread = int(ttl * jitter)
+    return max(1, ttl + random.randint(-spread, spread))
+
+
+def should_refresh_early(
+    expires_at: float,
+    delta: float,
+    beta: float = 1.0,
+    now: Optional[float] = None,
+) -> bool:
+    """확률적 조기 갱신 여부 (XFetch)
+
+    재계산 비용(delta)이 클수록, 만료가 가까울수록 갱신 확률이 높아져
+    만료 시점에 요청이 한꺼번에 DB로 몰리지 않는다.
+    """
+    if delta <= 0:
+        return False
+
+    current = time.time() if now is None else now
+    # 1 - random() 은 (0, 1] 범위이므로 log(0) 이 발생하지 않음
+    return current - delta * beta * math.log(1.0 - random.random()) >= expires_at
@@ -1,8 +1,16 @@
+from typing import Any, Dict, Optional
+
+from sqlalchemy.engine import make_url
 from sqlalchemy.ext.asyncio import create_async_engine, async_sessionmaker  # type: ignore
 from sqlalchemy.ext.asyncio.engine import AsyncEngine
 from sqlalchemy.orm import declarative_base
+from sqlalchemy.pool import AsyncAdaptedQueuePool
 
 # from sqlalchemy.orm import sessionmaker
+from app.common.db.pool import InstrumentedQueuePool
+from app.common.db.query_stats import instrument_queries
+from app.common.db.routing import ReplicaRouter, RoutingSession
+from app.common.db.slow_query import SlowQueryRecorder
 from app.core.config import Settings
 from app.core.config import get_settings
 
@@ -11,16 +19,79 @@ settings: Settings = get_settings()
 
 SQLALCHEMY_DATABASE_URL: str = settings.sqlalchemy_database_url
 
-engine: AsyncEngine = create_async_engine(
-    settings.sqlalchemy_database_url,
-    echo=True,
-    future=True,
-    connect_args={"charset": "utf8mb4"},
+
+def engine_options(settings: Settings, url: Optional[str] = None) -> Dict[str, Any]:
+    """설정값으로 만든 엔진 옵션 (풀 크기/오버플로/재활용/pre-ping/문장 타임아웃/echo)"""
+    options: Dict[str, Any] = {
+        "echo": settings.db_echo,
+        "future": True,
+        "poolclass": InstrumentedQueuePool,
+        "pool_size": settings.db_pool_size,
+        "max_overflow": settings.db_max_overflow,
+        "pool_timeout": settings.db_pool_timeout,
+        "pool_recycle": settings.db_pool_recycle,
+        "pool_pre_ping": settings.db_pool_pre_ping,
+    }
+
+    url = url or settings.sqlalchemy_database_url
+    if make_url(url).get_backend_name() == "mysql":
+        connect_args: Dict[str, Any] = {"charset": "utf8mb4"}
+        if settings.db_statement_timeout_ms > 0:
+            # MySQL 은 SELECT 에만 적용된다 (쓰기는 innodb_lock_wait_timeout 이 막음)
+            connect_args["init_command"] = (
+                f"SET SESSION max_execution_time={int(settings.db_statement_timeout_ms)}"
+            )
+        options["connect_args"] = connect_args
+
+    return options
+
+
+def create_engine(settings: Settings, url: Optional[str] = None) -> AsyncEngine:
+    url = url or settings.sqlalchemy_database_url
+    engine = create_async_engine(url, **engine_options(settings, url))
+    instrument_queries(engine)
+    return engine
+
+
+def create_replica_router(settings: Settings, primary: AsyncEngine) -> ReplicaRouter:
+    # 풀 메트릭(set_db_connection_metrics)은 주 DB 풀만 내보낸다
+    replicas = [
+        create_async_engine(
+            url.strip(),
+            **{**engine_options(settings, url.strip()), "poolclass": AsyncAdaptedQueuePool},
+        )
+        for url in settings.db_replica_urls.split(",")
+        if url.strip()
+    ]
+    for replica in replicas:
+        instrument_queries(replica)
+    return ReplicaRouter(
+        primary,
+        replicas,
+        max_lag=settings.db_replica_max_lag,
+        check_interval=settings.db_replica_check_interval,
+    )
+
+
+engine: AsyncEngine = create_engine(settings)
+
+replica_router: ReplicaRouter = create_replica_router(settings, engine)
+
+slow_query_recorder = SlowQueryRecorder(
+    threshold_ms=settings.db_slow_query_threshold_ms,
+    buffer_size=settings.db_slow_query_buffer_size,
+    explain_enabled=settings.db_slow_query_explain,
+    explain_min_count=settings.db_slow_query_explain_min_count,
+    explain_sample_rate=settings.db_slow_query_explain_sample_rate,
 )
+for _engine in [engine, *(replica.engine for replica in replica_router.replicas)]:
+    slow_query_recorder.instrument(_engine)
 
 AsyncSessionLocal = async_sessionmaker(  # type: ignore
     bind=engine,
     expire_on_commit=False,
+    sync_session_class=RoutingSession,
+    router=replica_router,
 )
 
 
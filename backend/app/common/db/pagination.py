@@ -0,0 +1,61 @@
+import base64
+import binascii
+import json
+from dataclasses import dataclass, field
+from datetime import datetime
+from typing import Any, Generic, List, Optional, TypeVar
+
+from sqlalchemy import and_, or_
+from sqlalchemy.sql.elements import ColumnElement
+
+T = TypeVar("T")
+
+
+@dataclass(frozen=True)
+class PageCursor:
+    """키셋 페이지네이션 커서 (정렬 시각 + ID)
+
+    클라이언트에는 base64url 문자열로만 노출한다.
+    """
+
+    sort_value: datetime
+    id: str
+
+    def encode(self) -> str:
+        raw = json.dumps({"t": self.sort_value.isoformat(), "id": self.id})
+        return base64.urlsafe_b64encode(raw.encode("utf-8")).decode("ascii").rstrip("=")
+
+    @classmethod
+    def decode(cls, token: str) -> "PageCursor":
+        try:
+            padded = token + "=" * (-len(token) % 4)
+            data = json.loads(base64.urlsafe_b64decode(padded.encode("ascii")))
+            return cls(
+                sort_value=datetime.fromisoformat(data["t"]),
+                id=str(data["id"]),
+            )
+        except (binascii.Error, UnicodeError, ValueError, KeyError, TypeError):
+            raise ValueError("Invalid cursor")
+
+
+@dataclass
+class CursorPage(Generic[T]):
+    """커서 기반 페이지 조회 결과"""
+
+    items: List[T] = field(default_factory=list)
+    next_cursor: Optional[str] = None
+    total_count: Optional[int] = None  # 요청한 경우에만 계산
+
+    @property
+    def has_next(self) -> bool:
+        return self.next_cursor is not None
+
+
+def keyset_after(
+    sort_column: Any, id_column: Any, cursor: PageCursor
+) -> ColumnElement[bool]:
+    """(정렬 시각, ID) 내림차순 기준으로 커서 이후 행 조건"""
+    return or_(
+        sort_column < cursor.sort_value,
+        and_(sort_column == cursor.sort_value, id_column < cursor.id),
+    )
@@ -0,0 +1,35 @@
+import time
+from typing import Any, Optional
+
+from sqlalchemy.pool import AsyncAdaptedQueuePool
+
+from app.common.monitoring.metrics import set_db_connection_metrics
+
+
+class InstrumentedQueuePool(AsyncAdaptedQueuePool):
+    """체크아웃/반납마다 풀 사용량과 대기 시간을 메트릭으로 내보내는 커넥션 풀
+
+    주기 수집(MetricsService)만으로는 잠깐씩 풀이 바닥나는 순간을 놓치므로
+    커넥션이 오갈 때마다 ``set_db_connection_metrics`` 를 갱신한다.
+    대기 시간은 커넥션을 얻지 못해 타임아웃난 경우도 포함한다.
+    """
+
+    def _do_get(self) -> Any:
+        started = time.perf_counter()
+        try:
+            return super()._do_get()
+        finally:
+            self.report(wait_time=time.perf_counter() - started)
+
+    def _do_return_conn(self, record: Any) -> None:
+        super()._do_return_conn(record)
+        self.report()
+
+    def report(self, wait_time: Optional[float] = None) -> None:
+        set_db_connection_metrics(
+            pool_size=self.size(),
+            checked_out=self.checkedout(),
+            # overflow() 는 -pool_size 부터 시작하므로 실제 초과 연결 수로 보정
+            overflow=max(self.overflow(), 0),
+            wait_time=wait_time,
+        )
@@ -0,0 +1,128 @@
+"""
+SQL 실행 수 / DB 시간 집계
+
+엔진의 cursor 실행 이벤트로 문장마다 실행 시간을 재서, 현재 컨텍스트의
+``QueryStats`` 에 더한다. 요청 단위 집계는 ``QueryStatsMiddleware`` 가,
+테스트의 쿼리 수 상한 검사는 ``assert_max_queries`` 가 사용한다.
+같은 SQL 이 한 범위 안에서 여러 번 반복되면 N+1 조회로 본다.
+"""
+
+import time
+from collections import Counter
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass, field
+from typing import Any, Iterator, List, Optional, Tuple, Type, Union
+
+from sqlalchemy import Engine, event
+from sqlalchemy.ext.asyncio import AsyncEngine
+
+_current: ContextVar[Optional["QueryStats"]] = ContextVar("query_stats", default=None)
+
+MAX_STATEMENT_LENGTH = 200
+
+
+@dataclass
+class QueryStats:
+    """한 범위(요청, 테스트 블록)에서 실행된 SQL 수와 시간"""
+
+    count: int = 0
+    duration: float = 0.0  # 초
+    statements: Counter = field(default_factory=Counter)
+    parent: Optional["QueryStats"] = None
+
+    def record(self, statement: str, duration: float) -> None:
+        stats: Optional[QueryStats] = self
+        while stats is not None:
+            stats.count += 1
+            stats.duration += duration
+            stats.statements[statement] += 1
+            stats = stats.parent
+
+    def repeated(self, threshold: int) -> List[Tuple[str, int]]:
+        """threshold 번 이상 반복된 SQL (N+1 후보), 많이 반복된 순"""
+        return [
+            (statement, count)
+            for statement, count in self.statements.most_common()
+            if count >= threshold
+        ]
+
+    def describe(self) -> str:
+        lines = [f"{self.count} queries in {self.duration * 1000:.1f}ms"]
+        for statement, count in self.statements.most_common():
+            lines.append(f"  {count:>3}x {_shorten(statement)}")
+        return "\n".join(lines)
+
+
+def _shorten(statement: str) -> str:
+    statement = " ".join(statement.split())
+    if len(statement) > MAX_STATEMENT_LENGTH:
+        return statement[:MAX_STATEMENT_LENGTH] + "..."
+    return statement
+
+
+@contextmanager
+def track_queries() -> Iterator[QueryStats]:
+    """이 블록(과 여기서 만든 태스크)에서 실행된 SQL 집계
+
+    바깥 범위가 있으면 바깥에도 함께 더한다.
+    """
+    stats = QueryStats(parent=_current.get())
+    token = _current.set(stats)
+    try:
+        yield stats
+    finally:
+        _current.reset(token)
+
+
+@contextmanager
+def assert_max_queries(max_queries: int) -> Iterator[QueryStats]:
+    """블록 안의 SQL 실행 수가 max_queries 를 넘으면 AssertionError
+
+    ``async with`` 가 아닌 ``with`` 로 감싸도 블록 안의 await 는 모두 집계된다.
+    """
+    with track_queries() as stats:
+        yield stats
+    if stats.count > max_queries:
+        raise AssertionError(
+            f"Query budget exceeded: {stats.count} > {max_queries}\n"
+            f"{stats.describe()}"
+        )
+
+
+def _before_cursor_execute(
+    conn: Any, cursor: Any, statement: str, parameters: Any, context: Any, executemany: bool
+) -> None:
+    context._query_started = time.perf_counter()
+
+
+def _after_cursor_execute(
+    conn: Any, cursor: Any, statement: str, parameters: Any, context: Any, executemany: bool
+) -> None:
+    stats = _current.get()
+    started = getattr(context, "_query_started", None)
+    if stats is None or started is None:
+        return
+    # 엔진과 Engine 클래스에 함께 걸려 있어도 한 번만 센다
+    context._query_started = None
+    stats.record(statement, time.perf_counter() - started)
+
+
+def instrument_queries(target: Union[AsyncEngine, Engine, Type[Engine]]) -> None:
+    """엔진의 SQL 실행을 현재 QueryStats 에 집계
+
+    ``Engine`` 클래스를 넘기면 프로세스의 모든 엔진을 계측한다 (테스트용).
+    """
+    target = getattr(target, "sync_engine", target)
+    if event.contains(target, "after_cursor_execute", _after_cursor_execute):
+        return
+    event.listen(target, "before_cursor_execute", _before_cursor_execute)
+    event.listen(target, "after_cursor_execute", _after_cursor_execute)
+
+
+def uninstrument_queries(target: Union[AsyncEngine, Engine, Type[Engine]]) -> None:
+    target = getattr(target, "sync_engine", target)
+    if not event.contains(target, "after_cursor_execute", _after_cursor_execute):
+        return
+    event.remove(target, "before_cursor_execute", _before_cursor_execute)
+    event.remove(target, "after_cursor_execute", _after_cursor_execute)
@@ -0,0 +1,180 @@
+"""
+읽기 복제본(replica) 라우팅
+
+``@read_only`` 로 표시한 저장소/서비스 메서드 안의 조회는 복제 지연이 허용치 이내인
+복제본으로 보내고, 나머지는 모두 주 DB 로 보낸다. 한 세션에서 쓰기(flush, DML)가
+한 번이라도 있었으면 그 세션의 이후 조회는 주 DB 에 고정해 방금 쓴 내용을 읽게 한다.
+복제본 지연은 백그라운드에서 주기적으로 재고, 지연을 알 수 없거나 허용치를 넘으면
+그 복제본은 건너뛴다 (모두 건너뛰면 주 DB).
+"""
+
+import asyncio
+import functools
+import itertools
+import logging
+from contextvars import ContextVar
+from dataclasses import dataclass
+from typing import Any, Awaitable, Callable, List, Optional, Sequence, TypeVar
+
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import AsyncConnection, AsyncEngine
+from sqlalchemy.orm import Session
+
+from app.common.monitoring.metrics import set_db_replica_lag
+
+logger = logging.getLogger(__name__)
+
+F = TypeVar("F", bound=Callable[..., Awaitable[Any]])
+
+# 세션이 쓰기를 한 뒤 주 DB 에 고정됐는지 (session.info 키)
+PINNED_TO_PRIMARY = "pinned_to_primary"
+
+_read_only: ContextVar[bool] = ContextVar("db_read_only", default=False)
+
+LagProbe = Callable[[AsyncConnection], Awaitable[Optional[float]]]
+
+
+def read_only(func: F) -> F:
+    """이 메서드 안의 조회는 복제본으로 보내도 된다고 표시
+
+    복제 지연만큼 오래된 데이터를 읽어도 되는 조회에만 붙인다.
+    """
+
+    @functools.wraps(func)
+    async def wrapper(*args: Any, **kwargs: Any) -> Any:
+        token = _read_only.set(True)
+        try:
+            return await func(*args, **kwargs)
+        finally:
+            _read_only.reset(token)
+
+    return wrapper  # type: ignore
+
+
+async def mysql_replica_lag(conn: AsyncConnection) -> Optional[float]:
+    """MySQL 복제 지연(초), 복제본이 아니거나 복제가 멈췄으면 None"""
+    result = await conn.execute(text("SHOW REPLICA STATUS"))
+    row = result.mappings().first()
+    if row is None:
+        return None
+    lag = row.get("Seconds_Behind_Source")
+    return float(lag) if lag is not None else None
+
+
+@dataclass
+class Replica:
+    engine: AsyncEngine
+    lag: Optional[float] = None  # 마지막으로 잰 지연(초), None 이면 사용하지 않음
+
+    @property
+    def name(self) -> str:
+        return self.engine.url.render_as_string(hide_password=True)
+
+
+class ReplicaRouter:
+    """주 DB 와 복제본 엔진, 복제본별 지연 상태"""
+
+    def __init__(
+        self,
+        primary: AsyncEngine,
+        replicas: Sequence[AsyncEngine] = (),
+        max_lag: float = 1.0,
+        check_interval: float = 5.0,
+        lag_probe: LagProbe = mysql_replica_lag,
+    ):
+        self.primary = primary
+        self.replicas: List[Replica] = [Replica(engine) for engine in replicas]
+        self.max_lag = max_lag
+        self.check_interval = check_interval
+        self.lag_probe = lag_probe
+        self._turn = itertools.count()
+        self._running = False
+        self._task: Optional[asyncio.Task] = None
+
+    def choose(self) -> Optional[AsyncEngine]:
+        """지연이 허용치 이내인 복제본을 돌아가며 선택 (없으면 None → 주 DB)"""
+        available = [
+            replica
+            for replica in self.replicas
+            if replica.lag is not None and replica.lag <= self.max_lag
+        ]
+        if not available:
+            return None
+        return available[next(self._turn) % len(available)].engine
+
+    async def check_lag(self) -> None:
+        """복제본마다 지연을 재서 갱신 (실패하면 사용하지 않음으로 표시)"""
+        for replica in self.replicas:
+            try:
+                async with replica.engine.connect() as conn:
+                    replica.lag = await asyncio.wait_for(
+                        self.lag_probe(conn), timeout=self.check_interval
+                    )
+            except Exception as e:
+                logger.warning(f"Replica lag check failed for {replica.name}: {e}")
+                replica.lag = None
+            if replica.lag is None or replica.lag > self.max_lag:
+                logger.debug("Replica %s skipped (lag %s)", replica.name, replica.lag)
+            set_db_replica_lag(replica.name, replica.lag)
+
+    async def start(self) -> None:
+        """지연 측정 시작 (첫 측정이 끝나야 복제본을 사용)"""
+        if self._running or not self.replicas:
+            return
+
+        self._running = True
+        await self.check_lag()
+        self._task = asyncio.create_task(self._check_loop())
+        logger.info("ReplicaRouter started with %d replicas", len(self.replicas))
+
+    async def stop(self) -> None:
+        """지연 측정 중지 및 복제본 연결 정리"""
+        if self._running:
+            self._running = False
+            if self._task:
+                self._task.cancel()
+                try:
+                    await self._task
+                except asyncio.CancelledError:
+                    pass
+
+        for replica in self.replicas:
+            replica.lag = None
+            await replica.engine.dispose()
+
+        logger.info("ReplicaRouter stopped")
+
+    async def _check_loop(self) -> None:
+        while self._running:
+            try:
+                await asyncio.sleep(self.check_interval)
+                await self.check_lag()
+            except asyncio.CancelledError:
+                break
+            except Exception as e:
+                logger.error(f"Error checking replica lag: {e}")
+
+
+class RoutingSession(Session):
+    """``@read_only`` 구간의 조회를 복제본으로 보내는 세션
+
+    ``async_sessionmaker(sync_session_class=RoutingSession, router=...)`` 로 쓴다.
+    """
+
+    def __init__(self, *args: Any, router: Optional[ReplicaRouter] = None, **kwargs: Any):
+        super().__init__(*args, **kwargs)
+        self.router = router
+
+    def get_bind(self, mapper: Any = None, clause: Any = None, **kw: Any) -> Any:
+        if self._flushing or getattr(clause, "is_dml", False):
+            # 쓰기 이후의 조회는 복제 지연과 관계없이 주 DB 에서 읽는다
+            self.info[PINNED_TO_PRIMARY] = True
+        elif (
+            self.router is not None
+            and _read_only.get()
+            and not self.info.get(PINNED_TO_PRIMARY)
+        ):
+            replica = self.router.choose()
+            if replica is not None:
+                return replica.sync_engine
+        return super().get_bind(mapper=mapper, clause=clause, **kw)
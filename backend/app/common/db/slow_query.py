@@ -0,0 +1,328 @@
+"""
+느린 SQL 기록
+
+엔진의 cursor 실행 이벤트로 문장마다 실행 시간을 재서, 임계값(ms)을 넘은 문장의
+정규화한 SQL, 바인드 파라미터 형태(값은 남기지 않음), 호출한 저장소 메서드, 실행 시간을
+크기가 정해진 링 버퍼에 남긴다. ``echo`` 를 켜지 않고도 느린 저장소 조회를 찾기 위한 것이다.
+
+같은 SELECT 가 버퍼에 여러 번 쌓이면(반복 범인) 일부를 표본으로 골라 백그라운드 워커가
+요청 경로 밖에서 EXPLAIN 을 실행해 실행 계획을 붙인다.
+"""
+
+import asyncio
+import logging
+import random
+import re
+import sys
+import time
+from collections import Counter, OrderedDict, deque
+from contextvars import ContextVar
+from dataclasses import dataclass
+from types import FrameType
+from typing import Any, Deque, Dict, Iterator, List, Optional, Tuple
+
+import greenlet
+from sqlalchemy import Engine, event
+from sqlalchemy.ext.asyncio import AsyncEngine
+
+logger = logging.getLogger(__name__)
+
+MAX_PLANS = 100
+EXPLAIN_QUEUE_SIZE = 100
+
+# EXPLAIN 워커가 실행하는 문장은 기록하지 않는다
+_explaining: ContextVar[bool] = ContextVar("slow_query_explaining", default=False)
+
+_STRING = re.compile(r"'(?:[^']|'')*'")
+_NUMBER = re.compile(r"(?<![\w.])\d+(?:\.\d+)?\b")
+_PLACEHOLDER = re.compile(r"%\(\w+\)s|%s|(?<![:\w]):\w+")
+_IN_LIST = re.compile(r"\bIN\s*\(\s*\?(?:\s*,\s*\?)*\s*\)", re.IGNORECASE)
+
+
+def normalize_sql(statement: str) -> str:
+    """리터럴과 자리표시자를 ``?`` 로 바꾸고 ``IN (?, ?, ...)`` 목록을 하나로 묶은 SQL"""
+    statement = _STRING.sub("?", statement)
+    statement = _PLACEHOLDER.sub("?", statement)
+    statement = _NUMBER.sub("?", statement)
+    statement = " ".join(statement.split())
+    return _IN_LIST.sub("IN (...)", statement)
+
+
+def parameter_shape(parameters: Any, executemany: bool = False) -> str:
+    """바인드 파라미터의 타입 모양, 예: ``(str, int*3)``, ``{id: str}``, ``[20 x (str)]``"""
+    if executemany and isinstance(parameters, (list, tuple)):
+        first = parameters[0] if parameters else ()
+        return f"[{len(parameters)} x {parameter_shape(first)}]"
+    if isinstance(parameters, dict):
+        return (
+            "{"
+            + ", ".join(f"{key}: {type(value).__name__}" for key, value in parameters.items())
+            + "}"
+        )
+    if isinstance(parameters, (list, tuple)):
+        # IN 목록처럼 같은 타입이 이어지면 묶는다
+        runs: List[List[Any]] = []
+        for value in parameters:
+            name = type(value).__name__
+            if runs and runs[-1][0] == name:
+                runs[-1][1] += 1
+            else:
+                runs.append([name, 1])
+        return "(" + ", ".join(n if c == 1 else f"{n}*{c}" for n, c in runs) + ")"
+    return "()"
+
+
+def _frames() -> Iterator[FrameType]:
+    """현재 스택을 바깥쪽으로, greenlet 경계를 넘어 부모(이벤트 루프 쪽)까지 순회"""
+    frame: Optional[FrameType] = sys._getframe(1)
+    current: Optional[Any] = greenlet.getcurrent()
+    while True:
+        while frame is not None:
+            yield frame
+            frame = frame.f_back
+        current = current.parent if current is not None else None
+        if current is None:
+            return
+        frame = current.gr_frame
+
+
+def _caller() -> str:
+    """SQL 을 실행한 저장소 메서드 (없으면 app 안에서 가장 가까운 호출 위치)"""
+    fallback = None
+    for frame in _frames():
+        module = frame.f_globals.get("__name__", "")
+        qualname = frame.f_code.co_qualname
+        if ".infrastructure.repository." in module or (
+            "." in qualname and qualname.split(".")[-2].endswith("Repository")
+        ):
+            return qualname
+        if (
+            fallback is None
+            and module.startswith("app.")
+            and not module.startswith("app.common.db")
+        ):
+            fallback = f"{module}:{qualname}"
+    return fallback or "unknown"
+
+
+@dataclass
+class SlowQuery:
+    """느린 문장 한 번의 실행"""
+
+    sql: str  # 정규화한 SQL
+    params_shape: str
+    caller: str
+    duration: float  # 초
+    at: float  # time.time()
+
+
+@dataclass
+class SlowQueryStat:
+    """버퍼 안에서 (SQL, 호출 위치) 별로 묶은 느린 문장 통계"""
+
+    sql: str
+    caller: str
+    count: int
+    total: float  # 초
+    max: float
+    last_params_shape: str
+    last_at: float
+    plan: Optional[List[str]] = None
+
+    @property
+    def avg(self) -> float:
+        return self.total / self.count
+
+
+class SlowQueryRecorder:
+    """임계값을 넘은 SQL 을 링 버퍼에 기록하고 반복 범인의 EXPLAIN 을 표본 수집"""
+
+    def __init__(
+        self,
+        threshold_ms: float = 200.0,
+        buffer_size: int = 500,
+        explain_enabled: bool = False,
+        explain_min_count: int = 5,
+        explain_sample_rate: float = 0.1,
+    ):
+        self.threshold_ms = threshold_ms
+        self.explain_enabled = explain_enabled
+        self.explain_min_count = explain_min_count
+        self.explain_sample_rate = explain_sample_rate
+        self._buffer: Deque[SlowQuery] = deque(maxlen=buffer_size)
+        # 버퍼 안의 SQL 별 개수 (버퍼에서 밀려나면 같이 뺀다)
+        self._counts: Counter = Counter()
+        self._plans: "OrderedDict[str, List[str]]" = OrderedDict()
+        self._pending: set = set()
+        self._engines: Dict[Engine, AsyncEngine] = {}
+        self._queue: "asyncio.Queue[Tuple[AsyncEngine, str, str, Any]]" = asyncio.Queue(
+            maxsize=EXPLAIN_QUEUE_SIZE
+        )
+        self._running = False
+        self._task: Optional[asyncio.Task] = None
+
+    @property
+    def enabled(self) -> bool:
+        return self.threshold_ms > 0
+
+    def instrument(self, engine: AsyncEngine) -> None:
+        """엔진의 SQL 실행 시간 측정 (임계값이 0이면 아무것도 하지 않음)"""
+        if not self.enabled or engine.sync_engine in self._engines:
+            return
+        self._engines[engine.sync_engine] = engine
+        event.listen(engine.sync_engine, "before_cursor_execute", self._before_cursor_execute)
+        event.listen(engine.sync_engine, "after_cursor_execute", self._after_cursor_execute)
+
+    def record(
+        self,
+        statement: str,
+        parameters: Any,
+        duration: float,
+        executemany: bool = False,
+        engine: Optional[AsyncEngine] = None,
+    ) -> None:
+        """임계값을 넘은 문장이면 버퍼에 남기고, 반복 범인이면 EXPLAIN 을 예약"""
+        if duration * 1000 < self.threshold_ms or _explaining.get():
+            return
+
+        sql = normalize_sql(statement)
+        if len(self._buffer) == self._buffer.maxlen:
+            evicted = self._buffer[0].sql
+            self._counts[evicted] -= 1
+            if self._counts[evicted] <= 0:
+                del self._counts[evicted]
+        self._buffer.append(
+            SlowQuery(
+                sql=sql,
+                params_shape=parameter_shape(parameters, executemany),
+                caller=_caller(),
+                duration=duration,
+                at=time.time(),
+            )
+        )
+        self._counts[sql] += 1
+
+        if (
+            self._running
+            and engine is not None
+            and not executemany
+            and self._counts[sql] >= self.explain_min_count
+            and sql not in self._plans
+            and sql not in self._pending
+            and sql[:6].upper() == "SELECT"
+            and random.random() < self.explain_sample_rate
+        ):
+            try:
+                # 원래 파라미터는 EXPLAIN 을 실행할 때까지만 큐에 들고 있는다
+                self._queue.put_nowait((engine, sql, statement, parameters))
+                self._pending.add(sql)
+            except asyncio.QueueFull:
+                logger.debug("EXPLAIN queue full, skipping %s", sql[:80])
+
+    def top(self, n: int = 20) -> List[SlowQueryStat]:
+        """버퍼 안의 느린 문장을 (SQL, 호출 위치) 별로 묶어 총 시간이 긴 순으로 n개"""
+        stats: Dict[Tuple[str, str], SlowQueryStat] = {}
+        for query in self._buffer:
+            stat = stats.get((query.sql, query.caller))
+            if stat is None:
+                stats[(query.sql, query.caller)] = SlowQueryStat(
+                    sql=query.sql,
+                    caller=query.caller,
+                    count=1,
+                    total=query.duration,
+                    max=query.duration,
+                    last_params_shape=query.params_shape,
+                    last_at=query.at,
+                    plan=self._plans.get(query.sql),
+                )
+                continue
+            stat.count += 1
+            stat.total += query.duration
+            stat.max = max(stat.max, query.duration)
+            stat.last_params_shape = query.params_shape
+            stat.last_at = query.at
+        return sorted(stats.values(), key=lambda stat: stat.total, reverse=True)[:n]
+
+    def clear(self) -> None:
+        self._buffer.clear()
+        self._counts.clear()
+        self._plans.clear()
+
+    async def start(self) -> None:
+        """EXPLAIN 워커 시작 (EXPLAIN 을 끈 경우 기록만 함)"""
+        if self._running or not (self.enabled and self.explain_enabled):
+            return
+
+        self._running = True
+        self._task = asyncio.create_task(self._explain_loop())
+        logger.info("SlowQueryRecorder EXPLAIN worker started")
+
+    async def stop(self) -> None:
+        """EXPLAIN 워커 중지 (대기 중인 EXPLAIN 은 버림)"""
+        if not self._running:
+            return
+
+        self._running = False
+        if self._task:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+        while not self._queue.empty():
+            self._queue.get_nowait()
+        self._pending.clear()
+        logger.info("SlowQueryRecorder EXPLAIN worker stopped")
+
+    async def explain(self, engine: AsyncEngine, statement: str, parameters: Any) -> List[str]:
+        """문장의 실행 계획 (실행하지 않고 계획만 조회)"""
+        prefix = (
+            "EXPLAIN QUERY PLAN " if engine.dialect.name == "sqlite" else "EXPLAIN "
+        )
+        token = _explaining.set(True)
+        try:
+            async with engine.connect() as conn:
+                result = await conn.exec_driver_sql(prefix + statement, parameters)
+                return [
+                    " | ".join("" if value is None else str(value) for value in row)
+                    for row in result
+                ]
+        finally:
+            _explaining.reset(token)
+
+    async def _explain_loop(self) -> None:
+        while self._running:
+            try:
+                engine, sql, statement, parameters = await self._queue.get()
+                try:
+                    self._plans[sql] = await self.explain(engine, statement, parameters)
+                    if len(self._plans) > MAX_PLANS:
+                        self._plans.popitem(last=False)
+                except Exception as e:
+                    logger.warning(f"EXPLAIN failed for {sql[:80]}: {e}")
+                finally:
+                    self._pending.discard(sql)
+            except asyncio.CancelledError:
+                break
+            except Exception as e:
+                logger.error(f"Error in slow query EXPLAIN worker: {e}")
+
+    def _before_cursor_execute(
+        self, conn: Any, cursor: Any, statement: str, parameters: Any, context: Any, executemany: bool
+    ) -> None:
+        context._slow_query_started = time.perf_counter()
+
+    def _after_cursor_execute(
+        self, conn: Any, cursor: Any, statement: str, parameters: Any, context: Any, executemany: bool
+    ) -> None:
+        started = getattr(context, "_slow_query_started", None)
+        if started is None:
+            return
+        context._slow_query_started = None
+        self.record(
+            statement,
+            parameters,
+            time.perf_counter() - started,
+            executemany=executemany,
+            engine=self._engines.get(conn.engine),
+        )
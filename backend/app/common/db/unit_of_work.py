@@ -0,0 +1,126 @@
+"""
+요청 단위 DB 세션 (Unit of Work)
+
+요청마다 세션을 하나 열고 그 요청에서 만든 저장소들이 같은 세션을 공유한다.
+경계(요청 종료)에서 정상이면 commit, 실패면 rollback 한 뒤 세션을 닫아
+커넥션을 풀에 돌려준다. 저장소는 ``flush()`` 까지만 하고 commit/rollback 은
+UnitOfWork 만 한다. 현재 세션은 ContextVar 로 전달되므로 동시에 처리되는
+요청끼리 세션(커넥션)을 나눠 쓰지 않는다.
+
+DB 밖으로 내보내는 부수 효과(피드 인덱스 갱신 등)는 ``after_commit`` 으로 등록해
+commit 된 뒤에만 실행하고, rollback 되면 버린다.
+"""
+
+import logging
+from contextvars import ContextVar, Token
+from typing import Any, Awaitable, Callable, List, Optional
+
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+from app.common.db.database import AsyncSessionLocal
+
+logger = logging.getLogger(__name__)
+
+_current: ContextVar[Optional["UnitOfWork"]] = ContextVar(
+    "unit_of_work", default=None
+)
+
+
+class UnitOfWork:
+    """세션 하나의 수명과 트랜잭션 경계
+
+    ``async with UnitOfWork() as session:`` 블록이 예외 없이 끝나면 commit,
+    예외가 나면 rollback 한다. 경계 전에 결과를 확정해야 하면 (응답을 보내기 전,
+    LLM 응답처럼 오래 기다리기 전 등) ``commit()`` / ``rollback()`` 을 직접 호출한다.
+    commit 하면 트랜잭션이 끝나 커넥션이 풀에 돌아가고, 다음 쿼리에서 새로 열린다.
+    """
+
+    def __init__(
+        self, session_factory: async_sessionmaker[AsyncSession] = AsyncSessionLocal
+    ) -> None:
+        self.session_factory = session_factory
+        self._session: Optional[AsyncSession] = None
+        self._token: Optional[Token] = None
+        self._after_commit: List[Callable[[], Awaitable[None]]] = []
+
+    @property
+    def session(self) -> AsyncSession:
+        if self._session is None:
+            raise RuntimeError("Unit of work is not active")
+        return self._session
+
+    async def __aenter__(self) -> AsyncSession:
+        self._session = self.session_factory()
+        self._token = _current.set(self)
+        return self._session
+
+    async def __aexit__(self, exc_type: Any, exc: Any, tb: Any) -> None:
+        try:
+            if exc_type is None:
+                await self.commit()
+            else:
+                await self.rollback()
+        finally:
+            await self.session.close()
+            if self._token is not None:
+                _current.reset(self._token)
+            self._session = None
+            self._token = None
+            self._after_commit.clear()
+
+    def after_commit(self, callback: Callable[[], Awaitable[None]]) -> None:
+        """다음 commit 이 성공한 뒤 실행할 작업 등록 (rollback 되면 버림)"""
+        self._after_commit.append(callback)
+
+    async def commit(self) -> None:
+        try:
+            await self.session.commit()
+        except Exception:
+            await self.rollback()
+            raise
+
+        callbacks, self._after_commit = self._after_commit, []
+        for callback in callbacks:
+            try:
+                await callback()
+            except Exception:
+                # 이미 commit 됐으므로 요청을 실패시키지 않는다
+                logger.exception("After-commit callback failed")
+        if callbacks and self.session.in_transaction():
+            # 작업이 조회하느라 연 트랜잭션도 끝내 커넥션을 돌려준다
+            await self.session.commit()
+
+    async def rollback(self) -> None:
+        self._after_commit.clear()
+        await self.session.rollback()
+
+
+def current_session() -> AsyncSession:
+    """현재 요청(UnitOfWork)의 세션
+
+    DI 컨테이너가 저장소를 만들 때 호출한다. 요청 밖(백그라운드 작업 등)에서는
+    ``UnitOfWork`` 를 직접 열어야 한다.
+    """
+    unit_of_work = _current.get()
+    if unit_of_work is None:
+        raise RuntimeError("No active unit of work; open UnitOfWork first")
+    return unit_of_work.session
+
+
+def after_commit(callback: Callable[[], Awaitable[None]]) -> None:
+    """현재 UnitOfWork 가 commit 된 뒤 실행할 작업 등록 (rollback 되면 버림)"""
+    unit_of_work = _current.get()
+    if unit_of_work is None:
+        raise RuntimeError("No active unit of work; open UnitOfWork first")
+    unit_of_work.after_commit(callback)
+
+
+async def commit_current() -> None:
+    """현재 UnitOfWork 를 경계 전에 commit 해 커넥션을 풀에 돌려준다
+
+    LLM 호출처럼 오래 기다리기 전, 스트리밍 중 진행 상황을 확정할 때 쓴다.
+    UnitOfWork 밖(저장소를 직접 구성한 경우 등)에서는 아무것도 하지 않는다.
+    """
+    unit_of_work = _current.get()
+    if unit_of_work is not None:
+        await unit_of_work.commit()
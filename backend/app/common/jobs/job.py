@@ -0,0 +1,71 @@
+from dataclasses import dataclass, field
+from datetime import datetime, timezone
+from enum import StrEnum
+from typing import Any, Dict, Optional
+
+
+class JobStatus(StrEnum):
+    PENDING = "PENDING"  # 대기 (재시도 대기 포함)
+    RUNNING = "RUNNING"
+    SUCCEEDED = "SUCCEEDED"
+    FAILED = "FAILED"  # 재시도 불가 또는 재시도 소진 (dead-letter)
+
+
+class JobPermanentError(Exception):
+    """재시도해도 결과가 같은 작업 실패 (즉시 FAILED 처리)"""
+
+    pass
+
+
+@dataclass
+class Job:
+    """백그라운드 작업 상태"""
+
+    id: str
+    job_type: str
+    owner_id: str
+    payload: Dict[str, Any] = field(default_factory=dict)
+    status: JobStatus = JobStatus.PENDING
+    attempts: int = 0
+    max_attempts: int = 3
+    result: Optional[Dict[str, Any]] = None
+    error: Optional[str] = None
+    created_at: datetime = field(default_factory=lambda: datetime.now(timezone.utc))
+    updated_at: datetime = field(default_factory=lambda: datetime.now(timezone.utc))
+
+    @property
+    def is_finished(self) -> bool:
+        return self.status in (JobStatus.SUCCEEDED, JobStatus.FAILED)
+
+    def to_dict(self) -> dict:
+        """딕셔너리로 변환 (Redis 저장용)"""
+        return {
+            "id": self.id,
+            "job_type": self.job_type,
+            "owner_id": self.owner_id,
+            "payload": self.payload,
+            "status": self.status.value,
+            "attempts": self.attempts,
+            "max_attempts": self.max_attempts,
+            "result": self.result,
+            "error": self.error,
+            "created_at": self.created_at.isoformat(),
+            "updated_at": self.updated_at.isoformat(),
+        }
+
+    @classmethod
+    def from_dict(cls, data: dict) -> "Job":
+        """딕셔너리에서 객체 생성 (Redis 조회용)"""
+        return cls(
+            id=data["id"],
+            job_type=data["job_type"],
+            owner_id=data["owner_id"],
+            payload=data.get("payload") or {},
+            status=JobStatus(data["status"]),
+            attempts=data.get("attempts", 0),
+            max_attempts=data.get("max_attempts", 3),
+            result=data.get("result"),
+            error=data.get("error"),
+            created_at=datetime.fromisoformat(data["created_at"]),
+            updated_at=datetime.fromisoformat(data["updated_at"]),
+        )
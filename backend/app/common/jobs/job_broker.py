@@ -0,0 +1,120 @@
+import asyncio
+import os
+import socket
+from abc import ABCMeta, abstractmethod
+from dataclasses import dataclass
+from typing import List, Optional
+
+from app.common.cache.redis_client import redis_client
+
+
+@dataclass(frozen=True)
+class JobMessage:
+    """브로커에서 꺼낸 작업 메시지"""
+
+    job_id: str
+    receipt: Optional[str] = None  # 처리 완료(ack) 시 필요한 브로커 식별자
+
+
+class IJobBroker(metaclass=ABCMeta):
+    @abstractmethod
+    async def publish(self, job_id: str) -> None:
+        """작업 등록"""
+        raise NotImplementedError
+
+    @abstractmethod
+    async def consume(self) -> Optional[JobMessage]:
+        """다음 작업 대기 후 반환 (잠시 기다려도 없으면 None)"""
+        raise NotImplementedError
+
+    @abstractmethod
+    async def ack(self, message: JobMessage) -> None:
+        """작업 처리 완료 표시"""
+        raise NotImplementedError
+
+    @abstractmethod
+    async def dead_letter(self, job_id: str, error: str) -> None:
+        """재시도를 소진한 작업을 dead-letter 큐로 이동"""
+        raise NotImplementedError
+
+
+class InMemoryJobBroker(IJobBroker):
+    """프로세스 내 asyncio 큐 브로커 (외부 브로커가 없을 때 사용)"""
+
+    def __init__(self) -> None:
+        self._queue: "asyncio.Queue[str]" = asyncio.Queue()
+        self.dead_letters: List[str] = []
+
+    async def publish(self, job_id: str) -> None:
+        self._queue.put_nowait(job_id)
+
+    async def consume(self) -> Optional[JobMessage]:
+        return JobMessage(job_id=await self._queue.get())
+
+    async def ack(self, message: JobMessage) -> None:
+        return None
+
+    async def dead_letter(self, job_id: str, error: str) -> None:
+        self.dead_letters.append(job_id)
+
+
+class RedisStreamJobBroker(IJobBroker):
+    """Redis Stream + 컨슈머 그룹 브로커
+
+    여러 인스턴스의 워커가 같은 그룹으로 메시지를 나눠 받는다.
+    처리 중 워커가 죽어 ack되지 않은 메시지는 ``claim_idle_ms`` 후 다른 워커가 인수한다.
+    """
+
+    STREAM_KEY = "jobs:stream"
+    DEAD_LETTER_KEY = "jobs:dead"
+    GROUP = "job-workers"
+
+    def __init__(
+        self,
+        block_ms: int = 5000,
+        claim_idle_ms: int = 300_000,  # 5분
+        maxlen: int = 10_000,
+    ) -> None:
+        self.block_ms = block_ms
+        self.claim_idle_ms = claim_idle_ms
+        self.maxlen = maxlen
+        self.consumer = f"{socket.gethostname()}-{os.getpid()}"
+        self._group_ready = False
+
+    async def _ensure_group(self) -> None:
+        if not self._group_ready:
+            await redis_client.stream_create_group(self.STREAM_KEY, self.GROUP)
+            self._group_ready = True
+
+    async def publish(self, job_id: str) -> None:
+        await redis_client.stream_add(
+            self.STREAM_KEY, {"job_id": job_id}, maxlen=self.maxlen
+        )
+
+    async def consume(self) -> Optional[JobMessage]:
+        await self._ensure_group()
+
+        # 방치된 메시지를 먼저 인수해 작업 유실 방지
+        messages = await redis_client.stream_claim_stale(
+            self.STREAM_KEY, self.GROUP, self.consumer, self.claim_idle_ms
+        )
+        if not messages:
+            messages = await redis_client.stream_read_group(
+                self.STREAM_KEY, self.GROUP, self.consumer, block_ms=self.block_ms
+            )
+        if not messages:
+            return None
+
+        message_id, fields = messages[0]
+        return JobMessage(job_id=fields["job_id"], receipt=message_id)
+
+    async def ack(self, message: JobMessage) -> None:
+        if message.receipt:
+            await redis_client.stream_ack(self.STREAM_KEY, self.GROUP, message.receipt)
+
+    async def dead_letter(self, job_id: str, error: str) -> None:
+        await redis_client.stream_add(
+            self.DEAD_LETTER_KEY,
+            {"job_id": job_id, "error": error[:500]},
+            maxlen=self.maxlen,
+        )
@@ -0,0 +1,46 @@
+import json
+import time
+from typing import Dict, Optional, Tuple
+
+from app.common.cache.redis_client import redis_client
+from app.common.jobs.job import Job
+
+
+class JobStore:
+    """작업 상태 저장소
+
+    Redis가 연결되어 있으면 여러 인스턴스가 공유하도록 Redis에 저장하고,
+    없으면 프로세스 메모리에 저장한다. 작업 상태는 마지막 갱신 후 TTL이 지나면 사라진다.
+    """
+
+    KEY_PREFIX = "jobs:state"
+
+    def __init__(self, ttl: int = 86400) -> None:
+        self.ttl = ttl
+        self._memory: Dict[str, Tuple[float, dict]] = {}
+
+    async def save(self, job: Job) -> None:
+        data = job.to_dict()
+        if redis_client.is_connected:
+            await redis_client.set(
+                f"{self.KEY_PREFIX}:{job.id}", json.dumps(data), ex=self.ttl
+            )
+            return
+
+        now = time.monotonic()
+        self._memory = {
+            job_id: entry
+            for job_id, entry in self._memory.items()
+            if entry[0] > now
+        }
+        self._memory[job.id] = (now + self.ttl, data)
+
+    async def get(self, job_id: str) -> Optional[Job]:
+        data: Optional[dict]
+        if redis_client.is_connected:
+            cached = await redis_client.get(f"{self.KEY_PREFIX}:{job_id}")
+            data = json.loads(cached) if cached else None
+        else:
+            entry = self._memory.get(job_id)
+            data = entry[1] if entry and entry[0] > time.monotonic() else None
+        return Job.from_dict(data) if data else None
@@ -0,0 +1,184 @@
+import asyncio
+import logging
+import time
+from datetime import datetime, timezone
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Set
+
+from ulid import ULID  # type: ignore
+
+from app.common.jobs.job import Job, JobPermanentError, JobStatus
+from app.common.jobs.job_broker import IJobBroker, InMemoryJobBroker, JobMessage
+from app.common.jobs.job_store import JobStore
+from app.common.monitoring.metrics import record_job_run
+
+logger = logging.getLogger(__name__)
+
+JobHandler = Callable[[Job], Awaitable[Dict[str, Any]]]
+
+
+class JobWorkerPool:
+    """백그라운드 작업 워커 풀
+
+    애플리케이션 프로세스 안에서 ``concurrency`` 개의 asyncio 워커가 브로커의
+    작업을 꺼내 처리한다. 실패한 작업은 지수 백오프 후 다시 등록하고,
+    ``max_attempts`` 를 소진하면 FAILED 상태로 dead-letter 큐에 보낸다.
+    """
+
+    def __init__(
+        self,
+        store: JobStore,
+        broker: Optional[IJobBroker] = None,
+        concurrency: int = 4,
+        max_attempts: int = 3,
+        backoff_base: float = 2.0,
+        backoff_max: float = 60.0,
+        ulid: ULID = ULID(),
+    ) -> None:
+        self.store = store
+        self.broker: IJobBroker = broker or InMemoryJobBroker()
+        self.concurrency = concurrency
+        self.max_attempts = max_attempts
+        self.backoff_base = backoff_base
+        self.backoff_max = backoff_max
+        self.ulid = ulid
+
+        self._handlers: Dict[str, JobHandler] = {}
+        self._workers: List[asyncio.Task] = []
+        self._retries: Set[asyncio.Task] = set()
+        self._pending_retries: Set[str] = set()
+        self._running = False
+
+    def register(self, job_type: str, handler: JobHandler) -> None:
+        """작업 유형별 처리기 등록"""
+        self._handlers[job_type] = handler
+
+    async def submit(
+        self, job_type: str, owner_id: str, payload: Dict[str, Any]
+    ) -> Job:
+        """작업 생성 및 등록"""
+        if job_type not in self._handlers:
+            raise ValueError(f"Unknown job type: {job_type}")
+
+        job = Job(
+            id=self.ulid.generate(),
+            job_type=job_type,
+            owner_id=owner_id,
+            payload=payload,
+            max_attempts=self.max_attempts,
+        )
+        await self.store.save(job)
+        await self.broker.publish(job.id)
+        return job
+
+    async def get(self, job_id: str) -> Optional[Job]:
+        """작업 상태 조회"""
+        return await self.store.get(job_id)
+
+    async def start(self, broker: Optional[IJobBroker] = None) -> None:
+        """워커 시작"""
+        if self._running:
+            logger.warning("JobWorkerPool is already running")
+            return
+
+        if broker is not None:
+            self.broker = broker
+        self._running = True
+        self._workers = [
+            asyncio.create_task(self._worker_loop()) for _ in range(self.concurrency)
+        ]
+        logger.info(
+            f"JobWorkerPool started ({self.concurrency} workers, "
+            f"{type(self.broker).__name__})"
+        )
+
+    async def stop(self) -> None:
+        """워커 중지, 백오프 대기 중인 작업은 바로 다시 등록"""
+        if not self._running:
+            return
+
+        self._running = False
+        tasks = self._workers + list(self._retries)
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+        self._workers = []
+        self._retries = set()
+
+        for job_id in list(self._pending_retries):
+            try:
+                await self.broker.publish(job_id)
+            except Exception as e:
+                logger.error(f"Failed to requeue job {job_id}: {e}")
+        self._pending_retries.clear()
+
+        logger.info("JobWorkerPool stopped")
+
+    async def _worker_loop(self) -> None:
+        while self._running:
+            try:
+                message = await self.broker.consume()
+                if message is not None:
+                    await self.process(message)
+            except asyncio.CancelledError:
+                break
+            except Exception as e:
+                logger.error(f"Error consuming jobs: {e}")
+                await asyncio.sleep(1.0)
+
+    async def process(self, message: JobMessage) -> None:
+        """작업 하나 처리"""
+        job = await self.store.get(message.job_id)
+        if job is None or job.is_finished:
+            await self.broker.ack(message)
+            return
+
+        handler = self._handlers.get(job.job_type)
+        started = time.monotonic()
+        job.status = JobStatus.RUNNING
+        job.attempts += 1
+        job.updated_at = datetime.now(timezone.utc)
+        await self.store.save(job)
+
+        try:
+            if handler is None:
+                raise JobPermanentError(f"No handler for job type: {job.job_type}")
+            job.result = await handler(job)
+        except Exception as e:
+            job.error = str(e)
+            if isinstance(e, JobPermanentError):
+                job.status = JobStatus.FAILED
+                outcome = "failed"
+            elif job.attempts >= job.max_attempts:
+                job.status = JobStatus.FAILED
+                outcome = "dead_lettered"
+                await self.broker.dead_letter(job.id, job.error)
+            else:
+                job.status = JobStatus.PENDING
+                outcome = "retried"
+                self._schedule_retry(job)
+            logger.warning(f"Job {job.id} {outcome} (attempt {job.attempts}): {e}")
+        else:
+            job.status = JobStatus.SUCCEEDED
+            job.error = None
+            outcome = "succeeded"
+
+        job.updated_at = datetime.now(timezone.utc)
+        await self.store.save(job)
+        await self.broker.ack(message)
+        record_job_run(job.job_type, outcome, time.monotonic() - started)
+
+    def _retry_delay(self, attempts: int) -> float:
+        return min(self.backoff_max, self.backoff_base ** attempts)
+
+    def _schedule_retry(self, job: Job) -> None:
+        delay = self._retry_delay(job.attempts)
+        self._pending_retries.add(job.id)
+
+        async def _requeue() -> None:
+            await asyncio.sleep(delay)
+            self._pending_retries.discard(job.id)
+            await self.broker.publish(job.id)
+
+        task = asyncio.create_task(_requeue())
+        self._retries.add(task)
+        task.add_done_callback(self._retries.discard)
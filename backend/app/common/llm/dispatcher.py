@@ -0,0 +1,304 @@
+import asyncio
+import time
+from collections import deque
+from contextlib import asynccontextmanager, contextmanager
+from contextvars import ContextVar
+from typing import (
+    Any,
+    AsyncIterator,
+    Awaitable,
+    Callable,
+    Deque,
+    Dict,
+    Iterator,
+    List,
+    Optional,
+    TypeVar,
+)
+
+from app.common.llm.exception import LLMQueueFullError, LLMUserLimitError
+from app.common.llm.llm_client_repo import ILLMClientRepository
+from app.common.monitoring.metrics import (
+    increment_llm_request_rejected,
+    record_llm_queue_wait,
+    set_llm_queue_state,
+)
+
+T = TypeVar("T")
+
+# 사용자를 지정하지 않은 호출(배치 작업 등)이 함께 쓰는 몫
+SYSTEM_USER = "system"
+
+_llm_user: ContextVar[str] = ContextVar("llm_user", default=SYSTEM_USER)
+
+
+@contextmanager
+def llm_user(user_id: str) -> Iterator[None]:
+    """블록 안의 LLM 호출을 user_id 몫으로 대기열에 넣음 (DispatchedLLMClient)"""
+    token = _llm_user.set(user_id)
+    try:
+        yield
+    finally:
+        _llm_user.reset(token)
+
+
+def current_llm_user() -> str:
+    return _llm_user.get()
+
+
+class LLMDispatcher:
+    """LLM 호출 동시 실행 제한 및 대기열 (프로세스 내)
+
+    - 동시에 실행되는 LLM 호출을 ``max_concurrency`` 개로 제한
+    - 빈 슬롯이 없으면 최대 ``max_queue_size`` 개까지 대기, 넘치면 즉시 거절
+    - 사용자별 대기 수를 ``max_queued_per_user`` 로 제한하고,
+      슬롯은 대기 중인 사용자들에게 라운드 로빈으로 배분 (한 사용자가 독점하지 않도록)
+    """
+
+    def __init__(
+        self,
+        max_concurrency: int = 8,
+        max_queue_size: int = 100,
+        max_queued_per_user: int = 2,
+        queue_timeout: Optional[float] = 30.0,
+    ) -> None:
+        self.max_concurrency = max_concurrency
+        self.max_queue_size = max_queue_size
+        self.max_queued_per_user = max_queued_per_user
+        self.queue_timeout = queue_timeout
+
+        self._active = 0
+        self._queued = 0
+        self._waiters: Dict[str, Deque["asyncio.Future[None]"]] = {}
+        self._turns: Deque[str] = deque()  # 대기 중인 사용자 순번
+
+    @property
+    def active(self) -> int:
+        """실행 중인 호출 수"""
+        return self._active
+
+    @property
+    def queued(self) -> int:
+        """대기 중인 호출 수"""
+        return self._queued
+
+    async def run(
+        self,
+        user_id: str,
+        operation: str,
+        fn: Callable[[], Awaitable[T]],
+    ) -> T:
+        """슬롯을 얻은 뒤 fn 실행"""
+        async with self.slot(user_id, operation):
+            return await fn()
+
+    @asynccontextmanager
+    async def slot(self, user_id: str, operation: str) -> AsyncIterator[None]:
+        """블록 동안 슬롯 하나 점유 (스트리밍처럼 호출이 길게 이어지는 경우)"""
+        await self._acquire(user_id, operation)
+        try:
+            yield
+        finally:
+            self._release()
+
+    def try_acquire(self) -> bool:
+        """빈 슬롯이 있고 대기자가 없을 때만 바로 점유 (기다리지 않음)
+
+        헤지 시도처럼 없어도 되는 추가 호출용. 점유했으면 ``release()`` 로 반납한다.
+        """
+        if self._active < self.max_concurrency and self._queued == 0:
+            self._active += 1
+            self._report()
+            return True
+        return False
+
+    def release(self) -> None:
+        """``try_acquire`` 로 점유한 슬롯 반납"""
+        self._release()
+
+    async def _acquire(self, user_id: str, operation: str) -> None:
+        started = time.monotonic()
+        if self.try_acquire():
+            record_llm_queue_wait(operation, 0.0)
+            return
+
+        if self._queued >= self.max_queue_size:
+            increment_llm_request_rejected(operation, "queue_full")
+            raise LLMQueueFullError("LLM service is busy. Please try again later")
+
+        user_waiters = self._waiters.get(user_id)
+        if user_waiters is not None and len(user_waiters) >= self.max_queued_per_user:
+            increment_llm_request_rejected(operation, "user_limit")
+            raise LLMUserLimitError(
+                "Too many pending LLM requests. Please wait for them to finish"
+            )
+
+        waiter: "asyncio.Future[None]" = asyncio.get_running_loop().create_future()
+        if user_waiters is None:
+            user_waiters = self._waiters[user_id] = deque()
+            self._turns.append(user_id)
+        user_waiters.append(waiter)
+        self._queued += 1
+        self._report()
+
+        try:
+            await asyncio.wait_for(waiter, timeout=self.queue_timeout)
+        except (asyncio.TimeoutError, asyncio.CancelledError) as e:
+            if waiter.done() and not waiter.cancelled():
+                # 슬롯을 넘겨받은 직후 중단된 경우 다음 대기자에게 양보
+                self._release()
+            else:
+                self._discard(user_id, waiter)
+            if isinstance(e, asyncio.CancelledError):
+                raise
+            increment_llm_request_rejected(operation, "timeout")
+            raise LLMQueueFullError("Timed out waiting for the LLM service")
+
+        record_llm_queue_wait(operation, time.monotonic() - started)
+
+    def _release(self) -> None:
+        """슬롯 반납, 대기자가 있으면 다음 순번 사용자에게 그대로 넘김"""
+        while self._turns:
+            user_id = self._turns.popleft()
+            user_waiters = self._waiters[user_id]
+            waiter = user_waiters.popleft()
+            self._queued -= 1
+            if user_waiters:
+                self._turns.append(user_id)
+            else:
+                del self._waiters[user_id]
+
+            if not waiter.done():
+                waiter.set_result(None)
+                self._report()
+                return
+
+        self._active -= 1
+        self._report()
+
+    def _discard(self, user_id: str, waiter: "asyncio.Future[None]") -> None:
+        """대기열에서 빠진 대기자 정리 (타임아웃/취소)"""
+        user_waiters = self._waiters.get(user_id)
+        if user_waiters is None or waiter not in user_waiters:
+            return
+
+        user_waiters.remove(waiter)
+        self._queued -= 1
+        if not user_waiters:
+            del self._waiters[user_id]
+            self._turns.remove(user_id)
+        self._report()
+
+    def _report(self) -> None:
+        set_llm_queue_state(self._queued, self._active)
+
+
+class DispatchedLLMClient(ILLMClientRepository):
+    """LLM 제공자 호출마다 디스패처 슬롯을 하나씩 점유하는 데코레이터
+
+    응답 캐시(``CachedLLMClient``) 아래에 두어 캐시 적중은 슬롯을 기다리지 않고,
+    분할 생성처럼 한 요청이 여러 번 호출해도 호출마다 전역 제한과 사용자별 배분을 받는다.
+    사용자는 호출하는 쪽에서 ``llm_user`` 로 지정한다.
+    """
+
+    def __init__(self, client: ILLMClientRepository, dispatcher: LLMDispatcher) -> None:
+        self.client = client
+        self.dispatcher = dispatcher
+
+    def __getattr__(self, name: str) -> Any:
+        # model, temperature 등 구현체 속성은 그대로 노출 (캐시 키 등에서 사용)
+        if name == "client":
+            raise AttributeError(name)
+        return getattr(self.client, name)
+
+    async def generate_curriculum(
+        self,
+        goal: str,
+        period: int,
+        difficulty: str,
+        details: str,
+    ) -> Dict[str, Any]:
+        return await self.dispatcher.run(
+            current_llm_user(),
+            "generate_curriculum",
+            lambda: self.client.generate_curriculum(
+                goal=goal,
+                period=period,
+                difficulty=difficulty,
+                details=details,
+            ),
+        )
+
+    async def generate_curriculum_outline(
+        self,
+        goal: str,
+        period: int,
+        difficulty: str,
+        details: str,
+    ) -> Dict[str, Any]:
+        return await self.dispatcher.run(
+            current_llm_user(),
+            "generate_curriculum_outline",
+            lambda: self.client.generate_curriculum_outline(
+                goal=goal,
+                period=period,
+                difficulty=difficulty,
+                details=details,
+            ),
+        )
+
+    async def expand_curriculum_weeks(
+        self,
+        goal: str,
+        difficulty: str,
+        details: str,
+        outline: List[Dict[str, Any]],
+        start_week: int,
+        end_week: int,
+    ) -> Dict[str, Any]:
+        return await self.dispatcher.run(
+            current_llm_user(),
+            "expand_curriculum_weeks",
+            lambda: self.client.expand_curriculum_weeks(
+                goal=goal,
+                difficulty=difficulty,
+                details=details,
+                outline=outline,
+                start_week=start_week,
+                end_week=end_week,
+            ),
+        )
+
+    async def generate_curriculum_stream(
+        self,
+        goal: str,
+        period: int,
+        difficulty: str,
+        details: str,
+    ) -> AsyncIterator[str]:
+        """스트림이 끝날 때까지 슬롯 하나를 점유"""
+        async with self.dispatcher.slot(current_llm_user(), "generate_curriculum"):
+            async for chunk in self.client.generate_curriculum_stream(
+                goal=goal,
+                period=period,
+                difficulty=difficulty,
+                details=details,
+            ):
+                yield chunk
+
+    async def generate_feedback(
+        self,
+        lessons: List[str],
+        summary_content: str,
+    ) -> Dict[str, Any]:
+        return await self.dispatcher.run(
+            current_llm_user(),
+            "generate_feedback",
+            lambda: self.client.generate_feedback(
+                lessons=lessons,
+                summary_content=summary_content,
+            ),
+        )
+
+    async def close(self) -> None:
+        await self.client.close()
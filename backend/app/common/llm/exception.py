@@ -0,0 +1,20 @@
+class LLMQueueFullError(Exception):
+    """LLM 대기열이 가득 차 즉시 거절 (HTTP_503_SERVICE_UNAVAILABLE)"""
+
+    def __init__(self, message: str, retry_after: int = 5) -> None:
+        super().__init__(message)
+        self.retry_after = retry_after
+
+
+class LLMUserLimitError(LLMQueueFullError):
+    """사용자별 대기 한도 초과 (HTTP_429_TOO_MANY_REQUESTS)"""
+
+
+class LLMCircuitOpenError(LLMQueueFullError):
+    """LLM 제공자 장애로 서킷이 열려 즉시 거절 (HTTP_503_SERVICE_UNAVAILABLE)"""
+
+
+class LLMTimeoutError(Exception):
+    """LLM 호출이 마감 시간 안에 끝나지 않음"""
+
+    pass
@@ -1,14 +1,23 @@
-import json
 import logging
-from typing import Any, Dict, List, Optional
+from typing import Any, AsyncIterator, Dict, List, Optional
 
 from langchain_openai import ChatOpenAI
 from langchain.schema import HumanMessage, SystemMessage, BaseMessage
+from langchain_core.runnables import RunnableConfig
 
 from app.common.llm.llm_client_repo import ILLMClientRepository
-from app.common.llm.prompts.curriculum import CURRICULUM_GENERATION_PROMPT
-from app.common.llm.prompts.feedback import FEEDBACK_GENERATION_PROMPT
+from app.common.llm.prompts.curriculum import (
+    CURRICULUM_GENERATION_PROMPT,
+    CURRICULUM_OUTLINE_PROMPT,
+    CURRICULUM_PLANNER_ROLE,
+    CURRICULUM_WEEKS_PROMPT,
+    format_outline,
+)
+from app.common.llm.prompt_builder import get_token_counter
+from app.common.llm.prompts.feedback import build_feedback_prompt
 from app.common.llm.langfuse_helper import langfuse_manager
+from app.common.llm.structured_output import repair_json
+from app.common.llm.usage import track_llm_call
 from app.core.config import Settings, get_settings
 
 logger: logging.Logger = logging.getLogger(__name__)
@@ -16,42 +25,41 @@ logger: logging.Logger = logging.getLogger(__name__)
 
 class LangChainLLMClient(ILLMClientRepository):
     def __init__(
-        self, api_key: Optional[str] = None, model: str = "gpt-4o-mini"
+        self,
+        api_key: Optional[str] = None,
+        model: str = "gpt-4o-mini",
+        endpoint: Optional[str] = None,
     ) -> None:
         logger.info("🔥 LangChainLLMClient v3 초기화 시작")
 
         settings: Settings = get_settings()
         self.api_key: str = api_key or settings.llm_api_key
         self.model: str = model
-
-        logger.info(f"🔥 Langfuse v3 manager enabled: {langfuse_manager.is_enabled}")
-
-        # 콜백 리스트 준비
-        callbacks = []
-        if langfuse_manager.is_enabled:
-            callback_handler = langfuse_manager.callback_handler
-            if callback_handler:
-                callbacks.append(callback_handler)
-                logger.info(
-                    f"🔥 Langfuse v3 callback handler added: {type(callback_handler)}"
-                )
-            else:
-                logger.error("🔥 Langfuse v3 is enabled but callback handler is None!")
-        else:
-            logger.warning("🔥 Langfuse v3 is not enabled, no callback handler added")
+        self.temperature: float = 0.3
+        self.feedback_prompt_budget: int = settings.llm_feedback_prompt_budget
+        # LLM_ENDPOINT(.../chat/completions)가 있으면 해당 서버로 호출 (호환 서버, mock 등)
+        endpoint = endpoint or settings.llm_endpoint
+        self.base_url: Optional[str] = (
+            endpoint.removesuffix("/chat/completions") or None
+        )
 
         # LangChain ChatOpenAI 클라이언트 초기화
         self.llm = ChatOpenAI(
             model=self.model,
             api_key=self.api_key,
-            temperature=0.3,
+            base_url=self.base_url,
+            temperature=self.temperature,
             max_tokens=1200,  # model_kwargs 대신 직접 설정 # type: ignore
-            callbacks=callbacks,
+            timeout=settings.llm_curriculum_timeout,
+            max_retries=0,  # 재시도는 ResilientLLMClient 가 마감 시간 안에서 처리
+            stream_usage=True,  # 스트리밍 응답에도 토큰 사용량 포함
         )
 
-        logger.info(
-            f"🔥 LangChain v3 client initialized with {len(callbacks)} callbacks"
-        )
+        logger.info("🔥 LangChain v3 client initialized")
+
+    def _run_config(self) -> RunnableConfig:
+        """호출별 실행 설정 (샘플링된 호출에만 Langfuse 콜백)"""
+        return {"callbacks": langfuse_manager.callbacks()}
 
     def _create_messages(self, prompt: str, role_content: str) -> List[BaseMessage]:
         """메시지 생성"""
@@ -61,29 +69,21 @@ class LangChainLLMClient(ILLMClientRepository):
         ]
 
     def _parse_json_response(self, response_text: str) -> Dict[str, Any]:
-        """JSON 응답 파싱"""
-        cleaned = response_text.strip()
-        if cleaned.startswith("```json"):
-            cleaned = cleaned[7:]
-        if cleaned.endswith("```"):
-            cleaned = cleaned[:-3]
-
+        """JSON 응답 파싱 (코드 블록, 앞뒤 설명, 잘린 배열 등은 고쳐서 파싱)"""
         try:
-            return json.loads(cleaned.strip())
-        except json.JSONDecodeError as e:
+            return repair_json(response_text)
+        except ValueError:
             logger.error(f"Failed to parse LLM response: {response_text}")
-            raise ValueError(f"Invalid JSON response from LLM: {e}")
+            raise
 
-    async def generate_curriculum(
+    def _create_curriculum_messages(
         self,
         goal: str,
         period: int,
         difficulty: str,
         details: str,
-    ) -> Dict[str, Any]:
-        """커리큘럼 생성"""
-        logger.info("🔥 Starting curriculum generation with LangChain v3")
-
+    ) -> List[BaseMessage]:
+        """커리큘럼 생성 메시지"""
         prompt: str = CURRICULUM_GENERATION_PROMPT.format(
             goal=goal,
             period=period,
@@ -102,22 +102,47 @@ class LangChainLLMClient(ILLMClientRepository):
             "else, generate as request"
         )
 
-        messages = self._create_messages(prompt, role_content)
+        return self._create_messages(prompt, role_content)
+
+    async def generate_curriculum(
+        self,
+        goal: str,
+        period: int,
+        difficulty: str,
+        details: str,
+    ) -> Dict[str, Any]:
+        """커리큘럼 생성"""
+        logger.info("🔥 Starting curriculum generation with LangChain v3")
+
+        messages = self._create_curriculum_messages(goal, period, difficulty, details)
 
         logger.info(
             f"🔥 Generating curriculum - Goal: {goal}, Period: {period}, Difficulty: {difficulty}"
         )
-        logger.info(f"🔥 Langfuse v3 enabled: {langfuse_manager.is_enabled}")
 
         try:
             logger.info("🔥 Calling LLM with LangChain v3...")
 
-            # v3에서는 콜백핸들러가 자동으로 모든 추적 처리
-            response = await self.llm.ainvoke(messages)
+            # 샘플링된 호출은 Langfuse 콜백이 추적 (_run_config)
+            result = await self._invoke_json("generate_curriculum", messages)
 
             logger.info("🔥 LLM call completed")
+            logger.info("🔥 Curriculum generation completed successfully")
+
+            return result
+
+        except Exception as e:
+            logger.error(f"🔥 Curriculum generation failed: {e}")
+            raise
+
+    async def _invoke_json(
+        self, operation: str, messages: List[BaseMessage]
+    ) -> Dict[str, Any]:
+        """LLM 호출 후 JSON 응답 파싱 (지연/토큰/비용 메트릭 기록)"""
+        with track_llm_call(operation, self.model) as call:
+            response = await self.llm.ainvoke(messages, config=self._run_config())
+            call.add_langchain_usage(getattr(response, "usage_metadata", None))
 
-            # response.content 처리
             response_text: str
             if isinstance(response.content, str):
                 response_text = response.content
@@ -125,16 +150,80 @@ class LangChainLLMClient(ILLMClientRepository):
                 response_text = str(response.content[0]) if response.content else ""
             else:
                 response_text = str(response.content)
+            return self._parse_json_response(response_text)
 
-            result = self._parse_json_response(response_text)
+    async def generate_curriculum_outline(
+        self,
+        goal: str,
+        period: int,
+        difficulty: str,
+        details: str,
+    ) -> Dict[str, Any]:
+        """커리큘럼 개요 생성 (분할 생성 1단계)"""
+        prompt = CURRICULUM_OUTLINE_PROMPT.format(
+            goal=goal,
+            period=period,
+            difficulty=difficulty,
+            details=details,
+        )
+        messages = self._create_messages(prompt, CURRICULUM_PLANNER_ROLE)
 
-            logger.info("🔥 Curriculum generation completed successfully")
-            logger.info(f"🔥 Response length: {len(response_text)}")
+        try:
+            return await self._invoke_json("generate_curriculum_outline", messages)
+        except Exception as e:
+            logger.error(f"🔥 Curriculum outline generation failed: {e}")
+            raise
 
-            return result
+    async def expand_curriculum_weeks(
+        self,
+        goal: str,
+        difficulty: str,
+        details: str,
+        outline: List[Dict[str, Any]],
+        start_week: int,
+        end_week: int,
+    ) -> Dict[str, Any]:
+        """개요 중 일부 주차의 레슨 생성 (분할 생성 2단계)"""
+        prompt = CURRICULUM_WEEKS_PROMPT.format(
+            goal=goal,
+            difficulty=difficulty,
+            details=details,
+            outline=format_outline(outline),
+            start_week=start_week,
+            end_week=end_week,
+        )
+        messages = self._create_messages(prompt, CURRICULUM_PLANNER_ROLE)
 
+        try:
+            return await self._invoke_json("expand_curriculum_weeks", messages)
         except Exception as e:
-            logger.error(f"🔥 Curriculum generation failed: {e}")
+            logger.error(
+                f"🔥 Curriculum weeks {start_week}-{end_week} generation failed: {e}"
+            )
+            raise
+
+    async def generate_curriculum_stream(
+        self,
+        goal: str,
+        period: int,
+        difficulty: str,
+        details: str,
+    ) -> AsyncIterator[str]:
+        """커리큘럼 생성 (토큰 스트리밍)"""
+        logger.info("🔥 Starting streaming curriculum generation with LangChain v3")
+
+        messages = self._create_curriculum_messages(goal, period, difficulty, details)
+
+        try:
+            with track_llm_call("generate_curriculum_stream", self.model) as call:
+                async for chunk in self.llm.astream(
+                    messages, config=self._run_config()
+                ):
+                    call.add_langchain_usage(chunk.usage_metadata)
+                    if isinstance(chunk.content, str) and chunk.content:
+                        yield chunk.content
+        except Exception as e:
+            logger.error(f"🔥 Streaming curriculum generation failed: {e}")
             raise
 
     async def generate_feedback(
@@ -144,60 +233,27 @@ class LangChainLLMClient(ILLMClientRepository):
     ) -> Dict[str, Any]:
         """피드백 생성"""
         logger.info("🔥 Starting feedback generation with LangChain v3")
-        lessons_str = ", ".join(lessons)
-
-        def _truncate(text: str, limit: int = 1200) -> str:
-            text = (text or "").strip()
-            return text if len(text) <= limit else (text[:limit] + " …(truncated)")
-
-        summary_slim = _truncate(summary_content, 1200)
-
-        role_content = (
-            "You are a learning feedback generator.\n"
-            "Follow EXACTLY the FEEDBACK_GENERATION_PROMPT rules.\n"
-            "Output ONLY a single valid JSON object with the required keys.\n"
-            "No preface, no suffix, no code fences, no extra text.\n"
-            "If the summary lacks detail, explicitly state that in the comment.\n"
-            "Do NOT invent or infer facts that are not present in the summary.\n"
-            "All direct quotes MUST come verbatim from the summary.\n"
-            "When evidence is insufficient, write '설명이 부족합니다' explicitly and avoid conjecture.\n"
-            "\n"
-            "=== CONTEXT (USE VERBATIM, DO NOT FABRICATE) ===\n"
-            f"Lessons: {lessons_str}\n"
-            "Summary:\n"
-            f"{summary_slim}\n"
-            "=== END CONTEXT ===\n"
+        built = build_feedback_prompt(
+            lessons,
+            summary_content,
+            budget=self.feedback_prompt_budget,
+            counter=get_token_counter(self.model),
         )
-
-        prompt = FEEDBACK_GENERATION_PROMPT.format(
-            lessons=", ".join(lessons), summary=summary_content
-        )
-
-        messages = self._create_messages(prompt, role_content)
+        messages = self._create_messages(built.user, built.system)
 
         logger.info(
-            f"🔥 Generating feedback - Lessons count: {len(lessons)}, Summary length: {len(summary_content)}"
+            f"🔥 Generating feedback - Lessons count: {len(lessons)}, "
+            f"Summary length: {len(summary_content)}, Prompt tokens: {built.tokens}"
+            + (f" (trimmed: {', '.join(built.trimmed)})" if built.trimmed else "")
         )
 
         try:
             logger.info("🔥 Calling LLM with LangChain v3...")
 
-            # v3에서는 콜백핸들러가 자동으로 모든 추적 처리
-            response = await self.llm.ainvoke(messages)
+            # 샘플링된 호출은 Langfuse 콜백이 추적 (_run_config)
+            result = await self._invoke_json("generate_feedback", messages)
 
             logger.info("🔥 LLM call completed")
-
-            # response.content 처리
-            response_text: str
-            if isinstance(response.content, str):
-                response_text = response.content
-            elif isinstance(response.content, list):
-                response_text = str(response.content[0]) if response.content else ""
-            else:
-                response_text = str(response.content)
-
-            result = self._parse_json_response(response_text)
-
             logger.info("🔥 Feedback generation completed successfully")
             return result
 
@@ -1,125 +1,159 @@
+import asyncio
 import logging
-from typing import Optional
 import os
-from langfuse.langchain import CallbackHandler
+import random
+from typing import Any, Callable, List, Optional, Tuple
+
+from app.core.config import Settings, get_settings
 
 logger = logging.getLogger(__name__)
 
+# 종료 시 진행 중인 초기화(연결 확인)를 기다리는 최대 시간 (초)
+INIT_SHUTDOWN_WAIT = 5.0
+
 
 class LangfuseManager:
-    """Langfuse v3 연동 관리 클래스"""
+    """Langfuse v3 연동 관리 클래스
+
+    import 시점에는 아무 것도 하지 않는다. 핸들러 생성과 연결 확인은 네트워크를
+    타므로 ``start()`` 가 백그라운드 태스크(스레드)에서 진행하고, 준비되기 전의
+    LLM 호출은 추적 없이 그대로 진행한다.
+
+    - 호출마다 ``sample_rate`` 확률로만 콜백을 붙인다 (``callbacks()``)
+    - 전송은 Langfuse(OpenTelemetry) 배치 프로세서의 크기 제한 큐를 거쳐
+      별도 스레드에서 이뤄지므로 요청 경로에서 기다리지 않는다
+    """
 
     _instance: Optional["LangfuseManager"] = None
-    _callback_handler: Optional[CallbackHandler] = None
 
     def __new__(cls) -> "LangfuseManager":
         if cls._instance is None:
             cls._instance = super().__new__(cls)
         return cls._instance
 
-    def __init__(self):
-        os.environ["LANGFUSE_LOG_LEVEL"] = "WARNING"
-        os.environ["LANGFUSE_LOG_DIR"] = "/workspace/backend/app/logs"
-
+    def __init__(self) -> None:
         if hasattr(self, "_initialized"):
             return
 
         self._initialized = True
-
-        # 🔥 환경변수 검증
-        secret_key = os.getenv("LANGFUSE_SECRET_KEY")
-        public_key = os.getenv("LANGFUSE_PUBLIC_KEY")
-        host = os.getenv("LANGFUSE_HOST", "https://cloud.langfuse.com")
-
-        logger.info(f"🔥 Langfuse Host: {host}")
-        logger.info(f"🔥 Secret Key Present: {bool(secret_key)}")
-        logger.info(f"🔥 Public Key Present: {bool(public_key)}")
-
-        if secret_key:
-            logger.info(
-                f"🔥 Secret Key Format: {secret_key[:10]}...{secret_key[-4:] if len(secret_key) > 14 else ''}"
-            )
-        if public_key:
-            logger.info(
-                f"🔥 Public Key Format: {public_key[:10]}...{public_key[-4:] if len(public_key) > 14 else ''}"
-            )
-
-        # 키 형식 검증
-        if secret_key and not secret_key.startswith("sk-lf-"):
-            logger.error("🔥 Secret key should start with 'sk-lf-'")
-            return
-
-        if public_key and not public_key.startswith("pk-lf-"):
-            logger.error("🔥 Public key should start with 'pk-lf-'")
-            return
-
-        # Langfuse v3는 환경변수만 있으면 자동 초기화
-        if secret_key and public_key:
-            try:
-                logger.info("🔥 Creating Langfuse v3 callback handler...")
-
-                # 환경변수 설정 확인
-                os.environ["LANGFUSE_SECRET_KEY"] = secret_key
-                os.environ["LANGFUSE_PUBLIC_KEY"] = public_key
-                os.environ["LANGFUSE_HOST"] = host
-
-                # v3에서는 환경변수만 있으면 자동으로 연결
-                self._callback_handler = CallbackHandler()
-
-                logger.info("🔥 Langfuse v3 initialized successfully")
-                logger.info(
-                    f"🔥 Callback handler created: {type(self._callback_handler)}"
-                )
-
-                # 추가 설정 로깅
-                logger.info(f"🔥 Using host: {host}")
-
-            except Exception as e:
-                logger.error(f"🔥 Failed to initialize Langfuse v3: {e}")
-                logger.exception("🔥 Langfuse v3 initialization error details:")
-                self._callback_handler = None
-        else:
-            logger.warning("🔥 Langfuse keys not provided or invalid format")
+        self._client: Any = None
+        self._callback_handler: Any = None
+        self._init_task: Optional[asyncio.Task] = None
+        self._closed = False
+        self.sample_rate = 1.0
+        self.random: Callable[[], float] = random.random
 
     @property
-    def callback_handler(self) -> Optional[CallbackHandler]:
-        """콜백 핸들러 반환"""
+    def callback_handler(self) -> Any:
+        """콜백 핸들러 반환 (초기화 전이거나 비활성화면 None)"""
         return self._callback_handler
 
     @property
     def is_enabled(self) -> bool:
-        enabled = self._callback_handler is not None
-        return enabled
-
-    def test_connection(self):
-        """연결 테스트"""
-        if not self.is_enabled:
-            logger.warning("🔥 Langfuse not enabled for connection test")
-            return False
+        return self._callback_handler is not None
+
+    def callbacks(self) -> List[Any]:
+        """이번 LLM 호출에 붙일 콜백 (샘플링에서 빠지면 빈 목록)"""
+        handler = self._callback_handler
+        if handler is None or self.random() >= self.sample_rate:
+            return []
+        return [handler]
+
+    def start(self, settings: Optional[Settings] = None) -> None:
+        """백그라운드에서 초기화 시작 (기다리지 않음)"""
+        if self._init_task is not None:
+            return
+        self._closed = False
+        self._init_task = asyncio.create_task(
+            self._initialize(settings or get_settings())
+        )
 
+    async def _initialize(self, settings: Settings) -> None:
         try:
-            # 간단한 테스트 이벤트 생성
-            from langfuse import Langfuse
-
-            client = Langfuse()
-
-            trace = client.trace(name="connection_test")  # type: ignore
-            trace.event(name="test_event", metadata={"test": True})
-            client.flush()
+            result = await asyncio.to_thread(self._setup, settings)
+        except Exception as e:
+            logger.error(f"🔥 Failed to initialize Langfuse v3: {e}")
+            return
+        if result is None:
+            return
 
-            logger.info("🔥 Connection test successful")
-            return True
+        client, handler = result
+        if self._closed:
+            # 연결 확인 중에 종료됐으면 만든 클라이언트를 붙이지 않고 닫는다
+            try:
+                await asyncio.to_thread(client.shutdown)
+            except Exception as e:
+                logger.error(f"🔥 Failed to close Langfuse: {e}")
+            return
 
-        except Exception as e:
-            logger.error(f"🔥 Connection test failed: {e}")
-            return False
+        self.sample_rate = settings.langfuse_sample_rate
+        self._client = client
+        self._callback_handler = handler
+        logger.info(
+            f"🔥 Langfuse v3 initialized ({settings.langfuse_host}, "
+            f"sample rate {self.sample_rate})"
+        )
+
+    def _setup(self, settings: Settings) -> Optional[Tuple[Any, Any]]:
+        """Langfuse 클라이언트/핸들러 생성 및 연결 확인 (스레드에서 실행)
+
+        매니저 상태는 건드리지 않고 (클라이언트, 핸들러)를 돌려준다. 비활성화면 None.
+        """
+        secret_key = settings.langfuse_secret_key
+        public_key = settings.langfuse_public_key
+
+        if not (secret_key and public_key):
+            logger.warning("🔥 Langfuse keys not provided, tracing disabled")
+            return None
+        if not secret_key.startswith("sk-lf-"):
+            logger.error("🔥 Secret key should start with 'sk-lf-'")
+            return None
+        if not public_key.startswith("pk-lf-"):
+            logger.error("🔥 Public key should start with 'pk-lf-'")
+            return None
+
+        os.environ.setdefault("LANGFUSE_LOG_LEVEL", "WARNING")
+        # 전송 대기 span 수 상한, 넘치면 버림 (OpenTelemetry BatchSpanProcessor)
+        os.environ.setdefault(
+            "OTEL_BSP_MAX_QUEUE_SIZE", str(settings.langfuse_max_queue_size)
+        )
+
+        from langfuse import Langfuse
+        from langfuse.langchain import CallbackHandler
+
+        client = Langfuse(
+            public_key=public_key,
+            secret_key=secret_key,
+            host=settings.langfuse_host,
+            flush_at=settings.langfuse_flush_at,
+            flush_interval=settings.langfuse_flush_interval,
+        )
+        if not client.auth_check():
+            logger.error("🔥 Langfuse auth check failed, tracing disabled")
+            client.shutdown()
+            return None
+
+        return client, CallbackHandler(public_key=public_key)
+
+    async def shutdown(self) -> None:
+        """남은 span 전송 후 종료
+
+        초기화 스레드는 취소할 수 없으므로 취소하지 않고 잠시 기다린다. 그래도 끝나지
+        않으면 초기화가 끝나는 쪽에서 ``_closed`` 를 보고 만든 클라이언트를 닫는다.
+        """
+        self._closed = True
+        if self._init_task is not None and not self._init_task.done():
+            await asyncio.wait({self._init_task}, timeout=INIT_SHUTDOWN_WAIT)
+        self._init_task = None
+
+        client, self._client = self._client, None
+        self._callback_handler = None
+        if client is not None:
+            try:
+                await asyncio.to_thread(client.shutdown)
+            except Exception as e:
+                logger.error(f"🔥 Failed to flush Langfuse: {e}")
 
 
-# 전역 인스턴스
-logger.info("🔥 Creating Langfuse v3 manager instance...")
+# 전역 인스턴스 (초기화는 lifespan 에서 백그라운드로)
 langfuse_manager = LangfuseManager()
-logger.info(f"🔥 Langfuse v3 manager created, enabled: {langfuse_manager.is_enabled}")
-
-# 연결 테스트 실행
-if langfuse_manager.is_enabled:
-    langfuse_manager.test_connection()
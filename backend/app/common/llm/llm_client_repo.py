@@ -1,5 +1,6 @@
+import json
 from abc import ABCMeta, abstractmethod
-from typing import Any, Dict, List
+from typing import Any, AsyncIterator, Dict, List
 
 
 class ILLMClientRepository(metaclass=ABCMeta):
@@ -13,6 +14,49 @@ class ILLMClientRepository(metaclass=ABCMeta):
     ) -> Dict[str, Any]:
         pass
 
+    @abstractmethod
+    async def generate_curriculum_outline(
+        self,
+        goal: str,
+        period: int,
+        difficulty: str,
+        details: str,
+    ) -> Dict[str, Any]:
+        """커리큘럼 개요 생성 (title + 주차별 제목만 담은 schedule)"""
+        pass
+
+    @abstractmethod
+    async def expand_curriculum_weeks(
+        self,
+        goal: str,
+        difficulty: str,
+        details: str,
+        outline: List[Dict[str, Any]],
+        start_week: int,
+        end_week: int,
+    ) -> Dict[str, Any]:
+        """개요 중 start_week~end_week 주차의 레슨 생성 (schedule)"""
+        pass
+
+    async def generate_curriculum_stream(
+        self,
+        goal: str,
+        period: int,
+        difficulty: str,
+        details: str,
+    ) -> AsyncIterator[str]:
+        """커리큘럼 생성 응답을 텍스트 조각 단위로 스트리밍
+
+        스트리밍을 지원하지 않는 구현체는 완성된 응답을 한 번에 내보낸다.
+        """
+        result = await self.generate_curriculum(
+            goal=goal,
+            period=period,
+            difficulty=difficulty,
+            details=details,
+        )
+        yield json.dumps(result, ensure_ascii=False)
+
     @abstractmethod
     async def generate_feedback(
         self,
@@ -20,3 +64,7 @@ class ILLMClientRepository(metaclass=ABCMeta):
         summary_content: str,
     ) -> Dict[str, Any]:
         pass
+
+    async def close(self) -> None:
+        """보유한 연결 등 리소스 정리 (필요한 구현체만 재정의)"""
+        return None
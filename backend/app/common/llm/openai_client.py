@@ -1,35 +1,87 @@
 import json
 import logging
-from typing import Any, Dict, List, Optional
+from typing import Any, AsyncIterator, Dict, List, Optional, Tuple
 
 import aiohttp
 from app.common.llm.llm_client_repo import ILLMClientRepository
-from app.common.llm.prompts.curriculum import CURRICULUM_GENERATION_PROMPT
-from app.common.llm.prompts.feedback import FEEDBACK_GENERATION_PROMPT
+from app.common.llm.prompts.curriculum import (
+    CURRICULUM_GENERATION_PROMPT,
+    CURRICULUM_OUTLINE_PROMPT,
+    CURRICULUM_PLANNER_ROLE,
+    CURRICULUM_WEEKS_PROMPT,
+    format_outline,
+)
+from app.common.llm.prompt_builder import get_token_counter
+from app.common.llm.prompts.feedback import build_feedback_prompt
+from app.common.llm.structured_output import repair_json
+from app.common.llm.usage import LLMCall, track_llm_call
 from app.core.config import Settings, get_settings
 
 logger: logging.Logger = logging.getLogger(__name__)
 
+DEFAULT_ENDPOINT = "https://api.openai.com/v1/chat/completions"
+
 
 class OpenAILLMClient(ILLMClientRepository):
     def __init__(
-        self, api_key: Optional[str] = None, model: str = "gpt-4o-mini"
+        self,
+        api_key: Optional[str] = None,
+        model: str = "gpt-4o-mini",
+        endpoint: Optional[str] = None,
+        pool_limit: Optional[int] = None,
+        pool_limit_per_host: Optional[int] = None,
+        keepalive_timeout: Optional[float] = None,
     ) -> None:
 
         settings: Settings = get_settings()
         self.api_key: str = api_key or settings.llm_api_key
         self.model: str = model
-        self.endpoint = "https://api.openai.com/v1/chat/completions"
+        self.temperature: float = 0.3  # 저무작위성
+        self.endpoint = endpoint or settings.llm_endpoint or DEFAULT_ENDPOINT
+        # 긴 커리큘럼 생성도 제공자 장애 시 무한정 붙잡혀 있지 않도록 상한 설정
+        self.curriculum_timeout = settings.llm_curriculum_timeout
+        self.feedback_prompt_budget = settings.llm_feedback_prompt_budget
 
-    async def _make_request(
-        self,
-        prompt: str,
-        role_content: str,
-        max_tokens: int = 1200,
-        timeout: float | None = 10.0,
-    ) -> str:
-        """OpenAI API 요청"""
-        payload: Dict[str, Any] = {
+        # 연결 풀 설정 (세션은 첫 요청 시 생성해 계속 재사용)
+        self.pool_limit = pool_limit or settings.llm_pool_limit
+        self.pool_limit_per_host = (
+            pool_limit_per_host or settings.llm_pool_limit_per_host
+        )
+        self.keepalive_timeout = keepalive_timeout or settings.llm_keepalive_timeout
+        self._session: Optional[aiohttp.ClientSession] = None
+
+    def _get_session(self) -> aiohttp.ClientSession:
+        """연결 풀을 공유하는 세션 반환
+
+        요청마다 세션을 만들면 매번 DNS 조회와 TCP/TLS 핸드셰이크가 발생하므로
+        keep-alive 연결을 재사용하는 세션 하나를 클라이언트가 소유한다.
+        """
+        if self._session is None or self._session.closed:
+            connector = aiohttp.TCPConnector(
+                limit=self.pool_limit,
+                limit_per_host=self.pool_limit_per_host,
+                keepalive_timeout=self.keepalive_timeout,
+                ttl_dns_cache=300,
+            )
+            self._session = aiohttp.ClientSession(
+                connector=connector,
+                headers={
+                    "Authorization": f"Bearer {self.api_key}",
+                    "Content-Type": "application/json",
+                },
+            )
+        return self._session
+
+    async def close(self) -> None:
+        """세션 및 연결 풀 정리"""
+        if self._session is not None and not self._session.closed:
+            await self._session.close()
+        self._session = None
+
+    def _build_payload(
+        self, prompt: str, role_content: str, max_tokens: int
+    ) -> Dict[str, Any]:
+        return {
             "model": self.model,
             "messages": [
                 {
@@ -42,47 +94,102 @@ class OpenAILLMClient(ILLMClientRepository):
                 },
             ],
             "max_tokens": max_tokens,
-            "temperature": 0.3,  # 저무작위성
+            "temperature": self.temperature,
         }
 
-        headers: Dict[str, str] = {
-            "Authorization": f"Bearer {self.api_key}",
-            "Content-Type": "application/json",
-        }
+    async def _make_request(
+        self,
+        prompt: str,
+        role_content: str,
+        max_tokens: int = 1200,
+        timeout: float | None = 10.0,
+        call: Optional[LLMCall] = None,
+    ) -> str:
+        """OpenAI API 요청"""
+        payload = self._build_payload(prompt, role_content, max_tokens)
 
-        async with aiohttp.ClientSession(
-            timeout=aiohttp.ClientTimeout(total=timeout)
-        ) as session:
-            async with session.post(
-                self.endpoint, json=payload, headers=headers
-            ) as response:
-                response.raise_for_status()
-                data = await response.json()
-                return data["choices"][0]["message"]["content"]
+        async with self._get_session().post(
+            self.endpoint,
+            json=payload,
+            timeout=aiohttp.ClientTimeout(total=timeout),
+        ) as response:
+            response.raise_for_status()
+            data = await response.json()
+            if call is not None:
+                call.add_openai_usage(data.get("usage"))
+            return data["choices"][0]["message"]["content"]
 
-    def _parse_json_response(self, response_text: str) -> Dict[str, Any]:
-        """JSON 응답 파싱"""
-        # 마크다운 코드 블록 제거
-        cleaned = response_text.strip()
-        if cleaned.startswith("```json"):
-            cleaned = cleaned[7:]
-        if cleaned.endswith("```"):
-            cleaned = cleaned[:-3]
+    async def _request_json(
+        self,
+        operation: str,
+        prompt: str,
+        role_content: str,
+        max_tokens: int = 1200,
+        timeout: float | None = 10.0,
+    ) -> Dict[str, Any]:
+        """OpenAI API 요청 후 JSON 응답 파싱 (지연/토큰/비용 메트릭 기록)"""
+        with track_llm_call(operation, self.model) as call:
+            response_text = await self._make_request(
+                prompt=prompt,
+                role_content=role_content,
+                max_tokens=max_tokens,
+                timeout=timeout,
+                call=call,
+            )
+            return self._parse_json_response(response_text)
 
+    async def _stream_request(
+        self,
+        prompt: str,
+        role_content: str,
+        max_tokens: int = 1200,
+        read_timeout: float | None = 30.0,
+        call: Optional[LLMCall] = None,
+    ) -> AsyncIterator[str]:
+        """OpenAI API 스트리밍 요청 (SSE 응답의 delta 텍스트를 차례로 반환)"""
+        payload = self._build_payload(prompt, role_content, max_tokens)
+        payload["stream"] = True
+        # 마지막 조각에 토큰 사용량 포함
+        payload["stream_options"] = {"include_usage": True}
+
+        async with self._get_session().post(
+            self.endpoint,
+            json=payload,
+            # 전체 시간 대신 조각 사이 대기 시간만 제한
+            timeout=aiohttp.ClientTimeout(total=None, sock_read=read_timeout),
+        ) as response:
+            response.raise_for_status()
+            async for raw_line in response.content:
+                line = raw_line.decode("utf-8").strip()
+                if not line.startswith("data:"):
+                    continue
+                data = line[len("data:") :].strip()
+                if data == "[DONE]":
+                    break
+                event = json.loads(data)
+                if call is not None:
+                    call.add_openai_usage(event.get("usage"))
+                choices = event.get("choices") or [{}]
+                content = (choices[0].get("delta") or {}).get("content")
+                if content:
+                    yield content
+
+    def _parse_json_response(self, response_text: str) -> Dict[str, Any]:
+        """JSON 응답 파싱 (코드 블록, 앞뒤 설명, 잘린 배열 등은 고쳐서 파싱)"""
         try:
-            return json.loads(cleaned.strip())
-        except json.JSONDecodeError as e:
+            return repair_json(response_text)
+        except ValueError:
             logger.error(f"Failed to parse LLM response: {response_text}")
-            raise ValueError(f"Invalid JSON response from LLM: {e}")
+            raise
 
-    async def generate_curriculum(
+    def _build_curriculum_prompt(
         self,
         goal: str,
         period: int,
         difficulty: str,
         details: str,
-    ) -> Dict[str, Any]:
-
+    ) -> Tuple[str, str]:
+        """커리큘럼 생성 (prompt, role_content)"""
         prompt: str = CURRICULUM_GENERATION_PROMPT.format(
             goal=goal,
             period=period,
@@ -100,13 +207,89 @@ class OpenAILLMClient(ILLMClientRepository):
             "if request for Computer Science, refer to OSSU curriculum "
             "else, generate as request"
         )
+        return prompt, role_content
+
+    async def generate_curriculum(
+        self,
+        goal: str,
+        period: int,
+        difficulty: str,
+        details: str,
+    ) -> Dict[str, Any]:
 
-        response_text = await self._make_request(
+        prompt, role_content = self._build_curriculum_prompt(
+            goal, period, difficulty, details
+        )
+        return await self._request_json(
+            "generate_curriculum",
             prompt=prompt,
             role_content=role_content,
-            timeout=None,
+            timeout=self.curriculum_timeout,
+        )
+
+    async def generate_curriculum_outline(
+        self,
+        goal: str,
+        period: int,
+        difficulty: str,
+        details: str,
+    ) -> Dict[str, Any]:
+
+        prompt = CURRICULUM_OUTLINE_PROMPT.format(
+            goal=goal,
+            period=period,
+            difficulty=difficulty,
+            details=details,
+        )
+        return await self._request_json(
+            "generate_curriculum_outline",
+            prompt=prompt,
+            role_content=CURRICULUM_PLANNER_ROLE,
+            max_tokens=600,
+            timeout=self.curriculum_timeout,
         )
-        return self._parse_json_response(response_text)
+
+    async def expand_curriculum_weeks(
+        self,
+        goal: str,
+        difficulty: str,
+        details: str,
+        outline: List[Dict[str, Any]],
+        start_week: int,
+        end_week: int,
+    ) -> Dict[str, Any]:
+
+        prompt = CURRICULUM_WEEKS_PROMPT.format(
+            goal=goal,
+            difficulty=difficulty,
+            details=details,
+            outline=format_outline(outline),
+            start_week=start_week,
+            end_week=end_week,
+        )
+        return await self._request_json(
+            "expand_curriculum_weeks",
+            prompt=prompt,
+            role_content=CURRICULUM_PLANNER_ROLE,
+            timeout=self.curriculum_timeout,
+        )
+
+    async def generate_curriculum_stream(
+        self,
+        goal: str,
+        period: int,
+        difficulty: str,
+        details: str,
+    ) -> AsyncIterator[str]:
+
+        prompt, role_content = self._build_curriculum_prompt(
+            goal, period, difficulty, details
+        )
+        with track_llm_call("generate_curriculum_stream", self.model) as call:
+            async for chunk in self._stream_request(
+                prompt=prompt, role_content=role_content, call=call
+            ):
+                yield chunk
 
     async def generate_feedback(
         self,
@@ -114,19 +297,15 @@ class OpenAILLMClient(ILLMClientRepository):
         summary_content: str,
     ) -> Dict[str, Any]:
 
-        prompt = FEEDBACK_GENERATION_PROMPT.format(
-            lessons=", ".join(lessons), summary=summary_content
+        built = build_feedback_prompt(
+            lessons,
+            summary_content,
+            budget=self.feedback_prompt_budget,
+            counter=get_token_counter(self.model),
         )
-        role_content: str = (
-            "You are a learning feedback generator. "
-            "Output *only* valid JSON with exactly `comment` (string) "
-            "Generate in Korean "
-            "no markdown, no explanations, nothing else "
-            "and `score` (float 0–10). No other keys or markdown."
-        )
-        response_text = await self._make_request(
-            prompt=prompt,
-            role_content=role_content,
+        return await self._request_json(
+            "generate_feedback",
+            prompt=built.user,
+            role_content=built.system,
             timeout=10.0,
         )
-        return self._parse_json_response(response_text)
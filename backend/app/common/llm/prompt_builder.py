@@ -0,0 +1,198 @@
+import logging
+import math
+import re
+import threading
+from dataclasses import dataclass, field
+from functools import lru_cache
+from typing import Any, List, Optional
+
+logger = logging.getLogger(__name__)
+
+_ASCII_RUN = re.compile(r"[\x00-\x7f]+")
+TRIM_MARKER = " …(생략)"
+SECTION_SEPARATOR = "\n\n"
+
+
+def estimate_tokens(text: str) -> int:
+    """토크나이저 없이 토큰 수 추정 (실제보다 크게 잡는 쪽)
+
+    영문/숫자/기호는 4글자당 1토큰, 한글 등 비 ASCII 문자는 글자당 1토큰으로 계산한다.
+    """
+    ascii_tokens = sum(math.ceil(len(run) / 4) for run in _ASCII_RUN.findall(text))
+    return ascii_tokens + len(_ASCII_RUN.sub("", text))
+
+
+class TokenCounter:
+    """모델 토크나이저(tiktoken) 기반 토큰 수 계산
+
+    인코딩 파일은 처음 쓸 때 내려받으므로 요청 처리 중에 기다리지 않도록 별도 스레드에서
+    불러오고, 준비되기 전이나 불러오지 못하면 ``estimate_tokens`` 로 계산한다.
+    ``model`` 이 None 이면 항상 추정치를 쓴다.
+    """
+
+    def __init__(self, model: Optional[str] = "gpt-4o-mini") -> None:
+        self.model = model
+        self._encoding: Any = None
+        self._loading = False
+        self._lock = threading.Lock()
+
+    def _load(self) -> None:
+        try:
+            import tiktoken
+
+            self._encoding = tiktoken.encoding_for_model(self.model or "")
+        except Exception as e:
+            logger.warning(f"Tokenizer for {self.model} unavailable, estimating: {e}")
+
+    def _get_encoding(self) -> Any:
+        if self._encoding is None and self.model is not None:
+            with self._lock:
+                if not self._loading:
+                    self._loading = True
+                    threading.Thread(target=self._load, daemon=True).start()
+        return self._encoding
+
+    def count(self, text: str) -> int:
+        encoding = self._get_encoding()
+        if encoding is None:
+            return estimate_tokens(text)
+        return len(encoding.encode(text))
+
+    def truncate(self, text: str, max_tokens: int) -> str:
+        """앞에서부터 max_tokens 토큰까지만 남김"""
+        if max_tokens <= 0:
+            return ""
+        encoding = self._get_encoding()
+        if encoding is not None:
+            tokens = encoding.encode(text)
+            return text if len(tokens) <= max_tokens else encoding.decode(
+                tokens[:max_tokens]
+            )
+
+        # 추정치 기준 이분 탐색
+        low, high = 0, len(text)
+        while low < high:
+            mid = (low + high + 1) // 2
+            if estimate_tokens(text[:mid]) <= max_tokens:
+                low = mid
+            else:
+                high = mid - 1
+        return text[:low]
+
+
+@lru_cache(maxsize=None)
+def get_token_counter(model: Optional[str] = "gpt-4o-mini") -> TokenCounter:
+    """모델별 TokenCounter 공유 인스턴스"""
+    return TokenCounter(model)
+
+
+def _normalize(text: str) -> str:
+    return " ".join(text.split())
+
+
+@dataclass
+class PromptSection:
+    name: str
+    text: str
+    priority: int = 0  # 예산이 모자라면 낮은 것부터 줄임
+    required: bool = False  # 줄이거나 빼지 않음
+
+
+@dataclass
+class BuiltPrompt:
+    system: str
+    user: str
+    tokens: int  # system + user (메시지 포맷 오버헤드 제외)
+    trimmed: List[str] = field(default_factory=list)
+    dropped: List[str] = field(default_factory=list)
+
+
+class PromptBuilder:
+    """토큰 예산 안에서 프롬프트 조립
+
+    - 같은 내용(공백 무시)이거나 다른 구역에 이미 포함된 문맥은 한 번만 넣는다
+    - system + user 합계가 ``budget`` 을 넘으면 ``priority`` 가 낮은 구역부터
+      잘라내고, 남는 자리가 ``min_section_tokens`` 보다 작으면 구역을 뺀다
+    - ``required`` 구역(지시문 등)은 줄이지 않는다
+    """
+
+    def __init__(
+        self,
+        budget: int,
+        counter: Optional[TokenCounter] = None,
+        system: str = "",
+        min_section_tokens: int = 32,
+    ) -> None:
+        self.budget = budget
+        self.counter = counter or get_token_counter()
+        self.system = system
+        self.min_section_tokens = min_section_tokens
+        self._sections: List[PromptSection] = []
+
+    def add(
+        self, name: str, text: str, priority: int = 0, required: bool = False
+    ) -> "PromptBuilder":
+        text = (text or "").strip()
+        normalized = _normalize(text)
+        if not normalized or normalized in _normalize(self.system):
+            return self
+
+        for i, section in enumerate(self._sections):
+            existing = _normalize(section.text)
+            if normalized in existing:
+                return self  # 이미 포함된 문맥
+            if existing in normalized:
+                # 잘린 사본 등 일부만 담은 구역은 전체 구역으로 대체
+                self._sections[i] = PromptSection(
+                    name=name,
+                    text=text,
+                    priority=max(priority, section.priority),
+                    required=required or section.required,
+                )
+                return self
+
+        self._sections.append(PromptSection(name, text, priority, required))
+        return self
+
+    def build(self) -> BuiltPrompt:
+        count = self.counter.count
+        separator = count(SECTION_SEPARATOR)
+        sizes = [count(section.text) for section in self._sections]
+        used = count(self.system) + sum(sizes) + separator * (len(sizes) - 1)
+
+        texts = [section.text for section in self._sections]
+        trimmed: List[str] = []
+        dropped: List[str] = []
+
+        order = sorted(
+            (i for i, s in enumerate(self._sections) if not s.required),
+            key=lambda i: self._sections[i].priority,
+        )
+        for i in order:
+            if used <= self.budget:
+                break
+            section = self._sections[i]
+            room = sizes[i] - (used - self.budget) - count(TRIM_MARKER)
+            if room >= self.min_section_tokens:
+                texts[i] = self.counter.truncate(section.text, room).rstrip() + TRIM_MARKER
+                trimmed.append(section.name)
+                used -= sizes[i] - count(texts[i])
+            else:
+                texts[i] = ""
+                dropped.append(section.name)
+                used -= sizes[i] + separator
+
+        user = SECTION_SEPARATOR.join(text for text in texts if text)
+        tokens = count(self.system) + count(user)
+        if tokens > self.budget:
+            logger.warning(
+                f"Prompt exceeds token budget ({tokens} > {self.budget}) "
+                f"with required sections only"
+            )
+        return BuiltPrompt(
+            system=self.system,
+            user=user,
+            tokens=tokens,
+            trimmed=trimmed,
+            dropped=dropped,
+        )
@@ -1,3 +1,5 @@
+from typing import Any, Dict, List
+
 CURRICULUM_GENERATION_PROMPT = """
 목표: {goal}
 기간(주): {period}  
@@ -31,6 +33,77 @@ CURRICULUM_GENERATION_PROMPT = """
 }}
 """
 
+# 분할 생성(개요/주차 확장)용 시스템 프롬프트
+CURRICULUM_PLANNER_ROLE = (
+    "You are a curriculum generator. "
+    "Generate in Korean "
+    "Output *only* a single valid JSON object in the requested format "
+    "no markdown, no explanations, nothing else "
+    "if request for Computer Science, refer to OSSU curriculum "
+    "else, generate as request"
+)
+
+# 긴 커리큘럼 분할 생성 1단계: 주차별 제목만 담은 개요
+CURRICULUM_OUTLINE_PROMPT = """
+목표: {goal}
+기간(주): {period}
+난이도: {difficulty}
+세부요청: {details}
+
+**중요**: 반드시 주어진 목표({goal})에 맞는 커리큘럼의 개요만 작성하세요. 레슨은 작성하지 않습니다.
+
+# 규칙
+- 주차 흐름이 기초에서 심화로 자연스럽게 이어지도록 구성.
+- 주차 제목은 핵심 요약 한 줄 (예: "개발환경 세팅").
+- 모든 텍스트는 한국어.
+- 주차는 1부터 {period}까지 중복 없이 오름차순.
+
+다음 JSON 형식으로 응답:
+{{
+  "title": "<목표에 맞는 커리큘럼 제목>",
+  "schedule": [
+    {{ "week_number": 1, "title": "<핵심요약>" }},
+    {{ "week_number": {period}, "title": "<핵심요약>" }}
+  ]
+}}
+"""
+
+# 긴 커리큘럼 분할 생성 2단계: 개요 중 일부 주차의 레슨 작성
+CURRICULUM_WEEKS_PROMPT = """
+목표: {goal}
+난이도: {difficulty}
+세부요청: {details}
+
+# 전체 커리큘럼 개요
+{outline}
+
+**중요**: 위 개요 중 {start_week}주차부터 {end_week}주차까지만 상세 레슨을 작성하세요.
+다른 주차와 내용이 겹치지 않도록 개요의 주차 제목 범위 안에서 작성합니다.
+
+# 규칙
+- 각 주차는 최소 2개, 최대 4개의 상세한 레슨으로 구성.
+- 각 레슨은 구체적인 학습 내용과 실습 방향을 포함해야 함.
+- 레슨 제목은 "학습내용: 구체적 설명 및 실습과제" 형태로 작성.
+- 모든 텍스트는 한국어.
+- 주차 제목은 개요의 제목을 그대로 사용.
+
+다음 JSON 형식으로 응답:
+{{
+  "schedule": [
+    {{ "week_number": {start_week}, "title": "<개요의 주차 제목>", "lessons": ["상세레슨1: 구체적 설명과 실습","상세레슨2: 구체적 설명과 실습"] }},
+    {{ "week_number": {end_week}, "title": "<개요의 주차 제목>", "lessons": ["상세레슨1: 구체적 설명과 실습","상세레슨2: 구체적 설명과 실습"] }}
+  ]
+}}
+"""
+
+
+def format_outline(outline: List[Dict[str, Any]]) -> str:
+    """개요 주차 목록을 프롬프트용 텍스트로 변환 ("1주차: 제목")"""
+    return "\n".join(
+        f"{week.get('week_number')}주차: {week.get('title', '')}" for week in outline
+    )
+
+
 # CURRICULUM_GENERATION_PROMPT = """
 # 목표: {goal}
 # 기간(주): {period}
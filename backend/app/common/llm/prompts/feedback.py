@@ -1,12 +1,24 @@
+from typing import List, Optional
+
+from app.common.llm.prompt_builder import BuiltPrompt, PromptBuilder, TokenCounter
+
+FEEDBACK_SYSTEM_ROLE = (
+    "You are a learning feedback generator.\n"
+    "Follow EXACTLY the rules in the user message.\n"
+    "Output ONLY a single valid JSON object with the required keys.\n"
+    "No preface, no suffix, no code fences, no extra text.\n"
+    "If the summary lacks detail, explicitly state that in the comment.\n"
+    "Do NOT invent or infer facts that are not present in the summary.\n"
+    "All direct quotes MUST come verbatim from the summary.\n"
+    "When evidence is insufficient, write '설명이 부족합니다' explicitly and avoid conjecture."
+)
+
+# 입력(lessons, summary)은 build_feedback_prompt 가 토큰 예산에 맞춰 앞에 붙임
 FEEDBACK_GENERATION_PROMPT = """
 당신의 임무: 학습자 요약을 분석하여 아래 JSON 스키마에 맞춘 정량/정성 피드백을 생성한다. 오직 JSON만 출력한다.
 
-[입력]
-- lessons: {{lessons}}
-- summary: {{summary}}
-
 [출력 형식(JSON only)]
-{{
+{
   "cognitive_load_retention": <float, 0.0~10.0, 소수점 1자리>,
   "engagement_behavior": <float, 0.0~10.0, 소수점 1자리>,
   "transfer_application": <float, 0.0~10.0, 소수점 1자리>,
@@ -14,7 +26,7 @@ FEEDBACK_GENERATION_PROMPT = """
   "realtime_analytics": <float, 0.0~10.0, 소수점 1자리>,
   "score": <위 5개 평균, 소수점 1자리>,
   "comment": "<아래 작문 규칙에 따른 Markdown 한국어 텍스트, 개행은 \\n 사용>"
-}}
+}
 
 [점수 규칙]
 - 각 점수는 0.0~10.0, 소수점 1자리.
@@ -24,8 +36,8 @@ FEEDBACK_GENERATION_PROMPT = """
 - 부족하거나 빠진 부분이 뚜렷하면 5.0 이하도 가능.
 
 [comment 작문 규칙]
-- 시작 문장: "{{lessons}}"에 대한 요약을 바탕으로 개인화 피드백을 제공합니다.
-- 반드시 {{summary}}에서 **직접 인용 2개 이상** 포함(따옴표로 표기, 각 6~15단어).
+- 시작 문장: "{lessons}"에 대한 요약을 바탕으로 개인화 피드백을 제공합니다.
+- 반드시 {summary}에서 **직접 인용 2개 이상** 포함(따옴표로 표기, 각 6~15단어).
 - Markdown 문법을 사용하여 구조화: 
   - 큰 제목(##), 작은 제목(###), bullet(-) 사용 가능.
 - "세부 피드백" 섹션에 5개 항목을 각각 2~3문장으로 구체 평가:
@@ -35,10 +47,10 @@ FEEDBACK_GENERATION_PROMPT = """
   - 📝 표현 및 구성 능력 (competency_performance/10)
   - 🔍 종합 분석 능력 (realtime_analytics/10)
 - "학습 보완 점"과 "다음 단계 학습 계획"은 Markdown 하위 섹션으로 작성하고, bullet(-)을 활용하여 2~4개 제시.
-- 모호어(예: “전반적으로 좋음”) 금지. **구체 근거**를 {{summary}} 내용에서 끌어올 것.
+- 모호어(예: “전반적으로 좋음”) 금지. **구체 근거**를 {summary} 내용에서 끌어올 것.
 - 대괄호로 된 지시문/placeholder(예: [구체적 부분]) 절대 사용 금지.
 - 코드블록, 불필요한 마크다운 문법(표 등) 금지.
-- comment의 모든 인용은 {{summary}} 원문에서 그대로 가져온다(오탈자 수정 금지).
+- comment의 모든 인용은 {summary} 원문에서 그대로 가져온다(오탈자 수정 금지).
 - summary에 없는 정보(토론, 질문, 예시, 감정평가 등)는 절대 서술하지 않는다.
 - summary가 단순 나열뿐이면, 그 나열을 인용하고 '설명이 부족함'을 명시적으로 지적한다.
 
@@ -55,9 +67,26 @@ FEEDBACK_GENERATION_PROMPT = """
 5) 모든 점수가 0.0~10.0 범위인가? → 아니면 수정.
 6) 점수 분포가 너무 후하지 않은가? (기본 5~7점대, 특별히 잘한 부분만 8점 이상) → 아니면 수정.
 
-- comment는 반드시 {{summary}}에 포함된 문구만 인용해야 한다.
+- comment는 반드시 {summary}에 포함된 문구만 인용해야 한다.
 - 존재하지 않는 사실(예: 토론, 질문, 감정 평가)은 절대 쓰지 않는다.
 - summary에 단순 나열만 있을 경우, 그대로 인용하고 '설명이 부족하다'고 명시한다.
 
 이제 위 규칙을 철저히 준수하여 JSON만 출력하라.
 """
+
+
+def build_feedback_prompt(
+    lessons: List[str],
+    summary: str,
+    budget: int,
+    counter: Optional[TokenCounter] = None,
+) -> BuiltPrompt:
+    """피드백 생성 프롬프트 조립
+
+    요약은 한 번만 넣고, 예산을 넘으면 지시문과 레슨은 두고 요약 뒷부분을 잘라낸다.
+    """
+    builder = PromptBuilder(budget, counter, system=FEEDBACK_SYSTEM_ROLE)
+    builder.add("lessons", f"[입력]\n- lessons: {', '.join(lessons)}", required=True)
+    builder.add("summary", f"- summary:\n{summary}", priority=1)
+    builder.add("instructions", FEEDBACK_GENERATION_PROMPT, required=True)
+    return builder.build()
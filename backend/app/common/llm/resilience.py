@@ -0,0 +1,445 @@
+import asyncio
+import logging
+import math
+import time
+from collections import deque
+from typing import (
+    Any,
+    AsyncIterator,
+    Awaitable,
+    Callable,
+    Deque,
+    Dict,
+    List,
+    Optional,
+    Set,
+    TypeVar,
+)
+
+import aiohttp
+import openai
+
+from app.common.llm.dispatcher import LLMDispatcher
+from app.common.llm.exception import LLMCircuitOpenError, LLMTimeoutError
+from app.common.llm.llm_client_repo import ILLMClientRepository
+from app.common.monitoring.metrics import (
+    increment_llm_resilience_event,
+    set_llm_circuit_state,
+)
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+CLOSED = "closed"
+OPEN = "open"
+HALF_OPEN = "half_open"
+
+# 4xx 중 다시 보내면 결과가 달라질 수 있는 상태 (요청 타임아웃, 요청 한도 초과)
+RETRYABLE_CLIENT_STATUSES = {408, 429}
+
+_TRANSIENT_ERRORS = (
+    asyncio.TimeoutError,
+    ConnectionError,
+    aiohttp.ClientConnectionError,
+    openai.APIConnectionError,  # APITimeoutError 포함
+)
+
+
+def _status_code(error: BaseException) -> Optional[int]:
+    """제공자 HTTP 응답 상태 (aiohttp ``status`` / openai ``status_code``)"""
+    for name in ("status_code", "status"):
+        status = getattr(error, name, None)
+        if isinstance(status, int):
+            return status
+    return None
+
+
+def is_retryable(error: BaseException) -> bool:
+    """다시 시도하면 성공할 수 있는 제공자 장애인지
+
+    타임아웃, 연결 오류, 429, 5xx 만 해당한다. 잘못된 API 키(401/403), 잘못된
+    요청(400/404) 같은 4xx 나 그 밖의 오류는 몇 번을 보내도 같으므로 재시도하지 않고
+    서킷 실패로도 세지 않는다.
+    """
+    if isinstance(error, _TRANSIENT_ERRORS):
+        return True
+    status = _status_code(error)
+    if status is None:
+        return False
+    return status >= 500 or status in RETRYABLE_CLIENT_STATUSES
+
+
+class CircuitBreaker:
+    """LLM 제공자 서킷 브레이커
+
+    - CLOSED: 정상 호출, 연속 실패가 ``failure_threshold`` 에 도달하면 OPEN
+    - OPEN: ``reset_timeout`` 동안 호출하지 않고 즉시 ``LLMCircuitOpenError``
+    - HALF_OPEN: 시험 호출 하나만 허용, 성공하면 CLOSED / 실패하면 다시 OPEN
+    """
+
+    def __init__(
+        self,
+        failure_threshold: int = 5,
+        reset_timeout: float = 30.0,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+        self.clock = clock
+
+        self._state = CLOSED
+        self._failures = 0
+        self._opened_at = 0.0
+        self._probing = False
+
+    @property
+    def state(self) -> str:
+        """현재 상태 (OPEN 유지 시간이 지났으면 HALF_OPEN)"""
+        if self._state == OPEN and self._remaining() <= 0:
+            return HALF_OPEN
+        return self._state
+
+    def _remaining(self) -> float:
+        return self._opened_at + self.reset_timeout - self.clock()
+
+    def before_call(self) -> None:
+        """호출 전 확인, 차단 중이면 LLMCircuitOpenError"""
+        state = self.state
+        if state == CLOSED:
+            return
+        if state == HALF_OPEN and not self._probing:
+            self._state = HALF_OPEN
+            self._probing = True
+            self._report()
+            return
+
+        retry_after = max(1, math.ceil(self._remaining()))
+        raise LLMCircuitOpenError(
+            "LLM provider is temporarily unavailable", retry_after=retry_after
+        )
+
+    def record_success(self) -> None:
+        """성공 기록, 시험 호출이 성공하면 CLOSED 로 복귀"""
+        self._failures = 0
+        self._probing = False
+        if self._state != CLOSED:
+            logger.info("LLM circuit closed")
+            self._state = CLOSED
+            self._report()
+
+    def release(self) -> None:
+        """결과 없이 끝난 호출(취소 등)의 시험 호출 자리 반납"""
+        self._probing = False
+
+    def record_failure(self) -> None:
+        """실패 기록, 기준을 넘으면 OPEN"""
+        self._failures += 1
+        self._probing = False
+        if self._state == HALF_OPEN or self._failures >= self.failure_threshold:
+            if self._state != OPEN:
+                logger.warning(
+                    f"LLM circuit opened after {self._failures} failures "
+                    f"(reset in {self.reset_timeout}s)"
+                )
+            self._state = OPEN
+            self._opened_at = self.clock()
+            self._report()
+
+    def _report(self) -> None:
+        set_llm_circuit_state(self._state)
+
+
+class LatencyTracker:
+    """작업별 최근 응답 시간 (헤지 지연 계산용)"""
+
+    def __init__(self, window: int = 200) -> None:
+        self.window = window
+        self._samples: Dict[str, Deque[float]] = {}
+
+    def record(self, operation: str, latency: float) -> None:
+        samples = self._samples.setdefault(operation, deque(maxlen=self.window))
+        samples.append(latency)
+
+    def count(self, operation: str) -> int:
+        return len(self._samples.get(operation, ()))
+
+    def percentile(self, operation: str, q: float) -> Optional[float]:
+        """최근 표본의 q 분위수 (표본이 없으면 None)"""
+        samples = self._samples.get(operation)
+        if not samples:
+            return None
+        ordered = sorted(samples)
+        index = min(len(ordered) - 1, math.ceil(q * len(ordered)) - 1)
+        return ordered[max(0, index)]
+
+
+class ResilientLLMClient(ILLMClientRepository):
+    """LLM 호출 타임아웃 / 서킷 브레이커 / 헤지 재시도 데코레이터
+
+    - 작업별 마감 시간(deadline) 안에 끝나지 않으면 ``LLMTimeoutError``
+    - 제공자 오류가 이어지면 서킷을 열고 복구 전까지 즉시 거절 (``LLMCircuitOpenError``)
+    - 첫 시도가 일시적 장애(``is_retryable``)로 실패하면 마감 시간 안에서
+      ``max_attempts`` 까지 재시도
+    - ``hedge`` 를 켜면 첫 시도가 최근 p95 응답 시간을 넘길 때 두 번째 시도를
+      동시에 보내고 먼저 성공한 응답을 사용 (나머지는 취소)
+
+    재시도는 앞 시도가 끝난 뒤라 바깥 ``DispatchedLLMClient`` 의 슬롯 하나로 충분하지만,
+    헤지 시도는 동시에 나가므로 ``dispatcher`` 에서 빈 슬롯을 하나 더 얻었을 때만
+    보낸다 (대기하지 않고, 없으면 헤지하지 않음). 그래서 제공자 동시 호출 수는
+    ``max_concurrency`` 를 넘지 않는다.
+
+    응답 JSON 파싱 실패(ValueError)와 4xx 는 제공자 장애가 아니므로 재시도하거나
+    서킷 실패로 세지 않는다.
+    """
+
+    def __init__(
+        self,
+        client: ILLMClientRepository,
+        curriculum_timeout: float = 120.0,
+        feedback_timeout: float = 30.0,
+        stream_idle_timeout: float = 30.0,
+        max_attempts: int = 2,
+        breaker: Optional[CircuitBreaker] = None,
+        hedge: bool = False,
+        hedge_min_samples: int = 20,
+        hedge_min_delay: float = 1.0,
+        latency: Optional[LatencyTracker] = None,
+        dispatcher: Optional[LLMDispatcher] = None,
+    ) -> None:
+        self.client = client
+        self.deadlines: Dict[str, float] = {
+            "generate_curriculum": curriculum_timeout,
+            "generate_curriculum_outline": curriculum_timeout,
+            "expand_curriculum_weeks": curriculum_timeout,
+            "generate_feedback": feedback_timeout,
+        }
+        self.stream_idle_timeout = stream_idle_timeout
+        self.max_attempts = max(1, max_attempts)
+        self.breaker = breaker or CircuitBreaker()
+        self.hedge = hedge
+        self.hedge_min_samples = hedge_min_samples
+        self.hedge_min_delay = hedge_min_delay
+        self.latency = latency or LatencyTracker()
+        self.dispatcher = dispatcher
+
+    def __getattr__(self, name: str) -> Any:
+        # model, temperature 등 구현체 속성은 그대로 노출 (캐시 키 등에서 사용)
+        if name == "client":
+            raise AttributeError(name)
+        return getattr(self.client, name)
+
+    def hedge_delay(self, operation: str) -> Optional[float]:
+        """두 번째 시도를 보내기까지 기다릴 시간 (헤지 안 하면 None)"""
+        if not self.hedge or self.latency.count(operation) < self.hedge_min_samples:
+            return None
+        p95 = self.latency.percentile(operation, 0.95) or 0.0
+        return max(self.hedge_min_delay, p95)
+
+    async def _call(self, operation: str, fn: Callable[[], Awaitable[T]]) -> T:
+        self.breaker.before_call()
+        deadline = self.deadlines[operation]
+        try:
+            result = await asyncio.wait_for(self._attempts(operation, fn), deadline)
+        except asyncio.TimeoutError:
+            self.breaker.record_failure()
+            increment_llm_resilience_event(operation, "timeout")
+            raise LLMTimeoutError(
+                f"LLM {operation} did not finish within {deadline}s"
+            ) from None
+        except ValueError:
+            self.breaker.record_success()  # 응답은 왔으므로 제공자는 정상
+            raise
+        except asyncio.CancelledError:
+            self.breaker.release()
+            raise
+        except Exception as e:
+            self._record_error(e)
+            raise
+        self.breaker.record_success()
+        return result
+
+    def _record_error(self, error: BaseException) -> None:
+        """일시적 장애만 서킷 실패로 센다 (4xx 등은 시험 호출 자리만 반납)"""
+        if is_retryable(error):
+            self.breaker.record_failure()
+        else:
+            self.breaker.release()
+
+    async def _attempts(self, operation: str, fn: Callable[[], Awaitable[T]]) -> T:
+        """시도 실행, 헤지 지연이 지나거나 진행 중인 시도가 모두 실패하면 다음 시도"""
+        pending: Set["asyncio.Task[T]"] = set()
+        started: Dict["asyncio.Task[T]", float] = {}
+        delay = self.hedge_delay(operation)
+        launched = 0
+        error: Optional[BaseException] = None
+
+        def _launch() -> "asyncio.Task[T]":
+            nonlocal launched
+            task = asyncio.ensure_future(fn())
+            pending.add(task)
+            started[task] = time.monotonic()
+            launched += 1
+            return task
+
+        _launch()
+        try:
+            while pending:
+                can_launch = launched < self.max_attempts
+                done, _ = await asyncio.wait(
+                    pending,
+                    timeout=delay if can_launch else None,
+                    return_when=asyncio.FIRST_COMPLETED,
+                )
+
+                if not done:  # 헤지 지연 초과
+                    if self.dispatcher is not None:
+                        if not self.dispatcher.try_acquire():
+                            # 빈 슬롯이 없으면 헤지하지 않고 첫 시도를 기다린다
+                            increment_llm_resilience_event(operation, "hedge_skipped")
+                            delay = None
+                            continue
+                        dispatcher = self.dispatcher
+                        _launch().add_done_callback(lambda _: dispatcher.release())
+                    else:
+                        _launch()
+                    increment_llm_resilience_event(operation, "hedge")
+                    continue
+
+                for task in done:
+                    pending.discard(task)
+                    if task.exception() is None:
+                        if launched == 1:
+                            self.latency.record(
+                                operation, time.monotonic() - started[task]
+                            )
+                        return task.result()
+                    error = task.exception()
+                    if not is_retryable(error):
+                        raise error
+
+                if not pending and launched < self.max_attempts:
+                    logger.warning(f"LLM {operation} failed, retrying: {error}")
+                    increment_llm_resilience_event(operation, "retry")
+                    _launch()
+
+            assert error is not None
+            raise error
+        finally:
+            for task in pending:
+                task.cancel()
+
+    async def generate_curriculum(
+        self,
+        goal: str,
+        period: int,
+        difficulty: str,
+        details: str,
+    ) -> Dict[str, Any]:
+        return await self._call(
+            "generate_curriculum",
+            lambda: self.client.generate_curriculum(
+                goal=goal,
+                period=period,
+                difficulty=difficulty,
+                details=details,
+            ),
+        )
+
+    async def generate_curriculum_outline(
+        self,
+        goal: str,
+        period: int,
+        difficulty: str,
+        details: str,
+    ) -> Dict[str, Any]:
+        return await self._call(
+            "generate_curriculum_outline",
+            lambda: self.client.generate_curriculum_outline(
+                goal=goal,
+                period=period,
+                difficulty=difficulty,
+                details=details,
+            ),
+        )
+
+    async def expand_curriculum_weeks(
+        self,
+        goal: str,
+        difficulty: str,
+        details: str,
+        outline: List[Dict[str, Any]],
+        start_week: int,
+        end_week: int,
+    ) -> Dict[str, Any]:
+        return await self._call(
+            "expand_curriculum_weeks",
+            lambda: self.client.expand_curriculum_weeks(
+                goal=goal,
+                difficulty=difficulty,
+                details=details,
+                outline=outline,
+                start_week=start_week,
+                end_week=end_week,
+            ),
+        )
+
+    async def generate_curriculum_stream(
+        self,
+        goal: str,
+        period: int,
+        difficulty: str,
+        details: str,
+    ) -> AsyncIterator[str]:
+        """스트리밍은 헤지/재시도 없이 조각 사이 대기 시간만 제한"""
+        self.breaker.before_call()
+        stream = self.client.generate_curriculum_stream(
+            goal=goal,
+            period=period,
+            difficulty=difficulty,
+            details=details,
+        )
+        finished = False
+        try:
+            while True:
+                try:
+                    chunk = await asyncio.wait_for(
+                        stream.__anext__(), self.stream_idle_timeout
+                    )
+                except StopAsyncIteration:
+                    finished = True
+                    break
+                except asyncio.TimeoutError:
+                    self.breaker.record_failure()
+                    increment_llm_resilience_event(
+                        "generate_curriculum_stream", "timeout"
+                    )
+                    raise LLMTimeoutError(
+                        f"LLM stream stalled for {self.stream_idle_timeout}s"
+                    ) from None
+                except Exception as e:
+                    finished = True
+                    self._record_error(e)
+                    raise
+                yield chunk
+        finally:
+            if not finished:  # 소비자가 도중에 중단
+                self.breaker.release()
+            await stream.aclose()  # type: ignore
+        self.breaker.record_success()
+
+    async def generate_feedback(
+        self,
+        lessons: List[str],
+        summary_content: str,
+    ) -> Dict[str, Any]:
+        return await self._call(
+            "generate_feedback",
+            lambda: self.client.generate_feedback(
+                lessons=lessons,
+                summary_content=summary_content,
+            ),
+        )
+
+    async def close(self) -> None:
+        await self.client.close()
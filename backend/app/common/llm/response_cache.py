@@ -0,0 +1,262 @@
+import hashlib
+import json
+import logging
+import time
+from typing import Any, AsyncIterator, Awaitable, Callable, Dict, List, Optional
+
+from app.common.cache.redis_client import redis_client
+from app.common.cache.stampede import SingleFlight
+from app.common.llm.dispatcher import DispatchedLLMClient
+from app.common.llm.exception import LLMQueueFullError
+from app.common.llm.llm_client_repo import ILLMClientRepository
+from app.common.llm.prompts.curriculum import (
+    CURRICULUM_GENERATION_PROMPT,
+    CURRICULUM_OUTLINE_PROMPT,
+    CURRICULUM_WEEKS_PROMPT,
+    format_outline,
+)
+from app.common.llm.resilience import ResilientLLMClient
+from app.common.llm.stream_parser import CurriculumStreamParser
+from app.common.monitoring.metrics import record_llm_cache_lookup
+
+logger = logging.getLogger(__name__)
+
+
+def normalize_prompt(text: str) -> str:
+    """캐시 키용 프롬프트/입력 정규화 (공백 정리 + 대소문자 무시)"""
+    return " ".join(text.split()).casefold()
+
+
+class CachedLLMClient(ILLMClientRepository):
+    """LLM 응답 캐시 데코레이터 (content-addressed)
+
+    포맷된 프롬프트를 정규화한 해시와 모델/temperature를 키로
+    파싱된 JSON 응답을 Redis에 저장한다. 같은 입력의 재생성은 LLM을 호출하지 않는다.
+    대기열(``DispatchedLLMClient``)보다 바깥에 두어 캐시 적중은 LLM 슬롯을 기다리지 않는다.
+    캐시 크기는 마지막 접근 시각 Sorted Set으로 관리해 오래 안 쓴 항목부터 제거한다.
+    """
+
+    CACHE_KEY_PREFIX = "llm:cache"
+
+    def __init__(
+        self,
+        client: ILLMClientRepository,
+        ttl: int = 86400,  # 1일
+        max_entries: int = 1000,
+    ) -> None:
+        self.client = client
+        self.ttl = ttl
+        self.max_entries = max_entries
+        self._single_flight = SingleFlight()
+
+    def _cache_key(self, operation: str, prompt: str) -> str:
+        model = getattr(self.client, "model", "")
+        temperature = getattr(self.client, "temperature", "")
+        raw = "|".join(
+            [
+                operation,
+                self._implementation(),  # 구현체별 시스템 프롬프트가 다름
+                str(model),
+                str(temperature),
+                normalize_prompt(prompt),
+            ]
+        )
+        return hashlib.sha256(raw.encode("utf-8")).hexdigest()
+
+    def _implementation(self) -> str:
+        # 대기열/타임아웃/재시도 데코레이터 등으로 감싼 경우 실제 구현체 기준
+        client = self.client
+        while isinstance(client, (DispatchedLLMClient, ResilientLLMClient)):
+            client = client.client
+        return type(client).__name__
+
+    def _lru_key(self, operation: str) -> str:
+        return f"{self.CACHE_KEY_PREFIX}:{operation}:lru"
+
+    async def _get(self, operation: str, digest: str) -> Optional[Any]:
+        try:
+            cached = await redis_client.get(
+                f"{self.CACHE_KEY_PREFIX}:{operation}:{digest}"
+            )
+            if cached is None:
+                return None
+            # 최근 사용 시각 갱신 (LRU)
+            await redis_client.zadd(self._lru_key(operation), {digest: time.time()})
+            return json.loads(cached)
+        except Exception as e:
+            logger.warning(f"LLM cache read failed: {e}")
+            return None
+
+    async def _set(self, operation: str, digest: str, value: Any) -> None:
+        lru_key = self._lru_key(operation)
+        try:
+            await redis_client.set_many_with_zadd(
+                {f"{self.CACHE_KEY_PREFIX}:{operation}:{digest}": json.dumps(value)},
+                lru_key,
+                {digest: time.time()},
+                ex=self.ttl,
+                zset_ex=self.ttl,
+            )
+            evicted: List[str] = await redis_client.trim_sorted_set(
+                lru_key, self.max_entries
+            )
+            for member in evicted:
+                await redis_client.delete(
+                    f"{self.CACHE_KEY_PREFIX}:{operation}:{member}"
+                )
+        except Exception as e:
+            logger.warning(f"LLM cache write failed: {e}")
+
+    def _curriculum_digest(
+        self, goal: str, period: int, difficulty: str, details: str
+    ) -> str:
+        prompt = CURRICULUM_GENERATION_PROMPT.format(
+            goal=normalize_prompt(goal),
+            period=period,
+            difficulty=difficulty,
+            details=normalize_prompt(details or ""),
+        )
+        return self._cache_key("generate_curriculum", prompt)
+
+    async def generate_curriculum(
+        self,
+        goal: str,
+        period: int,
+        difficulty: str,
+        details: str,
+    ) -> Dict[str, Any]:
+        return await self._cached(
+            "generate_curriculum",
+            self._curriculum_digest(goal, period, difficulty, details),
+            lambda: self.client.generate_curriculum(
+                goal=goal,
+                period=period,
+                difficulty=difficulty,
+                details=details,
+            ),
+        )
+
+    async def generate_curriculum_outline(
+        self,
+        goal: str,
+        period: int,
+        difficulty: str,
+        details: str,
+    ) -> Dict[str, Any]:
+        operation = "generate_curriculum_outline"
+        prompt = CURRICULUM_OUTLINE_PROMPT.format(
+            goal=normalize_prompt(goal),
+            period=period,
+            difficulty=difficulty,
+            details=normalize_prompt(details or ""),
+        )
+        return await self._cached(
+            operation,
+            self._cache_key(operation, prompt),
+            lambda: self.client.generate_curriculum_outline(
+                goal=goal,
+                period=period,
+                difficulty=difficulty,
+                details=details,
+            ),
+        )
+
+    async def expand_curriculum_weeks(
+        self,
+        goal: str,
+        difficulty: str,
+        details: str,
+        outline: List[Dict[str, Any]],
+        start_week: int,
+        end_week: int,
+    ) -> Dict[str, Any]:
+        operation = "expand_curriculum_weeks"
+        prompt = CURRICULUM_WEEKS_PROMPT.format(
+            goal=normalize_prompt(goal),
+            difficulty=difficulty,
+            details=normalize_prompt(details or ""),
+            outline=format_outline(outline),
+            start_week=start_week,
+            end_week=end_week,
+        )
+        return await self._cached(
+            operation,
+            self._cache_key(operation, prompt),
+            lambda: self.client.expand_curriculum_weeks(
+                goal=goal,
+                difficulty=difficulty,
+                details=details,
+                outline=outline,
+                start_week=start_week,
+                end_week=end_week,
+            ),
+        )
+
+    async def _cached(
+        self,
+        operation: str,
+        digest: str,
+        generate: Callable[[], Awaitable[Dict[str, Any]]],
+    ) -> Dict[str, Any]:
+        """캐시 조회 후 없으면 생성해 저장"""
+        cached = await self._get(operation, digest)
+        record_llm_cache_lookup(operation, hit=cached is not None)
+        if cached is not None:
+            return cached
+
+        async def _generate() -> Dict[str, Any]:
+            result = await generate()
+            await self._set(operation, digest, result)
+            return result
+
+        # 같은 입력의 동시 요청은 LLM 호출 하나를 공유. 대기열 거절(사용자별 한도,
+        # 대기 시간 초과)은 첫 호출자 몫이므로 다른 사용자에게 넘기지 않고, 대기자가
+        # 자기 몫으로 다시 슬롯을 얻어 실행한다.
+        return await self._single_flight.do(
+            f"{operation}:{digest}", _generate, not_shared=(LLMQueueFullError,)
+        )
+
+    async def generate_curriculum_stream(
+        self,
+        goal: str,
+        period: int,
+        difficulty: str,
+        details: str,
+    ) -> AsyncIterator[str]:
+        # 스트리밍도 일반 생성과 같은 캐시 항목을 공유
+        operation = "generate_curriculum"
+        digest = self._curriculum_digest(goal, period, difficulty, details)
+
+        cached = await self._get(operation, digest)
+        record_llm_cache_lookup(operation, hit=cached is not None)
+        if cached is not None:
+            yield json.dumps(cached, ensure_ascii=False)
+            return
+
+        parser = CurriculumStreamParser()
+        async for chunk in self.client.generate_curriculum_stream(
+            goal=goal,
+            period=period,
+            difficulty=difficulty,
+            details=details,
+        ):
+            parser.feed(chunk)
+            yield chunk
+
+        # 끝까지 완성된 응답만 저장
+        if parser.is_complete:
+            await self._set(operation, digest, parser.result())
+
+    async def generate_feedback(
+        self,
+        lessons: List[str],
+        summary_content: str,
+    ) -> Dict[str, Any]:
+        # 피드백은 사용자별 요약에 대한 응답이므로 캐시하지 않음
+        return await self.client.generate_feedback(
+            lessons=lessons,
+            summary_content=summary_content,
+        )
+
+    async def close(self) -> None:
+        await self.client.close()
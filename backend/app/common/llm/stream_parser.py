@@ -0,0 +1,124 @@
+import json
+from dataclasses import dataclass
+from typing import Any, List, Optional, Tuple
+
+StreamEvent = Tuple[str, Any]  # ("title", str) | ("week", dict)
+
+
+@dataclass
+class _Frame:
+    kind: str  # "{" 또는 "["
+    start: int
+    parent_key: Optional[str] = None  # 이 컨테이너가 값으로 들어간 키
+    key: Optional[str] = None  # 객체의 현재 키
+    expect_key: bool = False
+
+
+class CurriculumStreamParser:
+    """커리큘럼 생성 응답 JSON 증분 파서
+
+    LLM이 내보내는 텍스트 조각을 ``feed`` 로 넣으면 완성된 주차 객체를
+    그때그때 이벤트로 돌려준다. 전체 JSON이 끝날 때까지 기다리지 않는다.
+
+    - 최상위 객체의 ``title`` 문자열이 끝나면 ``("title", str)``
+    - ``schedule`` 배열(또는 최상위 배열)의 원소 객체가 닫히면 ``("week", dict)``
+
+    코드 블록 표시(```json) 등 루트 JSON 앞뒤의 텍스트는 무시한다.
+    """
+
+    def __init__(self) -> None:
+        self._text = ""
+        self._pos = 0
+        self._stack: List[_Frame] = []
+        self._in_string = False
+        self._escape = False
+        self._string_start = -1
+        self._root: Optional[Tuple[int, int]] = None
+        self.title: Optional[str] = None
+        self.weeks: List[dict] = []
+
+    @property
+    def is_complete(self) -> bool:
+        """루트 JSON이 닫혔는지 여부"""
+        return self._root is not None
+
+    def feed(self, chunk: str) -> List[StreamEvent]:
+        """텍스트 조각 추가 후 새로 완성된 이벤트 반환"""
+        self._text += chunk
+        events: List[StreamEvent] = []
+
+        for i in range(self._pos, len(self._text)):
+            c = self._text[i]
+
+            if self._in_string:
+                if self._escape:
+                    self._escape = False
+                elif c == "\\":
+                    self._escape = True
+                elif c == '"':
+                    self._in_string = False
+                    value = json.loads(self._text[self._string_start : i + 1])
+                    self._on_string(value, events)
+                continue
+
+            if self._root is not None:
+                break  # 루트 JSON 이후 텍스트 무시
+            if not self._stack and c not in "{[":
+                continue  # 루트 JSON 이전 텍스트 무시
+
+            if c == '"':
+                self._in_string = True
+                self._string_start = i
+            elif c in "{[":
+                parent = self._stack[-1] if self._stack else None
+                self._stack.append(
+                    _Frame(
+                        kind=c,
+                        start=i,
+                        parent_key=parent.key if parent and parent.kind == "{" else None,
+                        expect_key=c == "{",
+                    )
+                )
+            elif c in "}]":
+                self._on_close(i, events)
+            elif c == ":" and self._stack:
+                self._stack[-1].expect_key = False
+            elif c == "," and self._stack and self._stack[-1].kind == "{":
+                self._stack[-1].expect_key = True
+
+        self._pos = len(self._text)
+        return events
+
+    def result(self) -> Any:
+        """완성된 루트 JSON 전체 반환"""
+        if self._root is None:
+            raise ValueError("Incomplete JSON response from LLM")
+        start, end = self._root
+        return json.loads(self._text[start : end + 1])
+
+    def _on_string(self, value: str, events: List[StreamEvent]) -> None:
+        frame = self._stack[-1] if self._stack else None
+        if frame is None or frame.kind != "{":
+            return
+        if frame.expect_key:
+            frame.key = value
+        elif frame.key == "title" and len(self._stack) == 1 and self.title is None:
+            self.title = value
+            events.append(("title", value))
+
+    def _on_close(self, i: int, events: List[StreamEvent]) -> None:
+        frame = self._stack.pop()
+        parent = self._stack[-1] if self._stack else None
+
+        if frame.kind == "{" and parent is not None and parent.kind == "[":
+            is_schedule = parent.parent_key == "schedule"
+            is_root_array = len(self._stack) == 1
+            if is_schedule or is_root_array:
+                item = json.loads(self._text[frame.start : i + 1])
+                # [{"title", "schedule"}] 형태의 감싸는 객체는 주차가 아님
+                if isinstance(item, dict) and "schedule" not in item:
+                    self.weeks.append(item)
+                    events.append(("week", item))
+
+        if not self._stack:
+            self._root = (frame.start, i)
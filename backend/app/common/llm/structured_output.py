@@ -0,0 +1,307 @@
+import json
+import logging
+import re
+from dataclasses import dataclass, field
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+logger = logging.getLogger(__name__)
+
+_CODE_FENCE = re.compile(r"```(?:json|JSON)?\s*(.*?)(?:```|$)", re.DOTALL)
+_TRAILING_COMMA = re.compile(r",(\s*[}\]])")
+_WEEK_NUMBER = re.compile(r"^\s*(\d+)\s*(?:주차|주|week)?\s*$", re.IGNORECASE)
+_CLOSERS = {"{": "}", "[": "]"}
+
+# 최대 복구 시도 횟수 (잘린 응답을 끝에서부터 줄여가며 닫아 봄)
+MAX_REPAIR_ATTEMPTS = 64
+
+# 스키마 필드별 허용 키 (앞쪽이 표준 키)
+CURRICULUM_TITLE_KEYS = ("title", "curriculum_title", "name")
+CURRICULUM_SCHEDULE_KEYS = ("schedule", "weeks", "week_schedules", "curriculum")
+WEEK_NUMBER_KEYS = ("week_number", "weekNumber", "week")
+WEEK_TITLE_KEYS = ("title", "week_title", "weekTitle")
+WEEK_LESSONS_KEYS = ("lessons", "topics", "content")
+
+FEEDBACK_COMMENT_KEYS = ("comment", "feedback", "comments")
+FEEDBACK_SCORE_KEYS = ("score", "total_score", "overall_score")
+FEEDBACK_DETAIL_CONTAINER_KEYS = ("detailed_scores", "scores")
+FEEDBACK_DETAIL_KEYS = (
+    "cognitive_load_retention",
+    "engagement_behavior",
+    "transfer_application",
+    "competency_performance",
+    "realtime_analytics",
+)
+MIN_SCORE = 0.0
+MAX_SCORE = 10.0
+
+
+def _strip_fences(text: str) -> str:
+    match = _CODE_FENCE.search(text)
+    return match.group(1) if match else text
+
+
+def _scan(text: str) -> Tuple[Optional[int], List[Tuple[int, str]], List[str], bool]:
+    """루트 값의 끝 위치와 잘라도 되는 위치 목록 계산
+
+    반환: (루트가 닫힌 위치 또는 None, [(자를 위치, 그 시점의 열린 괄호)],
+    끝까지 열린 괄호, 문자열 안에서 끝났는지)
+    """
+    stack: List[str] = []
+    cuts: List[Tuple[int, str]] = []
+    in_string = False
+    escaped = False
+
+    for i, char in enumerate(text):
+        if in_string:
+            if escaped:
+                escaped = False
+            elif char == "\\":
+                escaped = True
+            elif char == '"':
+                in_string = False
+            continue
+
+        if char == '"':
+            in_string = True
+        elif char in _CLOSERS:
+            stack.append(char)
+        elif char in "}]":
+            if not stack:
+                return i, cuts, stack, False
+            stack.pop()
+            if not stack:
+                return i + 1, cuts, stack, False
+            # 안쪽 값이 끝난 자리
+            cuts.append((i + 1, "".join(stack)))
+        elif char == ",":
+            # 쉼표 앞까지는 완성된 항목
+            cuts.append((i, "".join(stack)))
+
+    return None, cuts, stack, in_string
+
+
+def _close(text: str, stack: Sequence[str]) -> str:
+    text = _TRAILING_COMMA.sub(r"\1", text.rstrip().rstrip(","))
+    return text + "".join(_CLOSERS[opener] for opener in reversed(stack))
+
+
+def repair_json(text: str) -> Any:
+    """LLM 의 JSON 응답 파싱 (흔한 형식 오류는 고쳐서 파싱)
+
+    - 코드 블록(```json) 과 JSON 앞뒤의 설명 문장 제거
+    - 닫는 괄호 앞의 쉼표 제거
+    - 출력이 잘려 닫히지 않은 배열/객체는 마지막으로 완성된 항목까지만 남기고 닫음
+
+    고칠 수 없으면 ValueError
+    """
+    cleaned = _strip_fences(text.strip()).strip()
+    try:
+        return json.loads(cleaned)
+    except json.JSONDecodeError:
+        pass
+
+    starts = [i for i in (cleaned.find("{"), cleaned.find("[")) if i >= 0]
+    if not starts:
+        raise ValueError("Invalid JSON response from LLM: no JSON value found")
+    body = cleaned[min(starts) :]
+
+    end, cuts, stack, in_string = _scan(body)
+    if end is not None:
+        # 루트 값 뒤의 텍스트는 버림
+        candidates = [_close(body[:end], [])]
+    else:
+        candidates = [] if in_string else [_close(body, stack)]
+        candidates += [
+            _close(body[:position], opened)
+            for position, opened in reversed(cuts[-MAX_REPAIR_ATTEMPTS:])
+        ]
+
+    for candidate in candidates:
+        try:
+            result = json.loads(candidate)
+        except json.JSONDecodeError:
+            continue
+        logger.warning(
+            f"Repaired malformed LLM JSON ({len(text)} chars -> {len(candidate)})"
+        )
+        return result
+
+    raise ValueError("Invalid JSON response from LLM: unable to repair")
+
+
+def _pick(data: Dict[str, Any], keys: Sequence[str]) -> Any:
+    for key in keys:
+        value = data.get(key)
+        if value not in (None, "", [], {}):
+            return value
+    return None
+
+
+def _to_week_number(value: Any) -> Optional[int]:
+    if isinstance(value, bool):
+        return None
+    if isinstance(value, int):
+        return value if value >= 1 else None
+    if isinstance(value, float) and value.is_integer():
+        return _to_week_number(int(value))
+    if isinstance(value, str):
+        match = _WEEK_NUMBER.match(value)
+        if match:
+            return _to_week_number(int(match.group(1)))
+    return None
+
+
+@dataclass
+class WeekPayload:
+    week_number: int
+    title: str
+    lessons: List[str]
+
+    def as_dict(self) -> Dict[str, Any]:
+        return {
+            "week_number": self.week_number,
+            "title": self.title,
+            "lessons": self.lessons,
+        }
+
+
+@dataclass
+class CurriculumPayload:
+    title: str
+    weeks: List[WeekPayload] = field(default_factory=list)
+
+    def missing_weeks(self, period: int) -> List[int]:
+        """1~period 중 레슨이 없는 주차"""
+        present = {week.week_number for week in self.weeks}
+        return [n for n in range(1, period + 1) if n not in present]
+
+    def merge(self, weeks: List[WeekPayload]) -> None:
+        """없는 주차만 추가 (이미 있는 주차는 유지)"""
+        present = {week.week_number for week in self.weeks}
+        for week in weeks:
+            if week.week_number not in present:
+                self.weeks.append(week)
+                present.add(week.week_number)
+        self.weeks.sort(key=lambda week: week.week_number)
+
+    def as_dict(self) -> Dict[str, Any]:
+        return {
+            "title": self.title,
+            "schedule": [week.as_dict() for week in self.weeks],
+        }
+
+
+def parse_curriculum(data: Any) -> CurriculumPayload:
+    """커리큘럼 응답을 표준 형태로 정규화
+
+    문자열이면 ``repair_json`` 으로 파싱한다. ``{"title", "schedule"}`` 객체,
+    주차 배열, ``[{"title", "schedule"}]`` 래퍼를 모두 받고, 키 별칭과 문자열 주차
+    번호("3", "3주차")를 표준 값으로 바꾼다. 주차 번호나 레슨이 없는 항목은 버린다.
+    """
+    if isinstance(data, str):
+        data = repair_json(data)
+
+    if isinstance(data, list):
+        first = data[0] if data else {}
+        if isinstance(first, dict) and _pick(first, CURRICULUM_SCHEDULE_KEYS):
+            data = first
+        else:
+            data = {"schedule": data}
+    if not isinstance(data, dict):
+        raise ValueError("Invalid LLM response format")
+
+    title = _pick(data, CURRICULUM_TITLE_KEYS)
+    schedule = _pick(data, CURRICULUM_SCHEDULE_KEYS) or []
+    if isinstance(schedule, dict):
+        schedule = [schedule]
+
+    weeks: Dict[int, WeekPayload] = {}
+    for item in schedule if isinstance(schedule, list) else []:
+        if not isinstance(item, dict):
+            continue
+        week_number = _to_week_number(_pick(item, WEEK_NUMBER_KEYS))
+        lessons_raw = _pick(item, WEEK_LESSONS_KEYS)
+        if week_number is None or not lessons_raw or week_number in weeks:
+            continue
+        if not isinstance(lessons_raw, list):
+            lessons_raw = [lessons_raw]
+        lessons = [str(lesson).strip() for lesson in lessons_raw if str(lesson).strip()]
+        if not lessons:
+            continue
+        week_title = _pick(item, WEEK_TITLE_KEYS)
+        weeks[week_number] = WeekPayload(
+            week_number=week_number,
+            title=str(week_title).strip() if week_title else "",
+            lessons=lessons,
+        )
+
+    return CurriculumPayload(
+        title=str(title).strip() if title else "",
+        weeks=sorted(weeks.values(), key=lambda week: week.week_number),
+    )
+
+
+def missing_week_ranges(weeks: Sequence[int], max_size: int) -> List[Tuple[int, int]]:
+    """빠진 주차 번호를 최대 max_size 주씩 연속 구간으로 묶음"""
+    ranges: List[Tuple[int, int]] = []
+    for week in sorted(weeks):
+        if ranges and ranges[-1][1] == week - 1 and week - ranges[-1][0] < max_size:
+            ranges[-1] = (ranges[-1][0], week)
+        else:
+            ranges.append((week, week))
+    return ranges
+
+
+def _to_score(value: Any) -> Optional[float]:
+    if isinstance(value, bool):
+        return None
+    if isinstance(value, str):
+        # "8", "8.5/10" 등
+        match = re.match(r"^\s*(-?\d+(?:\.\d+)?)", value)
+        value = float(match.group(1)) if match else None
+    if not isinstance(value, (int, float)):
+        return None
+    return min(max(float(value), MIN_SCORE), MAX_SCORE)
+
+
+def parse_feedback(data: Any) -> Dict[str, Any]:
+    """피드백 응답을 표준 형태로 정규화
+
+    키 별칭과 중첩된 상세 점수(``detailed_scores``)를 펼치고, 점수는 0~10 으로
+    맞춘다. 총점이 없으면 상세 점수 평균(소수점 1자리)으로 채운다.
+    comment 가 없거나 점수를 하나도 얻지 못하면 ValueError
+    """
+    if isinstance(data, str):
+        data = repair_json(data)
+    if isinstance(data, list) and data and isinstance(data[0], dict):
+        data = data[0]
+    if not isinstance(data, dict):
+        raise ValueError("Invalid LLM feedback format")
+
+    comment = _pick(data, FEEDBACK_COMMENT_KEYS)
+    if not isinstance(comment, str) or not comment.strip():
+        raise ValueError("LLM feedback is missing comment")
+
+    details_source = dict(data)
+    for key in FEEDBACK_DETAIL_CONTAINER_KEYS:
+        nested = data.get(key)
+        if isinstance(nested, dict):
+            details_source = {**nested, **details_source}
+
+    detailed_scores: Dict[str, float] = {}
+    for key in FEEDBACK_DETAIL_KEYS:
+        score = _to_score(details_source.get(key))
+        if score is not None:
+            detailed_scores[key] = score
+
+    score = _to_score(_pick(data, FEEDBACK_SCORE_KEYS))
+    if score is None:
+        if not detailed_scores:
+            raise ValueError("LLM feedback is missing score")
+        score = round(sum(detailed_scores.values()) / len(detailed_scores), 1)
+
+    return {
+        "comment": comment.strip(),
+        "score": score,
+        **{key: detailed_scores.get(key, 0) for key in FEEDBACK_DETAIL_KEYS},
+    }
@@ -0,0 +1,82 @@
+import asyncio
+import time
+from contextlib import contextmanager
+from typing import Any, Dict, Iterator, Optional, Tuple
+
+from app.common.monitoring.metrics import record_llm_request, record_llm_usage
+
+# 모델별 100만 토큰당 가격 (USD, 입력 / 출력)
+MODEL_PRICES: Dict[str, Tuple[float, float]] = {
+    "gpt-4o-mini": (0.15, 0.60),
+    "gpt-4o": (2.50, 10.00),
+    "gpt-4.1-mini": (0.40, 1.60),
+    "gpt-4.1": (2.00, 8.00),
+}
+
+
+def estimate_cost(model: str, prompt_tokens: int, completion_tokens: int) -> float:
+    """토큰 수로 예상 비용 계산 (가격표에 없는 모델은 0)"""
+    # gpt-4o-mini-2024-07-18 처럼 날짜가 붙은 모델명은 가장 긴 접두어 기준
+    matches = [name for name in MODEL_PRICES if model.startswith(name)]
+    if not matches:
+        return 0.0
+    input_price, output_price = MODEL_PRICES[max(matches, key=len)]
+    return (prompt_tokens * input_price + completion_tokens * output_price) / 1_000_000
+
+
+class LLMCall:
+    """LLM 호출 한 번의 사용량"""
+
+    def __init__(self) -> None:
+        self.prompt_tokens = 0
+        self.completion_tokens = 0
+
+    def add_usage(self, prompt_tokens: int, completion_tokens: int) -> None:
+        self.prompt_tokens += prompt_tokens or 0
+        self.completion_tokens += completion_tokens or 0
+
+    def add_openai_usage(self, usage: Optional[Dict[str, Any]]) -> None:
+        """OpenAI 응답의 ``usage`` (prompt_tokens / completion_tokens)"""
+        if usage:
+            self.add_usage(
+                usage.get("prompt_tokens", 0), usage.get("completion_tokens", 0)
+            )
+
+    def add_langchain_usage(self, usage: Optional[Dict[str, Any]]) -> None:
+        """LangChain 메시지의 ``usage_metadata`` (input_tokens / output_tokens)"""
+        if usage:
+            self.add_usage(
+                usage.get("input_tokens", 0), usage.get("output_tokens", 0)
+            )
+
+
+@contextmanager
+def track_llm_call(operation: str, model: str) -> Iterator[LLMCall]:
+    """블록 안의 LLM 호출 소요 시간 / 토큰 / 비용을 메트릭으로 기록
+
+    블록에서 ValueError 가 나면 응답 파싱 실패로 본다.
+    """
+    call = LLMCall()
+    started = time.monotonic()
+    status = "success"
+    try:
+        yield call
+    except ValueError:
+        status = "parse_error"
+        raise
+    except (asyncio.CancelledError, GeneratorExit):
+        status = "cancelled"  # 헤지 경쟁에서 진 시도, 중단된 스트림
+        raise
+    except BaseException:
+        status = "error"
+        raise
+    finally:
+        record_llm_request(operation, model, status, time.monotonic() - started)
+        if call.prompt_tokens or call.completion_tokens:
+            record_llm_usage(
+                operation,
+                model,
+                call.prompt_tokens,
+                call.completion_tokens,
+                estimate_cost(model, call.prompt_tokens, call.completion_tokens),
+            )
@@ -0,0 +1,50 @@
+import logging
+
+from starlette.types import ASGIApp, Receive, Scope, Send
+
+from app.common.db.query_stats import track_queries
+from app.common.monitoring.metrics import record_db_request
+
+logger = logging.getLogger(__name__)
+
+
+class QueryStatsMiddleware:
+    """HTTP 요청마다 SQL 실행 수와 DB 시간을 라우트 템플릿별로 기록
+
+    라우트는 ``/curriculums/{curriculum_id}`` 처럼 경로 템플릿으로 묶어 라벨 수가
+    늘어나지 않게 한다. 같은 SQL 이 ``n_plus_one_threshold`` 번 이상 반복되면
+    N+1 조회로 보고 경고를 남긴다 (0이면 끔).
+    """
+
+    def __init__(self, app: ASGIApp, n_plus_one_threshold: int = 10) -> None:
+        self.app = app
+        self.n_plus_one_threshold = n_plus_one_threshold
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        with track_queries() as stats:
+            try:
+                await self.app(scope, receive, send)
+            finally:
+                route = getattr(scope.get("route"), "path", None) or "unmatched"
+                repeated = (
+                    stats.repeated(self.n_plus_one_threshold)
+                    if self.n_plus_one_threshold > 0
+                    else []
+                )
+                if repeated:
+                    statement, count = repeated[0]
+                    logger.warning(
+                        f"Possible N+1 on {scope['method']} {route}: "
+                        f"{count}x {' '.join(statement.split())[:200]}"
+                    )
+                record_db_request(
+                    scope["method"],
+                    route,
+                    stats.count,
+                    stats.duration,
+                    n_plus_one=bool(repeated),
+                )
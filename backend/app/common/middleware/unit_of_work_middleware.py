@@ -0,0 +1,45 @@
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from app.common.db.database import AsyncSessionLocal
+from app.common.db.unit_of_work import UnitOfWork
+
+
+class UnitOfWorkMiddleware:
+    """HTTP 요청마다 UnitOfWork 를 열고 응답 경계에서 commit/rollback
+
+    응답 헤더를 보내기 직전에 상태 코드가 4xx/5xx 면 rollback, 아니면 commit 한다.
+    저장소는 flush 만 하므로 실패 응답 전에 저장소로 쓴 내용도 함께 rollback 되고,
+    ``after_commit`` 으로 등록한 작업(피드 반영 등)도 실행되지 않는다.
+    commit 이 실패하면 성공 응답이 나가지 않고 예외가 500 으로 처리된다.
+    스트리밍 응답 본문에서 쓴 내용은 요청이 끝날 때 한 번 더 commit 된다.
+
+    BaseHTTPMiddleware 는 응답 본문을 별도 태스크로 흘려보내므로 순수 ASGI
+    미들웨어로 구현해 스트리밍 중에도 같은 세션 범위를 유지한다.
+    """
+
+    def __init__(
+        self,
+        app: ASGIApp,
+        session_factory: async_sessionmaker[AsyncSession] = AsyncSessionLocal,
+    ) -> None:
+        self.app = app
+        self.session_factory = session_factory
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        unit_of_work = UnitOfWork(self.session_factory)
+        async with unit_of_work:
+
+            async def send_wrapper(message: Message) -> None:
+                if message["type"] == "http.response.start":
+                    if message["status"] < 400:
+                        await unit_of_work.commit()
+                    else:
+                        await unit_of_work.rollback()
+                await send(message)
+
+            await self.app(scope, receive, send_wrapper)
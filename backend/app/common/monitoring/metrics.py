@@ -157,6 +157,26 @@ db_query_total = Counter(
     ["query_type", "table", "operation", "status"],
 )
 
+db_request_queries = Histogram(
+    "db_request_queries",
+    "Number of SQL statements executed per API request",
+    ["method", "route"],
+    buckets=[0, 1, 2, 3, 5, 10, 20, 50, 100, 200],
+)
+
+db_request_duration = Histogram(
+    "db_request_duration_seconds",
+    "Total SQL execution time per API request",
+    ["method", "route"],
+    buckets=[0.001, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0],
+)
+
+db_n_plus_one_total = Counter(
+    "db_n_plus_one_total",
+    "API requests that repeated the same SQL statement over the N+1 threshold",
+    ["method", "route"],
+)
+
 db_connection_pool_size = Gauge(
     "db_connection_pool_size", "Current database connection pool size"
 )
@@ -169,6 +189,18 @@ db_connection_pool_overflow = Gauge(
     "db_connection_pool_overflow", "Number of connections in overflow"
 )
 
+db_connection_pool_wait = Histogram(
+    "db_connection_pool_wait_seconds",
+    "Time spent waiting for a pooled database connection",
+    buckets=[0.0005, 0.001, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 5.0, 30.0],
+)
+
+db_replica_lag = Gauge(
+    "db_replica_lag_seconds",
+    "Replication lag of each read replica (-1 when unavailable)",
+    ["replica"],
+)
+
 api_request_duration = Histogram(
     "api_request_duration_seconds",
     "API request execution time",
@@ -205,6 +237,109 @@ redis_operation_duration = Histogram(
 
 cache_hit_ratio = Gauge("cache_hit_ratio", "Cache hit ratio percentage")
 
+# 피드 캐시 갱신 워커 메트릭
+feed_cache_refresh_duration = Histogram(
+    "feed_cache_refresh_duration_seconds",
+    "Feed cache refresh execution time",
+    ["status"],
+    buckets=[0.01, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0],
+)
+
+feed_cache_refresh_total = Counter(
+    "feed_cache_refresh_total",
+    "Total number of feed cache refresh runs",
+    ["status"],
+)
+
+feed_cache_indexed_items_gauge = Gauge(
+    "feed_cache_indexed_items", "Number of curriculums in the feed index"
+)
+
+feed_cache_warmed_items_gauge = Gauge(
+    "feed_cache_warmed_items", "Number of feed items warmed in the last refresh"
+)
+
+feed_cache_refresher_leader_gauge = Gauge(
+    "feed_cache_refresher_leader", "Whether this worker holds the feed refresher lease"
+)
+
+# LLM 호출 대기열 메트릭
+llm_queue_depth_gauge = Gauge("llm_queue_depth", "Number of LLM calls waiting for a slot")
+
+llm_active_requests_gauge = Gauge(
+    "llm_active_requests", "Number of LLM calls currently in flight"
+)
+
+llm_queue_wait_duration = Histogram(
+    "llm_queue_wait_seconds",
+    "Time LLM calls spent waiting for a slot",
+    ["operation"],
+    buckets=[0.001, 0.01, 0.05, 0.1, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0],
+)
+
+llm_requests_rejected_total = Counter(
+    "llm_requests_rejected_total",
+    "Total number of LLM calls rejected by the dispatcher",
+    ["operation", "reason"],
+)
+
+llm_cache_requests_total = Counter(
+    "llm_cache_requests_total",
+    "Total number of LLM response cache lookups",
+    ["operation", "result"],
+)
+
+# LLM 호출 지연 / 토큰 / 비용 메트릭
+llm_request_duration = Histogram(
+    "llm_request_duration_seconds",
+    "LLM provider call latency",
+    ["operation", "model", "status"],
+    buckets=[0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 20.0, 30.0, 60.0, 120.0],
+)
+
+llm_tokens_total = Counter(
+    "llm_tokens_total",
+    "Total number of LLM tokens used",
+    ["operation", "model", "kind"],
+)
+
+llm_cost_usd_total = Counter(
+    "llm_cost_usd_total",
+    "Estimated LLM cost in USD",
+    ["operation", "model"],
+)
+
+llm_parse_failures_total = Counter(
+    "llm_parse_failures_total",
+    "Total number of LLM responses that could not be parsed",
+    ["operation", "model"],
+)
+
+llm_circuit_state_gauge = Gauge(
+    "llm_circuit_state",
+    "LLM circuit breaker state (0=closed, 1=half_open, 2=open)",
+)
+
+llm_resilience_events_total = Counter(
+    "llm_resilience_events_total",
+    "Total number of LLM timeouts, retries and hedged attempts",
+    ["operation", "event"],
+)
+
+# 백그라운드 작업 메트릭
+job_runs_total = Counter(
+    "job_runs_total",
+    "Total number of background job runs",
+    ["job_type", "result"],
+)
+
+job_duration = Histogram(
+    "job_duration_seconds",
+    "Background job execution time",
+    ["job_type"],
+    buckets=[0.1, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0, 60.0, 120.0],
+)
+
 # 메트릭 서버 상태
 _metrics_server_port: Optional[int] = None
 
@@ -443,11 +578,33 @@ def record_db_query(
     ).inc()
 
 
-def set_db_connection_metrics(pool_size: int, checked_out: int, overflow: int) -> None:
-    """DB 연결 풀 메트릭 설정"""
+def record_db_request(
+    method: str, route: str, queries: int, duration: float, n_plus_one: bool = False
+) -> None:
+    """요청 하나의 SQL 실행 수와 DB 시간 기록"""
+    db_request_queries.labels(method=method, route=route).observe(queries)
+    db_request_duration.labels(method=method, route=route).observe(duration)
+    if n_plus_one:
+        db_n_plus_one_total.labels(method=method, route=route).inc()
+
+
+def set_db_connection_metrics(
+    pool_size: int,
+    checked_out: int,
+    overflow: int,
+    wait_time: Optional[float] = None,
+) -> None:
+    """DB 연결 풀 메트릭 설정 (wait_time: 이번 체크아웃 대기 시간, 초)"""
     db_connection_pool_size.set(pool_size)
     db_connection_pool_checked_out.set(checked_out)
     db_connection_pool_overflow.set(overflow)
+    if wait_time is not None:
+        db_connection_pool_wait.observe(wait_time)
+
+
+def set_db_replica_lag(replica: str, lag: Optional[float]) -> None:
+    """복제본 지연 설정 (측정 실패 등 사용 불가면 -1)"""
+    db_replica_lag.labels(replica=replica).set(-1 if lag is None else lag)
 
 
 # API 성능 편의 함수
@@ -484,3 +641,93 @@ def record_redis_operation(
 def set_cache_hit_ratio(ratio: float) -> None:
     """캐시 적중률 설정"""
     cache_hit_ratio.set(ratio)
+
+
+# 피드 캐시 갱신 편의 함수
+def record_feed_cache_refresh(
+    duration: float,
+    indexed_items: int = 0,
+    warmed_items: int = 0,
+    status: str = "success",
+) -> None:
+    """피드 캐시 갱신 메트릭 기록 (아이템 수는 성공 시에만 갱신)"""
+    feed_cache_refresh_duration.labels(status=status).observe(duration)
+    feed_cache_refresh_total.labels(status=status).inc()
+    if status == "success":
+        feed_cache_indexed_items_gauge.set(indexed_items)
+        feed_cache_warmed_items_gauge.set(warmed_items)
+
+
+def set_feed_cache_refresher_leader(is_leader: bool) -> None:
+    """피드 캐시 갱신 리더 여부 설정"""
+    feed_cache_refresher_leader_gauge.set(1 if is_leader else 0)
+
+
+# LLM 대기열 편의 함수
+def set_llm_queue_state(depth: int, active: int) -> None:
+    """LLM 대기열 길이 및 실행 중 호출 수 설정"""
+    llm_queue_depth_gauge.set(depth)
+    llm_active_requests_gauge.set(active)
+
+
+def record_llm_queue_wait(operation: str, wait: float) -> None:
+    """LLM 슬롯 대기 시간 기록"""
+    llm_queue_wait_duration.labels(operation=operation).observe(wait)
+
+
+def increment_llm_request_rejected(operation: str, reason: str) -> None:
+    """LLM 호출 거절 수 증가"""
+    llm_requests_rejected_total.labels(operation=operation, reason=reason).inc()
+
+
+def record_llm_cache_lookup(operation: str, hit: bool) -> None:
+    """LLM 응답 캐시 조회 결과 기록"""
+    llm_cache_requests_total.labels(
+        operation=operation, result="hit" if hit else "miss"
+    ).inc()
+
+
+def record_llm_request(
+    operation: str, model: str, status: str, duration: float
+) -> None:
+    """LLM 호출 소요 시간 기록 (success/error/parse_error)"""
+    llm_request_duration.labels(
+        operation=operation, model=model, status=status
+    ).observe(duration)
+    if status == "parse_error":
+        llm_parse_failures_total.labels(operation=operation, model=model).inc()
+
+
+def record_llm_usage(
+    operation: str,
+    model: str,
+    prompt_tokens: int,
+    completion_tokens: int,
+    cost: float,
+) -> None:
+    """LLM 토큰 사용량 및 예상 비용 기록"""
+    llm_tokens_total.labels(operation=operation, model=model, kind="prompt").inc(
+        prompt_tokens
+    )
+    llm_tokens_total.labels(
+        operation=operation, model=model, kind="completion"
+    ).inc(completion_tokens)
+    llm_cost_usd_total.labels(operation=operation, model=model).inc(cost)
+
+
+def set_llm_circuit_state(state: str) -> None:
+    """LLM 서킷 브레이커 상태 설정"""
+    llm_circuit_state_gauge.set({"closed": 0, "half_open": 1, "open": 2}[state])
+
+
+def increment_llm_resilience_event(operation: str, event: str) -> None:
+    """LLM 타임아웃/재시도/헤지 발생 수 증가"""
+    llm_resilience_events_total.labels(operation=operation, event=event).inc()
+
+
+# 백그라운드 작업 편의 함수
+def record_job_run(job_type: str, result: str, duration: float) -> None:
+    """작업 실행 결과 기록 (succeeded/retried/failed/dead_lettered)"""
+    job_runs_total.labels(job_type=job_type, result=result).inc()
+    job_duration.labels(job_type=job_type).observe(duration)
+
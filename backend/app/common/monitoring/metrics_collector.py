@@ -7,6 +7,7 @@ from sqlalchemy import Engine, QueuePool, func, select
 from sqlalchemy.ext.asyncio import AsyncSession, AsyncConnection, AsyncEngine
 
 from app.common.cache.redis_client import RedisClient
+from app.common.db.routing import read_only
 from app.common.monitoring.metrics import (
     set_active_users,
     set_total_users,
@@ -107,6 +108,7 @@ class MetricsService:
                 logger.error(f"Error updating metrics: {e}")
                 await asyncio.sleep(self.update_interval)
 
+    @read_only
     async def update_all_metrics(self) -> None:
         """모든 메트릭 업데이트"""
         try:
@@ -637,7 +639,7 @@ class MetricsService:
             if isinstance(pool, QueuePool):
                 pool_size = int(pool.size())
                 checked_out = int(pool.checkedout())
-                overflow = int(pool.overflow())
+                overflow = max(int(pool.overflow()), 0)  # -pool_size 부터 시작
             else:
                 # NullPool 등은 수치 0 보고, 상태만 로그
                 status = pool.status() if hasattr(pool, "status") else "<no status>"
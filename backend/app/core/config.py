@@ -13,15 +13,65 @@ class Settings(BaseSettings):
     database_password: str = ""
     database_url: str = ""
     sqlalchemy_database_url: str = ""
+    db_echo: bool = False  # 모든 SQL 을 동기 로깅하므로 운영에서는 끔
+    db_pool_size: int = 10
+    db_max_overflow: int = 10
+    db_pool_timeout: float = 30.0  # 커넥션을 얻기까지 기다리는 최대 시간(초)
+    db_pool_recycle: int = 1800  # MySQL wait_timeout 보다 짧게
+    db_pool_pre_ping: bool = True
+    db_statement_timeout_ms: int = 0  # SELECT 실행 시간 상한, 0이면 끔 (MySQL)
+    db_replica_urls: str = ""  # 읽기 복제본 접속 URL (쉼표로 구분, 비우면 주 DB만 사용)
+    db_replica_max_lag: float = 1.0  # 이 지연(초)을 넘는 복제본은 건너뜀
+    db_replica_check_interval: float = 5.0
+    db_n_plus_one_threshold: int = 10  # 요청 안에서 같은 SQL 이 이만큼 반복되면 경고, 0이면 끔
+    db_slow_query_threshold_ms: float = 200.0  # 이보다 오래 걸린 SQL 을 기록, 0이면 끔
+    db_slow_query_buffer_size: int = 500
+    db_slow_query_explain: bool = False  # 반복되는 느린 SELECT 의 EXPLAIN 을 백그라운드에서 수집
+    db_slow_query_explain_min_count: int = 5
+    db_slow_query_explain_sample_rate: float = 0.1
     secret_key: str = ""
     algorithm: str = ""
     llm_api_key: str = ""
     llm_endpoint: str = ""
+    llm_pool_limit: int = 100
+    llm_pool_limit_per_host: int = 20
+    llm_keepalive_timeout: float = 30.0
+    llm_max_concurrency: int = 8
+    llm_max_queue_size: int = 100
+    llm_max_queued_per_user: int = 4  # 분할 생성은 구간마다 따로 기다리므로 llm_chunk_concurrency 이상
+    llm_queue_timeout: float = 30.0
+    llm_cache_ttl: int = 86400
+    llm_cache_max_entries: int = 1000
+    llm_chunked_min_period: int = 9  # 0이면 분할 생성 사용 안 함
+    llm_chunk_size: int = 4
+    llm_chunk_concurrency: int = 3
+    llm_regenerate_missing_weeks: bool = True  # 응답에 빠진 주차만 다시 생성
+    llm_curriculum_timeout: float = 120.0
+    llm_feedback_timeout: float = 30.0
+    llm_stream_idle_timeout: float = 30.0
+    llm_max_attempts: int = 2
+    llm_circuit_failure_threshold: int = 5
+    llm_circuit_reset_timeout: float = 30.0
+    llm_hedge_enabled: bool = False
+    llm_hedge_min_samples: int = 20
+    llm_hedge_min_delay: float = 1.0
+    llm_feedback_prompt_budget: int = 3000  # 피드백 프롬프트 입력 토큰 상한
     redis_url: str = ""
     kafka_bootstrap_servers: str = ""
     langfuse_secret_key: str = ""
     langfuse_public_key: str = ""
     langfuse_host: str = "https://cloud.langfuse.com"
+    langfuse_sample_rate: float = 0.1  # 추적할 LLM 호출 비율 (0~1)
+    langfuse_flush_at: int = 64
+    langfuse_flush_interval: float = 5.0
+    langfuse_max_queue_size: int = 2048
+    feed_refresh_enabled: bool = True
+    feed_refresh_interval: int = 300
+    feed_refresh_warm_up_size: int = 200
+    job_broker: str = "auto"  # auto | redis | memory
+    job_worker_concurrency: int = 4
+    job_max_attempts: int = 3
+    job_retry_backoff: float = 2.0
 
 
 @lru_cache
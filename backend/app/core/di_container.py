@@ -2,10 +2,15 @@ from dependency_injector import containers, providers
 
 # from dependency_injector.wiring import Provide
 from app.common.cache import redis_client
-from app.common.db.session import get_session
+from app.common.db.unit_of_work import current_session
 
 # from app.common.llm.openai_client import OpenAILLMClient
+from app.common.jobs.job_store import JobStore
+from app.common.jobs.job_worker import JobWorkerPool
 from app.common.llm.langchain_client import LangChainLLMClient
+from app.common.llm.dispatcher import DispatchedLLMClient, LLMDispatcher
+from app.common.llm.resilience import CircuitBreaker, ResilientLLMClient
+from app.common.llm.response_cache import CachedLLMClient
 from app.common.monitoring.metrics_collector import MetricsService
 from app.modules.admin.application.service.admin_curriculum_service import (
     AdminCurriculumService,
@@ -76,13 +81,14 @@ class Container(containers.DeclarativeContainer):
     ulid = providers.Singleton(ULID)
     crypto = providers.Singleton(Crypto)
 
-    db_session = providers.Resource(get_session)
+    # 요청마다 UnitOfWorkMiddleware 가 연 세션, 저장소는 요청(스코프)마다 새로 만든다
+    db_session = providers.Callable(current_session)
     redis_resources = providers.Resource(lambda: redis_client)
 
     # User
-    user_repository = providers.Singleton(UserRepository, session=db_session)
+    user_repository = providers.Factory(UserRepository, session=db_session)
 
-    user_domain_service = providers.Singleton(
+    user_domain_service = providers.Factory(
         UserDomainService,
         user_repo=user_repository,
     )
@@ -105,20 +111,65 @@ class Container(containers.DeclarativeContainer):
     )
 
     # LLM
+    llm_dispatcher = providers.Singleton(
+        LLMDispatcher,
+        max_concurrency=config.provided.llm_max_concurrency,
+        max_queue_size=config.provided.llm_max_queue_size,
+        max_queued_per_user=config.provided.llm_max_queued_per_user,
+        queue_timeout=config.provided.llm_queue_timeout,
+    )
+
+    # 캐시 → 대기열(호출마다 슬롯) → 타임아웃/재시도 → 구현체
     llm_client = providers.Singleton(
-        # OpenAILLMClient,
-        LangChainLLMClient,
-        api_key=config.provided.llm_api_key,
-        model="gpt-4o-mini",
+        CachedLLMClient,
+        client=providers.Singleton(
+            DispatchedLLMClient,
+            client=providers.Singleton(
+                ResilientLLMClient,
+                client=providers.Singleton(
+                    # OpenAILLMClient,
+                    LangChainLLMClient,
+                    api_key=config.provided.llm_api_key,
+                    model="gpt-4o-mini",
+                ),
+                curriculum_timeout=config.provided.llm_curriculum_timeout,
+                feedback_timeout=config.provided.llm_feedback_timeout,
+                stream_idle_timeout=config.provided.llm_stream_idle_timeout,
+                max_attempts=config.provided.llm_max_attempts,
+                breaker=providers.Singleton(
+                    CircuitBreaker,
+                    failure_threshold=config.provided.llm_circuit_failure_threshold,
+                    reset_timeout=config.provided.llm_circuit_reset_timeout,
+                ),
+                hedge=config.provided.llm_hedge_enabled,
+                hedge_min_samples=config.provided.llm_hedge_min_samples,
+                hedge_min_delay=config.provided.llm_hedge_min_delay,
+                dispatcher=llm_dispatcher,  # 헤지 시도는 빈 슬롯이 있을 때만
+            ),
+            dispatcher=llm_dispatcher,
+        ),
+        ttl=config.provided.llm_cache_ttl,
+        max_entries=config.provided.llm_cache_max_entries,
+    )
+
+    # Background jobs
+    job_store = providers.Singleton(JobStore)
+
+    job_worker_pool = providers.Singleton(
+        JobWorkerPool,
+        store=job_store,
+        concurrency=config.provided.job_worker_concurrency,
+        max_attempts=config.provided.job_max_attempts,
+        backoff_base=config.provided.job_retry_backoff,
     )
 
     # Social
-    follow_repository = providers.Singleton(
+    follow_repository = providers.Factory(
         FollowRepository,
         session=db_session,
     )
 
-    follow_domain_service = providers.Singleton(
+    follow_domain_service = providers.Factory(
         FollowDomainService,
         follow_repo=follow_repository,
         user_repo=user_repository,
@@ -132,13 +183,23 @@ class Container(containers.DeclarativeContainer):
         ulid=ulid,
     )
 
+    # Feed (커리큘럼 변경 이벤트 수신)
+    feed_container = providers.Container(
+        FeedContainer,
+        session=db_session,
+    )
+
+    feed_service = feed_container.feed_service
+    feed_repository = feed_container.feed_repository
+    feed_event_handler = feed_container.feed_event_handler
+
     # Curriculum
-    curriculum_repository = providers.Singleton(
+    curriculum_repository = providers.Factory(
         CurriculumRepository,
         session=db_session,
     )
 
-    curriculum_domain_service = providers.Singleton(
+    curriculum_domain_service = providers.Factory(
         CurriculumDomainService,
         curriculum_repo=curriculum_repository,
     )
@@ -149,6 +210,11 @@ class Container(containers.DeclarativeContainer):
         llm_client=llm_client,
         follow_repo=follow_repository,
         ulid=ulid,
+        feed_event_handler=feed_event_handler,
+        chunked_min_period=config.provided.llm_chunked_min_period,
+        chunk_size=config.provided.llm_chunk_size,
+        chunk_concurrency=config.provided.llm_chunk_concurrency,
+        regenerate_missing_weeks=config.provided.llm_regenerate_missing_weeks,
     )
     # Learning
 
@@ -157,6 +223,7 @@ class Container(containers.DeclarativeContainer):
         session=db_session,
         curriculum_repository=curriculum_repository,
         llm_client=llm_client,
+        job_pool=job_worker_pool,
     )
     summary_service = learning_container.summary_service
     summary_repository = learning_container.summary_repository
@@ -172,27 +239,27 @@ class Container(containers.DeclarativeContainer):
 
     # Taxonomy
 
-    tag_repository = providers.Singleton(
+    tag_repository = providers.Factory(
         TagRepository,
         session=db_session,
     )
 
-    category_repository = providers.Singleton(
+    category_repository = providers.Factory(
         CategoryRepository,
         session=db_session,
     )
 
-    curriculum_tag_repository = providers.Singleton(
+    curriculum_tag_repository = providers.Factory(
         CurriculumTagRepository,
         session=db_session,
     )
 
-    curriculum_category_repository = providers.Singleton(
+    curriculum_category_repository = providers.Factory(
         CurriculumCategoryRepository,
         session=db_session,
     )
 
-    tag_domain_service = providers.Singleton(
+    tag_domain_service = providers.Factory(
         TagDomainService,
         tag_repo=tag_repository,
         category_repo=category_repository,
@@ -222,6 +289,7 @@ class Container(containers.DeclarativeContainer):
         curriculum_category_repo=curriculum_category_repository,
         curriculum_repo=curriculum_repository,
         ulid=ulid,
+        feed_event_handler=feed_event_handler,
     )
 
     social_container = providers.Container(
@@ -234,20 +302,14 @@ class Container(containers.DeclarativeContainer):
     comment_service = social_container.comment_service
     bookmark_service = social_container.bookmark_service
 
-    feed_container = providers.Container(
-        FeedContainer,
-        session=db_session,
-    )
-
-    feed_service = feed_container.feed_service
-    feed_repository = feed_container.feed_repository
-
-    admin_curriculum_repository = providers.Singleton(
+    admin_curriculum_repository = providers.Factory(
         AdminCurriculumRepository,
         session=db_session,
     )
     admin_curriculum_service = providers.Factory(
-        AdminCurriculumService, repo=admin_curriculum_repository
+        AdminCurriculumService,
+        repo=admin_curriculum_repository,
+        feed_event_handler=feed_event_handler,
     )
 
     metrics_service = providers.Factory(
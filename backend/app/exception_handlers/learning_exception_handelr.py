@@ -4,6 +4,7 @@ from fastapi.responses import JSONResponse
 from app.modules.learning.application.exception import (
     FeedbackAccessDeniedError,
     FeedbackAlreadyExistsError,
+    FeedbackJobNotFoundError,
     FeedbackNotFoundError,
     InvalidFeedbackScoreError,
     InvalidSummaryContentError,
@@ -85,6 +86,15 @@ async def llm_feedback_generation_error(
     raise exc
 
 
+async def feedback_job_not_found_error(
+    request: Request,
+    exc: Exception,
+):
+    if isinstance(exc, FeedbackJobNotFoundError):
+        return JSONResponse(status_code=404, content={"detail": str(exc)})
+    raise exc
+
+
 def LearningExceptionHandler(app: FastAPI):
     app.add_exception_handler(SummaryNotFoundError, summary_not_found_error)
     app.add_exception_handler(SummaryAccessDeniedError, summary_access_denied_error)
@@ -94,3 +104,4 @@ def LearningExceptionHandler(app: FastAPI):
     app.add_exception_handler(FeedbackAccessDeniedError, feedback_access_denied_error)
     app.add_exception_handler(InvalidFeedbackScoreError, invalid_feedback_score_error)
     app.add_exception_handler(LLMFeedbackGenerationError, llm_feedback_generation_error)
+    app.add_exception_handler(FeedbackJobNotFoundError, feedback_job_not_found_error)
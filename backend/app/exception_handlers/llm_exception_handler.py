@@ -0,0 +1,21 @@
+from fastapi import FastAPI, Request
+from fastapi.responses import JSONResponse
+
+from app.common.llm.exception import LLMQueueFullError, LLMUserLimitError
+
+
+async def llm_queue_full_error(
+    request: Request,
+    exc: Exception,
+):
+    if isinstance(exc, LLMQueueFullError):
+        return JSONResponse(
+            status_code=429 if isinstance(exc, LLMUserLimitError) else 503,
+            content={"detail": str(exc)},
+            headers={"Retry-After": str(exc.retry_after)},
+        )
+    raise exc
+
+
+def LLMExceptionHandler(app: FastAPI):
+    app.add_exception_handler(LLMQueueFullError, llm_queue_full_error)
@@ -2,8 +2,13 @@ from contextlib import asynccontextmanager, AsyncExitStack
 from fastapi import FastAPI
 
 from app.lifespan.core import core_lifespan
+from app.lifespan.database import database_lifespan
 from app.lifespan.monitoring import monitoring_lifespan
 from .redis import redis_lifespan
+from .feed import feed_lifespan
+from .llm import llm_lifespan
+from .tracing import tracing_lifespan
+from .jobs import jobs_lifespan
 
 # from .core import core_lifespan
 
@@ -12,9 +17,14 @@ from .redis import redis_lifespan
 async def combined_lifespan(app: FastAPI):
     async with AsyncExitStack() as stack:
         # 초기화 순서가 중요하면 원하는 순서대로 등록
+        await stack.enter_async_context(database_lifespan(app))  # 가장 마지막에 정리
         await stack.enter_async_context(monitoring_lifespan(app))
         await stack.enter_async_context(core_lifespan(app))
         await stack.enter_async_context(redis_lifespan(app))  # type: ignore
+        await stack.enter_async_context(tracing_lifespan(app))  # 백그라운드 초기화
+        await stack.enter_async_context(llm_lifespan(app))
+        await stack.enter_async_context(jobs_lifespan(app))  # LLM 클라이언트 이후
+        await stack.enter_async_context(feed_lifespan(app))  # Redis 연결 이후
         yield  # ───── 애플리케이션 구동 중 ─────
 
     # ExitStack이 역순으로 안전하게 정리
@@ -0,0 +1,26 @@
+from contextlib import asynccontextmanager
+from fastapi import FastAPI
+from app.common.db.database import (
+    engine,
+    replica_router,
+    slow_query_recorder,
+)
+import logging
+
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+
+@asynccontextmanager
+async def database_lifespan(app: FastAPI):
+    if replica_router.replicas:
+        logger.info(f"🗄️ Starting replica lag checks ({len(replica_router.replicas)})")
+        await replica_router.start()
+    await slow_query_recorder.start()
+
+    yield
+
+    logger.info("🗄️ Closing database connections")
+    await slow_query_recorder.stop()
+    await replica_router.stop()
+    await engine.dispose()
@@ -0,0 +1,29 @@
+from contextlib import asynccontextmanager
+from fastapi import FastAPI
+from app.core.config import get_settings
+from app.tasks.feed_tasks import FeedCacheRefresher
+import logging
+
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+
+@asynccontextmanager
+async def feed_lifespan(app: FastAPI):
+    settings = get_settings()
+    refresher = None
+
+    if settings.feed_refresh_enabled:
+        logger.info("📰 Starting feed cache refresher")
+        refresher = FeedCacheRefresher(
+            interval=settings.feed_refresh_interval,
+            warm_up_size=settings.feed_refresh_warm_up_size,
+        )
+        app.state.feed_refresher = refresher
+        await refresher.start()
+
+    yield
+
+    if refresher:
+        logger.info("📰 Stopping feed cache refresher")
+        await refresher.stop()
@@ -0,0 +1,40 @@
+from contextlib import asynccontextmanager
+from fastapi import FastAPI
+from app.common.cache.redis_client import redis_client
+from app.common.jobs.job_broker import (
+    IJobBroker,
+    InMemoryJobBroker,
+    RedisStreamJobBroker,
+)
+from app.core.config import get_settings
+from app.tasks.feedback_tasks import FeedbackJobHandler
+import logging
+
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+
+def _select_broker(broker: str) -> IJobBroker:
+    if broker == "redis" or (broker == "auto" and redis_client.is_connected):
+        return RedisStreamJobBroker()
+    return InMemoryJobBroker()
+
+
+@asynccontextmanager
+async def jobs_lifespan(app: FastAPI):
+    settings = get_settings()
+    container = app.container  # type: ignore
+
+    pool = container.job_worker_pool()
+    pool.register(
+        FeedbackJobHandler.JOB_TYPE,
+        FeedbackJobHandler(llm_client=container.llm_client()),
+    )
+
+    logger.info("🧵 Starting background job workers")
+    await pool.start(_select_broker(settings.job_broker))
+
+    yield
+
+    logger.info("🧵 Stopping background job workers")
+    await pool.stop()
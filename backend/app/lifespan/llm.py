@@ -0,0 +1,16 @@
+from contextlib import asynccontextmanager
+from fastapi import FastAPI
+import logging
+
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+
+@asynccontextmanager
+async def llm_lifespan(app: FastAPI):
+    # 앱 수명 동안 하나의 LLM 클라이언트(연결 풀)를 공유
+    logger.info("🤖 Initializing LLM client")
+    llm_client = app.container.llm_client()  # type: ignore
+    yield
+    logger.info("🤖 Closing LLM client")
+    await llm_client.close()
@@ -0,0 +1,17 @@
+from contextlib import asynccontextmanager
+from fastapi import FastAPI
+from app.common.llm.langfuse_helper import langfuse_manager
+import logging
+
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+
+@asynccontextmanager
+async def tracing_lifespan(app: FastAPI):
+    # Langfuse 연결 확인은 네트워크를 타므로 기다리지 않고 백그라운드에서 진행
+    logger.info("🔥 Initializing Langfuse in background")
+    langfuse_manager.start()
+    yield
+    logger.info("🔥 Flushing Langfuse traces")
+    await langfuse_manager.shutdown()
@@ -5,6 +5,9 @@ from app.core.di_container import Container
 from app.exception_handlers import setup_exception_handlers
 from app.lifespan import combined_lifespan
 from app.common.middleware.activity_middleware import ActivityTrackingMiddleware
+from app.common.middleware.query_stats_middleware import QueryStatsMiddleware
+from app.common.middleware.unit_of_work_middleware import UnitOfWorkMiddleware
+from app.core.config import get_settings
 from fastapi.middleware.cors import CORSMiddleware
 
 
@@ -24,6 +27,11 @@ app.container = Container()
 setup_exception_handlers(app)
 
 # 미들웨어 추가
+app.add_middleware(UnitOfWorkMiddleware)  # 요청 단위 DB 세션
+app.add_middleware(
+    QueryStatsMiddleware,  # 요청/라우트별 SQL 실행 수와 DB 시간
+    n_plus_one_threshold=get_settings().db_n_plus_one_threshold,
+)
 app.add_middleware(ActivityTrackingMiddleware)
 app.add_middleware(
     CORSMiddleware,
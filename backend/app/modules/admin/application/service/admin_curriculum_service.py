@@ -1,4 +1,10 @@
+from functools import partial
 from typing import Optional
+
+from app.common.db.unit_of_work import after_commit
+from app.modules.curriculum.domain.event.curriculum_event_handler import (
+    CurriculumEventHandler,
+)
 from app.modules.admin.infrastructure.repository.admin_curriculum_repository import (
     AdminCurriculumRepository,
 )
@@ -10,8 +16,13 @@ from app.modules.admin.interface.schema.admin_curriculum_schema import (
 
 
 class AdminCurriculumService:
-    def __init__(self, repo: AdminCurriculumRepository) -> None:
+    def __init__(
+        self,
+        repo: AdminCurriculumRepository,
+        feed_event_handler: Optional[CurriculumEventHandler] = None,
+    ) -> None:
         self.repo = repo
+        self.feed_event_handler = feed_event_handler
 
     async def list_curriculums(
         self, *, page: int, items_per_page: int, owner_id: Optional[str]
@@ -46,7 +57,18 @@ class AdminCurriculumService:
         if visibility not in ("PUBLIC", "PRIVATE"):
             raise ValueError("invalid visibility")
         await self.repo.update_visibility(curriculum_id, visibility)
+        if self.feed_event_handler:
+            after_commit(
+                partial(
+                    self.feed_event_handler.on_curriculum_visibility_changed,
+                    curriculum_id,
+                )
+            )
         return await self.get_curriculum(curriculum_id)
 
     async def delete_curriculum(self, curriculum_id: str) -> None:
         await self.repo.delete_by_id(curriculum_id)
+        if self.feed_event_handler:
+            after_commit(
+                partial(self.feed_event_handler.on_curriculum_deleted, curriculum_id)
+            )
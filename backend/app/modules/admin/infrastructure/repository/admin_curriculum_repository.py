@@ -70,9 +70,9 @@ class AdminCurriculumRepository:
             .values(visibility=visibility)
         )
         await self.session.execute(stmt)
-        await self.session.commit()
+        await self.session.flush()
 
     async def delete_by_id(self, curriculum_id: str) -> None:
         stmt = sa_delete(CurriculumModel).where(CurriculumModel.id == curriculum_id)
         await self.session.execute(stmt)
-        await self.session.commit()
+        await self.session.flush()
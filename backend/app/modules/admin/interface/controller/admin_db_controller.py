@@ -0,0 +1,35 @@
+# app/modules/admin/interface/controller/admin_db_controller.py
+from typing import Annotated
+from fastapi import APIRouter, Depends, status
+
+from app.core.auth import CurrentUser, get_current_user
+from app.core.auth import assert_admin
+from app.common.db.database import slow_query_recorder
+
+from app.modules.admin.interface.schema.admin_db_schema import (
+    AdminListSlowQueriesQuery,
+    AdminSlowQueryItem,
+    AdminGetSlowQueriesResponse,
+)
+
+admin_db_router = APIRouter(prefix="/admin/db", tags=["Admin"])
+
+
+@admin_db_router.get(
+    "/slow-queries",
+    response_model=AdminGetSlowQueriesResponse,
+    status_code=status.HTTP_200_OK,
+)
+async def list_slow_queries(
+    query: Annotated[AdminListSlowQueriesQuery, Depends()],
+    current_user: Annotated[CurrentUser, Depends(get_current_user)],
+) -> AdminGetSlowQueriesResponse:
+    """총 실행 시간이 긴 느린 SQL 상위 N개"""
+    assert_admin(current_user)
+    return AdminGetSlowQueriesResponse(
+        threshold_ms=slow_query_recorder.threshold_ms,
+        slow_queries=[
+            AdminSlowQueryItem.from_stat(stat)
+            for stat in slow_query_recorder.top(query.limit)
+        ],
+    )
@@ -0,0 +1,37 @@
+from typing import List, Optional
+from pydantic import BaseModel, Field
+
+from app.common.db.slow_query import SlowQueryStat
+
+
+class AdminListSlowQueriesQuery(BaseModel):
+    limit: int = Field(default=20, ge=1, le=100)
+
+
+class AdminSlowQueryItem(BaseModel):
+    sql: str = Field(..., description="정규화한 SQL")
+    caller: str = Field(..., description="호출한 저장소 메서드")
+    count: int
+    total_ms: float
+    avg_ms: float
+    max_ms: float
+    params_shape: str = Field(..., description="마지막 실행의 바인드 파라미터 형태")
+    plan: Optional[List[str]] = Field(default=None, description="표본 EXPLAIN 결과")
+
+    @classmethod
+    def from_stat(cls, stat: SlowQueryStat) -> "AdminSlowQueryItem":
+        return cls(
+            sql=stat.sql,
+            caller=stat.caller,
+            count=stat.count,
+            total_ms=round(stat.total * 1000, 1),
+            avg_ms=round(stat.avg * 1000, 1),
+            max_ms=round(stat.max * 1000, 1),
+            params_shape=stat.last_params_shape,
+            plan=stat.plan,
+        )
+
+
+class AdminGetSlowQueriesResponse(BaseModel):
+    threshold_ms: float
+    slow_queries: List[AdminSlowQueryItem]
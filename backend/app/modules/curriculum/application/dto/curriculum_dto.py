@@ -2,6 +2,7 @@ from dataclasses import dataclass
 from datetime import datetime
 from typing import List, Optional, Sequence, Tuple, TypeAlias
 
+from app.common.db.pagination import CursorPage, PageCursor
 from app.modules.curriculum.domain.entity.curriculum import Curriculum
 from app.modules.curriculum.domain.entity.week_schedule import WeekSchedule
 from app.modules.curriculum.domain.vo.difficulty import Difficulty
@@ -109,6 +110,8 @@ class CurriculumQuery:
     page: int = 1
     items_per_page: int = 10
     visibility: Optional[Visibility] = None
+    cursor: Optional[str] = None  # 지정 시 커서(키셋) 페이지네이션
+    include_total: bool = False  # 커서 모드에서 전체 개수 계산 여부
 
 
 @dataclass
@@ -190,10 +193,11 @@ class CurriculumBriefDTO:
 class CurriculumPageDTO:
     """커리큘럼 목록 페이지 전송 객체"""
 
-    total_count: int
+    total_count: Optional[int]
     page: int
     items_per_page: int
     curriculums: List[CurriculumBriefDTO]
+    next_cursor: Optional[str] = None
 
     @classmethod
     def from_domain(
@@ -206,9 +210,33 @@ class CurriculumPageDTO:
         curriculum_dtos: List[CurriculumBriefDTO] = [
             CurriculumBriefDTO.from_domain(c) for c in curriculums
         ]
+
+        # 오프셋 페이지에서도 다음 페이지부터 커서 모드로 이어갈 수 있도록 제공
+        next_cursor: Optional[str] = None
+        if curriculums and page * items_per_page < total_count:
+            last = curriculums[-1]
+            next_cursor = PageCursor(last.created_at, last.id).encode()
+
         return cls(
             total_count=total_count,
             page=page,
             items_per_page=items_per_page,
             curriculums=curriculum_dtos,
+            next_cursor=next_cursor,
+        )
+
+    @classmethod
+    def from_cursor_page(
+        cls,
+        cursor_page: CursorPage[Curriculum],
+        items_per_page: int,
+    ) -> "CurriculumPageDTO":
+        return cls(
+            total_count=cursor_page.total_count,
+            page=1,  # 커서 모드에서는 페이지 번호를 사용하지 않음
+            items_per_page=items_per_page,
+            curriculums=[
+                CurriculumBriefDTO.from_domain(c) for c in cursor_page.items
+            ],
+            next_cursor=cursor_page.next_cursor,
         )
@@ -1,7 +1,20 @@
+import asyncio
+import logging
+import re
 from datetime import datetime, timezone
-from typing import Optional
+from functools import partial
+from typing import Any, AsyncIterator, Dict, Optional, Tuple
 from ulid import ULID  # type: ignore
+from app.common.db.unit_of_work import after_commit, commit_current
+from app.common.llm.dispatcher import llm_user
+from app.common.llm.exception import LLMQueueFullError
 from app.common.llm.llm_client_repo import ILLMClientRepository
+from app.common.llm.stream_parser import CurriculumStreamParser
+from app.common.llm.structured_output import (
+    CurriculumPayload,
+    missing_week_ranges,
+    parse_curriculum,
+)
 from app.modules.curriculum.application.dto.curriculum_dto import (
     CreateCurriculumCommand,
     CreateLessonCommand,
@@ -20,10 +33,12 @@ from app.modules.curriculum.application.exception import (
     LLMGenerationError,
     WeekIndexOutOfRangeError,
     WeekScheduleNotFoundError,
-    InvalidLLMResponseError,
 )
 from app.modules.curriculum.domain.entity.curriculum import Curriculum
 from app.modules.curriculum.domain.entity.week_schedule import WeekSchedule
+from app.modules.curriculum.domain.event.curriculum_event_handler import (
+    CurriculumEventHandler,
+)
 from app.modules.curriculum.domain.repository.curriculum_repo import (
     ICurriculumRepository,
 )
@@ -39,6 +54,10 @@ from app.modules.social.domain.repository.follow_repo import IFollowRepository
 from app.common.monitoring.metrics import increment_curriculum_creation
 from app.common.llm.decorators import trace_llm_operation
 
+logger = logging.getLogger(__name__)
+
+CurriculumStreamEvent = Tuple[str, Dict[str, Any]]
+
 
 class CurriculumService:
     def __init__(
@@ -48,7 +67,11 @@ class CurriculumService:
         llm_client: ILLMClientRepository,
         follow_repo: IFollowRepository,  # 추가
         ulid: ULID = ULID(),
-        # feed_event_handler: Optional[CurriculumEventHandler] = None,
+        feed_event_handler: Optional[CurriculumEventHandler] = None,
+        chunked_min_period: Optional[int] = None,
+        chunk_size: int = 4,
+        chunk_concurrency: int = 3,
+        regenerate_missing_weeks: bool = True,
     ) -> None:
 
         self.curriculum_repo: ICurriculumRepository = curriculum_repo
@@ -58,104 +81,43 @@ class CurriculumService:
         self.llm_client: ILLMClientRepository = llm_client
         self.ulid: ULID = ulid
         self.follow_repo: IFollowRepository = follow_repo  # 추가
-        # self.feed_event_handler = feed_event_handler  # 추가
+        self.feed_event_handler = feed_event_handler
+        # 기간이 chunked_min_period 이상이면 개요 + 구간별 동시 생성 (None/0이면 사용 안 함)
+        self.chunked_min_period = chunked_min_period
+        self.chunk_size = chunk_size
+        self.chunk_concurrency = chunk_concurrency
+        # 응답에 빠진 주차가 있으면 그 구간만 다시 생성
+        self.regenerate_missing_weeks = regenerate_missing_weeks
+
+    def _format_title(self, title_str: str, goal: str) -> str:
+        """제목에 타임스탬프 추가 (제목이 없으면 목표 사용)"""
+        now: datetime = datetime.now(timezone.utc)
+        prefix = now.strftime("%y%m%d%H%M")
+        return f"{prefix} {title_str}" if title_str else f"{prefix} {goal}"
 
     def _parse_llm_response(self, llm_response: dict, goal: str) -> dict:  # type: ignore
         try:
-            # LLM 응답 구조 확인 및 파싱
-            if isinstance(llm_response, dict):  # type: ignore
-                title_str = llm_response.get("title", "")  # type: ignore
-                schedule_list = llm_response.get("schedule", [])  # type: ignore
-
-            elif isinstance(llm_response, list):  # type: ignore
-                # 배열 형태의 응답 처리
-                first_item = llm_response[0] if llm_response else {}
-                if isinstance(first_item, dict) and "schedule" in first_item:
-                    title_str = first_item.get("title", "") or goal
-                    schedule_list = first_item.get("schedule", [])
-                else:
-                    # 스케줄 배열 자체인 경우
-                    title_str = goal
-                    schedule_list = llm_response
-            else:
-                raise InvalidLLMResponseError("Invalid LLM response format")
-
-            # 제목에 타임스탬프 추가
-            now: datetime = datetime.now(timezone.utc)
-            prefix = now.strftime("%y%m%d%H%M")
-            full_title = f"{prefix} {title_str}" if title_str else f"{prefix} {goal}"
+            # 키 별칭/래퍼 배열/문자열 주차 번호 등은 정규화, 잘못된 주차 항목은 제외
+            payload: CurriculumPayload = parse_curriculum(llm_response)
+            full_title = self._format_title(payload.title, goal)
 
-            # 스케줄 데이터 변환 및 검증
             week_schedules = []
-            for item in schedule_list:  # type: ignore
-                if not isinstance(item, dict):
-                    continue
-
-                # 주차 번호 추출 (여러 키 형태 지원)
-                week_num = (  # type: ignore
-                    item.get("week_number")  # type: ignore
-                    or item.get("weekNumber")  # type: ignore
-                    or item.get("week")  # type: ignore
-                )
-
-                # 주차 제목(여러 키 형태 지원)
-                week_title_raw = (
-                    item.get("title")  # type: ignore
-                    or item.get("week_title")  # type: ignore
-                    or None
-                )
-
-                # 레슨 리스트 추출 (여러 키 형태 지원)
-                lessons_raw = (  # type: ignore
-                    item.get("lessons")  # type: ignore
-                    or item.get("topics")  # type: ignore
-                    or item.get("content")  # type: ignore
-                    or []
-                )
-
-                if week_num is None or not lessons_raw:
-                    continue
-
-                # 유효성 검증
-                if not isinstance(week_num, int) or week_num < 1:
-                    continue
-
-                if not isinstance(lessons_raw, list):
-                    lessons_raw: list[str] = [str(lessons_raw)]  #  type: ignore
-
-                # 빈 레슨 제거 및 문자열 변환
-                lessons: list[str] = [str(lesson).strip() for lesson in lessons_raw if str(lesson).strip()]  # type: ignore
-
-                if lessons:
-                    # 1) LLM이 접두사를 붙였으면 제거: "1주차: ", "3 주차 -", 등
-                    def _strip_prefix(s: str, n: int) -> str:
-                        import re
-
-                        s = s.strip()
-                        # 숫자/주차/구분자(:：- ) 제거
-                        s = re.sub(rf"^\s*{n}\s*주차\s*[:：\-]?\s*", "", s)
-                        return s.strip()
-
-                    # 2) 없거나 너무 짧으면 첫 레슨으로 보정
-                    def _fallback_title(n: int, ls: list[str]) -> str:
-                        return ls[0][:50] if ls else str(goal)[:50]
-
-                    week_title = str(week_title_raw).strip() if week_title_raw else ""
-                    if week_title:
-                        week_title = _strip_prefix(week_title, week_num)
-                    if not week_title:
-                        week_title = _fallback_title(week_num, lessons)
-
-                    # (week, title, lessons)
-                    week_schedules.append((week_num, week_title, lessons))  # type: ignore
+            for week in payload.weeks:
+                # LLM이 접두사를 붙였으면 제거: "1주차: ", "3 주차 -", 등
+                week_title = re.sub(
+                    rf"^\s*{week.week_number}\s*주차\s*[:：\-]?\s*", "", week.title
+                ).strip()
+                # 없으면 첫 레슨으로 보정
+                if not week_title:
+                    week_title = week.lessons[0][:50]
+
+                # (week, title, lessons)
+                week_schedules.append((week.week_number, week_title, week.lessons))
 
             # 최소 1개 주차는 있어야 함
             if not week_schedules:
                 raise ValueError("No valid week schedules found in LLM response")
 
-            # 주차 번호 순으로 정렬
-            week_schedules.sort(key=lambda x: x[0])  # type: ignore
-
             return {
                 "title": full_title,
                 "week_schedules": week_schedules,
@@ -187,6 +149,11 @@ class CurriculumService:
 
         await self.curriculum_repo.save(curriculum)
 
+        if self.feed_event_handler:
+            after_commit(
+                partial(self.feed_event_handler.on_curriculum_created, curriculum.id)
+            )
+
         increment_curriculum_creation()
 
         return CurriculumDTO.from_domain(curriculum)
@@ -205,19 +172,36 @@ class CurriculumService:
                 "You can only have to 10 curriculums. Delete one before creating a new one"
             )
 
+        async def _call_llm() -> dict:  # type: ignore
+            if self.chunked_min_period and command.period >= self.chunked_min_period:
+                llm_response = await self._generate_chunked(command)
+            else:
+                llm_response = await self.llm_client.generate_curriculum(
+                    goal=command.goal,
+                    period=command.period,
+                    difficulty=command.difficulty,
+                    details=command.details,
+                )
+            if self.regenerate_missing_weeks:
+                return await self._fill_missing_weeks(command, llm_response)
+            return llm_response
+
+        # LLM 응답을 기다리는 동안 커넥션을 잡고 있지 않도록 사전 검증 트랜잭션을 끝내고,
+        # 결과는 새 트랜잭션에서 저장한다
+        await commit_current()
+
         try:
-            llm_response = await self.llm_client.generate_curriculum(
-                goal=command.goal,
-                period=command.period,
-                difficulty=command.difficulty,
-                details=command.details,
-            )
+            # 개요/구간 생성 등 LLM 호출마다 이 사용자 몫으로 슬롯을 받는다
+            with llm_user(command.owner_id):
+                llm_response = await _call_llm()
 
             curriculum_data = self._parse_llm_response(  # type: ignore
                 llm_response=llm_response,
                 goal=command.goal,
             )
 
+        except LLMQueueFullError:
+            raise
         except Exception as e:
             raise LLMGenerationError(f"Failed to generate curriculum: {str(e)}")
 
@@ -230,15 +214,289 @@ class CurriculumService:
         )
 
         await self.curriculum_repo.save(curriculum)
+
+        if self.feed_event_handler:
+            after_commit(
+                partial(self.feed_event_handler.on_curriculum_created, curriculum.id)
+            )
+
         increment_curriculum_creation()
         return CurriculumDTO.from_domain(curriculum)
 
+    async def _generate_chunked(
+        self,
+        command: GenerateCurriculumCommand,
+    ) -> Dict[str, Any]:
+        """긴 커리큘럼 분할 생성
+
+        짧은 개요(제목 + 주차별 제목)를 먼저 만든 뒤, 주차 구간별 레슨을
+        최대 chunk_concurrency 개씩 동시에 생성해 하나의 응답으로 합친다.
+        합친 결과는 일반 생성과 같이 _parse_llm_response 로 검증한다.
+        """
+        outline: Dict[str, Any] = await self.llm_client.generate_curriculum_outline(
+            goal=command.goal,
+            period=command.period,
+            difficulty=command.difficulty,
+            details=command.details,
+        )
+        outline_weeks = [
+            week for week in outline.get("schedule", []) if isinstance(week, dict)
+        ]
+
+        ranges = [
+            (start, min(start + self.chunk_size - 1, command.period))
+            for start in range(1, command.period + 1, self.chunk_size)
+        ]
+        semaphore = asyncio.Semaphore(self.chunk_concurrency)
+
+        async def _expand(start: int, end: int) -> Any:
+            async with semaphore:
+                return await self.llm_client.expand_curriculum_weeks(
+                    goal=command.goal,
+                    difficulty=command.difficulty,
+                    details=command.details,
+                    outline=outline_weeks,
+                    start_week=start,
+                    end_week=end,
+                )
+
+        tasks = [asyncio.create_task(_expand(start, end)) for start, end in ranges]
+        try:
+            chunks = await asyncio.gather(*tasks)
+        except BaseException:
+            # 한 구간이라도 실패하면 나머지 호출도 중단
+            for task in tasks:
+                task.cancel()
+            raise
+
+        schedule: list = []  # type: ignore
+        for (start, end), chunk in zip(ranges, chunks):
+            for week in parse_curriculum(chunk).weeks:
+                # 요청 구간 밖 주차는 버려 구간 간 중복 방지
+                if start <= week.week_number <= end:
+                    schedule.append(week.as_dict())
+
+        return {"title": outline.get("title", ""), "schedule": schedule}
+
+    async def _fill_missing_weeks(
+        self,
+        command: GenerateCurriculumCommand,
+        llm_response: Any,
+    ) -> Any:
+        """응답에서 빠진 주차만 다시 생성해 채움
+
+        잘린 응답 등으로 1~period 중 일부 주차가 없으면 전체를 다시 만들지 않고,
+        받은 주차를 개요로 삼아 빠진 구간만 expand_curriculum_weeks 로 생성한다.
+        다시 생성하지 못하면 받은 주차까지만 사용한다.
+        """
+        try:
+            payload = parse_curriculum(llm_response)
+        except ValueError:
+            return llm_response  # 형식 오류는 _parse_llm_response 에서 처리
+
+        missing = payload.missing_weeks(command.period)
+        if not missing or not payload.weeks:
+            return llm_response
+
+        logger.warning(
+            f"LLM response is missing weeks {missing}, regenerating only those weeks"
+        )
+        outline = [
+            {"week_number": week.week_number, "title": week.title}
+            for week in payload.weeks
+        ]
+        semaphore = asyncio.Semaphore(self.chunk_concurrency)
+
+        async def _expand(start: int, end: int) -> Any:
+            async with semaphore:
+                return await self.llm_client.expand_curriculum_weeks(
+                    goal=command.goal,
+                    difficulty=command.difficulty,
+                    details=command.details,
+                    outline=outline,
+                    start_week=start,
+                    end_week=end,
+                )
+
+        ranges = missing_week_ranges(missing, self.chunk_size)
+        chunks = await asyncio.gather(
+            *(_expand(start, end) for start, end in ranges), return_exceptions=True
+        )
+        for (start, end), chunk in zip(ranges, chunks):
+            if isinstance(chunk, BaseException):
+                logger.error(f"Regenerating weeks {start}-{end} failed: {chunk}")
+                continue
+            try:
+                weeks = parse_curriculum(chunk).weeks
+            except ValueError as e:
+                logger.error(f"Regenerated weeks {start}-{end} are invalid: {e}")
+                continue
+            payload.merge([w for w in weeks if start <= w.week_number <= end])
+
+        return payload.as_dict()
+
+    async def stream_generate_curriculum(
+        self,
+        command: GenerateCurriculumCommand,
+    ) -> AsyncIterator[CurriculumStreamEvent]:
+        """LLM 커리큘럼 스트리밍 생성
+
+        사전 검증(개수 제한)은 즉시 수행해 예외로 알리고, 통과하면 이벤트 스트림을 반환한다.
+        주차가 완성될 때마다 저장하고 commit 하므로 ``week`` 이벤트의 커리큘럼은 바로
+        조회할 수 있고, 도중에 실패해도 받은 주차까지는 남는다.
+
+        이벤트: ``("title", ...)``, ``("week", ...)``, ``("done", {"curriculum": DTO})``,
+        ``("error", {"detail", "curriculum_id"})``
+        """
+        count: int = await self.curriculum_repo.count_by_owner(command.owner_id)
+        if count >= 10:
+            raise CurriculumCountOverError(
+                "You can only have to 10 curriculums. Delete one before creating a new one"
+            )
+
+        return self._stream_generation(command)
+
+    async def _stream_generation(
+        self,
+        command: GenerateCurriculumCommand,
+    ) -> AsyncIterator[CurriculumStreamEvent]:
+        parser = CurriculumStreamParser()
+        curriculum: Optional[Curriculum] = None
+        # 스트림을 기다리는 동안 사전 검증 트랜잭션의 커넥션을 잡고 있지 않는다
+        await commit_current()
+        try:
+            with llm_user(command.owner_id):
+                async for chunk in self.llm_client.generate_curriculum_stream(
+                    goal=command.goal,
+                    period=command.period,
+                    difficulty=command.difficulty,
+                    details=command.details,
+                ):
+                    for kind, value in parser.feed(chunk):
+                        if kind == "title":
+                            title = self._format_title(value, command.goal)
+                            if curriculum is not None:
+                                # 주차가 제목보다 먼저 온 경우
+                                curriculum.change_title(Title(title))
+                                await self.curriculum_repo.update(curriculum)
+                                await commit_current()
+                            yield ("title", {"title": title})
+                            continue
+
+                        week = await self._save_streamed_week(
+                            command, curriculum, parser.title, value
+                        )
+                        if week is None:
+                            continue
+                        curriculum, week_event = week
+                        # 주차마다 commit 해 다른 요청에서 바로 조회할 수 있고 도중에
+                        # 끊겨도 받은 주차까지는 남는다 (스트림 내내 트랜잭션을 열어 두지 않음)
+                        await commit_current()
+                        yield ("week", week_event)
+
+            # 응답이 끝까지 완성되지 않았으면 실패로 처리
+            parser.result()
+            if curriculum is None:
+                raise LLMGenerationError("No valid week schedules found in LLM response")
+
+        except Exception as e:
+            logger.error(f"Streaming curriculum generation failed: {e}")
+            yield (
+                "error",
+                {
+                    "detail": str(e),
+                    "curriculum_id": curriculum.id if curriculum else None,
+                },
+            )
+            return
+
+        if self.feed_event_handler:
+            after_commit(
+                partial(self.feed_event_handler.on_curriculum_updated, curriculum.id)
+            )
+        await commit_current()
+
+        increment_curriculum_creation()
+        yield ("done", {"curriculum": CurriculumDTO.from_domain(curriculum)})
+
+    async def _save_streamed_week(
+        self,
+        command: GenerateCurriculumCommand,
+        curriculum: Optional[Curriculum],
+        title: Optional[str],
+        item: Dict[str, Any],
+    ) -> Optional[Tuple[Curriculum, Dict[str, Any]]]:
+        """스트림에서 완성된 주차 하나 저장 (첫 주차에서 커리큘럼 생성)
+
+        형식이 맞지 않거나 이미 받은 주차면 None 반환
+        """
+        try:
+            parsed = self._parse_llm_response(
+                {"title": title or "", "schedule": [item]}, goal=command.goal
+            )
+        except LLMGenerationError:
+            return None  # 일반 생성과 같이 잘못된 주차는 건너뜀
+        week_num, week_title, lessons = parsed["week_schedules"][0]
+
+        if curriculum is None:
+            curriculum = await self.curriculum_domain_service.create_curriculum(
+                curriculum_id=self.ulid.generate(),
+                owner_id=command.owner_id,
+                title=parsed["title"],
+                week_schedules_data=[(week_num, week_title, lessons)],
+                visibility=Visibility.PRIVATE,
+            )
+            await self.curriculum_repo.save(curriculum)
+            if self.feed_event_handler:
+                after_commit(
+                    partial(
+                        self.feed_event_handler.on_curriculum_created,
+                        curriculum.id,
+                    )
+                )
+        elif curriculum.has_week(WeekNumber(week_num)):
+            return None
+        else:
+            curriculum.add_week_schedule(
+                WeekSchedule(
+                    week_number=WeekNumber(week_num),
+                    title=Title(week_title),
+                    lessons=Lessons(lessons),
+                )
+            )
+            await self.curriculum_repo.update(curriculum)
+
+        return curriculum, {
+            "curriculum_id": curriculum.id,
+            "week_number": week_num,
+            "title": week_title,
+            "lessons": lessons,
+        }
+
     async def get_curriculums(
         self,
         query: CurriculumQuery,
         # role: RoleVO,
     ) -> CurriculumPageDTO:
 
+        if query.cursor is not None:
+            if query.owner_id:
+                cursor_page = await self.curriculum_repo.find_by_owner_id_after(
+                    owner_id=query.owner_id,
+                    cursor=query.cursor,
+                    limit=query.items_per_page,
+                    with_total=query.include_total,
+                )
+            else:
+                cursor_page = await self.curriculum_repo.find_public_curriculums_after(
+                    cursor=query.cursor,
+                    limit=query.items_per_page,
+                    with_total=query.include_total,
+                )
+            return CurriculumPageDTO.from_cursor_page(
+                cursor_page, items_per_page=query.items_per_page
+            )
+
         if query.owner_id:
             total_count, curriculums = await self.curriculum_repo.find_by_owner_id(
                 owner_id=query.owner_id,
@@ -297,9 +555,9 @@ class CurriculumService:
         if role != RoleVO.ADMIN and curriculum.owner_id != command.owner_id:
             raise PermissionError("You can only update your own curriculum")
 
-        # visibility_changed = (
-        #     command.visibility and curriculum.visibility != command.visibility
-        # )
+        visibility_changed = (
+            command.visibility and curriculum.visibility != command.visibility
+        )
 
         # 업데이트
         if command.title:
@@ -310,11 +568,21 @@ class CurriculumService:
 
         await self.curriculum_repo.update(curriculum)
 
-        # if self.feed_event_handler:
-        #     if visibility_changed:
-        #         await self.feed_event_handler.on_curriculum_visibility_changed(curriculum.id)
-        #     else:
-        #         await self.feed_event_handler.on_curriculum_updated(curriculum.id)
+        if self.feed_event_handler:
+            if visibility_changed:
+                after_commit(
+                    partial(
+                        self.feed_event_handler.on_curriculum_visibility_changed,
+                        curriculum.id,
+                    )
+                )
+            else:
+                after_commit(
+                    partial(
+                        self.feed_event_handler.on_curriculum_updated,
+                        curriculum.id,
+                    )
+                )
 
         return CurriculumDTO.from_domain(curriculum)
 
@@ -339,6 +607,11 @@ class CurriculumService:
 
         await self.curriculum_repo.delete(curriculum_id)
 
+        if self.feed_event_handler:
+            after_commit(
+                partial(self.feed_event_handler.on_curriculum_deleted, curriculum_id)
+            )
+
     async def create_week_schedule(
         self,
         command: CreateWeekScheduleCommand,
@@ -366,6 +639,15 @@ class CurriculumService:
         )
 
         await self.curriculum_repo.update(updated_curriculum)
+
+        if self.feed_event_handler:
+            after_commit(
+                partial(
+                    self.feed_event_handler.on_curriculum_updated,
+                    updated_curriculum.id,
+                )
+            )
+
         return CurriculumDTO.from_domain(updated_curriculum)
 
     async def delete_week_schedule(
@@ -399,6 +681,14 @@ class CurriculumService:
 
         await self.curriculum_repo.update(updated_curriculum)
 
+        if self.feed_event_handler:
+            after_commit(
+                partial(
+                    self.feed_event_handler.on_curriculum_updated,
+                    updated_curriculum.id,
+                )
+            )
+
     async def create_lesson(
         self,
         command: CreateLessonCommand,
@@ -446,6 +736,12 @@ class CurriculumService:
         curriculum.update_week_schedule(target_week, updated_week_schedule)
 
         await self.curriculum_repo.update(curriculum)
+
+        if self.feed_event_handler:
+            after_commit(
+                partial(self.feed_event_handler.on_curriculum_updated, curriculum.id)
+            )
+
         return CurriculumDTO.from_domain(curriculum)
 
     async def update_lesson(
@@ -485,6 +781,12 @@ class CurriculumService:
         curriculum.update_week_schedule(target_week, updated_week_schedule)
 
         await self.curriculum_repo.update(curriculum)
+
+        if self.feed_event_handler:
+            after_commit(
+                partial(self.feed_event_handler.on_curriculum_updated, curriculum.id)
+            )
+
         return CurriculumDTO.from_domain(curriculum)
 
     async def delete_lesson(
@@ -523,6 +825,12 @@ class CurriculumService:
         curriculum.update_week_schedule(target_week, updated_week_schedule)
 
         await self.curriculum_repo.update(curriculum)
+
+        if self.feed_event_handler:
+            after_commit(
+                partial(self.feed_event_handler.on_curriculum_updated, curriculum.id)
+            )
+
         return CurriculumDTO.from_domain(curriculum)
 
     async def get_following_users_curriculums(
@@ -530,8 +838,10 @@ class CurriculumService:
         user_id: str,
         page: int = 1,
         items_per_page: int = 10,
+        cursor: Optional[str] = None,
+        include_total: bool = False,
     ) -> CurriculumPageDTO:
-        """팔로우한 사용자들의 public 커리큘럼 목록 조회"""
+        """팔로우한 사용자들의 public 커리큘럼 목록 조회 (cursor 지정 시 커서 모드)"""
 
         # 팔로우한 사용자들 조회
         _, follows = await self.follow_repo.find_followees(
@@ -548,6 +858,19 @@ class CurriculumService:
 
         followee_ids = [follow.followee_id for follow in follows]
 
+        if cursor is not None:
+            cursor_page = (
+                await self.curriculum_repo.find_public_curriculums_by_users_after(
+                    user_ids=followee_ids,
+                    cursor=cursor,
+                    limit=items_per_page,
+                    with_total=include_total,
+                )
+            )
+            return CurriculumPageDTO.from_cursor_page(
+                cursor_page, items_per_page=items_per_page
+            )
+
         # 팔로우한 사용자들의 public 커리큘럼 조회
         total_count, curriculums = (
             await self.curriculum_repo.find_public_curriculums_by_users(
@@ -0,0 +1,29 @@
+from abc import ABCMeta, abstractmethod
+
+
+class CurriculumEventHandler(metaclass=ABCMeta):
+    """커리큘럼 변경 이벤트 수신자 (피드 인덱스 등 다른 모듈이 구현)
+
+    서비스가 ``after_commit`` 으로 등록해 커리큘럼 변경이 커밋된 뒤에만 호출된다.
+    요청이 rollback 되면 호출되지 않는다.
+    """
+
+    @abstractmethod
+    async def on_curriculum_created(self, curriculum_id: str) -> None:
+        """커리큘럼 생성"""
+        raise NotImplementedError
+
+    @abstractmethod
+    async def on_curriculum_updated(self, curriculum_id: str) -> None:
+        """커리큘럼 내용 변경 (제목, 주차, 레슨, 태그/카테고리)"""
+        raise NotImplementedError
+
+    @abstractmethod
+    async def on_curriculum_visibility_changed(self, curriculum_id: str) -> None:
+        """커리큘럼 공개 여부 변경"""
+        raise NotImplementedError
+
+    @abstractmethod
+    async def on_curriculum_deleted(self, curriculum_id: str) -> None:
+        """커리큘럼 삭제"""
+        raise NotImplementedError
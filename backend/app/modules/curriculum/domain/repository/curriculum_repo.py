@@ -1,6 +1,7 @@
 from abc import ABCMeta, abstractmethod
 from typing import List, Optional, Tuple
 
+from app.common.db.pagination import CursorPage
 from app.modules.curriculum.domain.entity.curriculum import Curriculum
 from app.modules.user.domain.vo.role import RoleVO
 
@@ -69,3 +70,35 @@ class ICurriculumRepository(metaclass=ABCMeta):
     ) -> Tuple[int, List[Curriculum]]:
         """특정 사용자들의 공개 커리큘럼 목록 조회"""
         raise NotImplementedError
+
+    @abstractmethod
+    async def find_by_owner_id_after(
+        self,
+        owner_id: str,
+        cursor: Optional[str] = None,
+        limit: int = 10,
+        with_total: bool = False,
+    ) -> CursorPage[Curriculum]:
+        """소유자 ID로 커리큘럼 목록 커서 조회 (created_at, id 기준)"""
+        raise NotImplementedError
+
+    @abstractmethod
+    async def find_public_curriculums_after(
+        self,
+        cursor: Optional[str] = None,
+        limit: int = 10,
+        with_total: bool = False,
+    ) -> CursorPage[Curriculum]:
+        """공개 커리큘럼 목록 커서 조회 (created_at, id 기준)"""
+        raise NotImplementedError
+
+    @abstractmethod
+    async def find_public_curriculums_by_users_after(
+        self,
+        user_ids: List[str],
+        cursor: Optional[str] = None,
+        limit: int = 10,
+        with_total: bool = False,
+    ) -> CursorPage[Curriculum]:
+        """특정 사용자들의 공개 커리큘럼 목록 커서 조회 (created_at, id 기준)"""
+        raise NotImplementedError
@@ -1,6 +1,6 @@
 from datetime import datetime
 from app.common.db.database import Base
-from sqlalchemy import DateTime, ForeignKey, String
+from sqlalchemy import DateTime, ForeignKey, Index, String
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 from typing import TYPE_CHECKING
 
@@ -18,6 +18,12 @@ if TYPE_CHECKING:
 
 class CurriculumModel(Base):
     __tablename__ = "curriculums"
+    __table_args__ = (
+        # 키셋 페이지네이션용 (정렬 시각, id) 복합 인덱스
+        Index("idx_curriculum_visibility_created", "visibility", "created_at", "id"),
+        Index("idx_curriculum_visibility_updated", "visibility", "updated_at", "id"),
+        Index("idx_curriculum_user_created", "user_id", "created_at", "id"),
+    )
 
     id: Mapped[str] = mapped_column(String(26), primary_key=True)
     user_id: Mapped[str] = mapped_column(
@@ -2,6 +2,7 @@ from typing import List, Optional, Sequence, Tuple
 from sqlalchemy import Result, Select, and_, func, select, or_
 from sqlalchemy.orm import selectinload, joinedload
 from sqlalchemy.ext.asyncio import AsyncSession
+from app.common.db.pagination import CursorPage, PageCursor, keyset_after
 from app.modules.curriculum.domain.entity.curriculum import (
     Curriculum as CurriculumDomain,
 )
@@ -65,7 +66,7 @@ class CurriculumRepository(ICurriculumRepository):
                 )
             )
         self.session.add(new_curriculum)
-        await self.session.commit()
+        await self.session.flush()
 
     async def find_by_id(
         self,
@@ -113,7 +114,7 @@ class CurriculumRepository(ICurriculumRepository):
             select(CurriculumModel)
             .where(CurriculumModel.user_id == owner_id)
             .options(selectinload(CurriculumModel.week_schedules))
-            .order_by(CurriculumModel.created_at.desc())
+            .order_by(CurriculumModel.created_at.desc(), CurriculumModel.id.desc())
             .offset((page - 1) * items_per_page)
             .limit(items_per_page)
         )
@@ -141,7 +142,7 @@ class CurriculumRepository(ICurriculumRepository):
             select(CurriculumModel)
             .options(selectinload(CurriculumModel.week_schedules))
             .where(CurriculumModel.visibility == Visibility.PUBLIC.value)
-            .order_by(CurriculumModel.created_at.desc())
+            .order_by(CurriculumModel.created_at.desc(), CurriculumModel.id.desc())
             .offset((page - 1) * items_per_page)
             .limit(items_per_page)
         )
@@ -173,7 +174,7 @@ class CurriculumRepository(ICurriculumRepository):
                 )
             )
         self.session.add(existing_curriculum)
-        await self.session.commit()
+        await self.session.flush()
 
     async def delete(self, curriculum_id: str) -> None:
         model: CurriculumModel | None = await self.session.get(
@@ -181,7 +182,7 @@ class CurriculumRepository(ICurriculumRepository):
         )
         if model:
             await self.session.delete(model)
-            await self.session.commit()
+            await self.session.flush()
 
     async def count_by_owner(self, owner_id: str) -> int:
         stmt: Select[Tuple[int]] = (
@@ -230,10 +231,107 @@ class CurriculumRepository(ICurriculumRepository):
         paged_query: Select[Tuple[CurriculumModel]] = (
             base_query.limit(items_per_page)
             .offset(offset)
-            .order_by(CurriculumModel.created_at.desc())
+            .order_by(CurriculumModel.created_at.desc(), CurriculumModel.id.desc())
         )
 
         result: Result[Tuple[CurriculumModel]] = await self.session.execute(paged_query)
         models: Sequence[CurriculumModel] = result.scalars().all()
 
         return total_count, [self._to_domain(m) for m in models]
+
+    async def _find_after(
+        self,
+        conditions: List,
+        cursor: Optional[str],
+        limit: int,
+        with_total: bool,
+    ) -> CursorPage[CurriculumDomain]:
+        """(created_at, id) 키셋 페이지네이션 공통 조회
+
+        OFFSET 대신 마지막 행 이후를 조건으로 조회하므로 깊은 페이지도
+        첫 페이지와 비용이 같다. 전체 개수는 요청한 경우에만 계산한다.
+        """
+        total_count: Optional[int] = None
+        if with_total:
+            count_query: Select[Tuple[int]] = (
+                select(func.count()).select_from(CurriculumModel).where(*conditions)
+            )
+            total_count = (await self.session.execute(count_query)).scalar_one()
+
+        query: Select[Tuple[CurriculumModel]] = (
+            select(CurriculumModel)
+            .where(*conditions)
+            .options(selectinload(CurriculumModel.week_schedules))
+            .order_by(CurriculumModel.created_at.desc(), CurriculumModel.id.desc())
+            .limit(limit + 1)  # 다음 페이지 존재 여부 확인용 1건 추가
+        )
+        if cursor:
+            query = query.where(
+                keyset_after(
+                    CurriculumModel.created_at,
+                    CurriculumModel.id,
+                    PageCursor.decode(cursor),
+                )
+            )
+
+        result: Result[Tuple[CurriculumModel]] = await self.session.execute(query)
+        models: Sequence[CurriculumModel] = result.scalars().all()
+
+        page_models = models[:limit]
+        next_cursor: Optional[str] = None
+        if len(models) > limit:
+            last = page_models[-1]
+            next_cursor = PageCursor(last.created_at, last.id).encode()
+
+        return CursorPage(
+            items=[self._to_domain(m) for m in page_models],
+            next_cursor=next_cursor,
+            total_count=total_count,
+        )
+
+    async def find_by_owner_id_after(
+        self,
+        owner_id: str,
+        cursor: Optional[str] = None,
+        limit: int = 10,
+        with_total: bool = False,
+    ) -> CursorPage[CurriculumDomain]:
+        """소유자 ID로 커리큘럼 목록 커서 조회"""
+        return await self._find_after(
+            [CurriculumModel.user_id == owner_id], cursor, limit, with_total
+        )
+
+    async def find_public_curriculums_after(
+        self,
+        cursor: Optional[str] = None,
+        limit: int = 10,
+        with_total: bool = False,
+    ) -> CursorPage[CurriculumDomain]:
+        """공개 커리큘럼 목록 커서 조회"""
+        return await self._find_after(
+            [CurriculumModel.visibility == Visibility.PUBLIC.value],
+            cursor,
+            limit,
+            with_total,
+        )
+
+    async def find_public_curriculums_by_users_after(
+        self,
+        user_ids: List[str],
+        cursor: Optional[str] = None,
+        limit: int = 10,
+        with_total: bool = False,
+    ) -> CursorPage[CurriculumDomain]:
+        """특정 사용자들의 공개 커리큘럼 목록 커서 조회"""
+        if not user_ids:
+            return CursorPage(total_count=0 if with_total else None)
+
+        return await self._find_after(
+            [
+                CurriculumModel.user_id.in_(user_ids),
+                CurriculumModel.visibility == Visibility.PUBLIC.value,
+            ],
+            cursor,
+            limit,
+            with_total,
+        )
@@ -1,5 +1,7 @@
-from typing import Annotated
+import json
+from typing import Annotated, Any, AsyncIterator, Dict, Optional
 from fastapi import APIRouter, Depends, Query, status
+from fastapi.responses import StreamingResponse
 from dependency_injector.wiring import inject, Provide
 from app.core.auth import CurrentUser, get_current_user
 from app.core.di_container import Container
@@ -68,12 +70,55 @@ async def generate_curriculum(
     return CurriculumResponse.from_dto(generated)
 
 
+def _sse_message(event: str, data: Dict[str, Any]) -> str:
+    """Server-Sent Events 메시지 포맷"""
+    return f"event: {event}\ndata: {json.dumps(data, ensure_ascii=False)}\n\n"
+
+
+@curriculum_router.post(
+    "/generate/stream",
+    response_class=StreamingResponse,
+    responses={200: {"content": {"text/event-stream": {}}}},
+)
+@inject
+async def generate_curriculum_stream(
+    body: GenerateCurriculumRequest,
+    current_user: Annotated[CurrentUser, Depends(get_current_user)],
+    curriculum_service: CurriculumService = Depends(
+        Provide[Container.curriculum_service]
+    ),
+) -> StreamingResponse:
+    """AI 커리큘럼 스트리밍 생성 (SSE, 주차가 완성될 때마다 전송)"""
+    dto: GenerateCurriculumCommand = body.to_dto(owner_id=current_user.id)
+    events = await curriculum_service.stream_generate_curriculum(dto)
+
+    async def _event_stream() -> AsyncIterator[str]:
+        async for event, data in events:
+            if event == "done":
+                response = CurriculumResponse.from_dto(data["curriculum"])
+                data = {"curriculum": response.model_dump(mode="json")}
+            yield _sse_message(event, data)
+
+    return StreamingResponse(
+        _event_stream(),
+        media_type="text/event-stream",
+        headers={
+            "Cache-Control": "no-cache",
+            "X-Accel-Buffering": "no",  # nginx 프록시 버퍼링 해제
+        },
+    )
+
+
 @curriculum_router.get("/public", response_model=CurriculumsPageResponse)
 @inject
 async def get_list_public_curriculums(
     current_user: Annotated[CurrentUser, Depends(get_current_user)],
     page: int = Query(1, ge=1),
     items_per_page: int = Query(10, ge=1, le=100),
+    cursor: Optional[str] = Query(
+        None, description="이전 응답의 next_cursor (지정 시 page 대신 커서로 조회)"
+    ),
+    include_total: bool = Query(False, description="커서 모드에서 전체 개수 포함 여부"),
     curriculum_service: CurriculumService = Depends(
         Provide[Container.curriculum_service]
     ),
@@ -82,6 +127,8 @@ async def get_list_public_curriculums(
         owner_id=None,
         page=page,
         items_per_page=items_per_page,
+        cursor=cursor,
+        include_total=include_total,
     )
     page_dto: CurriculumPageDTO = await curriculum_service.get_curriculums(query=query)
     return CurriculumsPageResponse.from_dto(page_dto)
@@ -93,6 +140,10 @@ async def get_following_users_curriculums(
     current_user: Annotated[CurrentUser, Depends(get_current_user)],
     page: int = Query(1, ge=1),
     items_per_page: int = Query(10, ge=1, le=100),
+    cursor: Optional[str] = Query(
+        None, description="이전 응답의 next_cursor (지정 시 page 대신 커서로 조회)"
+    ),
+    include_total: bool = Query(False, description="커서 모드에서 전체 개수 포함 여부"),
     curriculum_service: CurriculumService = Depends(
         Provide[Container.curriculum_service]
     ),
@@ -103,6 +154,8 @@ async def get_following_users_curriculums(
             user_id=current_user.id,
             page=page,
             items_per_page=items_per_page,
+            cursor=cursor,
+            include_total=include_total,
         )
     )
     return CurriculumsPageResponse.from_dto(page_dto)
@@ -313,6 +366,10 @@ async def get_list_my_curriculums(
     current_user: Annotated[CurrentUser, Depends(get_current_user)],
     page: int = Query(1, ge=1),
     items_per_page: int = Query(10, ge=1, le=100),
+    cursor: Optional[str] = Query(
+        None, description="이전 응답의 next_cursor (지정 시 page 대신 커서로 조회)"
+    ),
+    include_total: bool = Query(False, description="커서 모드에서 전체 개수 포함 여부"),
     curriculum_service: CurriculumService = Depends(
         Provide[Container.curriculum_service]
     ),
@@ -321,6 +378,8 @@ async def get_list_my_curriculums(
         owner_id=current_user.id,
         page=page,
         items_per_page=items_per_page,
+        cursor=cursor,
+        include_total=include_total,
     )
     page_dto: CurriculumPageDTO = await curriculum_service.get_curriculums(query=query)
     return CurriculumsPageResponse.from_dto(page_dto)
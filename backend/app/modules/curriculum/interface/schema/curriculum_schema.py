@@ -198,10 +198,11 @@ class CurriculumBriefResponse(BaseModel):
 
 
 class CurriculumsPageResponse(BaseModel):
-    total_count: int
+    total_count: Optional[int]  # 커서 모드에서 include_total=false면 None
     page: int
     items_per_page: int
     curriculums: List[CurriculumBriefResponse]
+    next_cursor: Optional[str] = None
 
     @classmethod
     def from_dto(cls, page_dto: CurriculumPageDTO) -> "CurriculumsPageResponse":
@@ -213,4 +214,5 @@ class CurriculumsPageResponse(BaseModel):
             page=page_dto.page,
             items_per_page=page_dto.items_per_page,
             curriculums=items,
+            next_cursor=page_dto.next_cursor,
         )
@@ -2,6 +2,7 @@ from dataclasses import dataclass
 from datetime import datetime
 from typing import List, Optional
 
+from app.common.db.pagination import CursorPage, PageCursor
 from app.modules.feed.domain.entity.feed_item import FeedItem
 from app.modules.feed.domain.vo.feed_filter import FeedFilter
 
@@ -52,6 +53,8 @@ class FeedQuery:
     search_query: Optional[str] = None
     page: int = 1
     items_per_page: int = 20
+    cursor: Optional[str] = None
+    include_total: bool = False
 
     def to_filter(self) -> FeedFilter:
         return FeedFilter(
@@ -60,6 +63,8 @@ class FeedQuery:
             search_query=self.search_query,
             page=self.page,
             items_per_page=self.items_per_page,
+            cursor=self.cursor,
+            include_total=self.include_total,
         )
 
 
@@ -67,11 +72,12 @@ class FeedQuery:
 class FeedPageDTO:
     """피드 페이지 전송 객체"""
 
-    total_count: int
+    total_count: Optional[int]
     page: int
     items_per_page: int
     has_next: bool
     items: List[FeedItemDTO]
+    next_cursor: Optional[str] = None
 
     @classmethod
     def from_domain(
@@ -83,10 +89,32 @@ class FeedPageDTO:
     ) -> "FeedPageDTO":
         has_next = (page * items_per_page) < total_count
 
+        # 오프셋 페이지에서도 다음 페이지부터 커서 모드로 이어갈 수 있도록 제공
+        next_cursor = None
+        if has_next and feed_items:
+            last = feed_items[-1]
+            next_cursor = PageCursor(last.updated_at, last.curriculum_id).encode()
+
         return cls(
             total_count=total_count,
             page=page,
             items_per_page=items_per_page,
             has_next=has_next,
             items=[FeedItemDTO.from_domain(item) for item in feed_items],
+            next_cursor=next_cursor,
+        )
+
+    @classmethod
+    def from_cursor_page(
+        cls,
+        cursor_page: CursorPage[FeedItem],
+        items_per_page: int,
+    ) -> "FeedPageDTO":
+        return cls(
+            total_count=cursor_page.total_count,
+            page=1,  # 커서 모드에서는 페이지 번호를 사용하지 않음
+            items_per_page=items_per_page,
+            has_next=cursor_page.has_next,
+            items=[FeedItemDTO.from_domain(item) for item in cursor_page.items],
+            next_cursor=cursor_page.next_cursor,
         )
@@ -0,0 +1,40 @@
+import logging
+
+from app.modules.curriculum.domain.event.curriculum_event_handler import (
+    CurriculumEventHandler,
+)
+from app.modules.feed.domain.repository.feed_repo import IFeedRepository
+
+logger = logging.getLogger(__name__)
+
+
+class FeedEventHandler(CurriculumEventHandler):
+    """커리큘럼 변경을 피드 인덱스에 점진적으로 반영
+
+    피드 반영 실패가 커리큘럼 변경 요청을 실패시키지 않도록 예외는 기록만 한다.
+    누락된 변경은 인덱스 주기적 재구성으로 복구된다.
+    """
+
+    def __init__(self, feed_repo: IFeedRepository):
+        self.feed_repo: IFeedRepository = feed_repo
+
+    async def on_curriculum_created(self, curriculum_id: str) -> None:
+        await self._upsert(curriculum_id)
+
+    async def on_curriculum_updated(self, curriculum_id: str) -> None:
+        await self._upsert(curriculum_id)
+
+    async def on_curriculum_visibility_changed(self, curriculum_id: str) -> None:
+        await self._upsert(curriculum_id)
+
+    async def on_curriculum_deleted(self, curriculum_id: str) -> None:
+        try:
+            await self.feed_repo.remove_from_cache(curriculum_id)
+        except Exception:
+            logger.exception("Failed to remove curriculum %s from feed", curriculum_id)
+
+    async def _upsert(self, curriculum_id: str) -> None:
+        try:
+            await self.feed_repo.upsert_feed_item(curriculum_id)
+        except Exception:
+            logger.exception("Failed to upsert curriculum %s into feed", curriculum_id)
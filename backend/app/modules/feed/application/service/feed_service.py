@@ -10,8 +10,15 @@ class FeedService:
         self.feed_repo: IFeedRepository = feed_repo
 
     async def get_public_feed(self, query: FeedQuery) -> FeedPageDTO:
-        """공개 커리큘럼 피드 조회"""
+        """공개 커리큘럼 피드 조회 (cursor 지정 시 커서 모드)"""
         feed_filter: FeedFilter = query.to_filter()
+
+        if feed_filter.cursor is not None:
+            cursor_page = await self.feed_repo.get_public_feed_after(feed_filter)
+            return FeedPageDTO.from_cursor_page(
+                cursor_page, items_per_page=feed_filter.items_per_page
+            )
+
         total_count, feed_items = await self.feed_repo.get_public_feed(feed_filter)
 
         return FeedPageDTO.from_domain(
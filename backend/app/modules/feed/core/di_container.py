@@ -1,5 +1,6 @@
 from dependency_injector import containers, providers
 
+from app.modules.feed.application.service.feed_event_handler import FeedEventHandler
 from app.modules.feed.application.service.feed_service import FeedService
 from app.modules.feed.infrastructure.repository.feed_repo import FeedRepository
 
@@ -7,7 +8,7 @@ from app.modules.feed.infrastructure.repository.feed_repo import FeedRepository
 class FeedContainer(containers.DeclarativeContainer):
     session: providers.Dependency[object] = providers.Dependency()
 
-    feed_repository = providers.Singleton(
+    feed_repository = providers.Factory(
         FeedRepository,
         session=session,
     )
@@ -16,3 +17,8 @@ class FeedContainer(containers.DeclarativeContainer):
         FeedService,
         feed_repo=feed_repository,
     )
+
+    feed_event_handler = providers.Factory(
+        FeedEventHandler,
+        feed_repo=feed_repository,
+    )
@@ -1,6 +1,7 @@
 from abc import ABCMeta, abstractmethod
 from typing import List, Tuple
 
+from app.common.db.pagination import CursorPage
 from app.modules.feed.domain.entity.feed_item import FeedItem
 from app.modules.feed.domain.vo.feed_filter import FeedFilter
 
@@ -13,11 +14,28 @@ class IFeedRepository(metaclass=ABCMeta):
         """공개 커리큘럼 피드 조회"""
         raise NotImplementedError
 
+    @abstractmethod
+    async def get_public_feed_after(
+        self, feed_filter: FeedFilter
+    ) -> CursorPage[FeedItem]:
+        """공개 커리큘럼 피드 커서 조회 (updated_at, id 기준)"""
+        raise NotImplementedError
+
     @abstractmethod
     async def cache_feed_item(self, feed_item: FeedItem) -> None:
         """피드 아이템 캐시"""
         raise NotImplementedError
 
+    @abstractmethod
+    async def cache_feed_items(self, feed_items: List[FeedItem]) -> None:
+        """피드 아이템 일괄 캐시"""
+        raise NotImplementedError
+
+    @abstractmethod
+    async def upsert_feed_item(self, curriculum_id: str) -> None:
+        """커리큘럼 변경을 피드 인덱스에 반영 (공개면 추가/갱신, 아니면 제거)"""
+        raise NotImplementedError
+
     @abstractmethod
     async def remove_from_cache(self, curriculum_id: str) -> None:
         """캐시에서 피드 아이템 제거"""
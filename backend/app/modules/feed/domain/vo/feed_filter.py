@@ -1,3 +1,5 @@
+import hashlib
+import json
 from dataclasses import dataclass
 from typing import Optional
 
@@ -11,6 +13,8 @@ class FeedFilter:
     search_query: Optional[str] = None
     page: int = 1
     items_per_page: int = 20
+    cursor: Optional[str] = None  # 지정 시 커서(키셋) 페이지네이션
+    include_total: bool = False  # 커서 모드에서 전체 개수 계산 여부
 
     def __post_init__(self):
         if self.tags is None:
@@ -32,3 +36,19 @@ class FeedFilter:
     def limit(self) -> int:
         """페이지네이션 리미트"""
         return self.items_per_page
+
+    @property
+    def is_unfiltered(self) -> bool:
+        """필터 조건이 없는지 여부"""
+        return not (self.category_id or self.tags or self.search_query)
+
+    @property
+    def cache_key(self) -> str:
+        """필터 조건의 안정적인 해시 (페이지 정보 제외)"""
+        criteria = {
+            "category_id": self.category_id,
+            "tags": sorted(set(self.tags or [])),
+            "search_query": (self.search_query or "").strip().lower(),
+        }
+        raw = json.dumps(criteria, sort_keys=True, ensure_ascii=False)
+        return hashlib.sha256(raw.encode("utf-8")).hexdigest()[:32]
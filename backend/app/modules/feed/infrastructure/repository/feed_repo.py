@@ -1,10 +1,15 @@
+import asyncio
 import json
-from typing import List, Tuple, Optional
+import time
+from typing import Awaitable, Callable, Dict, List, Sequence, Tuple, Optional, TypeVar
 from sqlalchemy import Result, Select, select, func, or_
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import selectinload, joinedload
 
 from app.common.cache.redis_client import redis_client
+from app.common.cache.stampede import SingleFlight, jittered_ttl, should_refresh_early
+from app.common.db.pagination import CursorPage, PageCursor, keyset_after
+from app.common.db.routing import read_only
 from app.modules.feed.domain.repository.feed_repo import IFeedRepository
 from app.modules.feed.domain.entity.feed_item import FeedItem
 from app.modules.feed.domain.vo.feed_filter import FeedFilter
@@ -17,36 +22,161 @@ from app.modules.taxonomy.infrastructure.db_model.curriculum_tag import (
 )
 from app.modules.taxonomy.infrastructure.db_model.tag import TagModel
 
+T = TypeVar("T")
+
+# 프로세스 내 캐시 미스 적재 단일화 (리포지토리 인스턴스와 무관하게 공유)
+feed_single_flight = SingleFlight()
+
 
 class FeedRepository(IFeedRepository):
     def __init__(self, session: AsyncSession):
         self.session = session
         self.CACHE_KEY_PREFIX = "feed"
-        self.CACHE_EXPIRE_TIME = 300  # 5분
+        # 변경은 커리큘럼 이벤트로 즉시 반영되므로 TTL은 누락 대비 안전망
+        self.CACHE_EXPIRE_TIME = 3600  # 1시간
         self.SORTED_SET_KEY = "feed:public_curriculums"
-
+        self.FILTER_CACHE_EXPIRE_TIME = 120  # 2분
+        self.FILTER_CACHE_MAX_IDS = 500  # 필터별로 캐시할 최대 ID 수
+        self.META_KEY = "feed:public_curriculums:meta"  # 인덱스 구성 여부 + 조기 갱신용 메타
+        self.INDEX_WARM_UP_SIZE = 100  # 인덱스 재구성 시 상세 정보까지 캐시할 최신 아이템 수
+        self.LOCK_TIMEOUT_MS = 5000  # 워커 간 적재 락 유지 시간
+        self.LOCK_WAIT_INTERVAL = 0.05  # 락 대기 중 캐시 재확인 간격 (초)
+        self.LOCK_WAIT_RETRIES = 20
+
+    @read_only
     async def get_public_feed(
         self, feed_filter: FeedFilter
     ) -> Tuple[int, List[FeedItem]]:
         """공개 커리큘럼 피드 조회 (캐시 우선, DB 백업)"""
 
-        # 1. 캐시에서 시도
-        cached_items = await self._get_from_cache(feed_filter)
-        if cached_items is not None:
-            return cached_items
+        # 필터가 있으면 필터별 캐시 사용
+        if not feed_filter.is_unfiltered:
+            return await self._get_filtered_feed(feed_filter)
 
-        # 2. DB에서 조회
-        total_count, feed_items = await self._get_from_database(feed_filter)
+        if not redis_client.is_connected:
+            return await self._get_from_database(feed_filter)
 
-        # 3. 캐시에 저장
-        await self._cache_feed_items(feed_items, feed_filter)
+        # 1. 피드 인덱스(Sorted Set)에서 페이지 조회
+        page = await self._get_from_cache(feed_filter)
+        if page is None:
+            # 2. 인덱스가 없거나 갱신 시점이면 재구성 (동시 요청은 한 번만 재구성)
+            await self._load_once("index", self._rebuild_index, self._index_ready)
+            page = await self._get_from_cache(feed_filter, allow_early_refresh=False)
 
-        return total_count, feed_items
+        if page is None:
+            # 인덱스를 사용할 수 없으면 DB에서 직접 조회
+            return await self._get_from_database(feed_filter)
 
-    async def _get_from_cache(
+        return page
+
+    @read_only
+    async def get_public_feed_after(
         self, feed_filter: FeedFilter
+    ) -> CursorPage[FeedItem]:
+        """공개 커리큘럼 피드 커서 조회 ((updated_at, id) 키셋)
+
+        OFFSET 없이 커서 이후 행만 읽으므로 깊은 페이지도 첫 페이지와
+        비용이 같다. 전체 개수는 include_total일 때만 계산한다.
+        """
+        base_query = self._apply_filters(
+            select(CurriculumModel).options(
+                selectinload(CurriculumModel.week_schedules),
+                joinedload(CurriculumModel.user),
+            ),
+            feed_filter,
+        )
+
+        total_count: Optional[int] = None
+        if feed_filter.include_total:
+            count_query = select(func.count()).select_from(base_query.subquery())
+            total_count = await self.session.scalar(count_query) or 0
+
+        # 다음 페이지 존재 여부 확인용으로 1건 더 조회
+        paged_query = base_query.order_by(
+            CurriculumModel.updated_at.desc(), CurriculumModel.id.desc()
+        ).limit(feed_filter.limit + 1)
+        if feed_filter.cursor:
+            paged_query = paged_query.where(
+                keyset_after(
+                    CurriculumModel.updated_at,
+                    CurriculumModel.id,
+                    PageCursor.decode(feed_filter.cursor),
+                )
+            )
+
+        result = await self.session.execute(paged_query)
+        curriculum_models = result.unique().scalars().all()
+
+        page_models = curriculum_models[: feed_filter.limit]
+        next_cursor: Optional[str] = None
+        if len(curriculum_models) > feed_filter.limit:
+            last = page_models[-1]
+            next_cursor = PageCursor(last.updated_at, last.id).encode()
+
+        return CursorPage(
+            items=await self._to_feed_items(page_models),
+            next_cursor=next_cursor,
+            total_count=total_count,
+        )
+
+    async def _load_once(
+        self,
+        flight_key: str,
+        load: Callable[[], Awaitable[T]],
+        read_cache: Callable[[], Awaitable[Optional[T]]],
+    ) -> T:
+        """캐시 미스 적재 단일화
+
+        프로세스 내에서는 single-flight로 같은 키의 적재를 하나로 합치고,
+        워커 간에는 짧은 Redis 락으로 한 워커만 DB를 조회하게 한다.
+        락을 얻지 못한 워커는 잠시 캐시가 채워지기를 기다린 뒤,
+        끝내 채워지지 않으면 직접 조회한다.
+        """
+
+        async def _load_with_lock() -> T:
+            lock_key = f"{self.CACHE_KEY_PREFIX}:lock:{flight_key}"
+            try:
+                token = await redis_client.acquire_lock(lock_key, self.LOCK_TIMEOUT_MS)
+            except Exception:
+                # 락 오류 시에도 조회는 진행
+                token = None
+            else:
+                if token is None:
+                    for _ in range(self.LOCK_WAIT_RETRIES):
+                        await asyncio.sleep(self.LOCK_WAIT_INTERVAL)
+                        cached = await read_cache()
+                        if cached is not None:
+                            return cached
+
+            try:
+                return await load()
+            finally:
+                if token:
+                    try:
+                        await redis_client.release_lock(lock_key, token)
+                    except Exception:
+                        pass
+
+        return await feed_single_flight.do(flight_key, _load_with_lock)
+
+    def _is_stale(self, meta: Optional[str]) -> bool:
+        """조기 갱신 대상인지 확인 (메타: 만료 시각 + 재계산 비용)"""
+        if not meta:
+            return False
+        try:
+            data = json.loads(meta)
+            return should_refresh_early(float(data["expires_at"]), float(data["delta"]))
+        except (ValueError, KeyError, TypeError):
+            return False
+
+    async def _get_from_cache(
+        self, feed_filter: FeedFilter, allow_early_refresh: bool = True
     ) -> Optional[Tuple[int, List[FeedItem]]]:
-        """캐시에서 피드 조회"""
+        """피드 인덱스에서 페이지 조회
+
+        인덱스가 구성되지 않았거나 조기 갱신 대상이면 None을 반환한다.
+        아이템 캐시가 없는 항목만 DB에서 채운다.
+        """
         try:
             # Sorted Set에서 최신순으로 조회
             start = feed_filter.offset
@@ -56,54 +186,105 @@ class FeedRepository(IFeedRepository):
                 self.SORTED_SET_KEY, start, end
             )
 
-            if not curriculum_ids:
-                return None
+            # 아이템 상세 정보, 메타, 전체 개수를 한 번의 왕복으로 조회
+            cache_keys = [
+                f"{self.CACHE_KEY_PREFIX}:item:{curriculum_id}"
+                for curriculum_id in curriculum_ids
+            ]
+            cached_values, total_count = await redis_client.mget_with_zcard(
+                cache_keys + [self.META_KEY], self.SORTED_SET_KEY
+            )
+            *item_values, meta = cached_values
+
+        except Exception:
+            # 캐시 오류 시 None 반환하여 DB 조회로 fallback
+            return None
+
+        # 메타가 없으면 인덱스가 구성되지 않은 상태 (빈 Sorted Set과 구분)
+        if not meta or (allow_early_refresh and self._is_stale(meta)):
+            return None
 
-            # 각 아이템의 상세 정보 조회
-            feed_items = []
-            for curriculum_id in curriculum_ids:
-                cache_key = f"{self.CACHE_KEY_PREFIX}:item:{curriculum_id}"
-                cached_data = await redis_client.get(cache_key)
+        feed_items = await self._fill_missing_items(
+            list(curriculum_ids), list(item_values)
+        )
+        return total_count, feed_items
 
-                if cached_data:
-                    item_data = json.loads(cached_data)
-                    feed_item = FeedItem.from_dict(item_data)
+    async def _index_ready(self) -> Optional[bool]:
+        """인덱스가 구성되어 있는지 확인 (락 대기 중 재확인용)"""
+        try:
+            return True if await redis_client.exists(self.META_KEY) else None
+        except Exception:
+            return None
 
-                    # 필터링 적용
-                    if self._matches_filter(feed_item, feed_filter):
-                        feed_items.append(feed_item)
+    async def _rebuild_index(self, warm_up_limit: Optional[int] = None) -> bool:
+        await self._build_index(warm_up_limit)
+        return True
 
-            # 전체 개수는 Sorted Set 크기로 추정
-            total_count = await redis_client.redis.zcard(self.SORTED_SET_KEY)  # type: ignore
+    async def _build_index(self, warm_up_limit: Optional[int] = None) -> Dict[str, int]:
+        """공개 커리큘럼 전체로 피드 인덱스 재구성
 
-            return total_count, feed_items
+        인덱스에는 ID와 점수만 담으므로 전체를 넣어도 가볍고,
+        전체 개수도 정확하다. 최신 아이템 일부는 상세 정보까지 함께 캐시한다.
+        """
+        started = time.monotonic()
+        result = await self.session.execute(
+            select(CurriculumModel.id, CurriculumModel.updated_at).where(
+                CurriculumModel.visibility == "PUBLIC"
+            )
+        )
+        mapping = {
+            curriculum_id: updated_at.timestamp()
+            for curriculum_id, updated_at in result.all()
+        }
+        hot_items = await self._get_latest_items(
+            self.INDEX_WARM_UP_SIZE if warm_up_limit is None else warm_up_limit
+        )
+        delta = time.monotonic() - started
 
+        ttl = jittered_ttl(self.CACHE_EXPIRE_TIME)
+        values = self._item_payloads(hot_items)
+        values[self.META_KEY] = json.dumps(
+            {"expires_at": time.time() + ttl, "delta": delta}
+        )
+        try:
+            await redis_client.replace_sorted_set(
+                self.SORTED_SET_KEY, mapping, values, ex=ttl
+            )
         except Exception:
-            # 캐시 오류 시 None 반환하여 DB 조회로 fallback
-            return None
+            # 캐시 오류는 무시
+            pass
+        return {"indexed_items": len(mapping), "warmed_items": len(hot_items)}
 
-    async def _get_from_database(
-        self, feed_filter: FeedFilter
-    ) -> Tuple[int, List[FeedItem]]:
-        """데이터베이스에서 피드 조회"""
-        base_query = (
+    async def _get_latest_items(self, limit: int) -> List[FeedItem]:
+        """최신 공개 커리큘럼을 FeedItem으로 조회"""
+        if limit <= 0:
+            return []
+
+        query = (
             select(CurriculumModel)
             .where(CurriculumModel.visibility == "PUBLIC")
+            .order_by(CurriculumModel.updated_at.desc(), CurriculumModel.id.desc())
+            .limit(limit)
             .options(
                 selectinload(CurriculumModel.week_schedules),
                 joinedload(CurriculumModel.user),
             )
         )
+        result = await self.session.execute(query)
+        return await self._to_feed_items(result.unique().scalars().all())
+
+    def _apply_filters(self, query: Select, feed_filter: FeedFilter) -> Select:
+        """공개 여부 및 필터 조건 적용"""
+        query = query.where(CurriculumModel.visibility == "PUBLIC")
 
-        # 필터링 적용
         if feed_filter.category_id:
-            base_query = base_query.join(CurriculumCategoryModel).where(
+            query = query.join(CurriculumCategoryModel).where(
                 CurriculumCategoryModel.category_id == feed_filter.category_id
             )
 
         if feed_filter.tags:
-            base_query = (
-                base_query.join(CurriculumTagModel)
+            query = (
+                query.join(CurriculumTagModel)
                 .join(TagModel)
                 .where(TagModel.name.in_(feed_filter.tags))
                 .group_by(CurriculumModel.id)
@@ -112,20 +293,36 @@ class FeedRepository(IFeedRepository):
 
         if feed_filter.search_query:
             search_term = f"%{feed_filter.search_query}%"
-            base_query = base_query.where(
+            query = query.where(
                 or_(
                     CurriculumModel.title.like(search_term),
                     CurriculumModel.user.has(UserModel.name.like(search_term)),
                 )
             )
 
+        return query
+
+    async def _get_from_database(
+        self, feed_filter: FeedFilter
+    ) -> Tuple[int, List[FeedItem]]:
+        """데이터베이스에서 피드 조회"""
+        base_query = self._apply_filters(
+            select(CurriculumModel).options(
+                selectinload(CurriculumModel.week_schedules),
+                joinedload(CurriculumModel.user),
+            ),
+            feed_filter,
+        )
+
         # 전체 개수
         count_query = select(func.count()).select_from(base_query.subquery())
         total_count = await self.session.scalar(count_query) or 0
 
         # 페이지네이션 및 정렬
         paged_query = (
-            base_query.order_by(CurriculumModel.updated_at.desc())
+            base_query.order_by(
+                CurriculumModel.updated_at.desc(), CurriculumModel.id.desc()
+            )
             .offset(feed_filter.offset)
             .limit(feed_filter.limit)
         )
@@ -133,14 +330,26 @@ class FeedRepository(IFeedRepository):
         result = await self.session.execute(paged_query)
         curriculum_models = result.unique().scalars().all()
 
-        # FeedItem으로 변환
+        # FeedItem으로 변환 (카테고리/태그 일괄 조회)
+        feed_items = await self._to_feed_items(curriculum_models)
+
+        return total_count, feed_items
+
+    async def _to_feed_items(
+        self, curriculum_models: Sequence[CurriculumModel]
+    ) -> List[FeedItem]:
+        """커리큘럼 모델 목록을 FeedItem으로 변환
+
+        카테고리와 태그는 페이지 단위로 한 번에 조회하므로
+        아이템 수와 관계없이 쿼리 수가 일정하다.
+        """
+        curriculum_ids = [curriculum.id for curriculum in curriculum_models]
+        category_infos = await self._get_category_infos(curriculum_ids)
+        tags_by_curriculum = await self._get_curriculum_tags_bulk(curriculum_ids)
+
         feed_items = []
         for curriculum in curriculum_models:
-            # 카테고리 정보 조회
-            category_info = await self._get_category_info(curriculum.id)
-
-            # 태그 정보 조회
-            tags = await self._get_curriculum_tags(curriculum.id)
+            category_info = category_infos.get(curriculum.id)
 
             feed_item = FeedItem(
                 curriculum_id=curriculum.id,
@@ -154,83 +363,260 @@ class FeedRepository(IFeedRepository):
                 score=curriculum.updated_at.timestamp(),
                 category_name=category_info[0] if category_info else None,
                 category_color=category_info[1] if category_info else None,
-                tags=tags,
+                tags=tags_by_curriculum.get(curriculum.id, []),
             )
             feed_items.append(feed_item)
 
-        return total_count, feed_items
+        return feed_items
 
-    async def _get_category_info(self, curriculum_id: str) -> Optional[Tuple[str, str]]:
-        """커리큘럼의 카테고리 정보 조회"""
-        query: Select[Tuple[str, str]] = (
-            select(CategoryModel.name, CategoryModel.color)
-            .join(CurriculumCategoryModel)
-            .where(CurriculumCategoryModel.curriculum_id == curriculum_id)
+    async def _get_category_infos(
+        self, curriculum_ids: List[str]
+    ) -> Dict[str, Tuple[str, str]]:
+        """커리큘럼들의 카테고리 정보 일괄 조회 (curriculum_id -> (name, color))"""
+        if not curriculum_ids:
+            return {}
+
+        query: Select[Tuple[str, str, str]] = (
+            select(
+                CurriculumCategoryModel.curriculum_id,
+                CategoryModel.name,
+                CategoryModel.color,
+            )
+            .join(CategoryModel)
+            .where(CurriculumCategoryModel.curriculum_id.in_(curriculum_ids))
         )
-        result: Result[Tuple[str, str]] = await self.session.execute(query)
-        return result.first()  # type: ignore
+        result: Result[Tuple[str, str, str]] = await self.session.execute(query)
+        return {row[0]: (row[1], row[2]) for row in result.fetchall()}
+
+    async def _get_curriculum_tags_bulk(
+        self, curriculum_ids: List[str]
+    ) -> Dict[str, List[str]]:
+        """커리큘럼들의 태그 목록 일괄 조회 (curriculum_id -> [tag_name])"""
+        if not curriculum_ids:
+            return {}
 
-    async def _get_curriculum_tags(self, curriculum_id: str) -> List[str]:
-        """커리큘럼의 태그 목록 조회"""
         query = (
-            select(TagModel.name)
-            .join(CurriculumTagModel)
-            .where(CurriculumTagModel.curriculum_id == curriculum_id)
+            select(CurriculumTagModel.curriculum_id, TagModel.name)
+            .join(TagModel)
+            .where(CurriculumTagModel.curriculum_id.in_(curriculum_ids))
+            .order_by(CurriculumTagModel.created_at)
         )
         result = await self.session.execute(query)
-        return [row[0] for row in result.fetchall()]
 
-    def _matches_filter(self, feed_item: FeedItem, feed_filter: FeedFilter) -> bool:
-        """피드 아이템이 필터 조건에 맞는지 확인"""
-        if feed_filter.search_query:
-            search_lower = feed_filter.search_query.lower()
-            if (
-                search_lower not in feed_item.title.lower()
-                and search_lower not in feed_item.owner_name.lower()
-            ):
-                return False
+        tags_by_curriculum: Dict[str, List[str]] = {}
+        for curriculum_id, tag_name in result.fetchall():
+            tags_by_curriculum.setdefault(curriculum_id, []).append(tag_name)
+        return tags_by_curriculum
 
-        if feed_filter.tags:
-            if not all(tag in feed_item.tags for tag in feed_filter.tags):  # type: ignore
-                return False
+    async def _get_filtered_feed(
+        self, feed_filter: FeedFilter
+    ) -> Tuple[int, List[FeedItem]]:
+        """필터 적용 피드 조회 (필터별 ID 목록 캐시 + 아이템 캐시)"""
+        if feed_filter.offset >= self.FILTER_CACHE_MAX_IDS:
+            # 캐시 범위를 벗어난 깊은 페이지는 DB에서 직접 조회
+            return await self._get_from_database(feed_filter)
+
+        cached = await self._get_filter_ids_from_cache(feed_filter)
+        if cached is None:
+            cached = await self._load_once(
+                f"filter:{feed_filter.cache_key}",
+                lambda: self._load_filter_ids(feed_filter),
+                lambda: self._get_filter_ids_from_cache(
+                    feed_filter, allow_early_refresh=False
+                ),
+            )
+        total_count, curriculum_ids = cached
 
-        return True
+        start = feed_filter.offset
+        page_ids = curriculum_ids[start : start + feed_filter.limit]
+        feed_items = await self._get_feed_items_by_ids(page_ids)
+
+        return total_count, feed_items
+
+    def _filter_cache_key(self, feed_filter: FeedFilter) -> str:
+        return f"{self.CACHE_KEY_PREFIX}:filter:{feed_filter.cache_key}"
+
+    async def _get_filter_ids_from_cache(
+        self, feed_filter: FeedFilter, allow_early_refresh: bool = True
+    ) -> Optional[Tuple[int, List[str]]]:
+        """필터별 ID 목록 캐시 조회 (조기 갱신 대상이면 미스로 처리)"""
+        try:
+            cached_data = await redis_client.get(self._filter_cache_key(feed_filter))
+            if not cached_data:
+                return None
+
+            if allow_early_refresh and self._is_stale(cached_data):
+                return None
 
-    async def _cache_feed_items(
-        self, feed_items: List[FeedItem], feed_filter: FeedFilter
+            data = json.loads(cached_data)
+            return int(data["total_count"]), list(data["curriculum_ids"])
+
+        except Exception:
+            return None
+
+    async def _load_filter_ids(self, feed_filter: FeedFilter) -> Tuple[int, List[str]]:
+        """DB에서 필터별 ID 목록 조회 후 캐시에 저장"""
+        started = time.monotonic()
+        total_count, curriculum_ids = await self._find_filtered_ids(feed_filter)
+        delta = time.monotonic() - started
+
+        await self._cache_filter_ids(feed_filter, total_count, curriculum_ids, delta)
+
+        return total_count, curriculum_ids
+
+    async def _cache_filter_ids(
+        self,
+        feed_filter: FeedFilter,
+        total_count: int,
+        curriculum_ids: List[str],
+        delta: float = 0.0,
     ) -> None:
-        """피드 아이템들을 캐시에 저장"""
+        """필터별 ID 목록 캐시 저장"""
         try:
-            # Sorted Set에 추가
-            mapping = {item.curriculum_id: item.feed_score for item in feed_items}
-            if mapping:
-                await redis_client.zadd(self.SORTED_SET_KEY, mapping)
-                await redis_client.expire(self.SORTED_SET_KEY, self.CACHE_EXPIRE_TIME)
+            ttl = jittered_ttl(self.FILTER_CACHE_EXPIRE_TIME)
+            await redis_client.set(
+                self._filter_cache_key(feed_filter),
+                {
+                    "total_count": total_count,
+                    "curriculum_ids": curriculum_ids,
+                    "expires_at": time.time() + ttl,
+                    "delta": delta,
+                },
+                ex=ttl,
+            )
+        except Exception:
+            # 캐시 오류는 무시
+            pass
+
+    async def _find_filtered_ids(
+        self, feed_filter: FeedFilter
+    ) -> Tuple[int, List[str]]:
+        """필터에 맞는 커리큘럼 ID 목록 조회 (최신순, 최대 FILTER_CACHE_MAX_IDS개)"""
+        base_query = self._apply_filters(select(CurriculumModel.id), feed_filter)
+
+        count_query = select(func.count()).select_from(base_query.subquery())
+        total_count = await self.session.scalar(count_query) or 0
+
+        ids_query = base_query.order_by(
+            CurriculumModel.updated_at.desc(), CurriculumModel.id.desc()
+        ).limit(self.FILTER_CACHE_MAX_IDS)
+        result = await self.session.execute(ids_query)
+
+        return total_count, [row[0] for row in result.fetchall()]
+
+    async def _get_feed_items_by_ids(self, curriculum_ids: List[str]) -> List[FeedItem]:
+        """ID 순서대로 피드 아이템 조회 (아이템 캐시 우선, 없는 것만 DB 조회)"""
+        if not curriculum_ids:
+            return []
+
+        try:
+            cached_values = await redis_client.mget(
+                [
+                    f"{self.CACHE_KEY_PREFIX}:item:{curriculum_id}"
+                    for curriculum_id in curriculum_ids
+                ]
+            )
+        except Exception:
+            # 캐시 오류 시 전부 DB에서 조회
+            cached_values = [None] * len(curriculum_ids)
+
+        return await self._fill_missing_items(curriculum_ids, cached_values)
+
+    async def _fill_missing_items(
+        self, curriculum_ids: List[str], cached_values: List[Optional[str]]
+    ) -> List[FeedItem]:
+        """캐시된 아이템은 그대로 쓰고, 없는 것만 DB에서 조회해 캐시"""
+        items_by_id: Dict[str, FeedItem] = {}
+        for curriculum_id, cached_data in zip(curriculum_ids, cached_values):
+            if cached_data:
+                items_by_id[curriculum_id] = FeedItem.from_dict(json.loads(cached_data))
+
+        missing_ids = [cid for cid in curriculum_ids if cid not in items_by_id]
+        if missing_ids:
+            query = (
+                select(CurriculumModel)
+                .where(
+                    CurriculumModel.id.in_(missing_ids),
+                    CurriculumModel.visibility == "PUBLIC",
+                )
+                .options(
+                    selectinload(CurriculumModel.week_schedules),
+                    joinedload(CurriculumModel.user),
+                )
+            )
+            result = await self.session.execute(query)
+            fetched_items = await self._to_feed_items(result.unique().scalars().all())
 
-            # 개별 아이템 캐시
-            for item in feed_items:
-                await self.cache_feed_item(item)
+            # 개별 아이템만 캐시 (인덱스는 이벤트와 재구성으로만 변경)
+            await self._cache_item_payloads(fetched_items)
+            items_by_id.update({item.curriculum_id: item for item in fetched_items})
 
+        return [items_by_id[cid] for cid in curriculum_ids if cid in items_by_id]
+
+    async def _cache_item_payloads(self, feed_items: List[FeedItem]) -> None:
+        """개별 피드 아이템만 캐시"""
+        try:
+            await redis_client.set_many_with_zadd(
+                self._item_payloads(feed_items),
+                self.SORTED_SET_KEY,
+                {},
+                ex=jittered_ttl(self.CACHE_EXPIRE_TIME),
+            )
         except Exception:
-            # 캐시 오류는 무시 (DB 조회는 성공했으므로)
+            # 캐시 오류는 무시
             pass
 
-    async def cache_feed_item(self, feed_item: FeedItem) -> None:
-        """단일 피드 아이템 캐시"""
+    def _item_payloads(self, feed_items: List[FeedItem]) -> Dict[str, str]:
+        return {
+            f"{self.CACHE_KEY_PREFIX}:item:{item.curriculum_id}": json.dumps(
+                item.to_dict(), ensure_ascii=False
+            )
+            for item in feed_items
+        }
+
+    async def cache_feed_items(self, feed_items: List[FeedItem]) -> None:
+        """피드 아이템 일괄 캐시 (개별 아이템 + 인덱스를 한 번의 트랜잭션으로 저장)
+
+        인덱스(Sorted Set)에는 TTL을 두지 않는다.
+        """
         try:
-            cache_key = f"{self.CACHE_KEY_PREFIX}:item:{feed_item.curriculum_id}"
-            item_data = json.dumps(feed_item.to_dict(), ensure_ascii=False)
-            await redis_client.set(cache_key, item_data, ex=self.CACHE_EXPIRE_TIME)
+            mapping = {item.curriculum_id: item.feed_score for item in feed_items}
 
-            # Sorted Set에도 추가
-            await redis_client.zadd(
-                self.SORTED_SET_KEY, {feed_item.curriculum_id: feed_item.feed_score}
+            await redis_client.set_many_with_zadd(
+                self._item_payloads(feed_items),
+                self.SORTED_SET_KEY,
+                mapping,
+                ex=jittered_ttl(self.CACHE_EXPIRE_TIME),
             )
 
         except Exception:
             # 캐시 오류는 무시
             pass
 
+    async def cache_feed_item(self, feed_item: FeedItem) -> None:
+        """단일 피드 아이템 캐시"""
+        await self.cache_feed_items([feed_item])
+
+    async def upsert_feed_item(self, curriculum_id: str) -> None:
+        """커리큘럼 변경을 피드 인덱스에 반영 (공개면 추가/갱신, 아니면 제거)"""
+        query = (
+            select(CurriculumModel)
+            .where(CurriculumModel.id == curriculum_id)
+            .options(
+                selectinload(CurriculumModel.week_schedules),
+                joinedload(CurriculumModel.user),
+            )
+        )
+        result = await self.session.execute(query)
+        curriculum = result.unique().scalars().first()
+
+        if curriculum is None or curriculum.visibility != "PUBLIC":
+            await self.remove_from_cache(curriculum_id)
+            return
+
+        feed_items = await self._to_feed_items([curriculum])
+        await self.cache_feed_item(feed_items[0])
+
     async def remove_from_cache(self, curriculum_id: str) -> None:
         """캐시에서 피드 아이템 제거"""
         try:
@@ -248,58 +634,27 @@ class FeedRepository(IFeedRepository):
     async def invalidate_feed_cache(self) -> None:
         """전체 피드 캐시 무효화"""
         try:
-            # Sorted Set 삭제
+            # Sorted Set 및 필터별 캐시 삭제
             await redis_client.delete(self.SORTED_SET_KEY)
+            await redis_client.delete(self.META_KEY)
+            await redis_client.delete_pattern(f"{self.CACHE_KEY_PREFIX}:filter:*")
 
         except Exception:
             # 캐시 오류는 무시
             pass
 
-    async def warm_up_cache(self, limit: int = 100) -> None:
-        """캐시 워밍업 - 최신 커리큘럼들을 미리 캐시에 로드"""
-        try:
-            # 최신 공개 커리큘럼들 조회
-            query = (
-                select(CurriculumModel)
-                .where(CurriculumModel.visibility == "PUBLIC")
-                .order_by(CurriculumModel.updated_at.desc())
-                .limit(limit)
-                .options(
-                    selectinload(CurriculumModel.week_schedules),
-                    joinedload(CurriculumModel.user),
-                )
-            )
-
-            result = await self.session.execute(query)
-            curriculums = result.unique().scalars().all()
-
-            # 캐시에 저장
-            for curriculum in curriculums:
-                category_info = await self._get_category_info(curriculum.id)
-                tags = await self._get_curriculum_tags(curriculum.id)
-
-                feed_item = FeedItem(
-                    curriculum_id=curriculum.id,
-                    title=curriculum.title,
-                    owner_id=curriculum.user_id,
-                    owner_name=curriculum.user.name,
-                    total_weeks=len(curriculum.week_schedules),
-                    total_lessons=sum(
-                        len(ws.lessons) for ws in curriculum.week_schedules
-                    ),
-                    created_at=curriculum.created_at,
-                    updated_at=curriculum.updated_at,
-                    score=curriculum.updated_at.timestamp(),
-                    category_name=category_info[0] if category_info else None,
-                    category_color=category_info[1] if category_info else None,
-                    tags=tags,
-                )
+    async def warm_up_cache(self, limit: int = 100) -> Optional[Dict[str, int]]:
+        """캐시 워밍업 - 피드 인덱스를 재구성하고 최신 커리큘럼들을 미리 캐시에 로드
 
-                await self.cache_feed_item(feed_item)
+        성공 시 인덱스/워밍업 아이템 수를, 실패 시 None 반환
+        """
+        try:
+            return await self._build_index(warm_up_limit=limit)
 
         except Exception as e:
             # 캐시 워밍업 실패는 로그만 남기고 계속 진행
             print(f"Cache warm-up failed: {e}")
+            return None
 
     async def get_cache_stats(self) -> dict:
         """캐시 통계 조회"""
@@ -307,8 +662,8 @@ class FeedRepository(IFeedRepository):
             # Sorted Set 크기
             total_cached = await redis_client.redis.zcard(self.SORTED_SET_KEY)  # type: ignore
 
-            # TTL 확인
-            ttl = await redis_client.redis.ttl(self.SORTED_SET_KEY)  # type: ignore
+            # TTL 확인 (인덱스 재구성 주기)
+            ttl = await redis_client.redis.ttl(self.META_KEY)  # type: ignore
 
             return {
                 "total_cached_items": total_cached,
@@ -21,6 +21,10 @@ async def get_public_feed(
     category_id: Optional[str] = Query(None, description="카테고리 ID로 필터링"),
     tags: Optional[str] = Query(None, description="태그로 필터링 (쉼표로 구분)"),
     search: Optional[str] = Query(None, description="제목 또는 작성자로 검색"),
+    cursor: Optional[str] = Query(
+        None, description="이전 응답의 next_cursor (지정 시 page 대신 커서로 조회)"
+    ),
+    include_total: bool = Query(False, description="커서 모드에서 전체 개수 포함 여부"),
     feed_service: FeedService = Depends(Provide[Container.feed_service]),
 ) -> FeedPageResponse:
     """공개 커리큘럼 피드 조회"""
@@ -36,6 +40,8 @@ async def get_public_feed(
         search_query=search,
         page=page,
         items_per_page=items_per_page,
+        cursor=cursor,
+        include_total=include_total,
     )
 
     feed_page = await feed_service.get_public_feed(query)
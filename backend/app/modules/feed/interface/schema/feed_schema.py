@@ -66,11 +66,12 @@ class FeedItemResponse(BaseModel):
 class FeedPageResponse(BaseModel):
     """피드 페이지 응답"""
 
-    total_count: int
+    total_count: Optional[int]  # 커서 모드에서 include_total=false면 None
     page: int
     items_per_page: int
     has_next: bool
     items: List[FeedItemResponse]
+    next_cursor: Optional[str] = None
 
     @classmethod
     def from_dto(cls, dto: FeedPageDTO) -> "FeedPageResponse":
@@ -80,4 +81,5 @@ class FeedPageResponse(BaseModel):
             items_per_page=dto.items_per_page,
             has_next=dto.has_next,
             items=[FeedItemResponse.from_dto(item) for item in dto.items],
+            next_cursor=dto.next_cursor,
         )
@@ -2,6 +2,7 @@ from dataclasses import dataclass
 from datetime import datetime
 from typing import Dict, List, Optional
 
+from app.common.jobs.job import Job
 from app.modules.learning.domain.entity.summary import Summary
 from app.modules.learning.domain.entity.feedback import Feedback
 
@@ -119,6 +120,33 @@ class FeedbackDTO:
         )
 
 
+@dataclass
+class FeedbackJobDTO:
+    """피드백 생성 작업 전송 객체"""
+
+    job_id: str
+    status: str
+    attempts: int
+    created_at: datetime
+    updated_at: datetime
+    error: Optional[str] = None
+    feedback: Optional[FeedbackDTO] = None
+
+    @classmethod
+    def from_job(
+        cls, job: Job, feedback: Optional[FeedbackDTO] = None
+    ) -> "FeedbackJobDTO":
+        return cls(
+            job_id=job.id,
+            status=job.status.value,
+            attempts=job.attempts,
+            created_at=job.created_at,
+            updated_at=job.updated_at,
+            error=job.error,
+            feedback=feedback,
+        )
+
+
 @dataclass
 class SummaryPageDTO:
     """요약 목록 페이지 전송 객체"""
@@ -44,3 +44,9 @@ class LLMFeedbackGenerationError(Exception):
     """LLM 피드백 생성 실패"""
 
     pass
+
+
+class FeedbackJobNotFoundError(Exception):
+    """피드백 생성 작업을 찾을 수 없음"""
+
+    pass
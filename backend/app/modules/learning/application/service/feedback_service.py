@@ -1,14 +1,21 @@
 from datetime import datetime, timezone
-from typing import Any, Dict, Optional, List
+from typing import Any, Dict, Optional, List, Tuple
 from ulid import ULID  # type: ignore
+from app.common.db.unit_of_work import commit_current
+from app.common.jobs.job import Job, JobStatus
+from app.common.jobs.job_worker import JobWorkerPool
 from app.common.monitoring.metrics import increment_feedback_creation
+from app.common.llm.dispatcher import llm_user
+from app.common.llm.exception import LLMQueueFullError
 from app.common.llm.llm_client_repo import ILLMClientRepository
+from app.common.llm.structured_output import FEEDBACK_DETAIL_KEYS, parse_feedback
 from app.modules.curriculum.domain.entity.curriculum import Curriculum
 from app.modules.curriculum.domain.entity.week_schedule import WeekSchedule
 from app.modules.learning.application.dto.learning_dto import (
     CreateFeedbackCommand,
     UpdateFeedbackCommand,
     FeedbackDTO,
+    FeedbackJobDTO,
     FeedbackPageDTO,
     FeedbackQuery,
 )
@@ -16,6 +23,7 @@ from app.modules.learning.application.exception import (
     FeedbackNotFoundError,
     FeedbackAlreadyExistsError,
     FeedbackAccessDeniedError,
+    FeedbackJobNotFoundError,
     LLMFeedbackGenerationError,
 )
 from app.modules.learning.domain.entity.feedback import Feedback
@@ -38,6 +46,8 @@ import logging
 
 logger = logging.getLogger()
 
+FEEDBACK_JOB_TYPE = "generate_feedback"
+
 
 class FeedbackService:
     def __init__(
@@ -48,6 +58,7 @@ class FeedbackService:
         learning_domain_service: LearningDomainService,
         llm_client: ILLMClientRepository,
         ulid: ULID = ULID(),
+        job_pool: Optional[JobWorkerPool] = None,
     ) -> None:
         self.feedback_repo: IFeedbackRepository = feedback_repo
         self.summary_repo: ISummaryRepository = summary_repo
@@ -55,6 +66,7 @@ class FeedbackService:
         self.learning_domain_service: LearningDomainService = learning_domain_service
         self.llm_client: ILLMClientRepository = llm_client
         self.ulid: ULID = ulid
+        self.job_pool = job_pool
 
     async def create_feedback(
         self,
@@ -95,14 +107,13 @@ class FeedbackService:
         increment_feedback_creation()
         return FeedbackDTO.from_domain(feedback)
 
-    @trace_llm_operation("generate_feedback")
-    async def generate_feedback_with_llm(
+    async def _load_feedback_context(
         self,
         summary_id: str,
         user_id: str,
         role: RoleVO,
-    ) -> FeedbackDTO:
-        """LLM을 사용한 자동 피드백 생성"""
+    ) -> Tuple[List[str], str]:
+        """LLM 피드백 생성 가능 여부 확인 후 (주차 레슨 목록, 요약 내용) 반환"""
         # 요약 존재 확인
         summary: Summary | None = await self.summary_repo.find_by_id(summary_id)
         if not summary:
@@ -144,25 +155,38 @@ class FeedbackService:
                 f"Week {summary.week_number.value} not found in curriculum"
             )
 
-        lessons: List[str] = week_schedule.lessons.items
+        return week_schedule.lessons.items, summary.content.value
+
+    @trace_llm_operation("generate_feedback")
+    async def generate_feedback_with_llm(
+        self,
+        summary_id: str,
+        user_id: str,
+        role: RoleVO,
+    ) -> FeedbackDTO:
+        """LLM을 사용한 자동 피드백 생성"""
+        lessons, summary_content = await self._load_feedback_context(
+            summary_id=summary_id,
+            user_id=user_id,
+            role=role,
+        )
+        # LLM 응답을 기다리는 동안 커넥션을 잡고 있지 않도록 조회 트랜잭션을 끝낸다
+        await commit_current()
 
         try:
             # LLM을 통한 피드백 생성
-            llm_response: Dict[str, Any] = await self.llm_client.generate_feedback(
-                lessons=lessons,
-                summary_content=summary.content.value,
-            )
+            llm_response: Dict[str, Any]
+            with llm_user(user_id):
+                llm_response = await self.llm_client.generate_feedback(
+                    lessons=lessons,
+                    summary_content=summary_content,
+                )
+
+            # 키 별칭/점수 범위 보정, 총점이 없으면 5개 지표 평균으로 채움
+            llm_response = parse_feedback(llm_response)
 
             # 5개 지표 점수 추출
-            detailed_scores = {
-                "cognitive_load_retention": llm_response.get(
-                    "cognitive_load_retention", 0
-                ),
-                "engagement_behavior": llm_response.get("engagement_behavior", 0),
-                "transfer_application": llm_response.get("transfer_application", 0),
-                "competency_performance": llm_response.get("competency_performance", 0),
-                "realtime_analytics": llm_response.get("realtime_analytics", 0),
-            }
+            detailed_scores = {key: llm_response[key] for key in FEEDBACK_DETAIL_KEYS}
             feedback: Feedback = await self.learning_domain_service.create_feedback(
                 feedback_id=self.ulid.generate(),
                 summary_id=summary_id,
@@ -182,10 +206,66 @@ class FeedbackService:
 
             return dto
 
+        except LLMQueueFullError:
+            raise
         except Exception as e:
             logger.error(f"🔥 Feedback generation failed: {e}")
             raise LLMFeedbackGenerationError(f"Failed to generate feedback: {str(e)}")
 
+    async def request_feedback_generation(
+        self,
+        summary_id: str,
+        user_id: str,
+        role: RoleVO,
+    ) -> FeedbackJobDTO:
+        """LLM 피드백 생성 작업 등록 (검증만 즉시 수행하고 생성은 백그라운드 처리)"""
+        if self.job_pool is None:
+            raise LLMFeedbackGenerationError("Feedback job queue is not configured")
+
+        await self._load_feedback_context(
+            summary_id=summary_id,
+            user_id=user_id,
+            role=role,
+        )
+
+        job: Job = await self.job_pool.submit(
+            job_type=FEEDBACK_JOB_TYPE,
+            owner_id=user_id,
+            payload={
+                "summary_id": summary_id,
+                "user_id": user_id,
+                "role": role.value,
+            },
+        )
+        return FeedbackJobDTO.from_job(job)
+
+    async def get_feedback_generation_job(
+        self,
+        job_id: str,
+        user_id: str,
+        role: RoleVO,
+    ) -> FeedbackJobDTO:
+        """피드백 생성 작업 상태 조회 (완료 시 생성된 피드백 포함)"""
+        job: Job | None = await self.job_pool.get(job_id) if self.job_pool else None
+        if (
+            not job
+            or job.job_type != FEEDBACK_JOB_TYPE
+            or (job.owner_id != user_id and role != RoleVO.ADMIN)
+        ):
+            raise FeedbackJobNotFoundError(f"Feedback job {job_id} not found")
+
+        feedback_dto: Optional[FeedbackDTO] = None
+        if job.status == JobStatus.SUCCEEDED and job.result:
+            feedback: Feedback | None = await self.feedback_repo.find_by_id(
+                job.result["feedback_id"]
+            )
+            if feedback:
+                feedback_dto = FeedbackDTO.from_domain(feedback)
+                # 상세 점수는 DB에 저장되지 않으므로 작업 결과에서 복원
+                feedback_dto.detailed_scores = job.result.get("detailed_scores")
+
+        return FeedbackJobDTO.from_job(job, feedback_dto)
+
     async def get_feedback_by_id(
         self,
         feedback_id: str,
@@ -1,6 +1,7 @@
 from datetime import datetime, timezone, timedelta
 from typing import List, Optional
 
+from app.common.db.routing import read_only
 from app.modules.learning.application.dto.learning_stats_dto import (
     UserLearningStatsQuery,
     UserLearningStatsDTO,
@@ -45,6 +46,7 @@ class LearningStatsService:
 
         return activity_time >= start_date
 
+    @read_only
     async def get_user_learning_stats(
         self,
         query: UserLearningStatsQuery,
@@ -21,18 +21,19 @@ class LearningContainer(containers.DeclarativeContainer):
     session: providers.Dependency[object] = providers.Dependency()
     curriculum_repository: providers.Dependency[object] = providers.Dependency()
     llm_client: providers.Dependency[object] = providers.Dependency()
+    job_pool: providers.Dependency[object] = providers.Dependency()
 
-    summary_repository = providers.Singleton(
+    summary_repository = providers.Factory(
         SummaryRepository,
         session=session,
     )
 
-    feedback_repository = providers.Singleton(
+    feedback_repository = providers.Factory(
         FeedbackRepository,
         session=session,
     )
 
-    learning_domain_service = providers.Singleton(
+    learning_domain_service = providers.Factory(
         LearningDomainService,
         summary_repo=summary_repository,
         feedback_repo=feedback_repository,
@@ -54,6 +55,7 @@ class LearningContainer(containers.DeclarativeContainer):
         learning_domain_service=learning_domain_service,
         llm_client=llm_client,
         ulid=providers.Singleton(ULID),
+        job_pool=job_pool,
     )
 
     learning_stats_service = providers.Factory(
@@ -38,11 +38,7 @@ class FeedbackRepository(IFeedbackRepository):
         )
 
         self.session.add(new_feedback)
-        try:
-            await self.session.commit()
-        except:
-            await self.session.rollback()
-            raise
+        await self.session.flush()
 
     async def find_by_id(self, feedback_id: str) -> Optional[FeedbackDomain]:
 
@@ -190,11 +186,7 @@ class FeedbackRepository(IFeedbackRepository):
         existing_feedback.score = feedback.score.value
         existing_feedback.updated_at = feedback.updated_at
 
-        try:
-            await self.session.commit()
-        except:
-            await self.session.rollback()
-            raise
+        await self.session.flush()
 
     async def delete(self, feedback_id: str) -> None:
 
@@ -203,11 +195,7 @@ class FeedbackRepository(IFeedbackRepository):
         )
         if existing_feedback:
             await self.session.delete(existing_feedback)
-            try:
-                await self.session.commit()
-            except:
-                await self.session.rollback()
-                raise
+            await self.session.flush()
 
     async def count_by_curriculum(self, curriculum_id: str) -> int:
 
@@ -39,11 +39,7 @@ class SummaryRepository(ISummaryRepository):
         )
 
         self.session.add(new_summary)
-        try:
-            await self.session.commit()
-        except:
-            await self.session.rollback()
-            raise
+        await self.session.flush()
 
     async def find_by_id(self, summary_id: str) -> Optional[SummaryDomain]:
 
@@ -174,11 +170,7 @@ class SummaryRepository(ISummaryRepository):
         existing_summary.content = summary.content.value
         existing_summary.updated_at = summary.updated_at
 
-        try:
-            await self.session.commit()
-        except:
-            await self.session.rollback()
-            raise
+        await self.session.flush()
 
     async def delete(self, summary_id: str) -> None:
 
@@ -187,11 +179,7 @@ class SummaryRepository(ISummaryRepository):
         )
         if existing_summary:
             await self.session.delete(existing_summary)
-            try:
-                await self.session.commit()
-            except:
-                await self.session.rollback()
-                raise
+            await self.session.flush()
 
     async def count_by_curriculum(self, curriculum_id: str) -> int:
 
@@ -1,5 +1,5 @@
 from typing import Annotated, Optional
-from fastapi import APIRouter, Depends, Query, status
+from fastapi import APIRouter, Depends, Query, Request, Response, status
 from dependency_injector.wiring import inject, Provide
 
 from app.core.auth import CurrentUser, get_current_user
@@ -8,10 +8,13 @@ from app.modules.learning.application.service.feedback_service import FeedbackSe
 from app.modules.learning.application.dto.learning_dto import (
     FeedbackQuery,
     FeedbackDTO,
+    FeedbackJobDTO,
     FeedbackPageDTO,
 )
 from app.modules.learning.interface.schema.feedback_schema import (
     FeedbackResponse,
+    FeedbackJobAcceptedResponse,
+    FeedbackJobResponse,
     FeedbackPageResponse,
     GenerateFeedbackRequest,
 )
@@ -69,6 +72,52 @@ async def generate_feedback_with_ai(
     return FeedbackResponse.from_dto(dto)
 
 
+@feedback_router.post(
+    "/{summary_id}/feedbacks/jobs",
+    response_model=FeedbackJobAcceptedResponse,
+    status_code=status.HTTP_202_ACCEPTED,
+)
+@inject
+async def request_feedback_generation(
+    summary_id: str,
+    request: Request,
+    response: Response,
+    current_user: Annotated[CurrentUser, Depends(get_current_user)],
+    feedback_service: FeedbackService = Depends(Provide[Container.feedback_service]),
+) -> FeedbackJobAcceptedResponse:
+    """AI 피드백 생성 작업 등록 (비동기, 상태 조회 URL 반환)"""
+    dto: FeedbackJobDTO = await feedback_service.request_feedback_generation(
+        summary_id=summary_id,
+        user_id=current_user.id,
+        role=RoleVO(current_user.role.value),
+    )
+
+    status_url = request.url_for("get_feedback_job", job_id=dto.job_id).path
+    response.headers["Location"] = status_url
+    return FeedbackJobAcceptedResponse.from_dto(dto, status_url=status_url)
+
+
+@feedback_router.get(
+    "/feedback-jobs/{job_id}",
+    response_model=FeedbackJobResponse,
+    status_code=status.HTTP_200_OK,
+)
+@inject
+async def get_feedback_job(
+    job_id: str,
+    current_user: Annotated[CurrentUser, Depends(get_current_user)],
+    feedback_service: FeedbackService = Depends(Provide[Container.feedback_service]),
+) -> FeedbackJobResponse:
+    """AI 피드백 생성 작업 상태 조회"""
+    dto: FeedbackJobDTO = await feedback_service.get_feedback_generation_job(
+        job_id=job_id,
+        user_id=current_user.id,
+        role=RoleVO(current_user.role.value),
+    )
+
+    return FeedbackJobResponse.from_dto(dto)
+
+
 @feedback_router.get(
     "/{summary_id}/feedbacks",
     response_model=Optional[FeedbackResponse],
@@ -7,6 +7,7 @@ from app.modules.learning.application.dto.learning_dto import (
     CreateFeedbackCommand,
     UpdateFeedbackCommand,
     FeedbackDTO,
+    FeedbackJobDTO,
     FeedbackPageDTO,
 )
 
@@ -127,3 +128,41 @@ class GenerateFeedbackRequest(BaseModel):
 
     # 요청 본문 없음 - summary_id는 경로에서 가져옴
     pass
+
+
+class FeedbackJobAcceptedResponse(BaseModel):
+    """AI 피드백 생성 작업 접수 응답"""
+
+    job_id: str
+    status: str
+    status_url: str
+
+    @classmethod
+    def from_dto(
+        cls, dto: FeedbackJobDTO, status_url: str
+    ) -> "FeedbackJobAcceptedResponse":
+        return cls(job_id=dto.job_id, status=dto.status, status_url=status_url)
+
+
+class FeedbackJobResponse(BaseModel):
+    """AI 피드백 생성 작업 상태 응답"""
+
+    job_id: str
+    status: str  # PENDING | RUNNING | SUCCEEDED | FAILED
+    attempts: int
+    error: Optional[str] = None
+    feedback: Optional[FeedbackResponse] = None  # SUCCEEDED일 때만 포함
+    created_at: datetime
+    updated_at: datetime
+
+    @classmethod
+    def from_dto(cls, dto: FeedbackJobDTO) -> "FeedbackJobResponse":
+        return cls(
+            job_id=dto.job_id,
+            status=dto.status,
+            attempts=dto.attempts,
+            error=dto.error,
+            feedback=FeedbackResponse.from_dto(dto.feedback) if dto.feedback else None,
+            created_at=dto.created_at,
+            updated_at=dto.updated_at,
+        )
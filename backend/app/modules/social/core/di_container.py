@@ -19,23 +19,23 @@ class SocialContainer(containers.DeclarativeContainer):
     user_repository: providers.Dependency[object] = providers.Dependency()
 
     # Repositories
-    like_repository = providers.Singleton(
+    like_repository = providers.Factory(
         LikeRepository,
         session=session,
     )
 
-    comment_repository = providers.Singleton(
+    comment_repository = providers.Factory(
         CommentRepository,
         session=session,
     )
 
-    bookmark_repository = providers.Singleton(
+    bookmark_repository = providers.Factory(
         BookmarkRepository,
         session=session,
     )
 
     # Domain Service
-    social_domain_service = providers.Singleton(
+    social_domain_service = providers.Factory(
         SocialDomainService,
         like_repo=like_repository,
         comment_repo=comment_repository,
@@ -29,11 +29,7 @@ class BookmarkRepository(IBookmarkRepository):
             created_at=bookmark.created_at,
         )
         self.session.add(new_bookmark)
-        try:
-            await self.session.commit()
-        except:
-            await self.session.rollback()
-            raise
+        await self.session.flush()
 
     async def find_by_id(self, bookmark_id: str) -> Optional[Bookmark]:
         """ID로 북마크 조회"""
@@ -96,11 +92,7 @@ class BookmarkRepository(IBookmarkRepository):
         """북마크 삭제"""
         query = delete(BookmarkModel).where(BookmarkModel.id == bookmark_id)
         await self.session.execute(query)
-        try:
-            await self.session.commit()
-        except:
-            await self.session.rollback()
-            raise
+        await self.session.flush()
 
     async def delete_by_curriculum_and_user(
         self, curriculum_id: str, user_id: str
@@ -111,11 +103,7 @@ class BookmarkRepository(IBookmarkRepository):
             BookmarkModel.user_id == user_id,
         )
         await self.session.execute(query)
-        try:
-            await self.session.commit()
-        except:
-            await self.session.rollback()
-            raise
+        await self.session.flush()
 
     async def count_by_user(self, user_id: str) -> int:
         """사용자의 북마크 수 조회"""
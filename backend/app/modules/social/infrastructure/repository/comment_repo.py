@@ -34,11 +34,7 @@ class CommentRepository(ICommentRepository):
             updated_at=comment.updated_at,
         )
         self.session.add(new_comment)
-        try:
-            await self.session.commit()
-        except:
-            await self.session.rollback()
-            raise
+        await self.session.flush()
 
     async def find_by_id(self, comment_id: str) -> Optional[Comment]:
         """ID로 댓글 조회"""
@@ -119,21 +115,13 @@ class CommentRepository(ICommentRepository):
         existing_comment.content = comment.content.value
         existing_comment.updated_at = comment.updated_at
 
-        try:
-            await self.session.commit()
-        except:
-            await self.session.rollback()
-            raise
+        await self.session.flush()
 
     async def delete(self, comment_id: str) -> None:
         """댓글 삭제"""
         query = delete(CommentModel).where(CommentModel.id == comment_id)
         await self.session.execute(query)
-        try:
-            await self.session.commit()
-        except:
-            await self.session.rollback()
-            raise
+        await self.session.flush()
 
     async def count_by_curriculum(self, curriculum_id: str) -> int:
         """커리큘럼의 댓글 수 조회"""
@@ -29,11 +29,7 @@ class FollowRepository(IFollowRepository):
             created_at=follow.created_at,
         )
         self.session.add(new_follow)
-        try:
-            await self.session.commit()
-        except:
-            await self.session.rollback()
-            raise
+        await self.session.flush()
 
     async def find_by_id(self, follow_id: str) -> Optional[Follow]:
         """ID로 팔로우 관계 조회"""
@@ -126,11 +122,7 @@ class FollowRepository(IFollowRepository):
         """팔로우 관계 삭제"""
         query = delete(FollowModel).where(FollowModel.id == follow_id)
         await self.session.execute(query)
-        try:
-            await self.session.commit()
-        except:
-            await self.session.rollback()
-            raise
+        await self.session.flush()
 
     async def delete_by_follower_and_followee(
         self, follower_id: str, followee_id: str
@@ -143,11 +135,7 @@ class FollowRepository(IFollowRepository):
             )
         )
         await self.session.execute(query)
-        try:
-            await self.session.commit()
-        except:
-            await self.session.rollback()
-            raise
+        await self.session.flush()
 
     async def count_followers(self, followee_id: str) -> int:
         """특정 사용자의 팔로워 수 조회"""
@@ -187,11 +175,7 @@ class FollowRepository(IFollowRepository):
             )
         )
         await self.session.execute(query)
-        try:
-            await self.session.commit()
-        except:
-            await self.session.rollback()
-            raise
+        await self.session.flush()
 
     async def get_mutual_followers(
         self, user1_id: str, user2_id: str, page: int = 1, items_per_page: int = 10
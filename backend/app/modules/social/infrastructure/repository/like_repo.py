@@ -29,11 +29,7 @@ class LikeRepository(ILikeRepository):
             created_at=like.created_at,
         )
         self.session.add(new_like)
-        try:
-            await self.session.commit()
-        except:
-            await self.session.rollback()
-            raise
+        await self.session.flush()
 
     async def find_by_id(self, like_id: str) -> Optional[Like]:
         """ID로 좋아요 조회"""
@@ -122,11 +118,7 @@ class LikeRepository(ILikeRepository):
         """좋아요 삭제"""
         query = delete(LikeModel).where(LikeModel.id == like_id)
         await self.session.execute(query)
-        try:
-            await self.session.commit()
-        except:
-            await self.session.rollback()
-            raise
+        await self.session.flush()
 
     async def delete_by_curriculum_and_user(
         self, curriculum_id: str, user_id: str
@@ -137,11 +129,7 @@ class LikeRepository(ILikeRepository):
             LikeModel.user_id == user_id,
         )
         await self.session.execute(query)
-        try:
-            await self.session.commit()
-        except:
-            await self.session.rollback()
-            raise
+        await self.session.flush()
 
     async def count_by_curriculum(self, curriculum_id: str) -> int:
         """커리큘럼의 좋아요 수 조회"""
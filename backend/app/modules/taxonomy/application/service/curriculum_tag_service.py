@@ -1,8 +1,13 @@
-from typing import List
+from functools import partial
+from typing import List, Optional
 from ulid import ULID  # type: ignore
 
+from app.common.db.unit_of_work import after_commit
 from app.modules.curriculum.application.exception import CurriculumNotFoundError
 from app.modules.curriculum.domain.entity.curriculum import Curriculum
+from app.modules.curriculum.domain.event.curriculum_event_handler import (
+    CurriculumEventHandler,
+)
 from app.modules.taxonomy.application.dto.tag_dto import (
     AddTagsToCurriculumCommand,
     RemoveTagFromCurriculumCommand,
@@ -44,6 +49,7 @@ class CurriculumTagService:
         curriculum_category_repo: ICurriculumCategoryRepository,
         curriculum_repo: ICurriculumRepository,
         ulid: ULID = ULID(),
+        feed_event_handler: Optional[CurriculumEventHandler] = None,
     ) -> None:
         self.tag_domain_service: TagDomainService = tag_domain_service
         self.curriculum_tag_repo: ICurriculumTagRepository = curriculum_tag_repo
@@ -52,6 +58,7 @@ class CurriculumTagService:
         )
         self.curriculum_repo: ICurriculumRepository = curriculum_repo
         self.ulid: ULID = ulid
+        self.feed_event_handler = feed_event_handler
 
     async def add_tags_to_curriculum(
         self,
@@ -88,6 +95,15 @@ class CurriculumTagService:
         )
         for _ in added_tags:
             increment_curriculum_tag_assignment()
+
+        if self.feed_event_handler:
+            after_commit(
+                partial(
+                    self.feed_event_handler.on_curriculum_updated,
+                    command.curriculum_id,
+                )
+            )
+
         return [TagDTO.from_domain(tag) for tag in added_tags]
 
     async def remove_tag_from_curriculum(
@@ -119,6 +135,14 @@ class CurriculumTagService:
             tag_name=command.tag_name,
         )
 
+        if self.feed_event_handler:
+            after_commit(
+                partial(
+                    self.feed_event_handler.on_curriculum_updated,
+                    command.curriculum_id,
+                )
+            )
+
     async def assign_category_to_curriculum(
         self,
         command: AssignCategoryToCurriculumCommand,
@@ -156,6 +180,15 @@ class CurriculumTagService:
             )
         )
         increment_curriculum_category_assignment()
+
+        if self.feed_event_handler:
+            after_commit(
+                partial(
+                    self.feed_event_handler.on_curriculum_updated,
+                    command.curriculum_id,
+                )
+            )
+
         return CategoryDTO.from_domain(category)
 
     async def remove_category_from_curriculum(
@@ -182,6 +215,11 @@ class CurriculumTagService:
 
         await self.tag_domain_service.remove_category_from_curriculum(curriculum_id)
 
+        if self.feed_event_handler:
+            after_commit(
+                partial(self.feed_event_handler.on_curriculum_updated, curriculum_id)
+            )
+
     async def get_curriculum_tags_and_category(
         self, curriculum_id: str, user_id: str, role: RoleVO = RoleVO.USER
     ) -> CurriculumTagsDTO:
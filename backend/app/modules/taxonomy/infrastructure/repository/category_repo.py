@@ -41,11 +41,7 @@ class CategoryRepository(ICategoryRepository):
             updated_at=category.updated_at,
         )
         self.session.add(new_category)
-        try:
-            await self.session.commit()
-        except:
-            await self.session.rollback()
-            raise
+        await self.session.flush()
 
     async def find_by_id(self, category_id: str) -> Optional[Category]:
         """ID로 카테고리 조회"""
@@ -178,21 +174,13 @@ class CategoryRepository(ICategoryRepository):
         existing_category.is_active = category.is_active
         existing_category.updated_at = category.updated_at
 
-        try:
-            await self.session.commit()
-        except:
-            await self.session.rollback()
-            raise
+        await self.session.flush()
 
     async def delete(self, category_id: str) -> None:
         """카테고리 삭제"""
         query = delete(CategoryModel).where(CategoryModel.id == category_id)
         await self.session.execute(query)
-        try:
-            await self.session.commit()
-        except:
-            await self.session.rollback()
-            raise
+        await self.session.flush()
 
     async def exists_by_name(self, name: CategoryName) -> bool:
         """같은 이름의 카테고리가 이미 존재하는지 확인"""
@@ -238,8 +226,4 @@ class CategoryRepository(ICategoryRepository):
             )
             await self.session.execute(query)
 
-        try:
-            await self.session.commit()
-        except:
-            await self.session.rollback()
-            raise
+        await self.session.flush()
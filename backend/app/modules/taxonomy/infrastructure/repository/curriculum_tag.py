@@ -58,11 +58,7 @@ class CurriculumTagRepository(ICurriculumTagRepository):
             created_at=curriculum_tag.created_at,
         )
         self.session.add(new_curriculum_tag)
-        try:
-            await self.session.commit()
-        except:
-            await self.session.rollback()
-            raise
+        await self.session.flush()
 
     async def find_by_id(self, curriculum_tag_id: str) -> Optional[CurriculumTag]:
         """ID로 커리큘럼-태그 연결 조회"""
@@ -199,11 +195,7 @@ class CurriculumTagRepository(ICurriculumTagRepository):
             CurriculumTagModel.id == curriculum_tag_id
         )
         await self.session.execute(query)
-        try:
-            await self.session.commit()
-        except:
-            await self.session.rollback()
-            raise
+        await self.session.flush()
 
     async def delete_by_curriculum_and_tag(
         self, curriculum_id: str, tag_id: str
@@ -214,11 +206,7 @@ class CurriculumTagRepository(ICurriculumTagRepository):
             CurriculumTagModel.tag_id == tag_id,
         )
         await self.session.execute(query)
-        try:
-            await self.session.commit()
-        except:
-            await self.session.rollback()
-            raise
+        await self.session.flush()
 
     async def delete_all_by_curriculum(self, curriculum_id: str) -> None:
         """커리큘럼의 모든 태그 연결 삭제"""
@@ -226,21 +214,13 @@ class CurriculumTagRepository(ICurriculumTagRepository):
             CurriculumTagModel.curriculum_id == curriculum_id
         )
         await self.session.execute(query)
-        try:
-            await self.session.commit()
-        except:
-            await self.session.rollback()
-            raise
+        await self.session.flush()
 
     async def delete_all_by_tag(self, tag_id: str) -> None:
         """태그의 모든 커리큘럼 연결 삭제"""
         query = delete(CurriculumTagModel).where(CurriculumTagModel.tag_id == tag_id)
         await self.session.execute(query)
-        try:
-            await self.session.commit()
-        except:
-            await self.session.rollback()
-            raise
+        await self.session.flush()
 
     async def count_by_curriculum(self, curriculum_id: str) -> int:
         """커리큘럼의 태그 수 조회"""
@@ -310,11 +290,7 @@ class CurriculumCategoryRepository(ICurriculumCategoryRepository):
             created_at=curriculum_category.created_at,
         )
         self.session.add(new_curriculum_category)
-        try:
-            await self.session.commit()
-        except:
-            await self.session.rollback()
-            raise
+        await self.session.flush()
 
     async def find_by_id(
         self, curriculum_category_id: str
@@ -440,11 +416,7 @@ class CurriculumCategoryRepository(ICurriculumCategoryRepository):
             CurriculumCategoryModel.id == curriculum_category_id
         )
         await self.session.execute(query)
-        try:
-            await self.session.commit()
-        except:
-            await self.session.rollback()
-            raise
+        await self.session.flush()
 
     async def delete_by_curriculum(self, curriculum_id: str) -> None:
         """커리큘럼의 카테고리 연결 삭제"""
@@ -452,11 +424,7 @@ class CurriculumCategoryRepository(ICurriculumCategoryRepository):
             CurriculumCategoryModel.curriculum_id == curriculum_id
         )
         await self.session.execute(query)
-        try:
-            await self.session.commit()
-        except:
-            await self.session.rollback()
-            raise
+        await self.session.flush()
 
     async def delete_all_by_category(self, category_id: str) -> None:
         """카테고리의 모든 커리큘럼 연결 삭제"""
@@ -464,11 +432,7 @@ class CurriculumCategoryRepository(ICurriculumCategoryRepository):
             CurriculumCategoryModel.category_id == category_id
         )
         await self.session.execute(query)
-        try:
-            await self.session.commit()
-        except:
-            await self.session.rollback()
-            raise
+        await self.session.flush()
 
     async def count_by_category(self, category_id: str) -> int:
         """특정 카테고리를 사용하는 커리큘럼 수"""
@@ -36,11 +36,7 @@ class TagRepository(ITagRepository):
             updated_at=tag.updated_at,
         )
         self.session.add(new_tag)
-        try:
-            await self.session.commit()
-        except:
-            await self.session.rollback()
-            raise
+        await self.session.flush()
 
     async def find_by_id(self, tag_id: str) -> Optional[Tag]:
         """ID로 태그 조회"""
@@ -186,21 +182,13 @@ class TagRepository(ITagRepository):
         existing_tag.usage_count = tag.usage_count
         existing_tag.updated_at = tag.updated_at
 
-        try:
-            await self.session.commit()
-        except:
-            await self.session.rollback()
-            raise
+        await self.session.flush()
 
     async def delete(self, tag_id: str) -> None:
         """태그 삭제"""
         query = delete(TagModel).where(TagModel.id == tag_id)
         await self.session.execute(query)
-        try:
-            await self.session.commit()
-        except:
-            await self.session.rollback()
-            raise
+        await self.session.flush()
 
     async def increment_usage_count(self, tag_id: str) -> None:
         """태그 사용 횟수 증가"""
@@ -213,11 +201,7 @@ class TagRepository(ITagRepository):
             )
         )
         await self.session.execute(query)
-        try:
-            await self.session.commit()
-        except:
-            await self.session.rollback()
-            raise
+        await self.session.flush()
 
     async def decrement_usage_count(self, tag_id: str) -> None:
         """태그 사용 횟수 감소"""
@@ -232,11 +216,7 @@ class TagRepository(ITagRepository):
             )
         )
         await self.session.execute(query)
-        try:
-            await self.session.commit()
-        except:
-            await self.session.rollback()
-            raise
+        await self.session.flush()
 
     async def exists_by_name(self, name: TagName) -> bool:
         """태그 이름으로 존재 여부 확인"""
@@ -38,11 +38,7 @@ class UserRepository(IUserRepository):
             updated_at=user.updated_at,
         )
         self.session.add(new_user)
-        try:
-            await self.session.commit()
-        except:
-            await self.session.rollback()
-            raise
+        await self.session.flush()
 
     async def find_by_id(self, id: str) -> Optional[UserDomain]:
         user: UserModel | None = await self.session.get(UserModel, id)
@@ -105,11 +101,7 @@ class UserRepository(IUserRepository):
         existing_user.updated_at = user.updated_at
 
         self.session.add(existing_user)
-        try:
-            await self.session.commit()
-        except:
-            await self.session.rollback()
-            raise
+        await self.session.flush()
 
     async def delete(self, id: str) -> None:
         existing_user: UserModel | None = await self.session.get(UserModel, id)
@@ -117,11 +109,7 @@ class UserRepository(IUserRepository):
             raise UserNotFoundError(f"user with id={id} not found")
 
         await self.session.delete(existing_user)
-        try:
-            await self.session.commit()
-        except:
-            await self.session.rollback()
-            raise
+        await self.session.flush()
 
     async def exists_by_email(self, email: Email) -> bool:
         query: Select[Tuple[int]] = (
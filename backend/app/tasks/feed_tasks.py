@@ -1,22 +1,133 @@
-# from celery import Celery
-# from app.modules.feed.infrastructure.repository.feed_repo import FeedRepository
-# from app.common.db.database import AsyncSessionLocal
-
-# celery_app = Celery("feed_tasks")
-
-# @celery_app.task
-# def refresh_feed_cache():
-#     """주기적 피드 캐시 갱신 (예: 매시간 실행)"""
-#     async def _refresh():
-#         async with AsyncSessionLocal() as session:
-#             feed_repo = FeedRepository(session)
-#             await feed_repo.warm_up_cache(limit=200)
-
-#     import asyncio
-#     asyncio.run(_refresh())
-
-# @celery_app.task
-# def cleanup_expired_cache():
-#     """만료된 캐시 정리"""
-#     # Redis에서 만료된 키들 정리
-#     pass
+import asyncio
+import logging
+import time
+from typing import Any, Callable, Dict, Optional
+
+from app.common.cache.redis_client import redis_client
+from app.common.db.database import AsyncSessionLocal
+from app.common.monitoring.metrics import (
+    record_feed_cache_refresh,
+    set_feed_cache_refresher_leader,
+)
+from app.modules.feed.infrastructure.repository.feed_repo import FeedRepository
+
+logger = logging.getLogger(__name__)
+
+
+class FeedCacheRefresher:
+    """피드 캐시 주기 갱신 워커
+
+    별도 브로커 없이 애플리케이션 프로세스 안에서 asyncio 태스크로 실행된다.
+    여러 워커가 떠 있어도 Redis 락 임대(lease)를 가진 리더 한 곳만
+    피드 인덱스를 재구성하고, 리더가 사라지면 임대 만료 후 다른 워커가 이어받는다.
+    """
+
+    LEADER_KEY = "feed:refresher:leader"
+
+    def __init__(
+        self,
+        session_factory: Callable[[], Any] = AsyncSessionLocal,
+        interval: int = 300,  # 5분마다 갱신
+        warm_up_size: int = 200,
+    ):
+        self.session_factory = session_factory
+        self.interval = interval
+        self.warm_up_size = warm_up_size
+        # 갱신이 늦어져도 임대가 끊기지 않도록 주기의 2배로 잡음
+        self.lease_ms = interval * 2 * 1000
+        self._token: Optional[str] = None
+        self._running = False
+        self._task: Optional[asyncio.Task] = None
+
+    @property
+    def is_leader(self) -> bool:
+        return self._token is not None
+
+    async def start(self) -> None:
+        """주기 갱신 시작"""
+        if self._running:
+            logger.warning("FeedCacheRefresher is already running")
+            return
+
+        self._running = True
+        self._task = asyncio.create_task(self._refresh_loop())
+        logger.info("FeedCacheRefresher started")
+
+    async def stop(self) -> None:
+        """주기 갱신 중지 및 리더 임대 반납"""
+        if not self._running:
+            return
+
+        self._running = False
+        if self._task:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+
+        if self._token is not None:
+            try:
+                await redis_client.release_lock(self.LEADER_KEY, self._token)
+            except Exception as e:
+                logger.error(f"Failed to release feed refresher lease: {e}")
+            self._token = None
+            set_feed_cache_refresher_leader(False)
+
+        logger.info("FeedCacheRefresher stopped")
+
+    async def _refresh_loop(self) -> None:
+        """주기적 피드 캐시 갱신"""
+        while self._running:
+            try:
+                await self.refresh_once()
+                await asyncio.sleep(self.interval)
+            except asyncio.CancelledError:
+                break
+            except Exception as e:
+                logger.error(f"Error refreshing feed cache: {e}")
+                await asyncio.sleep(self.interval)
+
+    async def _ensure_leadership(self) -> bool:
+        """리더 임대 연장, 리더가 아니면 획득 시도"""
+        if self._token is not None:
+            if await redis_client.extend_lock(
+                self.LEADER_KEY, self._token, self.lease_ms
+            ):
+                return True
+            logger.warning("Feed refresher lease lost")
+            self._token = None
+
+        self._token = await redis_client.acquire_lock(self.LEADER_KEY, self.lease_ms)
+        set_feed_cache_refresher_leader(self._token is not None)
+        return self._token is not None
+
+    async def refresh_once(self) -> Optional[Dict[str, int]]:
+        """리더일 때 한 번 갱신, 갱신 결과(아이템 수) 반환
+
+        리더가 아니거나 갱신에 실패하면 None 반환
+        """
+        if not await self._ensure_leadership():
+            return None
+
+        started = time.monotonic()
+        stats: Optional[Dict[str, int]] = None
+        try:
+            async with self.session_factory() as session:
+                stats = await FeedRepository(session).warm_up_cache(
+                    limit=self.warm_up_size
+                )
+        except Exception as e:
+            logger.error(f"Feed cache refresh failed: {e}")
+        duration = time.monotonic() - started
+
+        if stats is None:
+            record_feed_cache_refresh(duration, status="failure")
+            return None
+
+        record_feed_cache_refresh(
+            duration,
+            indexed_items=stats["indexed_items"],
+            warmed_items=stats["warmed_items"],
+        )
+        return stats
@@ -0,0 +1,85 @@
+import logging
+from typing import Any, Callable, Dict
+
+from app.common.db.database import AsyncSessionLocal
+from app.common.db.unit_of_work import UnitOfWork
+from app.common.jobs.job import Job, JobPermanentError
+from app.common.llm.llm_client_repo import ILLMClientRepository
+from app.modules.curriculum.infrastructure.repository.curriculum_repo import (
+    CurriculumRepository,
+)
+from app.modules.learning.application.exception import (
+    FeedbackAccessDeniedError,
+    FeedbackAlreadyExistsError,
+    FeedbackNotFoundError,
+)
+from app.modules.learning.application.service.feedback_service import (
+    FEEDBACK_JOB_TYPE,
+    FeedbackService,
+)
+from app.modules.learning.domain.service.learning_domain_service import (
+    LearningDomainService,
+)
+from app.modules.learning.infrastructure.repository.feedback_repo import (
+    FeedbackRepository,
+)
+from app.modules.learning.infrastructure.repository.summary_repo import (
+    SummaryRepository,
+)
+from app.modules.user.domain.vo.role import RoleVO
+
+logger = logging.getLogger(__name__)
+
+
+class FeedbackJobHandler:
+    """LLM 피드백 생성 작업 처리기
+
+    요청 스코프 세션과 섞이지 않도록 작업마다 새 UnitOfWork 로 서비스를 구성하고,
+    작업이 성공하면 commit, 실패하면 rollback 한다.
+    다시 시도해도 결과가 같은 오류(요약 없음, 중복, 권한 없음)는 재시도하지 않는다.
+    """
+
+    JOB_TYPE = FEEDBACK_JOB_TYPE
+
+    def __init__(
+        self,
+        llm_client: ILLMClientRepository,
+        session_factory: Callable[[], Any] = AsyncSessionLocal,
+    ) -> None:
+        self.llm_client = llm_client
+        self.session_factory = session_factory
+
+    async def __call__(self, job: Job) -> Dict[str, Any]:
+        async with UnitOfWork(self.session_factory) as session:
+            summary_repo = SummaryRepository(session)
+            feedback_repo = FeedbackRepository(session)
+            curriculum_repo = CurriculumRepository(session)
+            service = FeedbackService(
+                feedback_repo=feedback_repo,
+                summary_repo=summary_repo,
+                curriculum_repo=curriculum_repo,
+                learning_domain_service=LearningDomainService(
+                    summary_repo=summary_repo,
+                    feedback_repo=feedback_repo,
+                    curriculum_repo=curriculum_repo,
+                ),
+                llm_client=self.llm_client,
+            )
+
+            try:
+                feedback = await service.generate_feedback_with_llm(
+                    summary_id=job.payload["summary_id"],
+                    user_id=job.payload["user_id"],
+                    role=RoleVO(job.payload["role"]),
+                )
+            except (
+                FeedbackNotFoundError,
+                FeedbackAlreadyExistsError,
+                FeedbackAccessDeniedError,
+            ) as e:
+                raise JobPermanentError(str(e)) from e
+
+        return {
+            "feedback_id": feedback.id,
+            "detailed_scores": feedback.detailed_scores,
+        }
@@ -0,0 +1,191 @@
+import asyncio
+
+import pytest
+
+from app.common.cache.stampede import (
+    SingleFlight,
+    jittered_ttl,
+    should_refresh_early,
+)
+
+
+class TestSingleFlight:
+    """SingleFlight 테스트"""
+
+    @pytest.mark.asyncio
+    async def test_concurrent_calls_share_one_execution(self) -> None:
+        """동시 호출이 한 번만 실행되는지 테스트"""
+        # Given
+        single_flight = SingleFlight()
+        calls = 0
+        release = asyncio.Event()
+
+        async def load() -> str:
+            nonlocal calls
+            calls += 1
+            await release.wait()
+            return "result"
+
+        # When
+        tasks = [
+            asyncio.create_task(single_flight.do("key", load)) for _ in range(10)
+        ]
+        await asyncio.sleep(0)
+        assert single_flight.in_flight == 1
+        release.set()
+        results = await asyncio.gather(*tasks)
+
+        # Then
+        assert calls == 1
+        assert results == ["result"] * 10
+        assert single_flight.in_flight == 0
+
+    @pytest.mark.asyncio
+    async def test_exception_propagates_to_waiters(self) -> None:
+        """실행 중 예외가 대기자에게도 전달되는지 테스트"""
+        # Given
+        single_flight = SingleFlight()
+        release = asyncio.Event()
+
+        async def load() -> str:
+            await release.wait()
+            raise ValueError("boom")
+
+        # When
+        tasks = [asyncio.create_task(single_flight.do("key", load)) for _ in range(3)]
+        await asyncio.sleep(0)
+        release.set()
+        results = await asyncio.gather(*tasks, return_exceptions=True)
+
+        # Then
+        assert all(isinstance(result, ValueError) for result in results)
+        assert single_flight.in_flight == 0
+
+    @pytest.mark.asyncio
+    async def test_leader_cancellation_hands_over_to_waiter(self) -> None:
+        """첫 호출이 취소돼도 대기자는 취소되지 않고 대신 실행하는지 테스트"""
+        # Given
+        single_flight = SingleFlight()
+        calls = 0
+        release = asyncio.Event()
+
+        async def load() -> str:
+            nonlocal calls
+            calls += 1
+            await release.wait()
+            return "result"
+
+        leader = asyncio.create_task(single_flight.do("key", load))
+        await asyncio.sleep(0)
+        waiters = [
+            asyncio.create_task(single_flight.do("key", load)) for _ in range(3)
+        ]
+        await asyncio.sleep(0)
+
+        # When
+        leader.cancel()
+        for _ in range(10):  # 대기자가 깨어나 다시 실행할 때까지
+            if calls == 2:
+                break
+            await asyncio.sleep(0)
+        assert single_flight.in_flight == 1
+        release.set()
+        results = await asyncio.gather(*waiters)
+
+        # Then
+        assert leader.cancelled()
+        assert results == ["result"] * 3
+        assert calls == 2  # 취소된 첫 실행 + 넘겨받은 대기자 한 번
+        assert single_flight.in_flight == 0
+
+    @pytest.mark.asyncio
+    async def test_not_shared_error_hands_over_to_waiter(self) -> None:
+        """첫 호출자에게만 해당하는 예외는 대기자에게 넘기지 않고 대기자가 다시 실행하는지 테스트"""
+        # Given
+        single_flight = SingleFlight()
+        calls = 0
+        release = asyncio.Event()
+
+        async def load() -> str:
+            nonlocal calls
+            calls += 1
+            await release.wait()
+            if calls == 1:
+                raise PermissionError("leader only")
+            return "result"
+
+        leader = asyncio.create_task(
+            single_flight.do("key", load, not_shared=(PermissionError,))
+        )
+        await asyncio.sleep(0)
+        waiter = asyncio.create_task(
+            single_flight.do("key", load, not_shared=(PermissionError,))
+        )
+        await asyncio.sleep(0)
+
+        # When
+        release.set()
+
+        # Then
+        with pytest.raises(PermissionError):
+            await leader
+        assert await waiter == "result"
+        assert calls == 2
+        assert single_flight.in_flight == 0
+
+    @pytest.mark.asyncio
+    async def test_different_keys_run_separately(self) -> None:
+        """키가 다르면 각각 실행되는지 테스트"""
+        # Given
+        single_flight = SingleFlight()
+        calls = []
+
+        async def load(key: str) -> str:
+            calls.append(key)
+            return key
+
+        # When
+        results = await asyncio.gather(
+            single_flight.do("a", lambda: load("a")),
+            single_flight.do("b", lambda: load("b")),
+        )
+
+        # Then
+        assert results == ["a", "b"]
+        assert sorted(calls) == ["a", "b"]
+
+
+class TestJitteredTtl:
+    """jittered_ttl 테스트"""
+
+    def test_within_bounds(self) -> None:
+        """TTL 편차가 ±10% 안에 있는지 테스트"""
+        ttls = {jittered_ttl(300) for _ in range(200)}
+
+        assert all(270 <= ttl <= 330 for ttl in ttls)
+        assert len(ttls) > 1
+
+    def test_minimum_one_second(self) -> None:
+        """TTL이 1초 미만으로 내려가지 않는지 테스트"""
+        assert jittered_ttl(1, jitter=0.9) >= 1
+
+
+class TestShouldRefreshEarly:
+    """should_refresh_early 테스트"""
+
+    def test_expired_always_refreshes(self) -> None:
+        """만료 시각이 지났으면 항상 갱신하는지 테스트"""
+        assert should_refresh_early(expires_at=100.0, delta=0.5, now=100.0)
+
+    def test_far_from_expiry_never_refreshes(self) -> None:
+        """만료까지 충분히 남았으면 갱신하지 않는지 테스트"""
+        results = {
+            should_refresh_early(expires_at=10_000.0, delta=0.01, now=0.0)
+            for _ in range(100)
+        }
+
+        assert results == {False}
+
+    def test_zero_delta_never_refreshes(self) -> None:
+        """재계산 비용 정보가 없으면 조기 갱신하지 않는지 테스트"""
+        assert not should_refresh_early(expires_at=0.0, delta=0.0, now=100.0)
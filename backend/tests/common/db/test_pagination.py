@@ -0,0 +1,32 @@
+from datetime import datetime
+
+import pytest
+
+from app.common.db.pagination import CursorPage, PageCursor
+
+
+class TestPageCursor:
+    """PageCursor 테스트"""
+
+    def test_round_trip(self) -> None:
+        """인코딩한 커서를 그대로 복원하는지 테스트"""
+        cursor = PageCursor(datetime(2025, 8, 4, 12, 30, 15, 123456), "curriculum_001")
+
+        token = cursor.encode()
+
+        assert "=" not in token
+        assert PageCursor.decode(token) == cursor
+
+    @pytest.mark.parametrize("token", ["", "not-a-cursor", "e30", "!!!!"])
+    def test_invalid_token(self, token: str) -> None:
+        """잘못된 커서 문자열은 ValueError를 발생시키는지 테스트"""
+        with pytest.raises(ValueError):
+            PageCursor.decode(token)
+
+
+class TestCursorPage:
+    """CursorPage 테스트"""
+
+    def test_has_next(self) -> None:
+        assert CursorPage(items=[1], next_cursor="abc").has_next
+        assert not CursorPage(items=[1]).has_next
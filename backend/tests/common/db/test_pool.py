@@ -0,0 +1,140 @@
+"""
+DB 엔진 설정과 커넥션 풀 메트릭 테스트
+"""
+
+import asyncio
+from pathlib import Path
+from typing import Any, AsyncIterator, Generator
+
+import pytest
+import pytest_asyncio
+from prometheus_client import REGISTRY
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import AsyncEngine
+
+from app.common.db.database import create_engine, engine_options
+from app.common.db.pool import InstrumentedQueuePool
+from app.core.config import Settings
+
+HOLD_SECONDS = 0.1
+
+
+@pytest.fixture(autouse=True)  # type: ignore
+def _freeze_time() -> Generator[None, Any, None]:  # type: ignore
+    """대기 시간 측정은 실제 시간으로 진행 (공통 시간 고정 해제)"""
+    yield
+
+
+def _sample(name: str) -> float:
+    return REGISTRY.get_sample_value(name) or 0.0
+
+
+@pytest_asyncio.fixture
+async def engine(tmp_path: Path) -> AsyncIterator[AsyncEngine]:
+    settings = Settings(
+        sqlalchemy_database_url=f"sqlite+aiosqlite:///{tmp_path / 'pool.db'}",
+        db_pool_size=1,
+        db_max_overflow=1,
+        db_pool_timeout=5,
+    )
+    engine = create_engine(settings)
+    yield engine
+    await engine.dispose()
+
+
+class TestEngineOptions:
+    """설정 기반 엔진 옵션 테스트"""
+
+    def test_production_defaults(self) -> None:
+        """기본값은 echo 없이 pre-ping/재활용을 켜는지 테스트"""
+        options = engine_options(
+            Settings(sqlalchemy_database_url="mysql+aiomysql://u:p@db:3306/llearn")
+        )
+
+        assert options["echo"] is False
+        assert options["pool_pre_ping"] is True
+        assert options["pool_recycle"] == 1800
+        assert options["poolclass"] is InstrumentedQueuePool
+        assert options["connect_args"] == {"charset": "utf8mb4"}
+
+    def test_statement_timeout(self) -> None:
+        """MySQL 이면 세션 시작 시 실행 시간 상한을 거는지 테스트"""
+        options = engine_options(
+            Settings(
+                sqlalchemy_database_url="mysql+aiomysql://u:p@db:3306/llearn",
+                db_pool_size=20,
+                db_max_overflow=5,
+                db_statement_timeout_ms=3000,
+                db_echo=True,
+            )
+        )
+
+        assert options["pool_size"] == 20
+        assert options["max_overflow"] == 5
+        assert options["echo"] is True
+        assert (
+            options["connect_args"]["init_command"]
+            == "SET SESSION max_execution_time=3000"
+        )
+
+    def test_non_mysql_has_no_mysql_connect_args(self) -> None:
+        """MySQL 전용 접속 옵션은 다른 드라이버에 넘기지 않는지 테스트"""
+        options = engine_options(
+            Settings(
+                sqlalchemy_database_url="sqlite+aiosqlite:///./test.db",
+                db_statement_timeout_ms=3000,
+            )
+        )
+
+        assert "connect_args" not in options
+
+
+class TestPoolMetrics:
+    """커넥션 풀 메트릭 테스트"""
+
+    async def test_checkout_and_overflow_are_reported(self, engine: AsyncEngine) -> None:
+        """커넥션이 오갈 때마다 사용량/초과 연결 수를 갱신하는지 테스트"""
+        async with engine.connect() as first:
+            await first.execute(text("SELECT 1"))
+            assert _sample("db_connection_pool_checked_out") == 1
+            assert _sample("db_connection_pool_overflow") == 0
+
+            async with engine.connect() as second:
+                await second.execute(text("SELECT 1"))
+                assert _sample("db_connection_pool_checked_out") == 2
+                assert _sample("db_connection_pool_overflow") == 1
+
+        assert _sample("db_connection_pool_checked_out") == 0
+        assert _sample("db_connection_pool_size") == 1
+
+    async def test_wait_time_is_observed(self, tmp_path: Path) -> None:
+        """풀이 바닥났을 때 커넥션을 기다린 시간을 기록하는지 테스트"""
+        engine = create_engine(
+            Settings(
+                sqlalchemy_database_url=f"sqlite+aiosqlite:///{tmp_path / 'wait.db'}",
+                db_pool_size=1,
+                db_max_overflow=0,
+                db_pool_timeout=5,
+            )
+        )
+        count_before = _sample("db_connection_pool_wait_seconds_count")
+        sum_before = _sample("db_connection_pool_wait_seconds_sum")
+
+        async def _hold() -> None:
+            async with engine.connect() as conn:
+                await conn.execute(text("SELECT 1"))
+                await asyncio.sleep(HOLD_SECONDS)
+
+        async def _wait() -> None:
+            await asyncio.sleep(HOLD_SECONDS / 4)
+            async with engine.connect() as conn:
+                await conn.execute(text("SELECT 1"))
+
+        try:
+            await asyncio.gather(_hold(), _wait())
+        finally:
+            await engine.dispose()
+
+        assert _sample("db_connection_pool_wait_seconds_count") - count_before == 2
+        waited = _sample("db_connection_pool_wait_seconds_sum") - sum_before
+        assert waited >= HOLD_SECONDS / 2
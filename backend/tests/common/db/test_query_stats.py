@@ -0,0 +1,182 @@
+"""
+요청/블록 단위 SQL 실행 수 집계와 쿼리 수 상한 검사 테스트
+"""
+
+import asyncio
+from pathlib import Path
+from typing import Any, AsyncIterator, Callable, ContextManager, Generator
+
+import httpx
+import pytest
+import pytest_asyncio
+from fastapi import FastAPI
+from prometheus_client import REGISTRY
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import AsyncEngine, create_async_engine
+
+from app.common.db.query_stats import (
+    QueryStats,
+    assert_max_queries,
+    instrument_queries,
+    track_queries,
+)
+from app.common.middleware.query_stats_middleware import QueryStatsMiddleware
+
+
+@pytest.fixture(autouse=True)  # type: ignore
+def _freeze_time() -> Generator[None, Any, None]:  # type: ignore
+    """DB 시간 측정은 실제 시간으로 진행 (공통 시간 고정 해제)"""
+    yield
+
+
+@pytest_asyncio.fixture
+async def engine(tmp_path: Path) -> AsyncIterator[AsyncEngine]:
+    engine = create_async_engine(f"sqlite+aiosqlite:///{tmp_path / 'stats.db'}")
+    instrument_queries(engine)
+    async with engine.begin() as conn:
+        await conn.execute(text("CREATE TABLE users (id INTEGER PRIMARY KEY, name TEXT)"))
+        await conn.execute(
+            text("INSERT INTO users (id, name) VALUES (1, 'a'), (2, 'b'), (3, 'c')")
+        )
+    yield engine
+    await engine.dispose()
+
+
+async def _names_one_by_one(engine: AsyncEngine, ids: list) -> list:
+    """사용자마다 한 번씩 조회하는 N+1 경로"""
+    names = []
+    async with engine.connect() as conn:
+        for user_id in ids:
+            result = await conn.execute(
+                text("SELECT name FROM users WHERE id = :id"), {"id": user_id}
+            )
+            names.append(result.scalar_one())
+    return names
+
+
+async def _names_in_bulk(engine: AsyncEngine, ids: list) -> list:
+    async with engine.connect() as conn:
+        result = await conn.execute(
+            text(f"SELECT name FROM users WHERE id IN ({', '.join(map(str, ids))})")
+        )
+        return list(result.scalars())
+
+
+class TestQueryStats:
+    """SQL 실행 수 집계 테스트"""
+
+    async def test_counts_queries_and_time(self, engine: AsyncEngine) -> None:
+        """블록 안에서 실행된 SQL 수와 시간, 반복된 SQL 을 집계하는지 테스트"""
+        with track_queries() as stats:
+            await _names_one_by_one(engine, [1, 2, 3])
+
+        assert stats.count == 3
+        assert stats.duration > 0
+        assert stats.repeated(3) == [("SELECT name FROM users WHERE id = ?", 3)]
+        assert stats.repeated(4) == []
+
+    async def test_nested_scopes_add_to_outer(self, engine: AsyncEngine) -> None:
+        """안쪽 범위의 SQL 이 바깥 범위에도 더해지는지 테스트"""
+        with track_queries() as outer:
+            await _names_in_bulk(engine, [1, 2])
+            with track_queries() as inner:
+                await _names_one_by_one(engine, [1, 2])
+
+        assert inner.count == 2
+        assert outer.count == 3
+
+    async def test_concurrent_scopes_are_isolated(self, engine: AsyncEngine) -> None:
+        """동시에 도는 태스크끼리 집계가 섞이지 않는지 테스트"""
+
+        async def _scope(ids: list) -> QueryStats:
+            with track_queries() as stats:
+                await _names_one_by_one(engine, ids)
+                await asyncio.sleep(0)
+            return stats
+
+        first, second = await asyncio.gather(_scope([1]), _scope([1, 2, 3]))
+
+        assert (first.count, second.count) == (1, 3)
+
+    async def test_outside_scope_is_ignored(self, engine: AsyncEngine) -> None:
+        """집계 범위 밖의 SQL 은 그대로 실행만 되는지 테스트"""
+        assert await _names_in_bulk(engine, [1]) == ["a"]
+
+
+class TestQueryBudget:
+    """쿼리 수 상한 검사 테스트"""
+
+    async def test_within_budget(self, engine: AsyncEngine) -> None:
+        """상한 이내면 통과하는지 테스트"""
+        with assert_max_queries(1) as stats:
+            await _names_in_bulk(engine, [1, 2, 3])
+
+        assert stats.count == 1
+
+    async def test_budget_exceeded_reports_repeated_statement(
+        self, engine: AsyncEngine
+    ) -> None:
+        """상한을 넘으면 반복된 SQL 과 함께 실패하는지 테스트"""
+        with pytest.raises(AssertionError) as exc_info:
+            with assert_max_queries(1):
+                await _names_one_by_one(engine, [1, 2, 3])
+
+        message = str(exc_info.value)
+        assert "Query budget exceeded: 3 > 1" in message
+        assert "3x SELECT name FROM users WHERE id = ?" in message
+
+    async def test_fixture_counts_unregistered_engines(
+        self,
+        tmp_path: Path,
+        query_budget: Callable[[int], ContextManager[QueryStats]],
+    ) -> None:
+        """query_budget 픽스처가 따로 계측하지 않은 엔진도 세는지 테스트"""
+        engine = create_async_engine(f"sqlite+aiosqlite:///{tmp_path / 'plain.db'}")
+        try:
+            with query_budget(2) as stats:
+                async with engine.connect() as conn:
+                    await conn.execute(text("SELECT 1"))
+                    await conn.execute(text("SELECT 2"))
+        finally:
+            await engine.dispose()
+
+        assert stats.count == 2
+
+
+class TestQueryStatsMiddleware:
+    """요청/라우트별 SQL 메트릭 테스트"""
+
+    async def test_records_per_route_template(self, engine: AsyncEngine) -> None:
+        """경로 템플릿별로 SQL 수와 N+1 여부를 기록하는지 테스트"""
+        app = FastAPI()
+        app.add_middleware(QueryStatsMiddleware, n_plus_one_threshold=3)
+
+        @app.get("/teams/{team_id}/members")
+        async def members(team_id: int, bulk: bool = False) -> list:
+            if bulk:
+                return await _names_in_bulk(engine, [1, 2, 3])
+            return await _names_one_by_one(engine, [1, 2, 3])
+
+        labels = {"method": "GET", "route": "/teams/{team_id}/members"}
+        count_before = REGISTRY.get_sample_value("db_request_queries_count", labels) or 0
+        sum_before = REGISTRY.get_sample_value("db_request_queries_sum", labels) or 0
+        n_plus_one_before = (
+            REGISTRY.get_sample_value("db_n_plus_one_total", labels) or 0
+        )
+
+        async with httpx.AsyncClient(
+            transport=httpx.ASGITransport(app=app), base_url="http://test"
+        ) as client:
+            assert (await client.get("/teams/1/members")).json() == ["a", "b", "c"]
+            assert (await client.get("/teams/2/members?bulk=true")).status_code == 200
+
+        assert REGISTRY.get_sample_value("db_request_queries_count", labels) == (
+            count_before + 2
+        )
+        assert REGISTRY.get_sample_value("db_request_queries_sum", labels) == (
+            sum_before + 4
+        )
+        assert REGISTRY.get_sample_value("db_request_duration_seconds_sum", labels) > 0
+        assert REGISTRY.get_sample_value("db_n_plus_one_total", labels) == (
+            n_plus_one_before + 1
+        )
@@ -0,0 +1,205 @@
+"""
+읽기 복제본 라우팅 테스트
+
+주 DB 와 복제본 역할의 sqlite 파일 두 개에 서로 다른 행을 넣어 두고,
+조회 결과로 어느 쪽에서 읽었는지 구분한다. 복제 지연은 측정 함수를 바꿔 흉내 낸다.
+"""
+
+from pathlib import Path
+from typing import AsyncIterator, Dict, List, Optional
+
+import pytest
+import pytest_asyncio
+from sqlalchemy import Column, MetaData, String, Table, insert, select
+from sqlalchemy.ext.asyncio import (
+    AsyncConnection,
+    AsyncEngine,
+    AsyncSession,
+    async_sessionmaker,
+    create_async_engine,
+)
+from sqlalchemy.orm import registry
+
+from app.common.db.routing import ReplicaRouter, RoutingSession, read_only
+
+metadata = MetaData()
+items = Table("items", metadata, Column("name", String(32), primary_key=True))
+
+
+class Item:
+    name: str
+
+    def __init__(self, name: str) -> None:
+        self.name = name
+
+
+registry().map_imperatively(Item, items)
+
+
+class FakeLag:
+    """복제본별 지연(초)을 돌려주는 측정 함수 (None 이면 측정 실패)"""
+
+    def __init__(self) -> None:
+        self.lags: Dict[str, Optional[float]] = {}
+
+    async def __call__(self, conn: AsyncConnection) -> Optional[float]:
+        lag = self.lags.get(str(conn.engine.url.database), 0.0)
+        if lag is None:
+            raise ConnectionError("replica unreachable")
+        return lag
+
+
+async def _create_db(path: Path, rows: List[str]) -> AsyncEngine:
+    engine = create_async_engine(f"sqlite+aiosqlite:///{path}")
+    async with engine.begin() as conn:
+        await conn.run_sync(metadata.create_all)
+        await conn.execute(insert(items), [{"name": name} for name in rows])
+    return engine
+
+
+@pytest_asyncio.fixture
+async def engines(tmp_path: Path) -> AsyncIterator[Dict[str, AsyncEngine]]:
+    primary = await _create_db(tmp_path / "primary.db", ["primary"])
+    replica = await _create_db(tmp_path / "replica.db", ["replica"])
+    yield {"primary": primary, "replica": replica}
+    await primary.dispose()
+    await replica.dispose()
+
+
+@pytest.fixture
+def lag() -> FakeLag:
+    return FakeLag()
+
+
+@pytest_asyncio.fixture
+async def router(
+    engines: Dict[str, AsyncEngine], lag: FakeLag
+) -> AsyncIterator[ReplicaRouter]:
+    router = ReplicaRouter(
+        engines["primary"], [engines["replica"]], max_lag=1.0, lag_probe=lag
+    )
+    await router.check_lag()
+    yield router
+
+
+@pytest.fixture
+def session_factory(
+    engines: Dict[str, AsyncEngine], router: ReplicaRouter
+) -> async_sessionmaker[AsyncSession]:
+    return async_sessionmaker(
+        bind=engines["primary"],
+        expire_on_commit=False,
+        sync_session_class=RoutingSession,
+        router=router,
+    )
+
+
+class ItemRepository:
+    def __init__(self, session: AsyncSession) -> None:
+        self.session = session
+
+    async def names(self) -> List[str]:
+        result = await self.session.execute(select(items.c.name).order_by(items.c.name))
+        return list(result.scalars())
+
+    @read_only
+    async def names_read_only(self) -> List[str]:
+        return await self.names()
+
+    async def add(self, name: str) -> None:
+        await self.session.execute(insert(items).values(name=name))
+
+
+class TestReplicaRouting:
+    """조회 라우팅 테스트"""
+
+    async def test_read_only_goes_to_replica(
+        self, session_factory: async_sessionmaker[AsyncSession]
+    ) -> None:
+        """read_only 구간의 조회만 복제본으로 가는지 테스트"""
+        async with session_factory() as session:
+            repo = ItemRepository(session)
+
+            assert await repo.names_read_only() == ["replica"]
+            assert await repo.names() == ["primary"]
+
+    async def test_read_after_write_sticks_to_primary(
+        self, session_factory: async_sessionmaker[AsyncSession]
+    ) -> None:
+        """쓰기 이후에는 read_only 조회도 주 DB 에서 읽는지 테스트 (commit 이후 포함)"""
+        async with session_factory() as session:
+            repo = ItemRepository(session)
+            await repo.add("written")
+
+            assert await repo.names_read_only() == ["primary", "written"]
+            await session.commit()
+            assert await repo.names_read_only() == ["primary", "written"]
+
+        async with session_factory() as session:
+            # 새 세션(다음 요청)은 다시 복제본에서 읽는다
+            assert await ItemRepository(session).names_read_only() == ["replica"]
+
+    async def test_orm_flush_pins_to_primary(
+        self, session_factory: async_sessionmaker[AsyncSession]
+    ) -> None:
+        """autoflush 로 나간 ORM 쓰기도 주 DB 에 고정하는지 테스트"""
+        async with session_factory() as session:
+            session.add(Item(name="orm"))
+
+            @read_only
+            async def _orm_names() -> List[str]:
+                result = await session.execute(select(Item.name).order_by(Item.name))
+                return list(result.scalars())
+
+            assert await _orm_names() == ["orm", "primary"]
+
+
+class TestReplicaLag:
+    """복제 지연에 따른 대체 테스트"""
+
+    async def test_lagging_replica_falls_back_to_primary(
+        self,
+        session_factory: async_sessionmaker[AsyncSession],
+        router: ReplicaRouter,
+        lag: FakeLag,
+    ) -> None:
+        """지연이 허용치를 넘거나 측정에 실패하면 주 DB 에서 읽는지 테스트"""
+        replica_db = str(router.replicas[0].engine.url.database)
+
+        lag.lags[replica_db] = 5.0
+        await router.check_lag()
+        async with session_factory() as session:
+            assert await ItemRepository(session).names_read_only() == ["primary"]
+
+        lag.lags[replica_db] = None
+        await router.check_lag()
+        assert router.replicas[0].lag is None
+        async with session_factory() as session:
+            assert await ItemRepository(session).names_read_only() == ["primary"]
+
+        lag.lags[replica_db] = 0.2
+        await router.check_lag()
+        async with session_factory() as session:
+            assert await ItemRepository(session).names_read_only() == ["replica"]
+
+    async def test_unchecked_replica_is_not_used(
+        self, engines: Dict[str, AsyncEngine], lag: FakeLag
+    ) -> None:
+        """지연을 재기 전에는 복제본을 쓰지 않는지 테스트"""
+        router = ReplicaRouter(engines["primary"], [engines["replica"]], lag_probe=lag)
+        assert router.choose() is None
+
+        await router.check_lag()
+        assert router.choose() is engines["replica"]
+
+    def test_round_robin(self, engines: Dict[str, AsyncEngine]) -> None:
+        """지연이 허용치 이내인 복제본을 번갈아 고르는지 테스트"""
+        first, second = engines["primary"], engines["replica"]
+        router = ReplicaRouter(first, [first, second], max_lag=1.0)
+        router.replicas[0].lag = 0.0
+        router.replicas[1].lag = 0.5
+
+        assert [router.choose() for _ in range(4)] == [first, second, first, second]
+
+        router.replicas[1].lag = 2.0
+        assert [router.choose() for _ in range(2)] == [first, first]
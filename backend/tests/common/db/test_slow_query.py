@@ -0,0 +1,207 @@
+"""
+느린 SQL 기록 테스트
+
+sqlite 커넥션마다 지연을 주는 ``sleep(ms)`` 함수를 등록해 느린 문장을 흉내 낸다.
+"""
+
+import asyncio
+import time
+from pathlib import Path
+from typing import Any, AsyncIterator, Generator, List, Optional
+
+import httpx
+import pytest
+import pytest_asyncio
+from fastapi import FastAPI
+from sqlalchemy import event, text
+from sqlalchemy.ext.asyncio import AsyncEngine, create_async_engine
+
+from app.common.db.slow_query import (
+    SlowQueryRecorder,
+    normalize_sql,
+    parameter_shape,
+)
+from app.core.auth import CurrentUser, Role, get_current_user
+
+SLOW_MS = 30
+
+
+@pytest.fixture(autouse=True)  # type: ignore
+def _freeze_time() -> Generator[None, Any, None]:  # type: ignore
+    """SQL 시간 측정은 실제 시간으로 진행 (공통 시간 고정 해제)"""
+    yield
+
+
+@pytest_asyncio.fixture
+async def engine(tmp_path: Path) -> AsyncIterator[AsyncEngine]:
+    engine = create_async_engine(f"sqlite+aiosqlite:///{tmp_path / 'slow.db'}")
+
+    @event.listens_for(engine.sync_engine, "connect")
+    def _register_sleep(dbapi_connection, _):  # type: ignore
+        dbapi_connection.create_function(
+            "sleep", 1, lambda ms: time.sleep(ms / 1000) or 0
+        )
+
+    async with engine.begin() as conn:
+        await conn.execute(text("CREATE TABLE users (id INTEGER PRIMARY KEY, name TEXT)"))
+        await conn.execute(text("INSERT INTO users (id, name) VALUES (1, 'a'), (2, 'b')"))
+    yield engine
+    await engine.dispose()
+
+
+class UserRepository:
+    def __init__(self, engine: AsyncEngine) -> None:
+        self.engine = engine
+
+    async def find_slow(self, user_id: int) -> Optional[str]:
+        async with self.engine.connect() as conn:
+            result = await conn.execute(
+                text(f"SELECT name FROM users WHERE id = :id AND sleep({SLOW_MS}) = 0"),
+                {"id": user_id},
+            )
+            return result.scalar_one_or_none()
+
+    async def find(self, user_id: int) -> Optional[str]:
+        async with self.engine.connect() as conn:
+            result = await conn.execute(
+                text("SELECT name FROM users WHERE id = :id"), {"id": user_id}
+            )
+            return result.scalar_one_or_none()
+
+
+class TestNormalize:
+    """SQL 정규화 / 파라미터 형태 테스트"""
+
+    def test_normalize_sql(self) -> None:
+        """리터럴, 자리표시자, IN 목록, 공백을 정규화하는지 테스트"""
+        assert normalize_sql(
+            "SELECT *\n  FROM users_1 WHERE name = 'it''s' AND age > 30\n"
+            "  AND id IN (%s, %s, %s) LIMIT %(limit)s"
+        ) == "SELECT * FROM users_1 WHERE name = ? AND age > ? AND id IN (...) LIMIT ?"
+        assert normalize_sql("SELECT 1 WHERE a = :a AND b IN (?, ?)") == (
+            "SELECT ? WHERE a = ? AND b IN (...)"
+        )
+
+    def test_parameter_shape(self) -> None:
+        """값 없이 타입 모양만 남기는지 테스트"""
+        assert parameter_shape(("secret", 1, 2, 3)) == "(str, int*3)"
+        assert parameter_shape({"id": "secret", "limit": 10}) == "{id: str, limit: int}"
+        assert parameter_shape([("a",), ("b",)], executemany=True) == "[2 x (str)]"
+        assert parameter_shape(None) == "()"
+
+
+class TestSlowQueryRecorder:
+    """느린 SQL 기록 테스트"""
+
+    async def test_records_only_slow_statements(self, engine: AsyncEngine) -> None:
+        """임계값을 넘은 문장만 SQL 형태, 파라미터 형태, 호출 메서드와 함께 남기는지 테스트"""
+        recorder = SlowQueryRecorder(threshold_ms=SLOW_MS / 2)
+        recorder.instrument(engine)
+        repo = UserRepository(engine)
+
+        assert await repo.find(1) == "a"
+        assert await repo.find_slow(1) == "a"
+        assert await repo.find_slow(2) == "b"
+
+        [stat] = recorder.top()
+        assert stat.sql == "SELECT name FROM users WHERE id = ? AND sleep(?) = ?"
+        assert stat.caller == "UserRepository.find_slow"
+        assert stat.last_params_shape == "(int)"
+        assert stat.count == 2
+        assert stat.max >= SLOW_MS / 1000
+        assert stat.plan is None
+
+    def test_buffer_is_bounded(self) -> None:
+        """버퍼 크기를 넘으면 오래된 기록부터 밀려나는지 테스트"""
+        recorder = SlowQueryRecorder(threshold_ms=1, buffer_size=3)
+        for _ in range(4):
+            recorder.record("SELECT 1", (), 0.5)
+        recorder.record("SELECT name FROM users", (), 0.5)
+
+        assert [(stat.sql, stat.count) for stat in recorder.top()] == [
+            ("SELECT ?", 2),
+            ("SELECT name FROM users", 1),
+        ]
+        assert recorder._counts == {"SELECT ?": 2, "SELECT name FROM users": 1}
+
+    def test_top_orders_by_total_time(self) -> None:
+        """총 시간이 긴 순으로 n개만 돌려주는지 테스트"""
+        recorder = SlowQueryRecorder(threshold_ms=100)
+        recorder.record("SELECT a FROM t", (), 0.3)
+        recorder.record("SELECT b FROM t", (), 0.2)
+        recorder.record("SELECT b FROM t", (), 0.2)
+        recorder.record("SELECT c FROM t", (), 0.05)  # 임계값 미만
+
+        top = recorder.top(2)
+        assert [(stat.sql, stat.count) for stat in top] == [
+            ("SELECT b FROM t", 2),
+            ("SELECT a FROM t", 1),
+        ]
+        assert top[0].avg == pytest.approx(0.2)
+        assert len(recorder.top(1)) == 1
+
+    async def test_explains_repeat_offenders(self, engine: AsyncEngine) -> None:
+        """반복된 느린 SELECT 의 실행 계획을 백그라운드에서 붙이는지 테스트"""
+        recorder = SlowQueryRecorder(
+            threshold_ms=SLOW_MS / 2,
+            explain_enabled=True,
+            explain_min_count=2,
+            explain_sample_rate=1.0,
+        )
+        recorder.instrument(engine)
+        await recorder.start()
+        try:
+            repo = UserRepository(engine)
+            await repo.find_slow(1)
+            assert recorder._queue.empty()  # 한 번뿐이면 반복 범인이 아니다
+
+            await repo.find_slow(2)
+            plan: Optional[List[str]] = None
+            for _ in range(100):
+                plan = recorder.top()[0].plan
+                if plan is not None:
+                    break
+                await asyncio.sleep(0.02)
+        finally:
+            await recorder.stop()
+
+        assert plan is not None
+        assert any("users" in line for line in plan)
+        # EXPLAIN 자체는 기록하지 않는다 (sleep 이 든 문장이라도)
+        assert [stat.count for stat in recorder.top()] == [2]
+
+
+class TestSlowQueryEndpoint:
+    """관리자 느린 SQL 조회 API 테스트"""
+
+    async def test_admin_only_top_n(self) -> None:
+        """관리자에게만 상위 N개를 돌려주는지 테스트"""
+        from app.common.db.database import slow_query_recorder
+        from app.modules.admin.interface.controller.admin_db_controller import (
+            admin_db_router,
+        )
+
+        app = FastAPI()
+        app.include_router(admin_db_router)
+        user = CurrentUser(id="admin", role=Role.ADMIN)
+        app.dependency_overrides[get_current_user] = lambda: user
+
+        slow_query_recorder.clear()
+        slow_query_recorder.record("SELECT a FROM t WHERE id = ?", (1,), 0.5)
+        slow_query_recorder.record("SELECT b FROM t", (), 0.3)
+        try:
+            async with httpx.AsyncClient(
+                transport=httpx.ASGITransport(app=app), base_url="http://test"
+            ) as client:
+                response = await client.get("/admin/db/slow-queries?limit=1")
+                assert response.status_code == 200
+                [item] = response.json()["slow_queries"]
+                assert item["sql"] == "SELECT a FROM t WHERE id = ?"
+                assert item["params_shape"] == "(int)"
+                assert item["total_ms"] == 500.0
+
+                user.role = Role.USER
+                response = await client.get("/admin/db/slow-queries")
+                assert response.status_code == 403
+        finally:
+            slow_query_recorder.clear()
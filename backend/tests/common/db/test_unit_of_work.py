@@ -0,0 +1,318 @@
+"""
+요청 단위 세션(UnitOfWork) 테스트
+
+sqlite 커넥션마다 지연을 주는 ``sleep(ms)`` 함수를 등록해 쿼리 하나가 커넥션을
+잡고 있는 시간을 흉내 낸다. 요청마다 세션(커넥션)이 따로 열리면 동시 요청의 지연이
+겹쳐 처리량이 늘어나야 한다.
+"""
+
+import asyncio
+import time
+from pathlib import Path
+from typing import Any, AsyncIterator, Generator, List
+
+import httpx
+import pytest
+import pytest_asyncio
+from fastapi import FastAPI, HTTPException
+from sqlalchemy import event, text
+from sqlalchemy.ext.asyncio import (
+    AsyncEngine,
+    AsyncSession,
+    async_sessionmaker,
+    create_async_engine,
+)
+
+from app.common.db.unit_of_work import UnitOfWork, after_commit, current_session
+from app.common.middleware.unit_of_work_middleware import UnitOfWorkMiddleware
+
+QUERY_LATENCY_MS = 50
+PARALLEL_REQUESTS = 10
+
+
+@pytest.fixture(autouse=True)  # type: ignore
+def _freeze_time() -> Generator[None, Any, None]:  # type: ignore
+    """지연 측정은 실제 시간으로 진행 (공통 시간 고정 해제)"""
+    yield
+
+
+@pytest_asyncio.fixture
+async def engine(tmp_path: Path) -> AsyncIterator[AsyncEngine]:
+    engine = create_async_engine(
+        f"sqlite+aiosqlite:///{tmp_path / 'uow.db'}",
+        pool_size=PARALLEL_REQUESTS,
+    )
+
+    @event.listens_for(engine.sync_engine, "connect")
+    def _register_sleep(dbapi_connection, _):  # type: ignore
+        dbapi_connection.create_function(
+            "sleep", 1, lambda ms: time.sleep(ms / 1000) or 0
+        )
+
+    async with engine.begin() as conn:
+        await conn.execute(text("CREATE TABLE items (name TEXT NOT NULL)"))
+    yield engine
+    await engine.dispose()
+
+
+@pytest.fixture
+def session_factory(engine: AsyncEngine) -> async_sessionmaker[AsyncSession]:
+    return async_sessionmaker(bind=engine, expire_on_commit=False)
+
+
+@pytest.fixture
+def client(session_factory: async_sessionmaker[AsyncSession]) -> httpx.AsyncClient:
+    app = FastAPI()
+    app.add_middleware(UnitOfWorkMiddleware, session_factory=session_factory)
+    app.state.sessions = []
+
+    @app.get("/slow")
+    async def slow() -> dict:
+        session = current_session()
+        app.state.sessions.append(id(session))
+        await session.execute(text(f"SELECT sleep({QUERY_LATENCY_MS})"))
+        return {"ok": True}
+
+    @app.post("/items/{name}", status_code=201)
+    async def create(name: str) -> dict:
+        await current_session().execute(
+            text("INSERT INTO items (name) VALUES (:name)"), {"name": name}
+        )
+        return {"name": name}
+
+    @app.post("/items/{name}/reject")
+    async def reject(name: str) -> dict:
+        await current_session().execute(
+            text("INSERT INTO items (name) VALUES (:name)"), {"name": name}
+        )
+        raise HTTPException(status_code=400, detail="rejected")
+
+    @app.post("/items/{name}/crash")
+    async def crash(name: str) -> dict:
+        await current_session().execute(
+            text("INSERT INTO items (name) VALUES (:name)"), {"name": name}
+        )
+        raise RuntimeError("boom")
+
+    return httpx.AsyncClient(
+        transport=httpx.ASGITransport(app=app, raise_app_exceptions=False),
+        base_url="http://test",
+    )
+
+
+async def _item_names(session_factory: async_sessionmaker[AsyncSession]) -> List[str]:
+    async with session_factory() as session:
+        rows = await session.execute(text("SELECT name FROM items ORDER BY name"))
+        return [row[0] for row in rows]
+
+
+class TestUnitOfWork:
+    """UnitOfWork 경계 테스트"""
+
+    async def test_commit_on_success(
+        self, session_factory: async_sessionmaker[AsyncSession]
+    ) -> None:
+        """블록이 정상 종료되면 commit 되는지 테스트"""
+        async with UnitOfWork(session_factory) as session:
+            assert current_session() is session
+            await session.execute(text("INSERT INTO items (name) VALUES ('a')"))
+
+        assert await _item_names(session_factory) == ["a"]
+
+    async def test_rollback_on_error(
+        self, session_factory: async_sessionmaker[AsyncSession]
+    ) -> None:
+        """예외가 나면 rollback 되고 예외는 그대로 전파되는지 테스트"""
+        with pytest.raises(ValueError):
+            async with UnitOfWork(session_factory) as session:
+                await session.execute(text("INSERT INTO items (name) VALUES ('a')"))
+                raise ValueError("boom")
+
+        assert await _item_names(session_factory) == []
+
+    async def test_rollback_undoes_repository_writes(
+        self, engine: AsyncEngine, session_factory: async_sessionmaker[AsyncSession]
+    ) -> None:
+        """저장소는 flush 만 하므로 저장소로 쓴 내용도 rollback 되는지 테스트"""
+        from datetime import datetime, timezone
+
+        import app.common.db.database_models  # noqa: F401
+        from app.common.db.database import Base
+        from app.modules.user.domain.entity.user import User
+        from app.modules.user.domain.vo import Email, Name, Password, RoleVO
+        from app.modules.user.infrastructure.repository.user_repo import (
+            UserRepository,
+        )
+
+        async with engine.begin() as conn:
+            await conn.run_sync(Base.metadata.create_all)
+        now = datetime.now(timezone.utc)
+        user = User(
+            id="01H8ABC123DEF456GHI789JKL",
+            email=Email("test@example.com"),
+            name=Name("testuser"),
+            password=Password("hashed_password_123"),
+            role=RoleVO.USER,
+            created_at=now,
+            updated_at=now,
+        )
+
+        with pytest.raises(ValueError):
+            async with UnitOfWork(session_factory) as session:
+                await UserRepository(session).save(user)
+                assert await UserRepository(session).find_by_id(user.id) is not None
+                raise ValueError("boom")
+
+        async with UnitOfWork(session_factory) as session:
+            assert await UserRepository(session).find_by_id(user.id) is None
+
+    async def test_after_commit_runs_only_after_commit(
+        self, session_factory: async_sessionmaker[AsyncSession]
+    ) -> None:
+        """commit 뒤에만 등록한 작업을 실행하고, rollback 되면 버리는지 테스트"""
+        published: List[str] = []
+
+        async def _publish(name: str) -> None:
+            published.append(name)
+
+        async with UnitOfWork(session_factory) as session:
+            await session.execute(text("INSERT INTO items (name) VALUES ('a')"))
+            after_commit(lambda: _publish("a"))
+            assert published == []
+        assert published == ["a"]
+
+        with pytest.raises(ValueError):
+            async with UnitOfWork(session_factory) as session:
+                await session.execute(text("INSERT INTO items (name) VALUES ('b')"))
+                after_commit(lambda: _publish("b"))
+                raise ValueError("boom")
+        assert published == ["a"]
+        assert await _item_names(session_factory) == ["a"]
+
+    async def test_after_commit_failure_keeps_commit(
+        self, session_factory: async_sessionmaker[AsyncSession]
+    ) -> None:
+        """commit 뒤 작업이 실패해도 commit 은 유지되고 다음 작업은 실행되는지 테스트"""
+        published: List[str] = []
+
+        async def _fail() -> None:
+            raise RuntimeError("redis down")
+
+        async def _publish() -> None:
+            published.append("a")
+
+        async with UnitOfWork(session_factory) as session:
+            await session.execute(text("INSERT INTO items (name) VALUES ('a')"))
+            after_commit(_fail)
+            after_commit(_publish)
+
+        assert published == ["a"]
+        assert await _item_names(session_factory) == ["a"]
+
+    async def test_after_commit_outside_scope(self) -> None:
+        """스코프 밖에서는 commit 뒤 작업을 등록할 수 없는지 테스트"""
+
+        async def _noop() -> None:
+            pass
+
+        with pytest.raises(RuntimeError):
+            after_commit(_noop)
+
+    async def test_current_session_outside_scope(
+        self, session_factory: async_sessionmaker[AsyncSession]
+    ) -> None:
+        """스코프 밖에서는 세션을 꺼낼 수 없는지 테스트"""
+        with pytest.raises(RuntimeError):
+            current_session()
+
+        async with UnitOfWork(session_factory):
+            pass
+
+        with pytest.raises(RuntimeError):
+            current_session()
+
+    async def test_concurrent_scopes_are_isolated(
+        self, session_factory: async_sessionmaker[AsyncSession]
+    ) -> None:
+        """동시에 열린 스코프가 서로 다른 세션을 보는지 테스트"""
+
+        async def _scope() -> AsyncSession:
+            async with UnitOfWork(session_factory) as session:
+                await asyncio.sleep(0.01)
+                assert current_session() is session
+                return session
+
+        sessions = await asyncio.gather(*(_scope() for _ in range(5)))
+
+        assert len({id(session) for session in sessions}) == 5
+
+    async def test_container_builds_repositories_per_scope(
+        self, session_factory: async_sessionmaker[AsyncSession]
+    ) -> None:
+        """컨테이너가 스코프마다 그 스코프의 세션으로 저장소를 만드는지 테스트"""
+        from app.core.di_container import Container
+
+        container = Container()
+
+        async with UnitOfWork(session_factory) as first:
+            repo = container.user_repository()
+            service = container.follow_service()
+            assert repo.session is first
+            assert service.follow_repo.session is first
+            assert service.user_repo.session is first
+
+        async with UnitOfWork(session_factory) as second:
+            assert container.user_repository().session is second
+
+
+class TestUnitOfWorkMiddleware:
+    """요청 경계 commit/rollback 테스트"""
+
+    async def test_commit_on_success_response(
+        self,
+        client: httpx.AsyncClient,
+        session_factory: async_sessionmaker[AsyncSession],
+    ) -> None:
+        """2xx 응답이면 commit 되는지 테스트"""
+        response = await client.post("/items/kept")
+
+        assert response.status_code == 201
+        assert await _item_names(session_factory) == ["kept"]
+
+    async def test_rollback_on_error_response(
+        self,
+        client: httpx.AsyncClient,
+        session_factory: async_sessionmaker[AsyncSession],
+    ) -> None:
+        """4xx 응답과 처리되지 않은 예외는 rollback 되는지 테스트"""
+        rejected = await client.post("/items/rejected/reject")
+        crashed = await client.post("/items/crashed/crash")
+
+        assert rejected.status_code == 400
+        assert crashed.status_code == 500
+        assert await _item_names(session_factory) == []
+
+    async def test_parallel_requests_scale(self, client: httpx.AsyncClient) -> None:
+        """동시 요청이 한 커넥션을 기다리지 않고 지연을 겹쳐 처리하는지 테스트"""
+        app = client._transport.app  # type: ignore
+
+        started = time.perf_counter()
+        for _ in range(PARALLEL_REQUESTS):
+            assert (await client.get("/slow")).status_code == 200
+        serial = time.perf_counter() - started
+
+        started = time.perf_counter()
+        responses = await asyncio.gather(
+            *(client.get("/slow") for _ in range(PARALLEL_REQUESTS))
+        )
+        parallel = time.perf_counter() - started
+
+        assert all(response.status_code == 200 for response in responses)
+        print(
+            f"\n{PARALLEL_REQUESTS} requests: serial {serial:.3f}s, "
+            f"parallel {parallel:.3f}s ({serial / parallel:.1f}x)"
+        )
+        assert serial >= PARALLEL_REQUESTS * QUERY_LATENCY_MS / 1000
+        # 요청마다 커넥션이 따로라면 병렬 실행이 직렬보다 확연히 빨라야 한다
+        assert parallel < serial / 3
+        assert len(set(app.state.sessions[PARALLEL_REQUESTS:])) == PARALLEL_REQUESTS
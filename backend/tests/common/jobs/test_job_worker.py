@@ -0,0 +1,174 @@
+import asyncio
+from typing import Any, Dict
+
+import pytest
+
+from app.common.jobs.job import Job, JobPermanentError, JobStatus
+from app.common.jobs.job_broker import InMemoryJobBroker, RedisStreamJobBroker
+from app.common.jobs.job_store import JobStore
+from app.common.jobs.job_worker import JobWorkerPool
+from tests.conftest import FakeRedis
+
+
+class FlakyHandler:
+    """앞의 ``failures`` 번은 실패하고 이후 성공하는 처리기"""
+
+    def __init__(self, failures: int = 0, error: Exception = RuntimeError("boom")):
+        self.failures = failures
+        self.error = error
+        self.calls = 0
+
+    async def __call__(self, job: Job) -> Dict[str, Any]:
+        self.calls += 1
+        if self.calls <= self.failures:
+            raise self.error
+        return {"echo": job.payload["value"]}
+
+
+def _pool(handler: FlakyHandler, **kwargs: Any) -> JobWorkerPool:
+    pool = JobWorkerPool(JobStore(), backoff_base=0, **kwargs)  # 재시도 대기 없음
+    pool.register("echo", handler)
+    return pool
+
+
+async def _wait_finished(pool: JobWorkerPool, job_id: str) -> Job:
+    for _ in range(200):
+        job = await pool.get(job_id)
+        if job and job.is_finished:
+            return job
+        await asyncio.sleep(0)
+    raise AssertionError(f"job {job_id} did not finish")
+
+
+class TestJobWorkerPool:
+    """JobWorkerPool 테스트"""
+
+    @pytest.mark.asyncio
+    async def test_job_succeeds(self) -> None:
+        """등록한 작업이 처리되고 결과가 저장되는지 테스트"""
+        # Given
+        handler = FlakyHandler()
+        pool = _pool(handler)
+        await pool.start()
+
+        # When
+        job = await pool.submit("echo", "user-1", {"value": 42})
+        done = await _wait_finished(pool, job.id)
+        await pool.stop()
+
+        # Then
+        assert job.status == JobStatus.PENDING
+        assert done.status == JobStatus.SUCCEEDED
+        assert done.result == {"echo": 42}
+        assert done.attempts == 1
+        assert done.owner_id == "user-1"
+
+    @pytest.mark.asyncio
+    async def test_failed_job_is_retried(self) -> None:
+        """일시적 오류는 재시도 후 성공하는지 테스트"""
+        # Given
+        handler = FlakyHandler(failures=2)
+        pool = _pool(handler, max_attempts=3)
+        await pool.start()
+
+        # When
+        job = await pool.submit("echo", "user-1", {"value": 1})
+        done = await _wait_finished(pool, job.id)
+        await pool.stop()
+
+        # Then
+        assert done.status == JobStatus.SUCCEEDED
+        assert done.attempts == 3
+        assert done.error is None
+
+    @pytest.mark.asyncio
+    async def test_exhausted_job_is_dead_lettered(self) -> None:
+        """재시도를 소진하면 FAILED 후 dead-letter 큐로 가는지 테스트"""
+        # Given
+        broker = InMemoryJobBroker()
+        handler = FlakyHandler(failures=10)
+        pool = _pool(handler, broker=broker, max_attempts=2)
+        await pool.start()
+
+        # When
+        job = await pool.submit("echo", "user-1", {"value": 1})
+        done = await _wait_finished(pool, job.id)
+        await pool.stop()
+
+        # Then
+        assert done.status == JobStatus.FAILED
+        assert done.attempts == 2
+        assert done.error == "boom"
+        assert broker.dead_letters == [job.id]
+
+    @pytest.mark.asyncio
+    async def test_permanent_error_is_not_retried(self) -> None:
+        """재시도해도 같은 결과인 오류는 바로 실패 처리하는지 테스트"""
+        # Given
+        broker = InMemoryJobBroker()
+        handler = FlakyHandler(failures=1, error=JobPermanentError("not found"))
+        pool = _pool(handler, broker=broker)
+        await pool.start()
+
+        # When
+        job = await pool.submit("echo", "user-1", {"value": 1})
+        done = await _wait_finished(pool, job.id)
+        await pool.stop()
+
+        # Then
+        assert done.status == JobStatus.FAILED
+        assert done.attempts == 1
+        assert handler.calls == 1
+        assert broker.dead_letters == []
+
+    @pytest.mark.asyncio
+    async def test_unknown_job_type_is_rejected(self) -> None:
+        """등록되지 않은 작업 유형은 접수하지 않는지 테스트"""
+        pool = _pool(FlakyHandler())
+
+        with pytest.raises(ValueError):
+            await pool.submit("unknown", "user-1", {})
+
+    @pytest.mark.asyncio
+    async def test_pending_retry_is_requeued_on_stop(self) -> None:
+        """백오프 대기 중 중지하면 작업을 다시 큐에 넣는지 테스트"""
+        # Given
+        broker = InMemoryJobBroker()
+        pool = JobWorkerPool(JobStore(), broker=broker, backoff_base=30.0)
+        pool.register("echo", FlakyHandler(failures=1))
+        await pool.start()
+        job = await pool.submit("echo", "user-1", {"value": 1})
+        for _ in range(20):
+            await asyncio.sleep(0)
+
+        # When
+        await pool.stop()
+
+        # Then
+        message = await broker.consume()
+        assert message is not None and message.job_id == job.id
+        stored = await pool.get(job.id)
+        assert stored is not None and stored.status == JobStatus.PENDING
+
+    @pytest.mark.asyncio
+    async def test_redis_stream_broker(self, fake_redis: FakeRedis) -> None:
+        """Redis Stream 브로커로 처리하고 작업 상태를 Redis에 저장하는지 테스트"""
+        # Given
+        handler = FlakyHandler(failures=1)
+        pool = _pool(handler, broker=RedisStreamJobBroker(block_ms=0))
+        await pool.start()
+
+        # When
+        job = await pool.submit("echo", "user-1", {"value": 7})
+        done = await _wait_finished(pool, job.id)
+        for _ in range(10):  # 상태 저장 후 ack 까지 대기
+            await asyncio.sleep(0)
+        await pool.stop()
+
+        # Then
+        assert done.status == JobStatus.SUCCEEDED
+        assert done.result == {"echo": 7}
+        assert f"jobs:state:{job.id}" in fake_redis.strings
+        assert len(fake_redis.streams["jobs:stream"]) == 2  # 최초 등록 + 재시도
+        group = fake_redis.groups[("jobs:stream", "job-workers")]
+        assert group["pending"] == {}  # 모두 ack 됨
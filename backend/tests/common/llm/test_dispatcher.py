@@ -0,0 +1,247 @@
+import asyncio
+from typing import Any, Dict, List
+from unittest.mock import AsyncMock
+
+import pytest
+from pytest_mock import MockerFixture
+
+from app.common.llm.dispatcher import (
+    SYSTEM_USER,
+    DispatchedLLMClient,
+    LLMDispatcher,
+    current_llm_user,
+    llm_user,
+)
+from app.common.llm.llm_client_repo import ILLMClientRepository
+from app.common.llm.exception import LLMQueueFullError, LLMUserLimitError
+
+
+async def _settle() -> None:
+    """대기 중인 태스크가 진행되도록 양보"""
+    for _ in range(5):
+        await asyncio.sleep(0)
+
+
+class TestLLMDispatcher:
+    """LLMDispatcher 테스트"""
+
+    @pytest.mark.asyncio
+    async def test_runs_immediately_when_slot_available(self) -> None:
+        """빈 슬롯이 있으면 대기 없이 실행되는지 테스트"""
+        # Given
+        dispatcher = LLMDispatcher(max_concurrency=2)
+
+        async def call() -> str:
+            return "ok"
+
+        # When
+        result = await dispatcher.run("user_1", "generate_curriculum", call)
+
+        # Then
+        assert result == "ok"
+        assert dispatcher.active == 0
+        assert dispatcher.queued == 0
+
+    @pytest.mark.asyncio
+    async def test_limits_concurrent_calls(self) -> None:
+        """동시 실행 수가 max_concurrency로 제한되는지 테스트"""
+        # Given
+        dispatcher = LLMDispatcher(max_concurrency=2, max_queued_per_user=5)
+        release = asyncio.Event()
+        running = 0
+        peak = 0
+
+        async def call() -> None:
+            nonlocal running, peak
+            running += 1
+            peak = max(peak, running)
+            await release.wait()
+            running -= 1
+
+        # When
+        tasks = [
+            asyncio.create_task(dispatcher.run("user_1", "generate_feedback", call))
+            for _ in range(5)
+        ]
+        await _settle()
+
+        # Then
+        assert dispatcher.active == 2
+        assert dispatcher.queued == 3
+
+        release.set()
+        await asyncio.gather(*tasks)
+        assert peak == 2
+        assert dispatcher.active == 0
+        assert dispatcher.queued == 0
+
+    @pytest.mark.asyncio
+    async def test_rejects_when_queue_full(self) -> None:
+        """대기열이 가득 차면 즉시 거절하는지 테스트"""
+        # Given
+        dispatcher = LLMDispatcher(max_concurrency=1, max_queue_size=1)
+        release = asyncio.Event()
+
+        async def call() -> None:
+            await release.wait()
+
+        running = asyncio.create_task(dispatcher.run("user_1", "op", call))
+        waiting = asyncio.create_task(dispatcher.run("user_2", "op", call))
+        await _settle()
+
+        # When / Then
+        with pytest.raises(LLMQueueFullError):
+            await dispatcher.run("user_3", "op", call)
+
+        release.set()
+        await asyncio.gather(running, waiting)
+
+    @pytest.mark.asyncio
+    async def test_rejects_user_over_per_user_limit(self) -> None:
+        """한 사용자의 대기 수가 한도를 넘으면 거절하는지 테스트"""
+        # Given
+        dispatcher = LLMDispatcher(max_concurrency=1, max_queued_per_user=1)
+        release = asyncio.Event()
+
+        async def call() -> None:
+            await release.wait()
+
+        running = asyncio.create_task(dispatcher.run("user_1", "op", call))
+        waiting = asyncio.create_task(dispatcher.run("user_1", "op", call))
+        await _settle()
+
+        # When / Then
+        with pytest.raises(LLMUserLimitError):
+            await dispatcher.run("user_1", "op", call)
+
+        other = asyncio.create_task(dispatcher.run("user_2", "op", call))
+        await _settle()
+        assert dispatcher.queued == 2
+
+        release.set()
+        await asyncio.gather(running, waiting, other)
+
+    @pytest.mark.asyncio
+    async def test_slots_are_shared_round_robin_between_users(self) -> None:
+        """먼저 많이 대기한 사용자가 있어도 다른 사용자에게 차례가 돌아가는지 테스트"""
+        # Given
+        dispatcher = LLMDispatcher(max_concurrency=1, max_queued_per_user=3)
+        gate = asyncio.Event()
+        order: List[str] = []
+
+        def make_call(name: str):  # type: ignore
+            async def call() -> None:
+                order.append(name)
+                await gate.wait()
+
+            return call
+
+        tasks = [asyncio.create_task(dispatcher.run("a", "op", make_call("a1")))]
+        await _settle()
+        for name in ("a2", "a3"):
+            tasks.append(
+                asyncio.create_task(dispatcher.run("a", "op", make_call(name)))
+            )
+        await _settle()
+        tasks.append(asyncio.create_task(dispatcher.run("b", "op", make_call("b1"))))
+        await _settle()
+
+        # When
+        gate.set()
+        await asyncio.gather(*tasks)
+
+        # Then
+        assert order == ["a1", "a2", "b1", "a3"]
+
+    @pytest.mark.asyncio
+    async def test_queue_timeout_rejects_waiter(self) -> None:
+        """대기 시간이 초과되면 거절하고 대기열에서 제거하는지 테스트"""
+        # Given
+        dispatcher = LLMDispatcher(max_concurrency=1, queue_timeout=0)
+        release = asyncio.Event()
+
+        async def call() -> None:
+            await release.wait()
+
+        running = asyncio.create_task(dispatcher.run("user_1", "op", call))
+        await _settle()
+
+        # When / Then
+        with pytest.raises(LLMQueueFullError):
+            await dispatcher.run("user_2", "op", call)
+        assert dispatcher.queued == 0
+
+        release.set()
+        await running
+        assert dispatcher.active == 0
+
+    @pytest.mark.asyncio
+    async def test_cancelled_waiter_leaves_queue(self) -> None:
+        """대기 중 취소된 호출이 슬롯을 차지하지 않는지 테스트"""
+        # Given
+        dispatcher = LLMDispatcher(max_concurrency=1)
+        release = asyncio.Event()
+
+        async def call() -> None:
+            await release.wait()
+
+        running = asyncio.create_task(dispatcher.run("user_1", "op", call))
+        waiting = asyncio.create_task(dispatcher.run("user_2", "op", call))
+        await _settle()
+
+        # When
+        waiting.cancel()
+        await _settle()
+
+        # Then
+        assert dispatcher.queued == 0
+        release.set()
+        await running
+        assert dispatcher.active == 0
+
+
+class TestDispatchedLLMClient:
+    """DispatchedLLMClient 테스트"""
+
+    @pytest.mark.asyncio
+    async def test_each_call_takes_a_slot_as_current_user(
+        self, mocker: MockerFixture
+    ) -> None:
+        """호출마다 llm_user 로 지정한 사용자 몫의 슬롯을 하나씩 받는지 테스트"""
+        # Given
+        dispatcher = LLMDispatcher(max_concurrency=1, max_queued_per_user=5)
+        inner: AsyncMock = mocker.AsyncMock(spec=ILLMClientRepository)
+        release = asyncio.Event()
+        seen: List[Dict[str, Any]] = []
+
+        async def expand(**kwargs: Any) -> Dict[str, Any]:
+            seen.append({"user": current_llm_user(), "active": dispatcher.active})
+            await release.wait()
+            return {"schedule": []}
+
+        inner.expand_curriculum_weeks.side_effect = expand
+        client = DispatchedLLMClient(inner, dispatcher)
+
+        async def _expand(start: int) -> Dict[str, Any]:
+            return await client.expand_curriculum_weeks(
+                goal="Python",
+                difficulty="beginner",
+                details="",
+                outline=[],
+                start_week=start,
+                end_week=start,
+            )
+
+        # When
+        with llm_user("user_1"):
+            tasks = [asyncio.create_task(_expand(start)) for start in (1, 2, 3)]
+        await _settle()
+
+        # Then
+        assert dispatcher.active == 1
+        assert dispatcher.queued == 2
+        release.set()
+        await asyncio.gather(*tasks)
+        assert seen == [{"user": "user_1", "active": 1}] * 3
+        assert current_llm_user() == SYSTEM_USER
+        assert dispatcher.active == 0
@@ -0,0 +1,112 @@
+import asyncio
+import threading
+from typing import Any, Generator, Iterator, Tuple
+from unittest.mock import MagicMock
+
+import pytest
+
+from app.common.llm import langfuse_helper
+from app.common.llm.langfuse_helper import LangfuseManager
+from app.core.config import Settings, get_settings
+
+
+@pytest.fixture(autouse=True)  # type: ignore
+def _freeze_time() -> Generator[None, Any, None]:  # type: ignore
+    """종료 대기 시간은 실제 시간으로 진행 (공통 시간 고정 해제)"""
+    yield
+
+
+@pytest.fixture
+def manager(monkeypatch: pytest.MonkeyPatch) -> Iterator[LangfuseManager]:
+    """전역 싱글톤과 분리된 새 인스턴스"""
+    monkeypatch.setattr(LangfuseManager, "_instance", None)
+    yield LangfuseManager()
+
+
+class TestLangfuseManager:
+    """LangfuseManager 테스트"""
+
+    def test_callbacks_are_sampled(self, manager: LangfuseManager) -> None:
+        """sample_rate 비율의 호출에만 콜백을 붙이는지 테스트"""
+        # Given
+        handler = object()
+        manager._callback_handler = handler
+        manager.sample_rate = 0.25
+
+        # When / Then
+        manager.random = lambda: 0.1
+        assert manager.callbacks() == [handler]
+        manager.random = lambda: 0.5
+        assert manager.callbacks() == []
+
+    def test_no_callbacks_before_initialized(self, manager: LangfuseManager) -> None:
+        """초기화 전에는 추적 없이 호출되는지 테스트"""
+        assert manager.is_enabled is False
+        assert manager.callbacks() == []
+
+    def test_disabled_without_keys(self, manager: LangfuseManager) -> None:
+        """키가 없으면 네트워크 호출 없이 비활성화되는지 테스트"""
+        result = manager._setup(
+            Settings(langfuse_secret_key="", langfuse_public_key="")
+        )
+
+        assert result is None
+        assert manager.is_enabled is False
+
+    @pytest.mark.asyncio
+    async def test_start_does_not_block(
+        self, manager: LangfuseManager, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """느린 초기화(연결 확인)를 기다리지 않고 바로 반환하는지 테스트"""
+        # Given
+        release = threading.Event()
+        handler = object()
+
+        def slow_setup(settings: Settings) -> Tuple[Any, Any]:
+            release.wait(timeout=5)
+            return object(), handler
+
+        monkeypatch.setattr(manager, "_setup", slow_setup)
+
+        # When
+        manager.start(get_settings())
+
+        # Then
+        assert manager.is_enabled is False
+        release.set()
+        assert manager._init_task is not None
+        await manager._init_task
+        assert manager.callback_handler is handler
+
+        manager._client = None  # 가짜 클라이언트는 닫지 않는다
+        await manager.shutdown()
+        assert manager.is_enabled is False
+
+    @pytest.mark.asyncio
+    async def test_shutdown_during_setup_closes_late_client(
+        self, manager: LangfuseManager, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """연결 확인 중에 종료되면 늦게 만들어진 클라이언트를 붙이지 않고 닫는지 테스트"""
+        # Given
+        monkeypatch.setattr(langfuse_helper, "INIT_SHUTDOWN_WAIT", 0.01)
+        release = threading.Event()
+        client = MagicMock()
+
+        def slow_setup(settings: Settings) -> Tuple[Any, Any]:
+            release.wait(timeout=5)
+            return client, object()
+
+        monkeypatch.setattr(manager, "_setup", slow_setup)
+        manager.start(get_settings())
+        init_task = manager._init_task
+        assert init_task is not None
+
+        # When
+        await manager.shutdown()
+        release.set()
+        await asyncio.wait_for(init_task, timeout=5)
+
+        # Then
+        client.shutdown.assert_called_once_with()
+        assert manager.is_enabled is False
+        assert manager._client is None
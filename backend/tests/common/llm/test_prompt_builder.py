@@ -0,0 +1,126 @@
+import pytest
+
+from app.common.llm.prompt_builder import (
+    TRIM_MARKER,
+    PromptBuilder,
+    TokenCounter,
+    estimate_tokens,
+)
+from app.common.llm.prompts.feedback import (
+    FEEDBACK_GENERATION_PROMPT,
+    FEEDBACK_SYSTEM_ROLE,
+    build_feedback_prompt,
+)
+
+LESSONS = ["리스트", "딕셔너리"]
+SHORT_SUMMARY = (
+    "파이썬의 리스트와 딕셔너리를 비교했다. 리스트는 순서가 있고 인덱스로 접근하며, "
+    "딕셔너리는 키로 값을 찾는다. for 문으로 리스트를 순회하는 예제를 직접 작성해 보았다."
+)
+
+
+@pytest.fixture
+def counter() -> TokenCounter:
+    """토크나이저 없이 추정치로 계산 (환경과 무관하게 같은 값)"""
+    return TokenCounter(model=None)
+
+
+class TestEstimateTokens:
+    """estimate_tokens 테스트"""
+
+    def test_ascii_and_korean(self) -> None:
+        assert estimate_tokens("hello world") == 3
+        assert estimate_tokens("안녕하세요") == 5
+        assert estimate_tokens("abc 안녕") == 3
+        assert estimate_tokens("") == 0
+
+
+class TestPromptBuilder:
+    """PromptBuilder 테스트"""
+
+    def test_duplicate_context_added_once(self, counter: TokenCounter) -> None:
+        """같은 문맥은 한 번만, 잘린 사본은 전체 문맥으로 대체되는지 테스트"""
+        builder = PromptBuilder(1000, counter)
+        builder.add("summary_slim", SHORT_SUMMARY[:40])
+        builder.add("summary", SHORT_SUMMARY)
+        builder.add("summary_again", "  " + SHORT_SUMMARY.replace(" ", "\n") + "  ")
+
+        built = builder.build()
+
+        assert built.user == SHORT_SUMMARY
+        assert built.tokens == counter.count(SHORT_SUMMARY)
+
+    def test_context_in_system_is_not_repeated(self, counter: TokenCounter) -> None:
+        """system 메시지에 이미 있는 문맥은 user 에 다시 넣지 않는지 테스트"""
+        builder = PromptBuilder(1000, counter, system=f"규칙\n{SHORT_SUMMARY}")
+        builder.add("summary", SHORT_SUMMARY)
+        builder.add("task", "피드백을 작성하라", required=True)
+
+        assert builder.build().user == "피드백을 작성하라"
+
+    def test_trims_lowest_priority_first(self, counter: TokenCounter) -> None:
+        """예산을 넘으면 우선순위가 낮은 구역부터 자르고 필수 구역은 유지하는지 테스트"""
+        builder = PromptBuilder(300, counter)
+        builder.add("rules", "규칙" * 50, required=True)
+        builder.add("notes", "참고" * 200, priority=0)
+        builder.add("summary", "요약" * 50, priority=1)
+
+        built = builder.build()
+
+        assert built.tokens <= 300
+        assert built.trimmed == ["notes"]
+        assert "규칙" * 50 in built.user
+        assert "요약" * 50 in built.user
+        assert TRIM_MARKER in built.user
+
+    def test_drops_section_without_room(self, counter: TokenCounter) -> None:
+        """남는 자리가 너무 작으면 구역을 빼는지 테스트"""
+        builder = PromptBuilder(110, counter, min_section_tokens=32)
+        builder.add("rules", "규칙" * 50, required=True)
+        builder.add("summary", "요약" * 50)
+
+        built = builder.build()
+
+        assert built.dropped == ["summary"]
+        assert built.user == "규칙" * 50
+
+
+class TestFeedbackPrompt:
+    """피드백 프롬프트 토큰 수 테스트"""
+
+    def test_fixed_part_size(self, counter: TokenCounter) -> None:
+        """지시문 크기가 바뀌면 예산 기본값도 다시 봐야 하므로 고정"""
+        assert counter.count(FEEDBACK_SYSTEM_ROLE) == 125
+        assert counter.count(FEEDBACK_GENERATION_PROMPT) == 1311
+
+    @pytest.mark.parametrize(
+        "repeat, expected_tokens",
+        [
+            (1, 1543),  # 짧은 요약 (약 100자)
+            (8, 2166),  # 보통 요약 (약 800자)
+        ],
+    )
+    def test_summary_within_budget_sent_once(
+        self, counter: TokenCounter, repeat: int, expected_tokens: int
+    ) -> None:
+        """예산 안의 요약은 자르지 않고 한 번만 보내는지 테스트"""
+        summary = " ".join([SHORT_SUMMARY] * repeat)
+
+        built = build_feedback_prompt(LESSONS, summary, budget=3000, counter=counter)
+
+        assert built.tokens == expected_tokens
+        assert built.trimmed == [] and built.dropped == []
+        assert built.user.count(SHORT_SUMMARY) == repeat
+        assert SHORT_SUMMARY not in built.system
+        assert "- lessons: 리스트, 딕셔너리" in built.user
+
+    def test_long_summary_trimmed_to_budget(self, counter: TokenCounter) -> None:
+        """긴 요약(약 6000자)은 예산에 맞춰 뒷부분만 잘리는지 테스트"""
+        summary = " ".join([SHORT_SUMMARY] * 60)
+
+        built = build_feedback_prompt(LESSONS, summary, budget=3000, counter=counter)
+
+        assert 2950 <= built.tokens <= 3000
+        assert built.trimmed == ["summary"]
+        assert built.user.startswith("[입력]\n- lessons: 리스트, 딕셔너리")
+        assert built.user.endswith(FEEDBACK_GENERATION_PROMPT.strip())
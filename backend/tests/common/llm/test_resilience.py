@@ -0,0 +1,368 @@
+import asyncio
+import json
+import time
+from typing import Any, AsyncIterator, Generator, List, Tuple
+
+import aiohttp
+import pytest
+import pytest_asyncio
+from aiohttp import web
+
+from app.common.llm.dispatcher import DispatchedLLMClient, LLMDispatcher
+from app.common.llm.exception import LLMCircuitOpenError, LLMTimeoutError
+from app.common.llm.openai_client import OpenAILLMClient
+from app.common.llm.resilience import (
+    CLOSED,
+    HALF_OPEN,
+    OPEN,
+    CircuitBreaker,
+    LatencyTracker,
+    ResilientLLMClient,
+    is_retryable,
+)
+
+FEEDBACK = {"comment": "좋아요", "score": 8.0}
+
+
+@pytest.fixture(autouse=True)  # type: ignore
+def _freeze_time() -> Generator[None, Any, None]:  # type: ignore
+    """지연 주입은 실제 시간으로 진행 (공통 시간 고정 해제)"""
+    yield
+
+
+class FaultyCompletionsServer:
+    """지연과 오류를 주입하는 로컬 chat completions 서버
+
+    ``script`` 에 (지연 초, HTTP 상태) 를 요청 순서대로 넣고,
+    다 쓰면 지연 없이 200 으로 응답한다.
+    """
+
+    def __init__(self) -> None:
+        self.script: List[Tuple[float, int]] = []
+        self.requests = 0
+        self.runner: web.AppRunner
+        self.url = ""
+
+    async def _handle(self, request: web.Request) -> web.Response:
+        self.requests += 1
+        delay, status = self.script.pop(0) if self.script else (0.0, 200)
+        await asyncio.sleep(delay)
+        if status != 200:
+            return web.json_response({"error": "injected"}, status=status)
+        return web.json_response(
+            {
+                "choices": [
+                    {
+                        "message": {
+                            "role": "assistant",
+                            "content": json.dumps(FEEDBACK, ensure_ascii=False),
+                        }
+                    }
+                ]
+            }
+        )
+
+    async def start(self) -> None:
+        app = web.Application()
+        app.router.add_post("/v1/chat/completions", self._handle)
+        self.runner = web.AppRunner(app)
+        await self.runner.setup()
+        site = web.TCPSite(self.runner, "127.0.0.1", 0)
+        await site.start()
+        port = site._server.sockets[0].getsockname()[1]  # type: ignore
+        self.url = f"http://127.0.0.1:{port}/v1/chat/completions"
+
+    async def stop(self) -> None:
+        await self.runner.cleanup()
+
+
+@pytest_asyncio.fixture
+async def server() -> AsyncIterator[FaultyCompletionsServer]:
+    server = FaultyCompletionsServer()
+    await server.start()
+    yield server
+    await server.stop()
+
+
+@pytest_asyncio.fixture
+async def openai_client(
+    server: FaultyCompletionsServer,
+) -> AsyncIterator[OpenAILLMClient]:
+    client = OpenAILLMClient(api_key="test", endpoint=server.url)
+    yield client
+    await client.close()
+
+
+class FakeClock:
+    def __init__(self) -> None:
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+class TestCircuitBreaker:
+    """CircuitBreaker 테스트"""
+
+    def test_opens_after_threshold_and_recovers(self) -> None:
+        """연속 실패 시 열리고, 복구 시간 후 시험 호출 성공하면 닫히는지 테스트"""
+        # Given
+        clock = FakeClock()
+        breaker = CircuitBreaker(failure_threshold=2, reset_timeout=10.0, clock=clock)
+
+        # When / Then
+        breaker.record_failure()
+        assert breaker.state == CLOSED
+        breaker.record_failure()
+        assert breaker.state == OPEN
+
+        clock.now = 4.0
+        with pytest.raises(LLMCircuitOpenError) as exc_info:
+            breaker.before_call()
+        assert exc_info.value.retry_after == 6
+
+        clock.now = 10.0
+        assert breaker.state == HALF_OPEN
+        breaker.before_call()  # 시험 호출 허용
+        with pytest.raises(LLMCircuitOpenError):
+            breaker.before_call()  # 시험 중에는 나머지 거절
+        breaker.record_success()
+        assert breaker.state == CLOSED
+
+    def test_failed_probe_reopens(self) -> None:
+        """시험 호출이 실패하면 다시 열리는지 테스트"""
+        clock = FakeClock()
+        breaker = CircuitBreaker(failure_threshold=1, reset_timeout=5.0, clock=clock)
+        breaker.record_failure()
+
+        clock.now = 5.0
+        breaker.before_call()
+        breaker.record_failure()
+
+        assert breaker.state == OPEN
+        with pytest.raises(LLMCircuitOpenError):
+            breaker.before_call()
+
+
+class TestLatencyTracker:
+    """LatencyTracker 테스트"""
+
+    def test_percentile(self) -> None:
+        tracker = LatencyTracker(window=100)
+        for i in range(1, 101):
+            tracker.record("generate_feedback", i / 100)
+
+        assert tracker.percentile("generate_feedback", 0.95) == 0.95
+        assert tracker.percentile("generate_curriculum", 0.95) is None
+
+
+class TestResilientLLMClient:
+    """ResilientLLMClient 테스트 (로컬 장애 주입 서버)"""
+
+    @pytest.mark.asyncio
+    async def test_deadline_exceeded(
+        self, server: FaultyCompletionsServer, openai_client: OpenAILLMClient
+    ) -> None:
+        """마감 시간을 넘기면 기다리지 않고 LLMTimeoutError 인지 테스트"""
+        # Given
+        server.script = [(1.0, 200)]
+        client = ResilientLLMClient(openai_client, feedback_timeout=0.2)
+
+        # When
+        started = time.monotonic()
+        with pytest.raises(LLMTimeoutError):
+            await client.generate_feedback(["레슨"], "요약")
+
+        # Then
+        assert time.monotonic() - started < 0.5
+
+    @pytest.mark.asyncio
+    async def test_retries_server_error(
+        self, server: FaultyCompletionsServer, openai_client: OpenAILLMClient
+    ) -> None:
+        """5xx 응답은 마감 시간 안에서 재시도하는지 테스트"""
+        # Given
+        server.script = [(0.0, 500)]
+        client = ResilientLLMClient(openai_client, max_attempts=2)
+
+        # When
+        result = await client.generate_feedback(["레슨"], "요약")
+
+        # Then
+        assert result == FEEDBACK
+        assert server.requests == 2
+        assert client.breaker.state == CLOSED
+
+    @pytest.mark.asyncio
+    async def test_retries_rate_limit(
+        self, server: FaultyCompletionsServer, openai_client: OpenAILLMClient
+    ) -> None:
+        """429 응답은 재시도하는지 테스트"""
+        # Given
+        server.script = [(0.0, 429)]
+        client = ResilientLLMClient(openai_client, max_attempts=2)
+
+        # When
+        result = await client.generate_feedback(["레슨"], "요약")
+
+        # Then
+        assert result == FEEDBACK
+        assert server.requests == 2
+
+    @pytest.mark.asyncio
+    async def test_client_error_is_not_retried(
+        self, server: FaultyCompletionsServer, openai_client: OpenAILLMClient
+    ) -> None:
+        """401 같은 4xx 는 재시도하지 않고 서킷 실패로 세지 않는지 테스트"""
+        # Given
+        server.script = [(0.0, 401)] * 3
+        client = ResilientLLMClient(
+            openai_client,
+            max_attempts=3,
+            breaker=CircuitBreaker(failure_threshold=1),
+        )
+
+        # When
+        with pytest.raises(aiohttp.ClientResponseError) as exc_info:
+            await client.generate_feedback(["레슨"], "요약")
+
+        # Then
+        assert exc_info.value.status == 401
+        assert server.requests == 1
+        assert client.breaker.state == CLOSED
+
+    def test_is_retryable(self) -> None:
+        """타임아웃, 연결 오류, 429, 5xx 만 재시도 대상인지 테스트"""
+
+        def status_error(status: int) -> aiohttp.ClientResponseError:
+            return aiohttp.ClientResponseError(
+                request_info=None, history=(), status=status  # type: ignore
+            )
+
+        assert is_retryable(asyncio.TimeoutError())
+        assert is_retryable(aiohttp.ServerDisconnectedError())
+        assert is_retryable(ConnectionResetError())
+        assert is_retryable(status_error(429))
+        assert is_retryable(status_error(503))
+        assert not is_retryable(status_error(400))
+        assert not is_retryable(status_error(401))
+        assert not is_retryable(status_error(404))
+        assert not is_retryable(ValueError("Invalid JSON response from LLM"))
+
+    @pytest.mark.asyncio
+    async def test_circuit_opens_and_fails_fast(
+        self, server: FaultyCompletionsServer, openai_client: OpenAILLMClient
+    ) -> None:
+        """오류가 이어지면 서킷이 열리고 서버를 호출하지 않고 거절하는지 테스트"""
+        # Given
+        server.script = [(0.0, 503)] * 4
+        client = ResilientLLMClient(
+            openai_client,
+            max_attempts=2,
+            breaker=CircuitBreaker(failure_threshold=2, reset_timeout=60.0),
+        )
+
+        # When
+        for _ in range(2):
+            with pytest.raises(Exception) as exc_info:
+                await client.generate_feedback(["레슨"], "요약")
+            assert not isinstance(exc_info.value, LLMCircuitOpenError)
+
+        # Then
+        assert client.breaker.state == OPEN
+        with pytest.raises(LLMCircuitOpenError):
+            await client.generate_feedback(["레슨"], "요약")
+        assert server.requests == 4
+
+    @pytest.mark.asyncio
+    async def test_hedged_request_beats_slow_attempt(
+        self, server: FaultyCompletionsServer, openai_client: OpenAILLMClient
+    ) -> None:
+        """첫 시도가 p95를 넘기면 두 번째 시도를 보내 먼저 온 응답을 쓰는지 테스트"""
+        # Given
+        latency = LatencyTracker()
+        for _ in range(20):
+            latency.record("generate_feedback", 0.05)
+        server.script = [(1.0, 200)]
+        client = ResilientLLMClient(
+            openai_client,
+            hedge=True,
+            hedge_min_samples=20,
+            hedge_min_delay=0.05,
+            latency=latency,
+        )
+
+        # When
+        started = time.monotonic()
+        result = await client.generate_feedback(["레슨"], "요약")
+        elapsed = time.monotonic() - started
+
+        # Then
+        assert result == FEEDBACK
+        assert server.requests == 2
+        assert elapsed < 0.5
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize(
+        "max_concurrency, expected_requests", [(1, 1), (2, 2)]
+    )
+    async def test_hedge_takes_a_free_dispatcher_slot(
+        self,
+        server: FaultyCompletionsServer,
+        openai_client: OpenAILLMClient,
+        max_concurrency: int,
+        expected_requests: int,
+    ) -> None:
+        """헤지 시도는 빈 슬롯이 있을 때만 보내 동시 호출 수가 한도를 넘지 않는지 테스트"""
+        # Given
+        latency = LatencyTracker()
+        for _ in range(20):
+            latency.record("generate_feedback", 0.05)
+        server.script = [(0.3, 200)]
+        dispatcher = LLMDispatcher(max_concurrency=max_concurrency)
+        client = DispatchedLLMClient(
+            ResilientLLMClient(
+                openai_client,
+                hedge=True,
+                hedge_min_samples=20,
+                hedge_min_delay=0.05,
+                latency=latency,
+                dispatcher=dispatcher,
+            ),
+            dispatcher=dispatcher,
+        )
+
+        # When
+        result = await client.generate_feedback(["레슨"], "요약")
+        await asyncio.sleep(0)  # 취소된 헤지 시도의 슬롯 반납
+
+        # Then
+        assert result == FEEDBACK
+        assert server.requests == expected_requests
+        assert dispatcher.active == 0
+
+    @pytest.mark.asyncio
+    async def test_parse_error_is_not_retried(
+        self, openai_client: OpenAILLMClient
+    ) -> None:
+        """응답 파싱 실패는 재시도하지 않고 서킷 실패로 세지 않는지 테스트"""
+        # Given
+        calls = 0
+
+        async def broken(**kwargs: Any) -> Any:
+            nonlocal calls
+            calls += 1
+            raise ValueError("Invalid JSON response from LLM")
+
+        openai_client.generate_feedback = broken  # type: ignore
+        client = ResilientLLMClient(
+            openai_client, breaker=CircuitBreaker(failure_threshold=1)
+        )
+
+        # When
+        with pytest.raises(ValueError):
+            await client.generate_feedback(["레슨"], "요약")
+
+        # Then
+        assert calls == 1
+        assert client.breaker.state == CLOSED
@@ -0,0 +1,313 @@
+import asyncio
+import itertools
+import json
+from unittest.mock import AsyncMock
+
+import pytest
+from pytest_mock import MockerFixture
+
+from app.common.llm.dispatcher import (
+    DispatchedLLMClient,
+    LLMDispatcher,
+    current_llm_user,
+    llm_user,
+)
+from app.common.llm.exception import LLMQueueFullError, LLMUserLimitError
+from app.common.llm.llm_client_repo import ILLMClientRepository
+from app.common.llm.response_cache import CachedLLMClient
+from app.common.monitoring.metrics import llm_cache_requests_total
+from tests.conftest import FakeRedis
+
+LLM_RESPONSE = {
+    "title": "Python 기초",
+    "schedule": [{"week_number": 1, "topics": ["변수", "자료형"]}],
+}
+
+
+@pytest.fixture
+def inner_client(mocker: MockerFixture) -> AsyncMock:
+    client = mocker.AsyncMock(spec=ILLMClientRepository)
+    client.model = "gpt-4o-mini"
+    client.temperature = 0.3
+    client.generate_curriculum.return_value = LLM_RESPONSE
+    return client
+
+
+def _hits() -> float:
+    return llm_cache_requests_total.labels(
+        operation="generate_curriculum", result="hit"
+    )._value.get()
+
+
+async def _generate(client: CachedLLMClient, goal: str = "Python 학습") -> dict:  # type: ignore
+    return await client.generate_curriculum(
+        goal=goal, period=4, difficulty="beginner", details="입문자용"
+    )
+
+
+class TestCachedLLMClient:
+    """CachedLLMClient 테스트"""
+
+    @pytest.mark.asyncio
+    async def test_repeat_generation_served_from_cache(
+        self, fake_redis: FakeRedis, inner_client: AsyncMock
+    ) -> None:
+        """같은 입력의 재생성은 LLM을 호출하지 않는지 테스트"""
+        # Given
+        client = CachedLLMClient(inner_client)
+        hits_before = _hits()
+
+        # When
+        first = await _generate(client)
+        second = await _generate(client)
+
+        # Then
+        assert first == second == LLM_RESPONSE
+        inner_client.generate_curriculum.assert_awaited_once()
+        assert _hits() == hits_before + 1
+
+    @pytest.mark.asyncio
+    async def test_cache_hit_does_not_wait_for_llm_slot(
+        self, fake_redis: FakeRedis, inner_client: AsyncMock
+    ) -> None:
+        """LLM 슬롯이 모두 차 있어도 캐시 적중은 대기열을 거치지 않는지 테스트"""
+        # Given
+        dispatcher = LLMDispatcher(max_concurrency=1, max_queue_size=0)
+        client = CachedLLMClient(DispatchedLLMClient(inner_client, dispatcher))
+        await _generate(client)
+
+        # When
+        async with dispatcher.slot("other_user", "generate_curriculum"):
+            cached = await _generate(client)
+            with pytest.raises(LLMQueueFullError):
+                await _generate(client, goal="Rust 학습")
+
+        # Then
+        assert cached == LLM_RESPONSE
+        inner_client.generate_curriculum.assert_awaited_once()
+
+    @pytest.mark.asyncio
+    async def test_queue_rejection_is_not_shared_with_waiters(
+        self, fake_redis: FakeRedis, inner_client: AsyncMock
+    ) -> None:
+        """첫 호출자의 대기열 거절은 같은 입력을 기다리던 다른 사용자에게 넘기지 않는지 테스트"""
+        # Given: 슬롯은 다른 사용자가 쓰고 있고, user_a 는 이미 한도만큼 대기 중
+        dispatcher = LLMDispatcher(
+            max_concurrency=1, max_queued_per_user=1, queue_timeout=5.0
+        )
+        client = CachedLLMClient(DispatchedLLMClient(inner_client, dispatcher))
+        charged = []
+
+        async def generate(**kwargs: object) -> dict:  # type: ignore
+            charged.append(current_llm_user())
+            return LLM_RESPONSE
+
+        inner_client.generate_curriculum.side_effect = generate
+        holder = asyncio.Event()
+
+        async def _hold() -> None:
+            async with dispatcher.slot("other_user", "generate_curriculum"):
+                await holder.wait()
+
+        async def _as(user_id: str, goal: str = "Python 학습") -> dict:  # type: ignore
+            with llm_user(user_id):
+                return await _generate(client, goal=goal)
+
+        hold = asyncio.create_task(_hold())
+        queued = asyncio.create_task(_as("user_a", goal="Rust 학습"))
+        while dispatcher.queued < 1:
+            await asyncio.sleep(0)
+
+        # 다른 사용자가 같은 입력에 합류한 뒤에 user_a 의 슬롯 요청이 처리되도록 한다
+        joined = asyncio.Event()
+        acquire = dispatcher._acquire
+
+        async def _acquire_after_join(user_id: str, operation: str) -> None:
+            if user_id == "user_a":
+                await joined.wait()
+            await acquire(user_id, operation)
+
+        dispatcher._acquire = _acquire_after_join  # type: ignore
+
+        # When: user_b 가 합류한 뒤 user_a 의 호출이 사용자별 한도 초과로 거절됨
+        leader = asyncio.create_task(_as("user_a"))
+        waiter = asyncio.create_task(_as("user_b"))
+        for _ in range(10):
+            await asyncio.sleep(0)
+        assert client._single_flight.in_flight == 2  # 대기 중인 호출 + 합친 호출
+        joined.set()
+        with pytest.raises(LLMUserLimitError):
+            await leader
+        holder.set()
+        result = await waiter
+
+        # Then: user_b 는 자기 몫으로 슬롯을 얻어 결과를 받는다
+        assert result == LLM_RESPONSE
+        assert charged.count("user_b") == 1
+        assert charged.count("user_a") == 1  # 먼저 대기하던 다른 호출
+        await asyncio.gather(hold, queued)
+
+    @pytest.mark.asyncio
+    async def test_normalized_prompt_shares_cache_entry(
+        self, fake_redis: FakeRedis, inner_client: AsyncMock
+    ) -> None:
+        """공백/대소문자만 다른 입력은 같은 캐시 항목을 쓰는지 테스트"""
+        # Given
+        client = CachedLLMClient(inner_client)
+        await _generate(client, goal="Learn  Python")
+
+        # When
+        await _generate(client, goal=" learn python ")
+
+        # Then
+        inner_client.generate_curriculum.assert_awaited_once()
+
+    @pytest.mark.asyncio
+    async def test_model_is_part_of_cache_key(
+        self, fake_redis: FakeRedis, inner_client: AsyncMock
+    ) -> None:
+        """모델이 바뀌면 캐시를 공유하지 않는지 테스트"""
+        # Given
+        client = CachedLLMClient(inner_client)
+        await _generate(client)
+
+        # When
+        inner_client.model = "gpt-4o"
+        await _generate(client)
+
+        # Then
+        assert inner_client.generate_curriculum.await_count == 2
+
+    @pytest.mark.asyncio
+    async def test_entries_expire_with_ttl(
+        self, fake_redis: FakeRedis, inner_client: AsyncMock
+    ) -> None:
+        """캐시 항목에 TTL이 설정되는지 테스트"""
+        # Given
+        client = CachedLLMClient(inner_client, ttl=600)
+
+        # When
+        await _generate(client)
+
+        # Then
+        keys = [key for key in fake_redis.strings if key.startswith("llm:cache:")]
+        assert len(keys) == 1
+        assert await fake_redis.ttl(keys[0]) == 600
+
+    @pytest.mark.asyncio
+    async def test_least_recently_used_entry_is_evicted(
+        self,
+        fake_redis: FakeRedis,
+        inner_client: AsyncMock,
+        mocker: MockerFixture,
+    ) -> None:
+        """최대 개수를 넘으면 가장 오래 안 쓴 항목부터 제거하는지 테스트"""
+        # Given
+        clock = itertools.count(1000)
+        mocker.patch(
+            "app.common.llm.response_cache.time.time", side_effect=lambda: next(clock)
+        )
+        client = CachedLLMClient(inner_client, max_entries=2)
+        await _generate(client, goal="a")
+        await _generate(client, goal="b")
+        await _generate(client, goal="a")  # a 최근 사용
+
+        # When
+        await _generate(client, goal="c")  # b 제거
+
+        # Then
+        assert inner_client.generate_curriculum.await_count == 3
+        assert len(fake_redis.zsets["llm:cache:generate_curriculum:lru"]) == 2
+        await _generate(client, goal="a")
+        assert inner_client.generate_curriculum.await_count == 3
+        await _generate(client, goal="b")
+        assert inner_client.generate_curriculum.await_count == 4
+
+    @pytest.mark.asyncio
+    async def test_concurrent_misses_share_one_llm_call(
+        self, fake_redis: FakeRedis, inner_client: AsyncMock
+    ) -> None:
+        """같은 입력의 동시 요청이 LLM 호출 하나를 공유하는지 테스트"""
+        # Given
+        release = asyncio.Event()
+
+        async def slow_generate(**kwargs) -> dict:  # type: ignore
+            await release.wait()
+            return LLM_RESPONSE
+
+        inner_client.generate_curriculum.side_effect = slow_generate
+        client = CachedLLMClient(inner_client)
+
+        # When
+        tasks = [asyncio.create_task(_generate(client)) for _ in range(5)]
+        for _ in range(10):
+            await asyncio.sleep(0)
+        release.set()
+        results = await asyncio.gather(*tasks)
+
+        # Then
+        assert results == [LLM_RESPONSE] * 5
+        inner_client.generate_curriculum.assert_awaited_once()
+
+    @pytest.mark.asyncio
+    async def test_works_without_redis(
+        self, inner_client: AsyncMock, mocker: MockerFixture
+    ) -> None:
+        """Redis 미연결 시 캐시 없이 LLM을 그대로 호출하는지 테스트"""
+        # Given
+        from app.common.cache.redis_client import redis_client
+
+        mocker.patch.object(redis_client, "redis", None)
+        client = CachedLLMClient(inner_client)
+
+        # When
+        await _generate(client)
+        await _generate(client)
+
+        # Then
+        assert inner_client.generate_curriculum.await_count == 2
+
+    @pytest.mark.asyncio
+    async def test_streamed_generation_shares_cache_entry(
+        self, fake_redis: FakeRedis, inner_client: AsyncMock
+    ) -> None:
+        """스트리밍 생성 결과가 캐시되어 일반 생성에서 재사용되는지 테스트"""
+        # Given
+        text = json.dumps(LLM_RESPONSE, ensure_ascii=False)
+
+        async def fake_stream(**kwargs):  # type: ignore
+            yield text[:10]
+            yield text[10:]
+
+        inner_client.generate_curriculum_stream = fake_stream
+        client = CachedLLMClient(inner_client)
+
+        # When
+        chunks = [
+            chunk
+            async for chunk in client.generate_curriculum_stream(
+                goal="Python 학습", period=4, difficulty="beginner", details="입문자용"
+            )
+        ]
+        cached = await _generate(client)
+
+        # Then
+        assert "".join(chunks) == text
+        assert cached == LLM_RESPONSE
+        inner_client.generate_curriculum.assert_not_awaited()
+
+    @pytest.mark.asyncio
+    async def test_feedback_is_not_cached(
+        self, fake_redis: FakeRedis, inner_client: AsyncMock
+    ) -> None:
+        """피드백 생성은 캐시 없이 위임하는지 테스트"""
+        # Given
+        inner_client.generate_feedback.return_value = {"comment": "좋음", "score": 8}
+        client = CachedLLMClient(inner_client)
+
+        # When
+        await client.generate_feedback(lessons=["변수"], summary_content="요약")
+        await client.generate_feedback(lessons=["변수"], summary_content="요약")
+
+        # Then
+        assert inner_client.generate_feedback.await_count == 2
@@ -0,0 +1,95 @@
+import json
+
+import pytest
+
+from app.common.llm.stream_parser import CurriculumStreamParser
+
+CURRICULUM = {
+    "title": 'Python "기초" {입문}',
+    "schedule": [
+        {"week_number": 1, "title": "환경", "lessons": ["설치 [Windows]", "Hello {}"]},
+        {"week_number": 2, "title": "문법", "lessons": ["변수\n자료형"]},
+    ],
+}
+
+
+def _feed_all(parser: CurriculumStreamParser, text: str, size: int) -> list:
+    events = []
+    for i in range(0, len(text), size):
+        events.extend(parser.feed(text[i : i + size]))
+    return events
+
+
+class TestCurriculumStreamParser:
+    """CurriculumStreamParser 테스트"""
+
+    @pytest.mark.parametrize("size", [1, 3, 64])
+    def test_emits_title_and_weeks_incrementally(self, size: int) -> None:
+        """조각 크기와 관계없이 제목과 각 주차를 순서대로 내보내는지 테스트"""
+        # Given
+        parser = CurriculumStreamParser()
+        text = json.dumps(CURRICULUM, ensure_ascii=False)
+
+        # When
+        events = _feed_all(parser, text, size)
+
+        # Then
+        assert events == [
+            ("title", CURRICULUM["title"]),
+            ("week", CURRICULUM["schedule"][0]),
+            ("week", CURRICULUM["schedule"][1]),
+        ]
+        assert parser.is_complete
+        assert parser.result() == CURRICULUM
+
+    def test_week_is_emitted_before_stream_ends(self) -> None:
+        """주차 객체가 닫히는 즉시 이벤트가 나오는지 테스트"""
+        # Given
+        parser = CurriculumStreamParser()
+
+        # When
+        first = parser.feed('{"title": "T", "schedule": [{"week_number": 1, ')
+        second = parser.feed('"lessons": ["a"]}, {"week_number": 2')
+
+        # Then
+        assert first == [("title", "T")]
+        assert second == [("week", {"week_number": 1, "lessons": ["a"]})]
+        assert not parser.is_complete
+        with pytest.raises(ValueError):
+            parser.result()
+
+    def test_ignores_code_fence(self) -> None:
+        """코드 블록 표시를 무시하는지 테스트"""
+        # Given
+        parser = CurriculumStreamParser()
+        text = "```json\n" + json.dumps(CURRICULUM, ensure_ascii=False) + "\n```"
+
+        # When
+        events = _feed_all(parser, text, 5)
+
+        # Then
+        assert len(events) == 3
+        assert parser.result() == CURRICULUM
+
+    def test_top_level_week_array(self) -> None:
+        """주차 배열만 온 응답도 주차 단위로 내보내는지 테스트"""
+        # Given
+        parser = CurriculumStreamParser()
+        weeks = [{"week": 1, "topics": ["a"]}, {"week": 2, "topics": ["b"]}]
+
+        # When
+        events = parser.feed(json.dumps(weeks))
+
+        # Then
+        assert events == [("week", weeks[0]), ("week", weeks[1])]
+
+    def test_wrapped_array_response(self) -> None:
+        """[{title, schedule}] 형태에서 감싸는 객체는 주차로 보지 않는지 테스트"""
+        # Given
+        parser = CurriculumStreamParser()
+
+        # When
+        events = parser.feed(json.dumps([CURRICULUM], ensure_ascii=False))
+
+        # Then
+        assert [kind for kind, _ in events] == ["week", "week"]
@@ -0,0 +1,128 @@
+import pytest
+
+from app.common.llm.structured_output import (
+    missing_week_ranges,
+    parse_curriculum,
+    parse_feedback,
+    repair_json,
+)
+
+CURRICULUM = (
+    '{"title": "Python 기초", "schedule": ['
+    '{"week_number": 1, "title": "소개", "lessons": ["설치", "문법"]}, '
+    '{"week_number": 2, "title": "자료형", "lessons": ["리스트", "딕셔너리"]}, '
+    '{"week_number": 3, "title": "함수", "lessons": ["정의", "인자"]}]}'
+)
+
+
+class TestRepairJson:
+    """repair_json 테스트"""
+
+    def test_code_fence_and_surrounding_text(self) -> None:
+        """코드 블록과 앞뒤 설명 문장을 걷어내는지 테스트"""
+        text = f"다음은 커리큘럼입니다.\n```json\n{CURRICULUM}\n```\n도움이 되길 바랍니다!"
+
+        assert repair_json(text)["title"] == "Python 기초"
+
+    def test_trailing_text_after_json(self) -> None:
+        """JSON 뒤에 붙은 텍스트는 버리는지 테스트"""
+        assert repair_json('{"score": 8} 이상입니다. {}') == {"score": 8}
+
+    def test_trailing_comma(self) -> None:
+        """닫는 괄호 앞의 쉼표를 제거하는지 테스트"""
+        assert repair_json('{"lessons": ["a", "b",],}') == {"lessons": ["a", "b"]}
+
+    @pytest.mark.parametrize(
+        "cut, expected_weeks",
+        [
+            (150, [1, 2]),  # 레슨 배열 중간
+            (170, [1, 2]),  # 다음 주차 키 중간
+            (210, [1, 2, 3]),  # 마지막 레슨 직후
+            (len(CURRICULUM) - 2, [1, 2, 3]),  # 닫는 괄호만 빠짐
+        ],
+    )
+    def test_truncated_output_keeps_complete_items(
+        self, cut: int, expected_weeks: list
+    ) -> None:
+        """잘린 응답은 완성된 항목까지만 남기고 닫는지 테스트"""
+        result = repair_json(CURRICULUM[:cut])
+
+        assert result["title"] == "Python 기초"
+        assert [week["week_number"] for week in result["schedule"]] == expected_weeks
+        assert result["schedule"][0]["lessons"] == ["설치", "문법"]
+
+    def test_truncated_inside_string_drops_partial_value(self) -> None:
+        """문자열 중간에서 잘리면 잘린 값은 버리는지 테스트"""
+        result = repair_json('{"schedule": [{"week_number": 1, "lessons": ["설치", "문')
+
+        assert result == {"schedule": [{"week_number": 1, "lessons": ["설치"]}]}
+
+    def test_unrepairable(self) -> None:
+        """JSON 이 없으면 ValueError"""
+        with pytest.raises(ValueError):
+            repair_json("죄송합니다. 생성할 수 없습니다.")
+
+
+class TestParseCurriculum:
+    """parse_curriculum 테스트"""
+
+    def test_aliases_and_wrapper(self) -> None:
+        """키 별칭, 래퍼 배열, 문자열 주차 번호를 정규화하는지 테스트"""
+        payload = parse_curriculum(
+            [
+                {
+                    "title": "Python",
+                    "weeks": [
+                        {"weekNumber": "2주차", "week_title": "심화", "topics": "클래스"},
+                        {"week": 1, "content": ["변수", " "]},
+                        {"week": 1, "lessons": ["중복"]},
+                        {"week_number": "invalid", "lessons": ["무효"]},
+                    ],
+                }
+            ]
+        )
+
+        assert payload.title == "Python"
+        assert [week.as_dict() for week in payload.weeks] == [
+            {"week_number": 1, "title": "", "lessons": ["변수"]},
+            {"week_number": 2, "title": "심화", "lessons": ["클래스"]},
+        ]
+
+    def test_missing_weeks(self) -> None:
+        """기간 중 빠진 주차를 찾고 구간으로 묶는지 테스트"""
+        payload = parse_curriculum(CURRICULUM[: CURRICULUM.index(', {"week_number": 3')])
+
+        missing = payload.missing_weeks(7)
+
+        assert missing == [3, 4, 5, 6, 7]
+        assert missing_week_ranges(missing, max_size=4) == [(3, 6), (7, 7)]
+        assert missing_week_ranges([2, 5, 6], max_size=4) == [(2, 2), (5, 6)]
+
+
+class TestParseFeedback:
+    """parse_feedback 테스트"""
+
+    def test_score_recomputed_from_details(self) -> None:
+        """총점이 없으면 상세 점수 평균으로 채우고 범위를 맞추는지 테스트"""
+        result = parse_feedback(
+            {
+                "feedback": " 잘했어요 ",
+                "detailed_scores": {
+                    "cognitive_load_retention": 8,
+                    "engagement_behavior": "7/10",
+                    "transfer_application": 12,
+                    "competency_performance": 6.5,
+                    "realtime_analytics": -1,
+                },
+            }
+        )
+
+        assert result["comment"] == "잘했어요"
+        assert result["transfer_application"] == 10.0
+        assert result["realtime_analytics"] == 0.0
+        assert result["score"] == 6.3
+
+    def test_missing_comment(self) -> None:
+        """comment 가 없으면 ValueError"""
+        with pytest.raises(ValueError):
+            parse_feedback({"score": 8})
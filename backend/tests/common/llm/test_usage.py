@@ -0,0 +1,112 @@
+from typing import Any, Optional
+
+import pytest
+from langchain_core.messages import AIMessage
+from prometheus_client import REGISTRY
+
+from app.common.llm.langchain_client import LangChainLLMClient
+from app.common.llm.openai_client import OpenAILLMClient
+from app.common.llm.usage import estimate_cost, track_llm_call
+
+
+def _sample(name: str, **labels: str) -> float:
+    value: Optional[float] = REGISTRY.get_sample_value(name, labels)
+    return value or 0.0
+
+
+class FakeChatModel:
+    """usage_metadata 를 담은 응답을 돌려주는 ChatOpenAI 대역"""
+
+    def __init__(self, content: str) -> None:
+        self.content = content
+
+    async def ainvoke(self, messages: Any, config: Any = None) -> AIMessage:
+        return AIMessage(
+            content=self.content,
+            usage_metadata={
+                "input_tokens": 120,
+                "output_tokens": 30,
+                "total_tokens": 150,
+            },
+        )
+
+
+class TestLLMUsage:
+    """LLM 지연/토큰/비용 메트릭 테스트"""
+
+    def test_estimate_cost(self) -> None:
+        """모델 가격표로 비용을 계산하고 날짜가 붙은 모델명도 인식하는지 테스트"""
+        assert estimate_cost("gpt-4o-mini", 1_000_000, 0) == pytest.approx(0.15)
+        assert estimate_cost("gpt-4o-mini-2024-07-18", 0, 1_000_000) == pytest.approx(
+            0.60
+        )
+        assert estimate_cost("gpt-4o", 1_000_000, 1_000_000) == pytest.approx(12.5)
+        assert estimate_cost("unknown-model", 1000, 1000) == 0.0
+
+    def test_parse_failure_is_counted(self) -> None:
+        """블록에서 ValueError 가 나면 parse_error 로 기록하는지 테스트"""
+        labels = {"operation": "test_parse", "model": "gpt-4o-mini"}
+        before = _sample("llm_parse_failures_total", **labels)
+
+        with pytest.raises(ValueError):
+            with track_llm_call("test_parse", "gpt-4o-mini"):
+                raise ValueError("Invalid JSON response from LLM")
+
+        assert _sample("llm_parse_failures_total", **labels) == before + 1
+        assert (
+            _sample(
+                "llm_request_duration_seconds_count", status="parse_error", **labels
+            )
+            >= 1
+        )
+
+    @pytest.mark.asyncio
+    async def test_langchain_usage_metadata(self) -> None:
+        """LangChain 응답의 usage_metadata 로 토큰과 비용을 기록하는지 테스트"""
+        # Given
+        client = LangChainLLMClient(api_key="test", model="gpt-4o-mini")
+        client.llm = FakeChatModel('{"comment": "좋아요", "score": 8}')  # type: ignore
+        labels = {"operation": "generate_feedback", "model": "gpt-4o-mini"}
+        prompt_before = _sample("llm_tokens_total", kind="prompt", **labels)
+        completion_before = _sample("llm_tokens_total", kind="completion", **labels)
+        cost_before = _sample("llm_cost_usd_total", **labels)
+
+        # When
+        result = await client.generate_feedback(["레슨"], "요약")
+
+        # Then
+        assert result["score"] == 8
+        assert _sample("llm_tokens_total", kind="prompt", **labels) == prompt_before + 120
+        assert (
+            _sample("llm_tokens_total", kind="completion", **labels)
+            == completion_before + 30
+        )
+        assert _sample("llm_cost_usd_total", **labels) == pytest.approx(
+            cost_before + estimate_cost("gpt-4o-mini", 120, 30)
+        )
+
+    @pytest.mark.asyncio
+    async def test_openai_usage(self, mocker: Any) -> None:
+        """OpenAI 응답의 usage 로 토큰을 기록하는지 테스트"""
+        # Given
+        client = OpenAILLMClient(api_key="test", model="gpt-4o")
+
+        async def fake_make_request(**kwargs: Any) -> str:
+            kwargs["call"].add_openai_usage(
+                {"prompt_tokens": 200, "completion_tokens": 50}
+            )
+            return '{"comment": "좋아요", "score": 7}'
+
+        mocker.patch.object(client, "_make_request", side_effect=fake_make_request)
+        labels = {"operation": "generate_feedback", "model": "gpt-4o"}
+        before = _sample("llm_tokens_total", kind="prompt", **labels)
+
+        # When
+        await client.generate_feedback(["레슨"], "요약")
+
+        # Then
+        assert _sample("llm_tokens_total", kind="prompt", **labels) == before + 200
+        assert (
+            _sample("llm_request_duration_seconds_count", status="success", **labels)
+            >= 1
+        )
@@ -4,13 +4,22 @@ pytest 공통 설정 및 fixture 정의
 
 from datetime import datetime, timezone
 import os
-from typing import Any, Generator
+from typing import Any, Callable, ContextManager, Generator
 import pytest
 from ulid import ULID  # type: ignore
 from freezegun import freeze_time
 import asyncio
+import fnmatch
+import time
 from unittest.mock import AsyncMock, Mock
 from pytest_mock import MockerFixture
+from sqlalchemy import Engine
+from app.common.db.query_stats import (
+    QueryStats,
+    assert_max_queries,
+    instrument_queries,
+    uninstrument_queries,
+)
 from app.modules.curriculum.application.service.curriculum_service import (
     CurriculumService,
 )
@@ -58,6 +67,18 @@ def integration_test_setup():  # type: ignore
     }
 
 
+@pytest.fixture
+def query_budget() -> Generator[Callable[[int], ContextManager[QueryStats]], Any, None]:
+    """SQL 쿼리 수 상한 검사 (테스트 중 모든 엔진의 SQL 을 집계)
+
+    with query_budget(5):
+        await repo.get_public_feed(feed_filter)
+    """
+    instrument_queries(Engine)
+    yield assert_max_queries
+    uninstrument_queries(Engine)
+
+
 @pytest.fixture
 def mock_curriculum_repo(mocker: MockerFixture) -> AsyncMock:
     return mocker.AsyncMock(spec=ICurriculumRepository)
@@ -137,3 +158,229 @@ def test_env():
     os.environ["SECRET_KEY"] = "test-secret-key"
     os.environ["LLM_API_KEY"] = "test-api-key"
     os.environ["REDIS_URL"] = "redis://localhost:6379/1"
+
+
+class FakePipeline:
+    """FakeRedis 파이프라인 (명령을 모아 한 번의 왕복으로 실행)"""
+
+    def __init__(self, redis: "FakeRedis") -> None:
+        self._redis = redis
+        self._commands: list = []
+
+    def __getattr__(self, name: str):  # type: ignore
+        if name.startswith("_"):
+            raise AttributeError(name)
+        command = getattr(self._redis, f"_cmd_{name}")
+
+        def _queue(*args, **kwargs):  # type: ignore
+            self._commands.append((command, args, kwargs))
+            return self
+
+        return _queue
+
+    async def execute(self) -> list:
+        await self._redis._round_trip()
+        results = [command(*args, **kwargs) for command, args, kwargs in self._commands]
+        self._commands = []
+        return results
+
+    async def __aenter__(self) -> "FakePipeline":
+        return self
+
+    async def __aexit__(self, *exc_info) -> None:  # type: ignore
+        self._commands = []
+
+
+class FakeRedis:
+    """로컬 Redis 대역 (redis.asyncio.Redis 부분 구현)
+
+    명령(또는 파이프라인) 1회를 네트워크 왕복 1회로 보고
+    ``round_trips`` 로 집계하며, ``latency`` 만큼 지연을 흉내낸다.
+    """
+
+    def __init__(self, latency: float = 0.0) -> None:
+        self.latency = latency
+        self.round_trips = 0
+        self.strings: dict = {}
+        self.zsets: dict = {}
+        self.expires: dict = {}
+        self.streams: dict = {}
+        self.groups: dict = {}
+
+    async def _round_trip(self) -> None:
+        self.round_trips += 1
+        await asyncio.sleep(self.latency)
+
+    def __getattr__(self, name: str):  # type: ignore
+        if name.startswith("_"):
+            raise AttributeError(name)
+        command = getattr(self, f"_cmd_{name}")
+
+        async def _call(*args, **kwargs):  # type: ignore
+            await self._round_trip()
+            return command(*args, **kwargs)
+
+        return _call
+
+    def pipeline(self, transaction: bool = True) -> FakePipeline:
+        return FakePipeline(self)
+
+    async def scan_iter(self, match: str = "*", count: int = 10):  # type: ignore
+        await self._round_trip()
+        for key in list(self.strings) + list(self.zsets):
+            self._purge(key)
+            if fnmatch.fnmatchcase(key, match) and self._cmd_exists(key):
+                yield key
+
+    def _purge(self, key: str) -> None:
+        expire_at = self.expires.get(key)
+        if expire_at is not None and expire_at <= time.time():
+            self.strings.pop(key, None)
+            self.zsets.pop(key, None)
+            self.expires.pop(key, None)
+
+    def _cmd_get(self, key: str):  # type: ignore
+        self._purge(key)
+        return self.strings.get(key)
+
+    def _cmd_mget(self, keys: list) -> list:
+        return [self._cmd_get(key) for key in keys]
+
+    def _cmd_set(self, key: str, value, ex=None, px=None, nx: bool = False):  # type: ignore
+        self._purge(key)
+        if nx and key in self.strings:
+            return None
+        self.strings[key] = str(value)
+        self.expires.pop(key, None)
+        if ex is not None:
+            self.expires[key] = time.time() + ex
+        elif px is not None:
+            self.expires[key] = time.time() + px / 1000
+        return True
+
+    def _cmd_eval(self, script: str, numkeys: int, key: str, token: str, *args) -> int:  # type: ignore
+        # 락 해제(compare-and-delete)/연장(compare-and-pexpire) 스크립트만 지원
+        self._purge(key)
+        if self.strings.get(key) != token:
+            return 0
+        if "pexpire" in script:
+            self.expires[key] = time.time() + int(args[0]) / 1000
+            return 1
+        return self._cmd_delete(key)
+
+    def _cmd_delete(self, *keys: str) -> int:
+        deleted = 0
+        for key in keys:
+            self._purge(key)
+            if self.strings.pop(key, None) is not None or self.zsets.pop(key, None):
+                deleted += 1
+            self.expires.pop(key, None)
+        return deleted
+
+    def _cmd_exists(self, *keys: str) -> int:
+        for key in keys:
+            self._purge(key)
+        return sum(1 for key in keys if key in self.strings or key in self.zsets)
+
+    def _cmd_expire(self, key: str, seconds: int) -> bool:
+        if not self._cmd_exists(key):
+            return False
+        self.expires[key] = time.time() + seconds
+        return True
+
+    def _cmd_ttl(self, key: str) -> int:
+        if not self._cmd_exists(key):
+            return -2
+        expire_at = self.expires.get(key)
+        return -1 if expire_at is None else int(expire_at - time.time())
+
+    def _cmd_zadd(self, key: str, mapping: dict) -> int:
+        self._purge(key)
+        zset = self.zsets.setdefault(key, {})
+        added = sum(1 for member in mapping if member not in zset)
+        zset.update(mapping)
+        return added
+
+    def _cmd_zrem(self, key: str, *members: str) -> int:
+        self._purge(key)
+        zset = self.zsets.get(key, {})
+        return sum(1 for member in members if zset.pop(member, None) is not None)
+
+    def _cmd_zcard(self, key: str) -> int:
+        self._purge(key)
+        return len(self.zsets.get(key, {}))
+
+    def _cmd_zrange(self, key: str, start: int, end: int) -> list:
+        self._purge(key)
+        ordered = sorted(self.zsets.get(key, {}).items(), key=lambda kv: (kv[1], kv[0]))
+        stop = None if end == -1 else end + 1
+        return [member for member, _ in ordered[start:stop]]
+
+    def _cmd_zremrangebyrank(self, key: str, start: int, end: int) -> int:
+        members = self._cmd_zrange(key, start, end)
+        return self._cmd_zrem(key, *members) if members else 0
+
+    def _cmd_zrevrange(self, key: str, start: int, end: int, withscores: bool = False) -> list:
+        self._purge(key)
+        ordered = sorted(
+            self.zsets.get(key, {}).items(), key=lambda kv: (kv[1], kv[0]), reverse=True
+        )
+        stop = None if end == -1 else end + 1
+        page = ordered[start:stop]
+        return page if withscores else [member for member, _ in page]
+
+    def _cmd_xadd(self, stream: str, fields: dict, maxlen=None, approximate: bool = True) -> str:  # type: ignore
+        entries = self.streams.setdefault(stream, [])
+        message_id = f"{len(entries) + 1}-0"
+        entries.append((message_id, dict(fields)))
+        return message_id
+
+    def _cmd_xgroup_create(self, stream: str, group: str, id: str = "$", mkstream: bool = False) -> bool:  # type: ignore
+        # 대역에서는 id="0"(처음부터 읽기)만 지원
+        import redis.asyncio as redis
+
+        if (stream, group) in self.groups:
+            raise redis.ResponseError("BUSYGROUP Consumer Group name already exists")
+        self.streams.setdefault(stream, [])
+        self.groups[(stream, group)] = {"delivered": 0, "pending": {}}
+        return True
+
+    def _cmd_xreadgroup(self, group: str, consumer: str, streams: dict, count=None, block=None) -> list:  # type: ignore
+        # block은 흉내내지 않음 (새 메시지가 없으면 바로 빈 응답)
+        response = []
+        for stream in streams:
+            state = self.groups[(stream, group)]
+            entries = self.streams.get(stream, [])
+            batch = entries[state["delivered"] : state["delivered"] + (count or len(entries))]
+            state["delivered"] += len(batch)
+            for message_id, _ in batch:
+                state["pending"][message_id] = (consumer, time.time())
+            if batch:
+                response.append([stream, batch])
+        return response
+
+    def _cmd_xautoclaim(self, stream: str, group: str, consumer: str, min_idle_time: int, start_id: str = "0-0", count=None) -> list:  # type: ignore
+        state = self.groups[(stream, group)]
+        entries = dict(self.streams.get(stream, []))
+        claimed = []
+        for message_id, (_, delivered_at) in list(state["pending"].items()):
+            if (time.time() - delivered_at) * 1000 >= min_idle_time:
+                state["pending"][message_id] = (consumer, time.time())
+                claimed.append((message_id, entries.get(message_id)))
+            if count and len(claimed) >= count:
+                break
+        return ["0-0", claimed, []]
+
+    def _cmd_xack(self, stream: str, group: str, *message_ids: str) -> int:
+        pending = self.groups[(stream, group)]["pending"]
+        return sum(1 for message_id in message_ids if pending.pop(message_id, None))
+
+
+@pytest.fixture
+def fake_redis(mocker: MockerFixture) -> FakeRedis:
+    """전역 redis_client 를 FakeRedis 로 교체"""
+    from app.common.cache.redis_client import redis_client
+
+    fake = FakeRedis()
+    mocker.patch.object(redis_client, "redis", fake)
+    return fake
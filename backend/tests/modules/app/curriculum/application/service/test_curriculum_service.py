@@ -1,3 +1,5 @@
+import asyncio
+import json
 from typing import Tuple
 from unittest.mock import AsyncMock, Mock, patch
 import pytest
@@ -5,6 +7,26 @@ from ulid import ULID  # type: ignore
 from datetime import datetime, timezone
 from pytest_mock import MockerFixture
 
+import pytest_asyncio
+from pathlib import Path
+from typing import AsyncIterator
+from sqlalchemy.ext.asyncio import (
+    AsyncEngine,
+    AsyncSession,
+    async_sessionmaker,
+    create_async_engine,
+)
+
+import app.common.db.database_models  # noqa: F401
+from app.common.db.database import Base
+from app.common.db.pagination import CursorPage
+from app.common.db.unit_of_work import UnitOfWork
+from app.common.llm.dispatcher import (
+    DispatchedLLMClient,
+    LLMDispatcher,
+    current_llm_user,
+)
+from app.common.llm.exception import LLMQueueFullError
 from app.common.llm.llm_client_repo import ILLMClientRepository
 from app.modules.curriculum.application.dto.curriculum_dto import (
     CreateCurriculumCommand,
@@ -24,6 +46,9 @@ from app.modules.curriculum.application.service.curriculum_service import (
 )
 from app.modules.curriculum.domain.entity.curriculum import Curriculum
 from app.modules.curriculum.domain.entity.week_schedule import WeekSchedule
+from app.modules.curriculum.domain.event.curriculum_event_handler import (
+    CurriculumEventHandler,
+)
 from app.modules.curriculum.domain.repository.curriculum_repo import (
     ICurriculumRepository,
 )
@@ -32,8 +57,19 @@ from app.modules.curriculum.domain.service.curriculum_domain_service import (
 )
 from app.modules.curriculum.domain.vo import Title, Visibility, WeekNumber, Lessons
 from app.modules.curriculum.domain.vo.difficulty import Difficulty
+from app.modules.curriculum.infrastructure.repository.curriculum_repo import (
+    CurriculumRepository,
+)
 from app.modules.social.domain.repository.follow_repo import IFollowRepository
 from app.modules.user.domain.vo.role import RoleVO
+from app.modules.user.infrastructure.db_model.user import UserModel
+
+
+def _unit_of_work(mocker: MockerFixture) -> UnitOfWork:
+    """DB 없이 commit/rollback 경계만 흉내 내는 UnitOfWork"""
+    session = mocker.AsyncMock(spec=AsyncSession)
+    session.in_transaction = mocker.Mock(return_value=False)
+    return UnitOfWork(session_factory=mocker.Mock(return_value=session))
 
 
 class TestCurriculumService:
@@ -237,6 +273,337 @@ class TestCurriculumService:
         with pytest.raises(LLMGenerationError):
             await service.generate_curriculum(command)
 
+    async def test_generate_curriculum_rejected_when_llm_queue_full(
+        self,
+        curriculum_service: Tuple[CurriculumService, AsyncMock, Mock, AsyncMock, Mock],
+        mocker: MockerFixture,
+    ) -> None:
+        """LLM 대기열 거절은 생성 실패로 감싸지 않고 그대로 전달하는지 테스트"""
+        # Given
+        service, mock_repo, _, mock_llm_client, _ = curriculum_service
+        users = []
+
+        async def busy(**kwargs):  # type: ignore
+            users.append(current_llm_user())
+            raise LLMQueueFullError("busy")
+
+        mock_llm_client.generate_curriculum.side_effect = busy
+        command = GenerateCurriculumCommand(
+            owner_id="user_123",
+            goal="Python 학습",
+            period=2,
+            difficulty=Difficulty.BEGINNER,
+            details="기초 과정",
+        )
+        mock_repo.count_by_owner.return_value = 5
+
+        # When & Then
+        with pytest.raises(LLMQueueFullError):
+            await service.generate_curriculum(command)
+
+        assert users == ["user_123"]  # 요청한 사용자 몫으로 대기열에 넣음
+        mock_repo.save.assert_not_called()
+
+    async def test_generate_long_curriculum_in_parallel_chunks(
+        self,
+        curriculum_service: Tuple[CurriculumService, AsyncMock, Mock, AsyncMock, Mock],
+        sample_curriculum: Curriculum,
+    ) -> None:
+        """긴 기간은 개요 생성 후 주차 구간을 제한된 동시성으로 나눠 생성하는지 테스트"""
+        # Given
+        service, mock_repo, mock_domain_service, mock_llm_client, _ = curriculum_service
+        service.chunked_min_period = 8
+        service.chunk_size = 4
+        service.chunk_concurrency = 2
+        mock_repo.count_by_owner.return_value = 0
+        mock_domain_service.create_curriculum.return_value = sample_curriculum
+        mock_llm_client.generate_curriculum_outline.return_value = {
+            "title": "Python 심화",
+            "schedule": [{"week_number": n, "title": f"주제{n}"} for n in range(1, 11)],
+        }
+        running = 0
+        peak = 0
+
+        async def expand(**kwargs):  # type: ignore
+            nonlocal running, peak
+            running += 1
+            peak = max(peak, running)
+            await asyncio.sleep(0)
+            running -= 1
+            start, end = kwargs["start_week"], kwargs["end_week"]
+            weeks = [
+                {"week_number": n, "title": f"주제{n}", "lessons": [f"레슨{n}"]}
+                for n in range(start, end + 1)
+            ]
+            # 구간 밖 주차는 무시되어야 함
+            weeks.append({"week_number": end + 1, "lessons": ["중복"]})
+            return {"schedule": weeks}
+
+        mock_llm_client.expand_curriculum_weeks.side_effect = expand
+        command = GenerateCurriculumCommand(
+            owner_id="user_123",
+            goal="Python 심화 학습",
+            period=10,
+            difficulty=Difficulty.INTERMEDIATE,
+            details="",
+        )
+
+        # When
+        await service.generate_curriculum(command)
+
+        # Then
+        mock_llm_client.generate_curriculum.assert_not_called()
+        mock_llm_client.generate_curriculum_outline.assert_awaited_once()
+        ranges = [
+            (call.kwargs["start_week"], call.kwargs["end_week"])
+            for call in mock_llm_client.expand_curriculum_weeks.call_args_list
+        ]
+        assert sorted(ranges) == [(1, 4), (5, 8), (9, 10)]
+        assert peak == 2
+
+        weeks = mock_domain_service.create_curriculum.call_args.kwargs[
+            "week_schedules_data"
+        ]
+        assert [week[0] for week in weeks] == list(range(1, 11))
+        assert weeks[0][2] == ["레슨1"]
+
+    async def test_chunked_generation_takes_a_slot_per_llm_call(
+        self,
+        curriculum_service: Tuple[CurriculumService, AsyncMock, Mock, AsyncMock, Mock],
+        sample_curriculum: Curriculum,
+    ) -> None:
+        """분할 생성의 LLM 호출이 각각 슬롯을 받아 디스패처 제한을 넘지 않는지 테스트"""
+        # Given
+        service, mock_repo, mock_domain_service, mock_llm_client, _ = curriculum_service
+        service.chunked_min_period = 8
+        service.chunk_size = 4
+        service.chunk_concurrency = 3
+        mock_repo.count_by_owner.return_value = 0
+        mock_domain_service.create_curriculum.return_value = sample_curriculum
+        mock_llm_client.generate_curriculum_outline.return_value = {
+            "title": "Python 심화",
+            "schedule": [{"week_number": n, "title": f"주제{n}"} for n in range(1, 11)],
+        }
+        dispatcher = LLMDispatcher(max_concurrency=1, max_queued_per_user=3)
+        service.llm_client = DispatchedLLMClient(mock_llm_client, dispatcher)
+        running = 0
+        peak = 0
+
+        async def expand(**kwargs):  # type: ignore
+            nonlocal running, peak
+            running += 1
+            peak = max(peak, running)
+            await asyncio.sleep(0)
+            running -= 1
+            start, end = kwargs["start_week"], kwargs["end_week"]
+            return {
+                "schedule": [
+                    {"week_number": n, "title": f"주제{n}", "lessons": [f"레슨{n}"]}
+                    for n in range(start, end + 1)
+                ]
+            }
+
+        mock_llm_client.expand_curriculum_weeks.side_effect = expand
+        command = GenerateCurriculumCommand(
+            owner_id="user_123",
+            goal="Python 심화 학습",
+            period=10,
+            difficulty=Difficulty.INTERMEDIATE,
+            details="",
+        )
+
+        # When
+        await service.generate_curriculum(command)
+
+        # Then
+        assert mock_llm_client.expand_curriculum_weeks.await_count == 3
+        assert peak == 1
+        assert dispatcher.active == 0
+
+    async def test_short_curriculum_uses_single_call(
+        self,
+        curriculum_service: Tuple[CurriculumService, AsyncMock, Mock, AsyncMock, Mock],
+        sample_curriculum: Curriculum,
+        sample_llm_response: dict,  # type: ignore
+    ) -> None:
+        """기준보다 짧은 기간은 기존처럼 한 번에 생성하는지 테스트"""
+        # Given
+        service, mock_repo, mock_domain_service, mock_llm_client, _ = curriculum_service
+        service.chunked_min_period = 8
+        mock_repo.count_by_owner.return_value = 0
+        mock_domain_service.create_curriculum.return_value = sample_curriculum
+        mock_llm_client.generate_curriculum.return_value = sample_llm_response
+        command = GenerateCurriculumCommand(
+            owner_id="user_123",
+            goal="Python 학습",
+            period=4,
+            difficulty=Difficulty.BEGINNER,
+            details="",
+        )
+
+        # When
+        await service.generate_curriculum(command)
+
+        # Then
+        mock_llm_client.generate_curriculum.assert_awaited_once()
+        mock_llm_client.generate_curriculum_outline.assert_not_called()
+
+    async def test_generate_curriculum_regenerates_only_missing_weeks(
+        self,
+        curriculum_service: Tuple[CurriculumService, AsyncMock, Mock, AsyncMock, Mock],
+        sample_curriculum: Curriculum,
+    ) -> None:
+        """응답에 빠진 주차가 있으면 전체 재생성 없이 그 주차만 다시 생성하는지 테스트"""
+        # Given
+        service, mock_repo, mock_domain_service, mock_llm_client, _ = curriculum_service
+        mock_repo.count_by_owner.return_value = 0
+        mock_domain_service.create_curriculum.return_value = sample_curriculum
+        # 출력이 잘려 3~4주차가 없는 응답
+        mock_llm_client.generate_curriculum.return_value = {
+            "title": "Python 기초",
+            "schedule": [
+                {"week_number": 1, "title": "소개", "lessons": ["설치"]},
+                {"weekNumber": "2", "week_title": "자료형", "topics": ["리스트"]},
+            ],
+        }
+        mock_llm_client.expand_curriculum_weeks.return_value = {
+            "schedule": [
+                {"week_number": 2, "lessons": ["중복"]},
+                {"week_number": 3, "title": "함수", "lessons": ["정의"]},
+                {"week_number": 4, "title": "클래스", "lessons": ["상속"]},
+            ]
+        }
+        command = GenerateCurriculumCommand(
+            owner_id="user_123",
+            goal="Python 학습",
+            period=4,
+            difficulty=Difficulty.BEGINNER,
+            details="",
+        )
+
+        # When
+        await service.generate_curriculum(command)
+
+        # Then
+        mock_llm_client.generate_curriculum.assert_awaited_once()
+        mock_llm_client.expand_curriculum_weeks.assert_awaited_once()
+        kwargs = mock_llm_client.expand_curriculum_weeks.call_args.kwargs
+        assert (kwargs["start_week"], kwargs["end_week"]) == (3, 4)
+        assert [week["title"] for week in kwargs["outline"]] == ["소개", "자료형"]
+
+        weeks = mock_domain_service.create_curriculum.call_args.kwargs[
+            "week_schedules_data"
+        ]
+        assert weeks == [
+            (1, "소개", ["설치"]),
+            (2, "자료형", ["리스트"]),
+            (3, "함수", ["정의"]),
+            (4, "클래스", ["상속"]),
+        ]
+
+    async def test_stream_generate_curriculum_persists_each_week(
+        self,
+        curriculum_service: Tuple[CurriculumService, AsyncMock, Mock, AsyncMock, Mock],
+        sample_llm_response: dict,  # type: ignore
+        mocker: MockerFixture,
+    ) -> None:
+        """스트리밍 생성 시 주차가 완성될 때마다 저장하고 이벤트를 보내는지 테스트"""
+        # Given
+        service, mock_repo, mock_domain_service, mock_llm_client, _ = curriculum_service
+        mock_domain_service.create_curriculum.side_effect = CurriculumDomainService(
+            mock_repo
+        ).create_curriculum
+        mock_repo.count_by_owner.return_value = 5
+        text = json.dumps(sample_llm_response, ensure_ascii=False)
+
+        async def fake_stream(**kwargs):  # type: ignore
+            for i in range(0, len(text), 7):  # 토큰 단위 조각 흉내
+                yield text[i : i + 7]
+
+        mock_llm_client.generate_curriculum_stream = fake_stream
+        dispatcher = LLMDispatcher()
+        service.llm_client = DispatchedLLMClient(mock_llm_client, dispatcher)
+        command = GenerateCurriculumCommand(
+            owner_id="user_123",
+            goal="Python 기초 학습",
+            period=4,
+            difficulty=Difficulty.BEGINNER,
+            details="입문자용",
+        )
+
+        # When
+        events = await service.stream_generate_curriculum(command)
+        received = []
+        async for event, data in events:
+            received.append(event)
+            if event == "week":
+                # 주차 이벤트 시점에 이미 저장되어 있어야 함
+                saved = mock_repo.save.call_count + mock_repo.update.call_count
+                assert saved == data["week_number"]
+            if event == "done":
+                result: CurriculumDTO = data["curriculum"]
+
+        # Then
+        assert received == ["title", "week", "week", "week", "week", "done"]
+        assert result.title.endswith("Python 기초 커리큘럼")
+        assert [week.week_number for week in result.week_schedules] == [1, 2, 3, 4]
+        mock_repo.save.assert_called_once()
+        assert mock_repo.update.call_count == 3
+        assert dispatcher.active == 0
+
+    async def test_stream_generate_curriculum_reports_partial_failure(
+        self,
+        curriculum_service: Tuple[CurriculumService, AsyncMock, Mock, AsyncMock, Mock],
+    ) -> None:
+        """응답이 중간에 끊기면 저장된 커리큘럼 ID와 함께 error 이벤트를 보내는지 테스트"""
+        # Given
+        service, mock_repo, mock_domain_service, mock_llm_client, _ = curriculum_service
+        mock_domain_service.create_curriculum.side_effect = CurriculumDomainService(
+            mock_repo
+        ).create_curriculum
+        mock_repo.count_by_owner.return_value = 5
+
+        async def broken_stream(**kwargs):  # type: ignore
+            yield '{"title": "Python", "schedule": [{"week_number": 1, '
+            yield '"lessons": ["변수"]}, {"week_number": 2, "less'
+            raise ConnectionError("stream closed")
+
+        mock_llm_client.generate_curriculum_stream = broken_stream
+        command = GenerateCurriculumCommand(
+            owner_id="user_123",
+            goal="Python 학습",
+            period=2,
+            difficulty=Difficulty.BEGINNER,
+            details="",
+        )
+
+        # When
+        events = [event async for event in await service.stream_generate_curriculum(command)]
+
+        # Then
+        assert [name for name, _ in events] == ["title", "week", "error"]
+        assert events[-1][1]["curriculum_id"] == "01HKQJQJQJQJQJQJQJQJQJ"
+        assert "stream closed" in events[-1][1]["detail"]
+        mock_repo.save.assert_called_once()
+
+    async def test_stream_generate_curriculum_checks_limit_before_streaming(
+        self,
+        curriculum_service: Tuple[CurriculumService, AsyncMock, Mock, AsyncMock, Mock],
+    ) -> None:
+        """개수 제한은 스트림 시작 전에 예외로 알리는지 테스트"""
+        service, mock_repo, _, _, _ = curriculum_service
+        mock_repo.count_by_owner.return_value = 10
+        command = GenerateCurriculumCommand(
+            owner_id="user_123",
+            goal="Python 학습",
+            period=2,
+            difficulty=Difficulty.BEGINNER,
+            details="",
+        )
+
+        with pytest.raises(CurriculumCountOverError):
+            await service.stream_generate_curriculum(command)
+
     # 커리큘럼 조회 테스트
     async def test_get_curriculums_by_owner(
         self,
@@ -285,6 +652,31 @@ class TestCurriculumService:
             page=1, items_per_page=10
         )
 
+    async def test_get_public_curriculums_with_cursor(
+        self,
+        curriculum_service: Tuple[CurriculumService, AsyncMock, Mock, AsyncMock, Mock],
+        sample_curriculum: Curriculum,
+    ) -> None:
+        """커서 모드 공개 커리큘럼 조회 테스트 (COUNT 생략)"""
+        # Given
+        service, mock_repo, _, _, _ = curriculum_service
+        query = CurriculumQuery(page=1, items_per_page=10, cursor="cursor_token")
+        mock_repo.find_public_curriculums_after.return_value = CursorPage(
+            items=[sample_curriculum], next_cursor="next_token"
+        )
+
+        # When
+        result = await service.get_curriculums(query)
+
+        # Then
+        assert result.total_count is None
+        assert result.next_cursor == "next_token"
+        assert len(result.curriculums) == 1
+        mock_repo.find_public_curriculums_after.assert_called_once_with(
+            cursor="cursor_token", limit=10, with_total=False
+        )
+        mock_repo.find_public_curriculums.assert_not_called()
+
     async def test_get_curriculum_by_id_success(
         self,
         curriculum_service: Tuple[CurriculumService, AsyncMock, Mock, AsyncMock, Mock],
@@ -417,6 +809,94 @@ class TestCurriculumService:
         mock_repo.find_by_id.assert_called_once()
         mock_repo.delete.assert_called_once_with(curriculum_id)
 
+    async def test_update_curriculum_emits_visibility_event(
+        self,
+        curriculum_service: Tuple[CurriculumService, AsyncMock, Mock, AsyncMock, Mock],
+        sample_curriculum: Curriculum,
+        mocker: MockerFixture,
+    ) -> None:
+        """공개 여부 변경 시 피드 이벤트를 발행하는지 테스트"""
+        # Given
+        service, mock_repo, _, _, _ = curriculum_service
+        service.feed_event_handler = mocker.AsyncMock(spec=CurriculumEventHandler)
+        mock_repo.find_by_id.return_value = sample_curriculum
+        command = UpdateCurriculumCommand(
+            curriculum_id=sample_curriculum.id,
+            owner_id="user_123",
+            visibility=Visibility.PUBLIC,
+        )
+
+        # When
+        async with _unit_of_work(mocker):
+            await service.update_curriculum(command, RoleVO.USER)
+            await service.update_curriculum(
+                UpdateCurriculumCommand(
+                    curriculum_id=sample_curriculum.id,
+                    owner_id="user_123",
+                    title="제목만 변경",
+                ),
+                RoleVO.USER,
+            )
+            # commit 전에는 발행하지 않는다
+            service.feed_event_handler.on_curriculum_visibility_changed.assert_not_awaited()
+
+        # Then
+        service.feed_event_handler.on_curriculum_visibility_changed.assert_awaited_once_with(
+            sample_curriculum.id
+        )
+        service.feed_event_handler.on_curriculum_updated.assert_awaited_once_with(
+            sample_curriculum.id
+        )
+
+    async def test_delete_curriculum_emits_deleted_event(
+        self,
+        curriculum_service: Tuple[CurriculumService, AsyncMock, Mock, AsyncMock, Mock],
+        sample_curriculum: Curriculum,
+        mocker: MockerFixture,
+    ) -> None:
+        """삭제 시 피드 이벤트를 발행하는지 테스트"""
+        # Given
+        service, mock_repo, _, _, _ = curriculum_service
+        service.feed_event_handler = mocker.AsyncMock(spec=CurriculumEventHandler)
+        mock_repo.find_by_id.return_value = sample_curriculum
+
+        # When
+        async with _unit_of_work(mocker):
+            await service.delete_curriculum(
+                sample_curriculum.id, "user_123", RoleVO.USER
+            )
+
+        # Then
+        service.feed_event_handler.on_curriculum_deleted.assert_awaited_once_with(
+            sample_curriculum.id
+        )
+
+    async def test_rolled_back_change_emits_no_event(
+        self,
+        curriculum_service: Tuple[CurriculumService, AsyncMock, Mock, AsyncMock, Mock],
+        sample_curriculum: Curriculum,
+        mocker: MockerFixture,
+    ) -> None:
+        """요청이 rollback 되면 피드 이벤트를 발행하지 않는지 테스트"""
+        # Given
+        service, mock_repo, _, _, _ = curriculum_service
+        service.feed_event_handler = mocker.AsyncMock(spec=CurriculumEventHandler)
+        mock_repo.find_by_id.return_value = sample_curriculum
+        command = UpdateCurriculumCommand(
+            curriculum_id=sample_curriculum.id,
+            owner_id="user_123",
+            visibility=Visibility.PUBLIC,
+        )
+
+        # When
+        with pytest.raises(RuntimeError):
+            async with _unit_of_work(mocker):
+                await service.update_curriculum(command, RoleVO.USER)
+                raise RuntimeError("request failed after the change")
+
+        # Then
+        service.feed_event_handler.on_curriculum_visibility_changed.assert_not_awaited()
+
     async def test_delete_curriculum_permission_denied(
         self,
         curriculum_service: Tuple[CurriculumService, AsyncMock, Mock, AsyncMock, Mock],
@@ -1340,3 +1820,139 @@ if __name__ == "__main__":
     # pytest를 사용하여 테스트 실행
     # pytest tests/test_curriculum_service.py -v
     pass
+
+
+class TestCurriculumServiceTransaction:
+    """UnitOfWork 안에서의 트랜잭션/커넥션 경계 테스트 (sqlite 파일 DB)"""
+
+    @pytest_asyncio.fixture
+    async def engine(self, tmp_path: Path) -> AsyncIterator[AsyncEngine]:
+        engine = create_async_engine(f"sqlite+aiosqlite:///{tmp_path / 'tx.db'}")
+        async with engine.begin() as conn:
+            await conn.run_sync(Base.metadata.create_all)
+        session_factory = async_sessionmaker(engine, expire_on_commit=False)
+        async with session_factory() as session:
+            now = datetime.now(timezone.utc)
+            session.add(
+                UserModel(  # type: ignore
+                    id="user_123",
+                    email="tx@example.com",
+                    name="Tx User",
+                    password="hashed_password",
+                    role=RoleVO.USER,
+                    created_at=now,
+                    updated_at=now,
+                )
+            )
+            await session.commit()
+        yield engine
+        await engine.dispose()
+
+    @pytest.fixture
+    def session_factory(self, engine: AsyncEngine) -> async_sessionmaker[AsyncSession]:
+        return async_sessionmaker(engine, expire_on_commit=False)
+
+    @staticmethod
+    def _service(
+        session: AsyncSession, llm_client: AsyncMock, mocker: MockerFixture
+    ) -> CurriculumService:
+        repo = CurriculumRepository(session)
+        return CurriculumService(
+            curriculum_repo=repo,
+            curriculum_domain_service=CurriculumDomainService(repo),
+            llm_client=llm_client,
+            follow_repo=mocker.AsyncMock(spec=IFollowRepository),
+            ulid=ULID(),
+        )
+
+    @staticmethod
+    def _command() -> GenerateCurriculumCommand:
+        return GenerateCurriculumCommand(
+            owner_id="user_123",
+            goal="Python 기초 학습",
+            period=2,
+            difficulty=Difficulty.BEGINNER,
+            details="입문자용",
+        )
+
+    async def test_no_connection_is_held_during_llm_call(
+        self,
+        engine: AsyncEngine,
+        session_factory: async_sessionmaker[AsyncSession],
+        mocker: MockerFixture,
+    ) -> None:
+        """사전 검증 뒤 트랜잭션을 끝내 LLM 응답을 기다리는 동안 커넥션을 잡지 않는지 테스트"""
+        # Given
+        checked_out = []
+
+        async def generate(**kwargs: object) -> dict:  # type: ignore
+            checked_out.append(engine.pool.checkedout())  # type: ignore
+            return {
+                "title": "Python 기초",
+                "schedule": [
+                    {"week_number": 1, "title": "소개", "lessons": ["설치"]},
+                    {"week_number": 2, "title": "문법", "lessons": ["변수"]},
+                ],
+            }
+
+        llm_client = mocker.AsyncMock(spec=ILLMClientRepository)
+        llm_client.generate_curriculum.side_effect = generate
+
+        # When
+        async with UnitOfWork(session_factory) as session:
+            service = self._service(session, llm_client, mocker)
+            dto = await service.generate_curriculum(self._command())
+
+        # Then: 호출 중에는 커넥션이 없고, 결과는 새 트랜잭션에서 저장된다
+        assert checked_out == [0]
+        assert engine.pool.checkedout() == 0  # type: ignore
+        async with session_factory() as session:
+            saved = await CurriculumRepository(session).find_by_id(
+                dto.id, role=RoleVO.ADMIN
+            )
+        assert saved is not None
+        assert len(saved.week_schedules) == 2
+
+    async def test_streamed_week_is_committed_before_event(
+        self,
+        session_factory: async_sessionmaker[AsyncSession],
+        mocker: MockerFixture,
+    ) -> None:
+        """스트리밍 중 week 이벤트를 받은 시점에 다른 세션에서 커리큘럼이 보이는지 테스트"""
+        # Given
+        text = json.dumps(
+            {
+                "title": "Python 기초",
+                "schedule": [
+                    {"week_number": 1, "title": "소개", "lessons": ["설치"]},
+                    {"week_number": 2, "title": "문법", "lessons": ["변수"]},
+                ],
+            },
+            ensure_ascii=False,
+        )
+
+        async def fake_stream(**kwargs):  # type: ignore
+            for i in range(0, len(text), 7):
+                yield text[i : i + 7]
+
+        llm_client = mocker.AsyncMock(spec=ILLMClientRepository)
+        llm_client.generate_curriculum_stream = fake_stream
+        seen = []
+
+        # When
+        async with UnitOfWork(session_factory) as session:
+            service = self._service(session, llm_client, mocker)
+            events = await service.stream_generate_curriculum(self._command())
+            async for event, data in events:
+                if event != "week" or seen:
+                    continue
+                async with session_factory() as other:
+                    seen.append(
+                        await CurriculumRepository(other).find_by_id(
+                            data["curriculum_id"], role=RoleVO.ADMIN
+                        )
+                    )
+
+        # Then: 첫 주차 이벤트 시점에 이미 commit 되어 있다
+        assert seen[0] is not None
+        assert len(seen[0].week_schedules) == 1
@@ -642,3 +642,114 @@ class TestCurriculumRepositoryErrorHandling:
         # When & Then - 예외가 발생하지 않아야 함 (update 메서드는 None 반환)
         result = await curriculum_repository.update(non_existing_curriculum)  # type: ignore
         assert result is None
+
+
+class TestCurriculumRepositoryCursorPagination:
+    """CurriculumRepository 커서(키셋) 페이지네이션 테스트"""
+
+    @staticmethod
+    async def _save_public_curriculums(
+        curriculum_repository: CurriculumRepository, count: int
+    ) -> None:
+        # 동일한 created_at으로 생성해 id 보조 정렬까지 검증
+        now = datetime.now(timezone.utc)
+        for i in range(count):
+            await curriculum_repository.save(
+                Curriculum(
+                    id=f"curriculum_{i}",
+                    owner_id="test_user_id",
+                    title=Title(f"Test Curriculum {i}"),
+                    visibility=Visibility.PUBLIC,
+                    created_at=now,
+                    updated_at=now,
+                    week_schedules=[
+                        WeekSchedule(
+                            week_number=WeekNumber(1),
+                            title=Title("개념"),
+                            lessons=Lessons([f"Lesson {i}"]),
+                        )
+                    ],
+                )
+            )
+
+    @pytest.mark.asyncio
+    async def test_walk_all_pages_without_duplicates(
+        self,
+        curriculum_repository: CurriculumRepository,
+        sample_user: UserModel,
+    ) -> None:
+        """커서를 따라가면 중복/누락 없이 전체를 조회하는지 테스트"""
+        # Given
+        await self._save_public_curriculums(curriculum_repository, 5)
+
+        # When
+        seen = []
+        cursor = None
+        while True:
+            page = await curriculum_repository.find_public_curriculums_after(
+                cursor=cursor, limit=2
+            )
+            seen.extend(c.id for c in page.items)
+            if not page.has_next:
+                break
+            cursor = page.next_cursor
+
+        # Then
+        assert seen == [f"curriculum_{i}" for i in range(4, -1, -1)]
+
+    @pytest.mark.asyncio
+    async def test_total_count_only_when_requested(
+        self,
+        curriculum_repository: CurriculumRepository,
+        sample_user: UserModel,
+    ) -> None:
+        """전체 개수는 요청한 경우에만 계산하는지 테스트"""
+        # Given
+        await self._save_public_curriculums(curriculum_repository, 3)
+
+        # When
+        without_total = await curriculum_repository.find_by_owner_id_after(
+            owner_id="test_user_id", limit=2
+        )
+        with_total = await curriculum_repository.find_by_owner_id_after(
+            owner_id="test_user_id", limit=2, with_total=True
+        )
+
+        # Then
+        assert without_total.total_count is None
+        assert with_total.total_count == 3
+        assert with_total.next_cursor is not None
+
+    @pytest.mark.asyncio
+    async def test_by_users_after(
+        self,
+        curriculum_repository: CurriculumRepository,
+        sample_user: UserModel,
+    ) -> None:
+        """특정 사용자들의 공개 커리큘럼 커서 조회 테스트"""
+        # Given
+        await self._save_public_curriculums(curriculum_repository, 3)
+
+        # When
+        page = await curriculum_repository.find_public_curriculums_by_users_after(
+            user_ids=["test_user_id"], limit=5
+        )
+        empty = await curriculum_repository.find_public_curriculums_by_users_after(
+            user_ids=[], limit=5
+        )
+
+        # Then
+        assert len(page.items) == 3
+        assert page.next_cursor is None
+        assert empty.items == []
+
+    @pytest.mark.asyncio
+    async def test_invalid_cursor(
+        self,
+        curriculum_repository: CurriculumRepository,
+    ) -> None:
+        """잘못된 커서는 ValueError를 발생시키는지 테스트"""
+        with pytest.raises(ValueError):
+            await curriculum_repository.find_public_curriculums_after(
+                cursor="not-a-cursor"
+            )
@@ -0,0 +1,65 @@
+from unittest.mock import AsyncMock
+
+import pytest
+from pytest_mock import MockerFixture
+
+from app.modules.feed.application.service.feed_event_handler import FeedEventHandler
+from app.modules.feed.domain.repository.feed_repo import IFeedRepository
+
+
+@pytest.fixture
+def feed_repo(mocker: MockerFixture) -> AsyncMock:
+    return mocker.AsyncMock(spec=IFeedRepository)
+
+
+@pytest.fixture
+def handler(feed_repo: AsyncMock) -> FeedEventHandler:
+    return FeedEventHandler(feed_repo=feed_repo)
+
+
+class TestFeedEventHandler:
+    """FeedEventHandler 테스트"""
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize(
+        "event",
+        [
+            "on_curriculum_created",
+            "on_curriculum_updated",
+            "on_curriculum_visibility_changed",
+        ],
+    )
+    async def test_change_events_upsert(
+        self, handler: FeedEventHandler, feed_repo: AsyncMock, event: str
+    ) -> None:
+        """생성/수정/공개 여부 변경은 인덱스 upsert로 반영되는지 테스트"""
+        # When
+        await getattr(handler, event)("curriculum_1")
+
+        # Then
+        feed_repo.upsert_feed_item.assert_awaited_once_with("curriculum_1")
+
+    @pytest.mark.asyncio
+    async def test_delete_event_removes(
+        self, handler: FeedEventHandler, feed_repo: AsyncMock
+    ) -> None:
+        """삭제는 인덱스에서 제거되는지 테스트"""
+        # When
+        await handler.on_curriculum_deleted("curriculum_1")
+
+        # Then
+        feed_repo.remove_from_cache.assert_awaited_once_with("curriculum_1")
+        feed_repo.upsert_feed_item.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_failure_does_not_propagate(
+        self, handler: FeedEventHandler, feed_repo: AsyncMock
+    ) -> None:
+        """피드 반영 실패가 호출자에게 전파되지 않는지 테스트"""
+        # Given
+        feed_repo.upsert_feed_item.side_effect = RuntimeError("redis down")
+        feed_repo.remove_from_cache.side_effect = RuntimeError("redis down")
+
+        # When & Then
+        await handler.on_curriculum_updated("curriculum_1")
+        await handler.on_curriculum_deleted("curriculum_1")
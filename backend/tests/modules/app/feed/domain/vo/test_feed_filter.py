@@ -0,0 +1,47 @@
+from app.modules.feed.domain.vo.feed_filter import FeedFilter
+
+
+class TestFeedFilter:
+    """FeedFilter 테스트"""
+
+    def test_pagination_bounds(self) -> None:
+        """페이지 범위 보정 테스트"""
+        feed_filter = FeedFilter(page=0, items_per_page=100)
+
+        assert feed_filter.page == 1
+        assert feed_filter.limit == 50
+        assert feed_filter.offset == 0
+
+    def test_is_unfiltered(self) -> None:
+        """필터 조건 유무 테스트"""
+        assert FeedFilter().is_unfiltered
+        assert FeedFilter(search_query="").is_unfiltered
+        assert not FeedFilter(category_id="category_1").is_unfiltered
+        assert not FeedFilter(tags=["python"]).is_unfiltered
+        assert not FeedFilter(search_query="파이썬").is_unfiltered
+
+    def test_cache_key_ignores_pagination(self) -> None:
+        """페이지 정보는 캐시 키에 영향을 주지 않음"""
+        first = FeedFilter(category_id="category_1", page=1, items_per_page=10)
+        second = FeedFilter(category_id="category_1", page=3, items_per_page=50)
+
+        assert first.cache_key == second.cache_key
+
+    def test_cache_key_is_normalized(self) -> None:
+        """태그 순서와 검색어 대소문자/공백은 정규화됨"""
+        first = FeedFilter(tags=["python", "backend"], search_query=" FastAPI ")
+        second = FeedFilter(tags=["backend", "python"], search_query="fastapi")
+
+        assert first.cache_key == second.cache_key
+
+    def test_cache_key_differs_by_criteria(self) -> None:
+        """조건이 다르면 캐시 키도 다름"""
+        keys = {
+            FeedFilter().cache_key,
+            FeedFilter(category_id="category_1").cache_key,
+            FeedFilter(category_id="category_2").cache_key,
+            FeedFilter(tags=["python"]).cache_key,
+            FeedFilter(search_query="python").cache_key,
+        }
+
+        assert len(keys) == 5
@@ -0,0 +1,967 @@
+import asyncio
+import json
+import time
+
+import httpx
+import pytest
+from datetime import datetime, timedelta, timezone
+from typing import List
+from fastapi import FastAPI, HTTPException
+from sqlalchemy import event
+from sqlalchemy.ext.asyncio import create_async_engine, async_sessionmaker, AsyncSession
+from sqlalchemy.pool import StaticPool
+
+from app.common.db.database import Base
+import app.common.db.database_models  # noqa: F401
+from app.common.db.unit_of_work import current_session
+from app.common.middleware.unit_of_work_middleware import UnitOfWorkMiddleware
+from app.modules.admin.application.service.admin_curriculum_service import (
+    AdminCurriculumService,
+)
+from app.modules.admin.infrastructure.repository.admin_curriculum_repository import (
+    AdminCurriculumRepository,
+)
+from app.modules.curriculum.infrastructure.db_model.curriculum import CurriculumModel
+from app.modules.curriculum.infrastructure.db_model.week_schedule import (
+    WeekScheduleModel,
+)
+from app.modules.feed.application.service.feed_event_handler import FeedEventHandler
+from app.modules.feed.domain.entity.feed_item import FeedItem
+from app.modules.feed.domain.vo.feed_filter import FeedFilter
+from app.modules.feed.infrastructure.repository.feed_repo import FeedRepository
+from app.modules.taxonomy.infrastructure.db_model.category import CategoryModel
+from app.modules.taxonomy.infrastructure.db_model.curriculum_tag import (
+    CurriculumCategoryModel,
+    CurriculumTagModel,
+)
+from app.modules.taxonomy.infrastructure.db_model.tag import TagModel
+from app.modules.user.domain.vo.role import RoleVO
+from app.modules.user.infrastructure.db_model.user import UserModel
+from tests.conftest import FakeRedis
+
+
+@pytest.fixture
+async def engine():
+    """테스트용 비동기 엔진"""
+    engine = create_async_engine(
+        "sqlite+aiosqlite:///:memory:",
+        connect_args={"check_same_thread": False},
+        poolclass=StaticPool,
+    )
+
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.create_all)
+
+    yield engine
+
+    await engine.dispose()
+
+
+@pytest.fixture
+async def async_session(engine):
+    """테스트용 비동기 세션"""
+    async_session_local: async_sessionmaker[AsyncSession] = async_sessionmaker(
+        engine, class_=AsyncSession, expire_on_commit=False
+    )
+
+    async with async_session_local() as session:
+        yield session
+
+
+@pytest.fixture
+def statements(engine) -> List[str]:
+    """실행된 SQL 문 기록"""
+    executed: List[str] = []
+
+    def _before_cursor_execute(conn, cursor, statement, *args):  # type: ignore
+        executed.append(statement)
+
+    event.listen(engine.sync_engine, "before_cursor_execute", _before_cursor_execute)
+    yield executed
+    event.remove(engine.sync_engine, "before_cursor_execute", _before_cursor_execute)
+
+
+@pytest.fixture
+def feed_repository(async_session: AsyncSession) -> FeedRepository:
+    """FeedRepository 픽스처"""
+    return FeedRepository(async_session)
+
+
+async def _seed_public_curriculums(session: AsyncSession, count: int) -> None:
+    """카테고리/태그가 연결된 공개 커리큘럼 생성"""
+    now = datetime.now(timezone.utc)
+
+    session.add(
+        UserModel(  # type: ignore
+            id="feed_user",
+            email="feed@example.com",
+            name="Feed User",
+            password="hashed_password",
+            role=RoleVO.USER,
+            created_at=now,
+            updated_at=now,
+        )
+    )
+    session.add(
+        CategoryModel(  # type: ignore
+            id="category_1",
+            name="프로그래밍",
+            color="#FF0000",
+            sort_order=0,
+            is_active=True,
+            created_at=now,
+            updated_at=now,
+        )
+    )
+    for tag_name in ("python", "backend"):
+        session.add(
+            TagModel(  # type: ignore
+                id=f"tag_{tag_name}",
+                name=tag_name,
+                usage_count=0,
+                created_by="feed_user",
+                created_at=now,
+                updated_at=now,
+            )
+        )
+
+    for i in range(count):
+        curriculum_id = f"curriculum_{i:03d}"
+        updated_at = now - timedelta(minutes=i)
+        curriculum = CurriculumModel(  # type: ignore
+            id=curriculum_id,
+            user_id="feed_user",
+            title=f"공개 커리큘럼 {i}",
+            visibility="PUBLIC",
+            created_at=updated_at,
+            updated_at=updated_at,
+        )
+        curriculum.week_schedules.append(
+            WeekScheduleModel(  # type: ignore
+                week_number=1,
+                title="개념",
+                lessons=["기초", "실습"],
+            )
+        )
+        session.add(curriculum)
+        session.add(
+            CurriculumCategoryModel(  # type: ignore
+                id=f"{curriculum_id}_category_1",
+                curriculum_id=curriculum_id,
+                category_id="category_1",
+                assigned_by="feed_user",
+                created_at=now,
+            )
+        )
+        # 짝수 커리큘럼만 태그 연결
+        if i % 2 == 0:
+            for tag_name in ("python", "backend"):
+                session.add(
+                    CurriculumTagModel(  # type: ignore
+                        id=f"{curriculum_id}_tag_{tag_name}",
+                        curriculum_id=curriculum_id,
+                        tag_id=f"tag_{tag_name}",
+                        added_by="feed_user",
+                        created_at=now,
+                    )
+                )
+
+    await session.commit()
+
+
+class TestFeedRepositoryHydration:
+    """FeedRepository 카테고리/태그 일괄 조회 테스트"""
+
+    @pytest.mark.asyncio
+    async def test_get_from_database_hydrates_category_and_tags(
+        self,
+        feed_repository: FeedRepository,
+        async_session: AsyncSession,
+    ) -> None:
+        """카테고리/태그 정보가 피드 아이템에 채워지는지 테스트"""
+        # Given
+        await _seed_public_curriculums(async_session, 4)
+
+        # When
+        total_count, feed_items = await feed_repository._get_from_database(
+            FeedFilter(page=1, items_per_page=10)
+        )
+
+        # Then
+        assert total_count == 4
+        assert [item.curriculum_id for item in feed_items] == [
+            "curriculum_000",
+            "curriculum_001",
+            "curriculum_002",
+            "curriculum_003",
+        ]
+        assert all(item.category_name == "프로그래밍" for item in feed_items)
+        assert all(item.category_color == "#FF0000" for item in feed_items)
+        assert sorted(feed_items[0].tags) == ["backend", "python"]  # type: ignore
+        assert feed_items[1].tags == []
+        assert feed_items[0].total_weeks == 1
+        assert feed_items[0].total_lessons == 2
+
+    @pytest.mark.asyncio
+    async def test_get_from_database_empty_page(
+        self,
+        feed_repository: FeedRepository,
+        statements: List[str],
+    ) -> None:
+        """빈 페이지는 카테고리/태그 쿼리를 생략하는지 테스트"""
+        # When
+        total_count, feed_items = await feed_repository._get_from_database(
+            FeedFilter(page=1, items_per_page=10)
+        )
+
+        # Then
+        assert total_count == 0
+        assert feed_items == []
+        assert not any("curriculum_categories" in s for s in statements)
+        assert not any("curriculum_tags" in s for s in statements)
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("items_per_page", [5, 20, 50])
+    async def test_query_count_constant_regardless_of_page_size(
+        self,
+        feed_repository: FeedRepository,
+        async_session: AsyncSession,
+        statements: List[str],
+        items_per_page: int,
+    ) -> None:
+        """페이지 크기와 관계없이 쿼리 수가 일정한지 테스트"""
+        # Given
+        await _seed_public_curriculums(async_session, 50)
+        statements.clear()
+
+        # When
+        _, feed_items = await feed_repository._get_from_database(
+            FeedFilter(page=1, items_per_page=items_per_page)
+        )
+
+        # Then - count + page + week_schedules + categories + tags
+        assert len(feed_items) == items_per_page
+        assert len(statements) == 5
+
+    @pytest.mark.asyncio
+    async def test_public_feed_without_redis_within_query_budget(
+        self,
+        feed_repository: FeedRepository,
+        async_session: AsyncSession,
+        query_budget,
+    ) -> None:
+        """Redis 없이 DB 로 조회할 때 아이템 수만큼 쿼리가 늘지 않는지 테스트"""
+        # Given
+        await _seed_public_curriculums(async_session, 30)
+
+        # When / Then - count + page + week_schedules + categories + tags
+        with query_budget(5):
+            _, feed_items = await feed_repository.get_public_feed(
+                FeedFilter(page=1, items_per_page=30)
+            )
+        assert len(feed_items) == 30
+
+    @pytest.mark.asyncio
+    async def test_warm_up_cache_query_count_constant(
+        self,
+        feed_repository: FeedRepository,
+        async_session: AsyncSession,
+        statements: List[str],
+    ) -> None:
+        """캐시 워밍업도 일정한 수의 쿼리만 실행하는지 테스트"""
+        # Given
+        await _seed_public_curriculums(async_session, 30)
+        statements.clear()
+
+        # When
+        await feed_repository.warm_up_cache(limit=30)
+
+        # Then - index + page + week_schedules + categories + tags
+        assert len(statements) == 5
+
+
+def _make_feed_item(index: int) -> FeedItem:
+    """테스트용 피드 아이템"""
+    updated_at = datetime.now(timezone.utc) - timedelta(minutes=index)
+    return FeedItem(
+        curriculum_id=f"curriculum_{index:03d}",
+        title=f"공개 커리큘럼 {index}",
+        owner_id="feed_user",
+        owner_name="Feed User",
+        total_weeks=1,
+        total_lessons=2,
+        created_at=updated_at,
+        updated_at=updated_at,
+        score=updated_at.timestamp(),
+        tags=["python"],
+    )
+
+
+async def _mark_index_ready(feed_repository: FeedRepository, fake_redis: FakeRedis) -> None:
+    """피드 인덱스 구성 완료 표시 (메타 저장)"""
+    await fake_redis.set(
+        feed_repository.META_KEY,
+        json.dumps({"expires_at": time.time() + 3600, "delta": 0.0}),
+    )
+
+
+class TestFeedRepositoryCacheRead:
+    """FeedRepository 캐시 조회 테스트"""
+
+    @pytest.mark.asyncio
+    async def test_get_from_cache_uses_two_round_trips(
+        self,
+        feed_repository: FeedRepository,
+        fake_redis: FakeRedis,
+    ) -> None:
+        """아이템 수와 관계없이 두 번의 왕복으로 페이지를 읽는지 테스트"""
+        # Given
+        for i in range(30):
+            await feed_repository.cache_feed_item(_make_feed_item(i))
+        await _mark_index_ready(feed_repository, fake_redis)
+        fake_redis.round_trips = 0
+
+        # When
+        cached = await feed_repository._get_from_cache(
+            FeedFilter(page=2, items_per_page=10)
+        )
+
+        # Then - zrevrange + (mget, zcard) pipeline
+        assert cached is not None
+        total_count, feed_items = cached
+        assert total_count == 30
+        assert [item.curriculum_id for item in feed_items] == [
+            f"curriculum_{i:03d}" for i in range(10, 20)
+        ]
+        assert fake_redis.round_trips == 2
+
+    @pytest.mark.asyncio
+    async def test_get_from_cache_skips_missing_items(
+        self,
+        feed_repository: FeedRepository,
+        fake_redis: FakeRedis,
+    ) -> None:
+        """개별 아이템 캐시가 없고 DB에도 없으면 건너뛰는지 테스트"""
+        # Given
+        for i in range(3):
+            await feed_repository.cache_feed_item(_make_feed_item(i))
+        await _mark_index_ready(feed_repository, fake_redis)
+        await fake_redis.delete("feed:item:curriculum_001")
+
+        # When
+        cached = await feed_repository._get_from_cache(FeedFilter())
+
+        # Then
+        assert cached is not None
+        total_count, feed_items = cached
+        assert total_count == 3
+        assert [item.curriculum_id for item in feed_items] == [
+            "curriculum_000",
+            "curriculum_002",
+        ]
+
+    @pytest.mark.asyncio
+    async def test_get_from_cache_empty_returns_none(
+        self,
+        feed_repository: FeedRepository,
+        fake_redis: FakeRedis,
+    ) -> None:
+        """인덱스가 구성되지 않았으면 None을 반환하는지 테스트"""
+        # Given - 메타 없이 아이템만 있는 상태
+        await feed_repository.cache_feed_item(_make_feed_item(0))
+
+        # When
+        cached = await feed_repository._get_from_cache(FeedFilter())
+
+        # Then
+        assert cached is None
+
+    @pytest.mark.asyncio
+    async def test_get_from_cache_empty_index(
+        self,
+        feed_repository: FeedRepository,
+        fake_redis: FakeRedis,
+    ) -> None:
+        """구성된 빈 인덱스는 빈 페이지로 조회되는지 테스트"""
+        # Given
+        await _mark_index_ready(feed_repository, fake_redis)
+
+        # When
+        cached = await feed_repository._get_from_cache(FeedFilter())
+
+        # Then
+        assert cached == (0, [])
+
+    @pytest.mark.asyncio
+    async def test_get_from_cache_fills_missing_items_from_database(
+        self,
+        feed_repository: FeedRepository,
+        async_session: AsyncSession,
+        fake_redis: FakeRedis,
+    ) -> None:
+        """인덱스에는 있지만 아이템 캐시가 없는 항목은 DB에서 채우는지 테스트"""
+        # Given
+        await _seed_public_curriculums(async_session, 10)
+        stats = await feed_repository.warm_up_cache(limit=3)
+        assert stats == {"indexed_items": 10, "warmed_items": 3}
+
+        # When
+        cached = await feed_repository._get_from_cache(FeedFilter(page=2, items_per_page=3))
+
+        # Then
+        assert cached is not None
+        total_count, feed_items = cached
+        assert total_count == 10
+        assert [item.curriculum_id for item in feed_items] == [
+            "curriculum_003",
+            "curriculum_004",
+            "curriculum_005",
+        ]
+        assert await fake_redis.exists("feed:item:curriculum_004")
+
+
+class TestFeedRepositoryCacheWrite:
+    """FeedRepository 캐시 저장 테스트"""
+
+    @pytest.mark.asyncio
+    async def test_cache_feed_items_single_round_trip(
+        self,
+        feed_repository: FeedRepository,
+        fake_redis: FakeRedis,
+    ) -> None:
+        """여러 아이템을 한 번의 왕복으로 저장하는지 테스트"""
+        # Given
+        feed_items = [_make_feed_item(i) for i in range(50)]
+
+        # When
+        await feed_repository.cache_feed_items(feed_items)
+
+        # Then
+        assert fake_redis.round_trips == 1
+        assert await fake_redis.zcard(feed_repository.SORTED_SET_KEY) == 50
+        # 인덱스에는 TTL을 두지 않음 (이벤트로 갱신)
+        assert await fake_redis.ttl(feed_repository.SORTED_SET_KEY) == -1
+        assert 3240 <= await fake_redis.ttl("feed:item:curriculum_049") <= 3960
+
+    @pytest.mark.asyncio
+    async def test_cache_feed_items_empty(
+        self,
+        feed_repository: FeedRepository,
+        fake_redis: FakeRedis,
+    ) -> None:
+        """빈 목록은 Redis를 호출하지 않는지 테스트"""
+        # When
+        await feed_repository.cache_feed_items([])
+
+        # Then
+        assert fake_redis.round_trips == 0
+
+    @pytest.mark.asyncio
+    async def test_warm_up_cache_writes_in_one_round_trip(
+        self,
+        feed_repository: FeedRepository,
+        async_session: AsyncSession,
+        fake_redis: FakeRedis,
+    ) -> None:
+        """캐시 워밍업이 한 번의 트랜잭션으로 저장되는지 테스트"""
+        # Given
+        await _seed_public_curriculums(async_session, 30)
+
+        # When
+        await feed_repository.warm_up_cache(limit=30)
+
+        # Then
+        assert fake_redis.round_trips == 1
+        assert await fake_redis.zcard(feed_repository.SORTED_SET_KEY) == 30
+        cached = await feed_repository._get_from_cache(FeedFilter(items_per_page=5))
+        assert cached is not None
+        assert cached[1][0].category_name == "프로그래밍"
+
+
+class TestFeedRepositoryFilterCache:
+    """FeedRepository 필터별 캐시 테스트"""
+
+    @pytest.mark.asyncio
+    async def test_category_filter_full_pages_and_total(
+        self,
+        feed_repository: FeedRepository,
+        async_session: AsyncSession,
+        fake_redis: FakeRedis,
+    ) -> None:
+        """카테고리 필터가 정확한 페이지와 전체 개수를 반환하는지 테스트"""
+        # Given
+        await _seed_public_curriculums(async_session, 12)
+        # 전체 피드 캐시가 있어도 필터 결과에 섞이지 않아야 함
+        await feed_repository.get_public_feed(FeedFilter(items_per_page=5))
+
+        # When
+        total_count, feed_items = await feed_repository.get_public_feed(
+            FeedFilter(category_id="category_1", page=2, items_per_page=5)
+        )
+
+        # Then
+        assert total_count == 12
+        assert [item.curriculum_id for item in feed_items] == [
+            f"curriculum_{i:03d}" for i in range(5, 10)
+        ]
+
+    @pytest.mark.asyncio
+    async def test_filtered_feed_served_from_cache(
+        self,
+        feed_repository: FeedRepository,
+        async_session: AsyncSession,
+        fake_redis: FakeRedis,
+        statements: List[str],
+    ) -> None:
+        """두 번째 필터 조회는 DB를 거치지 않는지 테스트"""
+        # Given
+        await _seed_public_curriculums(async_session, 12)
+        feed_filter = FeedFilter(tags=["python"], page=1, items_per_page=4)
+        first = await feed_repository.get_public_feed(feed_filter)
+        statements.clear()
+
+        # When
+        second = await feed_repository.get_public_feed(feed_filter)
+
+        # Then
+        assert statements == []
+        assert first[0] == second[0] == 6
+        assert [item.curriculum_id for item in second[1]] == [
+            "curriculum_000",
+            "curriculum_002",
+            "curriculum_004",
+            "curriculum_006",
+        ]
+        assert 108 <= await fake_redis.ttl(
+            feed_repository._filter_cache_key(feed_filter)
+        ) <= 132
+
+    @pytest.mark.asyncio
+    async def test_filtered_feed_next_page_uses_cached_ids(
+        self,
+        feed_repository: FeedRepository,
+        async_session: AsyncSession,
+        fake_redis: FakeRedis,
+        statements: List[str],
+    ) -> None:
+        """다음 페이지는 캐시된 ID 목록으로 조회하는지 테스트"""
+        # Given
+        await _seed_public_curriculums(async_session, 12)
+        await feed_repository.get_public_feed(
+            FeedFilter(tags=["python"], page=1, items_per_page=4)
+        )
+        statements.clear()
+
+        # When
+        total_count, feed_items = await feed_repository.get_public_feed(
+            FeedFilter(tags=["python"], page=2, items_per_page=4)
+        )
+
+        # Then - 캐시에 없는 아이템만 조회 (page + week_schedules + categories + tags)
+        assert total_count == 6
+        assert [item.curriculum_id for item in feed_items] == [
+            "curriculum_008",
+            "curriculum_010",
+        ]
+        assert not any("count(" in s.lower() for s in statements)
+        assert len(statements) == 4
+
+    @pytest.mark.asyncio
+    async def test_search_filter(
+        self,
+        feed_repository: FeedRepository,
+        async_session: AsyncSession,
+        fake_redis: FakeRedis,
+    ) -> None:
+        """검색 필터 테스트"""
+        # Given
+        await _seed_public_curriculums(async_session, 12)
+
+        # When
+        total_count, feed_items = await feed_repository.get_public_feed(
+            FeedFilter(search_query="커리큘럼 1")
+        )
+
+        # Then - "커리큘럼 1", "커리큘럼 10", "커리큘럼 11"
+        assert total_count == 3
+        assert len(feed_items) == 3
+
+    @pytest.mark.asyncio
+    async def test_invalidate_feed_cache_clears_filter_cache(
+        self,
+        feed_repository: FeedRepository,
+        async_session: AsyncSession,
+        fake_redis: FakeRedis,
+    ) -> None:
+        """전체 캐시 무효화 시 필터 캐시도 삭제되는지 테스트"""
+        # Given
+        await _seed_public_curriculums(async_session, 3)
+        feed_filter = FeedFilter(category_id="category_1")
+        await feed_repository.get_public_feed(feed_filter)
+
+        # When
+        await feed_repository.invalidate_feed_cache()
+
+        # Then
+        assert await feed_repository._get_filter_ids_from_cache(feed_filter) is None
+
+
+class TestFeedRepositoryStampede:
+    """FeedRepository 캐시 스탬피드 방지 테스트"""
+
+    @staticmethod
+    def _count_queries(statements: List[str]) -> int:
+        return sum(1 for sql in statements if sql.lstrip().upper().startswith("SELECT COUNT"))
+
+    @staticmethod
+    def _index_queries(statements: List[str]) -> int:
+        return sum(
+            1
+            for sql in statements
+            if " ".join(sql.split()).startswith(
+                "SELECT curriculums.id, curriculums.updated_at FROM curriculums"
+            )
+        )
+
+    @pytest.mark.asyncio
+    async def test_concurrent_cold_requests_hit_database_once(
+        self,
+        feed_repository: FeedRepository,
+        async_session: AsyncSession,
+        fake_redis: FakeRedis,
+        statements: List[str],
+    ) -> None:
+        """콜드 캐시에 동시 요청이 몰려도 DB는 한 번만 조회하는지 테스트"""
+        # Given
+        await _seed_public_curriculums(async_session, 12)
+        statements.clear()
+
+        # When
+        results = await asyncio.gather(
+            *(
+                feed_repository.get_public_feed(FeedFilter(items_per_page=5))
+                for _ in range(10)
+            )
+        )
+
+        # Then - 인덱스 재구성 한 번 (index + page + week_schedules + categories + tags)
+        assert self._index_queries(statements) == 1
+        assert len(statements) == 5
+        assert all(total_count == 12 for total_count, _ in results)
+        assert all(len(feed_items) == 5 for _, feed_items in results)
+        assert not await fake_redis.exists("feed:lock:index")
+
+    @pytest.mark.asyncio
+    async def test_concurrent_cold_filtered_requests_hit_database_once(
+        self,
+        feed_repository: FeedRepository,
+        async_session: AsyncSession,
+        fake_redis: FakeRedis,
+        statements: List[str],
+    ) -> None:
+        """필터 캐시 미스도 한 번만 DB를 조회하는지 테스트"""
+        # Given
+        await _seed_public_curriculums(async_session, 12)
+        statements.clear()
+
+        # When
+        results = await asyncio.gather(
+            *(
+                feed_repository.get_public_feed(FeedFilter(tags=["python"]))
+                for _ in range(10)
+            )
+        )
+
+        # Then
+        assert self._count_queries(statements) == 1
+        assert all(total_count == 6 for total_count, _ in results)
+
+    @pytest.mark.asyncio
+    async def test_lock_held_elsewhere_falls_back_to_database(
+        self,
+        feed_repository: FeedRepository,
+        async_session: AsyncSession,
+        fake_redis: FakeRedis,
+    ) -> None:
+        """다른 워커가 락을 잡고 캐시를 채우지 않으면 직접 조회하는지 테스트"""
+        # Given
+        await _seed_public_curriculums(async_session, 3)
+        await fake_redis.set("feed:lock:index", "other-worker", px=5000)
+        feed_repository.LOCK_WAIT_INTERVAL = 0
+        feed_repository.LOCK_WAIT_RETRIES = 2
+
+        # When
+        total_count, feed_items = await feed_repository.get_public_feed(FeedFilter())
+
+        # Then - 다른 워커의 락은 건드리지 않음
+        assert total_count == 3
+        assert len(feed_items) == 3
+        assert await fake_redis.get("feed:lock:index") == "other-worker"
+
+    @pytest.mark.asyncio
+    async def test_expiring_entry_is_refreshed_early(
+        self,
+        feed_repository: FeedRepository,
+        async_session: AsyncSession,
+        fake_redis: FakeRedis,
+        statements: List[str],
+    ) -> None:
+        """만료가 임박한 캐시는 미리 갱신되는지 테스트"""
+        # Given
+        await _seed_public_curriculums(async_session, 3)
+        await feed_repository.get_public_feed(FeedFilter())
+        await fake_redis.set(
+            feed_repository.META_KEY,
+            json.dumps({"expires_at": time.time(), "delta": 1.0}),
+        )
+        statements.clear()
+
+        # When
+        total_count, _ = await feed_repository.get_public_feed(FeedFilter())
+
+        # Then
+        assert total_count == 3
+        assert self._index_queries(statements) == 1
+        meta = json.loads(await fake_redis.get(feed_repository.META_KEY))
+        assert meta["expires_at"] > time.time()
+
+
+class TestFeedRepositoryCursorPagination:
+    """FeedRepository 커서(키셋) 페이지네이션 테스트"""
+
+    @pytest.mark.asyncio
+    async def test_cursor_pages_match_offset_pages(
+        self,
+        feed_repository: FeedRepository,
+        async_session: AsyncSession,
+        fake_redis: FakeRedis,
+    ) -> None:
+        """커서 페이지가 오프셋 페이지와 같은 순서를 유지하는지 테스트"""
+        # Given
+        await _seed_public_curriculums(async_session, 7)
+
+        # When
+        first = await feed_repository.get_public_feed_after(FeedFilter(items_per_page=3))
+        second = await feed_repository.get_public_feed_after(
+            FeedFilter(items_per_page=3, cursor=first.next_cursor)
+        )
+        third = await feed_repository.get_public_feed_after(
+            FeedFilter(items_per_page=3, cursor=second.next_cursor)
+        )
+
+        # Then
+        ids = [item.curriculum_id for page in (first, second, third) for item in page.items]
+        assert ids == [f"curriculum_{i:03d}" for i in range(7)]
+        assert third.next_cursor is None
+        assert first.total_count is None
+
+    @pytest.mark.asyncio
+    async def test_cursor_page_skips_count_query(
+        self,
+        feed_repository: FeedRepository,
+        async_session: AsyncSession,
+        fake_redis: FakeRedis,
+        statements: List[str],
+    ) -> None:
+        """include_total이 없으면 COUNT 쿼리를 실행하지 않는지 테스트"""
+        # Given
+        await _seed_public_curriculums(async_session, 5)
+        first = await feed_repository.get_public_feed_after(FeedFilter(items_per_page=2))
+        statements.clear()
+
+        # When
+        page = await feed_repository.get_public_feed_after(
+            FeedFilter(items_per_page=2, cursor=first.next_cursor)
+        )
+
+        # Then
+        assert TestFeedRepositoryStampede._count_queries(statements) == 0
+        assert [item.curriculum_id for item in page.items] == [
+            "curriculum_002",
+            "curriculum_003",
+        ]
+        assert page.items[0].category_name == "프로그래밍"
+
+    @pytest.mark.asyncio
+    async def test_cursor_with_tag_filter_and_total(
+        self,
+        feed_repository: FeedRepository,
+        async_session: AsyncSession,
+        fake_redis: FakeRedis,
+    ) -> None:
+        """태그 필터와 전체 개수를 함께 사용하는 커서 조회 테스트"""
+        # Given
+        await _seed_public_curriculums(async_session, 8)
+
+        # When
+        first = await feed_repository.get_public_feed_after(
+            FeedFilter(tags=["python"], items_per_page=3, include_total=True)
+        )
+        second = await feed_repository.get_public_feed_after(
+            FeedFilter(tags=["python"], items_per_page=3, cursor=first.next_cursor)
+        )
+
+        # Then
+        assert first.total_count == 4
+        assert [item.curriculum_id for item in second.items] == ["curriculum_006"]
+        assert second.next_cursor is None
+
+
+class TestFeedRepositoryIncrementalIndex:
+    """FeedRepository 이벤트 기반 인덱스 갱신 테스트"""
+
+    @pytest.mark.asyncio
+    async def test_upsert_new_public_curriculum_without_rebuild(
+        self,
+        feed_repository: FeedRepository,
+        async_session: AsyncSession,
+        fake_redis: FakeRedis,
+        statements: List[str],
+    ) -> None:
+        """새 공개 커리큘럼이 인덱스 재구성 없이 피드에 반영되는지 테스트"""
+        # Given
+        await _seed_public_curriculums(async_session, 3)
+        await feed_repository.warm_up_cache()
+        curriculum = await async_session.get(CurriculumModel, "curriculum_002")
+        assert curriculum is not None
+        curriculum.updated_at = datetime.now(timezone.utc) + timedelta(minutes=1)
+        await async_session.commit()
+
+        # When
+        await feed_repository.upsert_feed_item("curriculum_002")
+        statements.clear()
+        total_count, feed_items = await feed_repository.get_public_feed(FeedFilter())
+
+        # Then - 캐시에서만 조회
+        assert statements == []
+        assert total_count == 3
+        assert [item.curriculum_id for item in feed_items] == [
+            "curriculum_002",
+            "curriculum_000",
+            "curriculum_001",
+        ]
+
+    @pytest.mark.asyncio
+    async def test_upsert_private_curriculum_removes_entry(
+        self,
+        feed_repository: FeedRepository,
+        async_session: AsyncSession,
+        fake_redis: FakeRedis,
+    ) -> None:
+        """비공개로 바뀐 커리큘럼은 인덱스에서 제거되는지 테스트"""
+        # Given
+        await _seed_public_curriculums(async_session, 3)
+        await feed_repository.warm_up_cache()
+        curriculum = await async_session.get(CurriculumModel, "curriculum_000")
+        assert curriculum is not None
+        curriculum.visibility = "PRIVATE"
+        await async_session.commit()
+
+        # When
+        await feed_repository.upsert_feed_item("curriculum_000")
+        total_count, feed_items = await feed_repository.get_public_feed(FeedFilter())
+
+        # Then
+        assert total_count == 2
+        assert [item.curriculum_id for item in feed_items] == [
+            "curriculum_001",
+            "curriculum_002",
+        ]
+        assert not await fake_redis.exists("feed:item:curriculum_000")
+
+    @pytest.mark.asyncio
+    async def test_upsert_deleted_curriculum_removes_entry(
+        self,
+        feed_repository: FeedRepository,
+        async_session: AsyncSession,
+        fake_redis: FakeRedis,
+    ) -> None:
+        """삭제된 커리큘럼은 인덱스에서 제거되는지 테스트"""
+        # Given
+        await _seed_public_curriculums(async_session, 2)
+        await feed_repository.warm_up_cache()
+
+        # When
+        await feed_repository.upsert_feed_item("missing_curriculum")
+        await feed_repository.remove_from_cache("curriculum_001")
+
+        # Then
+        assert await fake_redis.zrevrange(feed_repository.SORTED_SET_KEY, 0, -1) == [
+            "curriculum_000"
+        ]
+
+    @pytest.mark.asyncio
+    async def test_rebuild_replaces_stale_members(
+        self,
+        feed_repository: FeedRepository,
+        async_session: AsyncSession,
+        fake_redis: FakeRedis,
+    ) -> None:
+        """인덱스 재구성 시 DB에 없는 멤버는 제거되는지 테스트"""
+        # Given
+        await _seed_public_curriculums(async_session, 2)
+        await fake_redis.zadd(feed_repository.SORTED_SET_KEY, {"stale": 9999999999.0})
+
+        # When
+        await feed_repository.warm_up_cache()
+
+        # Then
+        assert await fake_redis.zrevrange(feed_repository.SORTED_SET_KEY, 0, -1) == [
+            "curriculum_000",
+            "curriculum_001",
+        ]
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("status_code, published", [(200, True), (400, False)])
+    async def test_event_is_published_only_after_commit(
+        self,
+        engine,
+        feed_repository: FeedRepository,
+        async_session: AsyncSession,
+        fake_redis: FakeRedis,
+        status_code: int,
+        published: bool,
+    ) -> None:
+        """요청이 실패해 rollback 되면 비공개 커리큘럼이 피드에 올라가지 않는지 테스트"""
+        # Given: curriculum_000 은 비공개라 인덱스에 없다
+        await _seed_public_curriculums(async_session, 2)
+        curriculum = await async_session.get(CurriculumModel, "curriculum_000")
+        assert curriculum is not None
+        curriculum.visibility = "PRIVATE"
+        await async_session.commit()
+        await feed_repository.warm_up_cache()
+
+        app = FastAPI()
+        app.add_middleware(
+            UnitOfWorkMiddleware,
+            session_factory=async_sessionmaker(engine, expire_on_commit=False),
+        )
+
+        @app.post("/curriculums/{curriculum_id}/publish")
+        async def publish(curriculum_id: str) -> dict:
+            session = current_session()
+            service = AdminCurriculumService(
+                AdminCurriculumRepository(session),
+                feed_event_handler=FeedEventHandler(FeedRepository(session)),
+            )
+            await service.change_visibility(curriculum_id, "PUBLIC")
+            if status_code >= 400:
+                # 공개로 바꾼 뒤 같은 요청의 다른 처리가 실패
+                raise HTTPException(status_code=status_code, detail="rejected")
+            return {"ok": True}
+
+        # When
+        async with httpx.AsyncClient(
+            transport=httpx.ASGITransport(app=app), base_url="http://test"
+        ) as client:
+            response = await client.post("/curriculums/curriculum_000/publish")
+
+        # Then
+        assert response.status_code == status_code
+        members = await fake_redis.zrevrange(feed_repository.SORTED_SET_KEY, 0, -1)
+        assert ("curriculum_000" in members) is published
+        assert await fake_redis.exists("feed:item:curriculum_000") == published
+        async_session.expire_all()
+        curriculum = await async_session.get(CurriculumModel, "curriculum_000")
+        assert curriculum is not None
+        assert curriculum.visibility == ("PUBLIC" if published else "PRIVATE")
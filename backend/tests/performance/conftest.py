@@ -0,0 +1,8 @@
+from typing import Any, Generator
+import pytest
+
+
+@pytest.fixture(autouse=True)  # type: ignore
+def _freeze_time() -> Generator[None, Any, None]:  # type: ignore
+    """성능 측정은 실제 시간으로 진행 (공통 시간 고정 해제)"""
+    yield
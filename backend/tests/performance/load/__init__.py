@@ -0,0 +1 @@
+"""mock LLM 서버 기반 API 부하 테스트 (``python -m tests.performance.load``)"""
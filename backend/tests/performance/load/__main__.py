@@ -0,0 +1,190 @@
+"""
+LLearn API 부하 테스트
+
+mock LLM 서버를 띄우고 (``--boot`` 면 그 서버를 바라보는 앱도 함께 띄워)
+커리큘럼 생성 / 피드백 / 피드 / 학습 통계 요청을 섞어 보내며 처리량과
+p50/p95/p99 지연을 측정합니다. 실제 LLM 을 호출하지 않으므로 비용이 들지 않고,
+같은 seed 면 같은 지연 분포와 요청 순서로 반복 측정할 수 있습니다.
+
+    # 앱까지 띄워서 측정 (.env 의 DB/Redis 사용)
+    python -m tests.performance.load --boot --users 20 --duration 60
+
+    # 이미 떠 있는 앱을 측정 (앱의 LLM_ENDPOINT 를 mock 서버로 지정)
+    python -m tests.performance.load --base-url http://localhost:8000 --mock-port 9100
+"""
+
+import argparse
+import asyncio
+import json
+import os
+import socket
+import sys
+import time
+from pathlib import Path
+from typing import List, Optional
+
+import aiohttp
+
+from tests.performance.load.mock_llm_server import (
+    LatencyDistribution,
+    MockCompletionsServer,
+)
+from tests.performance.load.runner import run_load
+from tests.performance.load.scenario import DEFAULT_MIX, AppScenario, parse_mix
+
+BACKEND_DIR = Path(__file__).resolve().parents[3]
+
+
+def _parse_args(argv: Optional[List[str]] = None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(prog="python -m tests.performance.load")
+    parser.add_argument("--base-url", help="측정할 앱 주소 (없으면 --boot)")
+    parser.add_argument("--boot", action="store_true", help="앱을 직접 띄워 측정")
+    parser.add_argument("--users", type=int, default=10, help="가상 사용자 수")
+    parser.add_argument("--concurrency", type=int, help="동시 요청 수 (기본: 사용자 수)")
+    parser.add_argument("--requests", type=int, help="보낼 요청 수")
+    parser.add_argument("--duration", type=float, default=60.0, help="측정 시간(초)")
+    parser.add_argument(
+        "--mix",
+        default=",".join(f"{k}={v:g}" for k, v in DEFAULT_MIX.items()),
+        help="작업 비율 (generate/feedback/feed/stats)",
+    )
+    parser.add_argument(
+        "--latency",
+        default="lognormal:1.5,0.5",
+        help="mock LLM 지연 분포 (constant:S | uniform:MIN,MAX | "
+        "normal:MEAN,STD | lognormal:MEDIAN,SIGMA)",
+    )
+    parser.add_argument("--error-rate", type=float, default=0.0, help="mock LLM 실패율")
+    parser.add_argument("--mock-port", type=int, default=0, help="mock LLM 포트")
+    parser.add_argument("--period", type=int, default=4, help="생성할 커리큘럼 기간")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--output", type=Path, help="결과 JSON 저장 경로")
+    args = parser.parse_args(argv)
+    if not args.base_url and not args.boot:
+        parser.error("--base-url or --boot is required")
+    return args
+
+
+def _free_port() -> int:
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+async def _wait_healthy(
+    process: asyncio.subprocess.Process, base_url: str, timeout: float = 60.0
+) -> None:
+    deadline = time.monotonic() + timeout
+    async with aiohttp.ClientSession() as session:
+        while time.monotonic() < deadline:
+            if process.returncode is not None:
+                raise RuntimeError(f"App exited with code {process.returncode}")
+            try:
+                async with session.get(f"{base_url}/health") as response:
+                    if response.status == 200:
+                        return
+            except aiohttp.ClientError:
+                pass
+            await asyncio.sleep(0.5)
+    raise RuntimeError(f"App did not become healthy: {base_url}")
+
+
+async def _boot_app(mock: MockCompletionsServer) -> tuple:
+    """mock LLM 서버를 바라보는 앱 프로세스 실행"""
+    port = _free_port()
+    env = {
+        **os.environ,
+        "LLM_ENDPOINT": mock.url,
+        "LLM_API_KEY": os.environ.get("LLM_API_KEY") or "load-test",
+        "LANGFUSE_SECRET_KEY": "",  # 추적 전송 비용이 측정에 섞이지 않도록
+        "LANGFUSE_PUBLIC_KEY": "",
+    }
+    process = await asyncio.create_subprocess_exec(
+        sys.executable,
+        "-m",
+        "uvicorn",
+        "app.main:app",
+        "--host",
+        "127.0.0.1",
+        "--port",
+        str(port),
+        "--log-level",
+        "warning",
+        cwd=BACKEND_DIR,
+        env=env,
+    )
+    base_url = f"http://127.0.0.1:{port}"
+    try:
+        await _wait_healthy(process, base_url)
+    except BaseException:
+        await _stop_app(process)
+        raise
+    return process, base_url
+
+
+async def _stop_app(process: asyncio.subprocess.Process) -> None:
+    if process.returncode is None:
+        process.terminate()
+    await process.wait()
+
+
+async def main(argv: Optional[List[str]] = None) -> int:
+    args = _parse_args(argv)
+    mock = MockCompletionsServer(
+        latency=LatencyDistribution.parse(args.latency),
+        error_rate=args.error_rate,
+        seed=args.seed,
+        port=args.mock_port,
+    )
+    await mock.start()
+    print(f"🤖 mock LLM: {mock.url} ({mock.latency}, error rate {args.error_rate:g})")
+
+    process = None
+    scenario: Optional[AppScenario] = None
+    try:
+        base_url = args.base_url
+        if args.boot:
+            process, base_url = await _boot_app(mock)
+            print(f"🚀 app: {base_url}")
+
+        scenario = AppScenario(
+            base_url=base_url,
+            users=args.users,
+            mix=parse_mix(args.mix),
+            period=args.period,
+            run_id=f"load{int(time.time())}",
+        )
+        await scenario.setup()
+        mock.requests = 0
+
+        report = await run_load(
+            scenario.operations(),
+            concurrency=args.concurrency or args.users,
+            requests=args.requests,
+            duration=None if args.requests else args.duration,
+            seed=args.seed,
+        )
+    finally:
+        if scenario is not None:
+            await scenario.teardown()
+        if process is not None:
+            await _stop_app(process)
+        await mock.stop()
+
+    print(report.format())
+    print(f"🤖 mock LLM calls: {mock.requests} (peak in flight {mock.peak_in_flight})")
+    if args.output:
+        result = {
+            "latency": str(mock.latency),
+            "error_rate": args.error_rate,
+            "mix": parse_mix(args.mix),
+            "llm_calls": mock.requests,
+            **report.as_dict(),
+        }
+        args.output.write_text(json.dumps(result, ensure_ascii=False, indent=2))
+        print(f"💾 {args.output}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(asyncio.run(main()))
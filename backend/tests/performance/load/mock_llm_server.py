@@ -0,0 +1,235 @@
+"""
+부하 테스트용 mock OpenAI chat completions 서버
+
+실제 LLM 대신 설정한 지연 분포에 따라 응답을 늦추고, 프롬프트 종류(커리큘럼,
+개요, 주차 확장, 피드백)에 맞는 JSON 을 돌려준다. 스트리밍(``stream: true``)
+요청은 같은 지연을 조각 사이에 나눠 SSE 로 보낸다.
+"""
+
+import asyncio
+import json
+import math
+import random
+import re
+from dataclasses import dataclass
+from typing import Any, Dict, List, Optional
+
+from aiohttp import web
+
+_PERIOD = re.compile(r"기간\(주\):\s*(\d+)")
+_WEEK_RANGE = re.compile(r"(\d+)주차부터\s*(\d+)주차까지만")
+STREAM_CHUNKS = 8
+
+
+@dataclass
+class LatencyDistribution:
+    """응답 지연 분포 (초)
+
+    - ``constant:0.8``
+    - ``uniform:0.5,2.0`` (최소, 최대)
+    - ``normal:1.0,0.3`` (평균, 표준편차, 0 미만은 0)
+    - ``lognormal:1.0,0.5`` (중앙값, 로그 표준편차; 꼬리가 긴 실제 LLM 지연에 가까움)
+    """
+
+    kind: str = "constant"
+    a: float = 0.0
+    b: float = 0.0
+
+    @classmethod
+    def parse(cls, spec: str) -> "LatencyDistribution":
+        kind, _, params = spec.partition(":")
+        values = [float(value) for value in params.split(",") if value.strip()]
+        if kind not in ("constant", "uniform", "normal", "lognormal"):
+            raise ValueError(f"Unknown latency distribution: {spec}")
+        if len(values) != (1 if kind == "constant" else 2):
+            raise ValueError(f"Invalid latency parameters: {spec}")
+        return cls(kind, values[0], values[1] if len(values) > 1 else 0.0)
+
+    def sample(self, rng: random.Random) -> float:
+        if self.kind == "uniform":
+            return rng.uniform(self.a, self.b)
+        if self.kind == "normal":
+            return max(0.0, rng.gauss(self.a, self.b))
+        if self.kind == "lognormal":
+            return rng.lognormvariate(math.log(self.a), self.b) if self.a > 0 else 0.0
+        return self.a
+
+    def __str__(self) -> str:
+        if self.kind == "constant":
+            return f"constant:{self.a:g}"
+        return f"{self.kind}:{self.a:g},{self.b:g}"
+
+
+def _week(n: int, lessons: bool = True) -> Dict[str, Any]:
+    week: Dict[str, Any] = {"week_number": n, "title": f"{n}주차 핵심 주제"}
+    if lessons:
+        week["lessons"] = [
+            f"{n}주차 레슨{k}: 개념 정리와 예제 실습 과제 수행" for k in range(1, 4)
+        ]
+    return week
+
+
+def build_completion(prompt: str) -> Dict[str, Any]:
+    """프롬프트 종류에 맞는 응답 본문"""
+    week_range = _WEEK_RANGE.search(prompt)
+    if week_range:
+        start, end = int(week_range.group(1)), int(week_range.group(2))
+        return {"schedule": [_week(n) for n in range(start, end + 1)]}
+
+    period = _PERIOD.search(prompt)
+    if period:
+        weeks = range(1, int(period.group(1)) + 1)
+        outline = "개요만" in prompt
+        return {
+            "title": "부하 테스트 커리큘럼",
+            "schedule": [_week(n, lessons=not outline) for n in weeks],
+        }
+
+    scores = {
+        "cognitive_load_retention": 7,
+        "engagement_behavior": 8,
+        "transfer_application": 6,
+        "competency_performance": 7,
+        "realtime_analytics": 8,
+    }
+    return {
+        "comment": "## 총평\n요약에서 핵심 개념을 잘 정리했습니다.",
+        "score": 7.2,
+        **scores,
+    }
+
+
+class MockCompletionsServer:
+    """지연 분포를 따르는 로컬 OpenAI chat completions 서버
+
+    ``error_rate`` 비율의 요청은 500 으로 실패시킨다. 같은 ``seed`` 면 같은
+    지연/실패 순서를 만들어 측정을 반복할 수 있다.
+    """
+
+    def __init__(
+        self,
+        latency: Optional[LatencyDistribution] = None,
+        error_rate: float = 0.0,
+        seed: Optional[int] = 0,
+        host: str = "127.0.0.1",
+        port: int = 0,
+    ) -> None:
+        self.latency = latency or LatencyDistribution()
+        self.error_rate = error_rate
+        self.rng = random.Random(seed)
+        self.host = host
+        self.port = port
+        self.requests = 0
+        self.in_flight = 0
+        self.peak_in_flight = 0
+        self.runner: Optional[web.AppRunner] = None
+
+    @property
+    def base_url(self) -> str:
+        """OpenAI SDK 의 base_url (``/v1``)"""
+        return f"http://{self.host}:{self.port}/v1"
+
+    @property
+    def url(self) -> str:
+        return f"{self.base_url}/chat/completions"
+
+    async def _handle(self, request: web.Request) -> web.StreamResponse:
+        payload = await request.json()
+        prompt = "\n".join(
+            str(message.get("content", "")) for message in payload.get("messages", [])
+        )
+        delay = self.latency.sample(self.rng)
+        fail = self.rng.random() < self.error_rate
+        model = payload.get("model", "gpt-4o-mini")
+
+        self.requests += 1
+        self.in_flight += 1
+        self.peak_in_flight = max(self.peak_in_flight, self.in_flight)
+        try:
+            if fail:
+                await asyncio.sleep(delay)
+                return web.json_response(
+                    {"error": {"message": "mock failure", "type": "server_error"}},
+                    status=500,
+                )
+
+            content = json.dumps(build_completion(prompt), ensure_ascii=False)
+            usage = {
+                "prompt_tokens": len(prompt) // 2,
+                "completion_tokens": len(content) // 2,
+                "total_tokens": (len(prompt) + len(content)) // 2,
+            }
+            if payload.get("stream"):
+                return await self._stream(request, content, delay, model, usage)
+
+            await asyncio.sleep(delay)
+            return web.json_response(
+                {
+                    "id": f"chatcmpl-mock-{self.requests}",
+                    "object": "chat.completion",
+                    "created": 0,
+                    "model": model,
+                    "choices": [
+                        {
+                            "index": 0,
+                            "message": {"role": "assistant", "content": content},
+                            "finish_reason": "stop",
+                        }
+                    ],
+                    "usage": usage,
+                }
+            )
+        finally:
+            self.in_flight -= 1
+
+    async def _stream(
+        self,
+        request: web.Request,
+        content: str,
+        delay: float,
+        model: str,
+        usage: Dict[str, int],
+    ) -> web.StreamResponse:
+        response = web.StreamResponse(headers={"Content-Type": "text/event-stream"})
+        await response.prepare(request)
+
+        size = math.ceil(len(content) / STREAM_CHUNKS)
+        pieces: List[str] = [
+            content[i : i + size] for i in range(0, len(content), size)
+        ]
+        for piece in pieces:
+            await asyncio.sleep(delay / len(pieces))
+            event = {
+                "id": f"chatcmpl-mock-{self.requests}",
+                "object": "chat.completion.chunk",
+                "created": 0,
+                "model": model,
+                "choices": [{"index": 0, "delta": {"content": piece}}],
+            }
+            await response.write(f"data: {json.dumps(event)}\n\n".encode())
+
+        final = {
+            "id": f"chatcmpl-mock-{self.requests}",
+            "object": "chat.completion.chunk",
+            "created": 0,
+            "model": model,
+            "choices": [],
+            "usage": usage,
+        }
+        await response.write(f"data: {json.dumps(final)}\n\ndata: [DONE]\n\n".encode())
+        await response.write_eof()
+        return response
+
+    async def start(self) -> None:
+        app = web.Application()
+        app.router.add_post("/v1/chat/completions", self._handle)
+        self.runner = web.AppRunner(app)
+        await self.runner.setup()
+        site = web.TCPSite(self.runner, self.host, self.port)
+        await site.start()
+        self.port = site._server.sockets[0].getsockname()[1]  # type: ignore
+
+    async def stop(self) -> None:
+        if self.runner is not None:
+            await self.runner.cleanup()
+            self.runner = None
@@ -0,0 +1,156 @@
+"""
+asyncio 부하 생성기
+
+가상 사용자(worker) 수만큼 동시에 돌면서 가중치에 따라 작업을 골라 실행하고,
+작업별 처리량과 지연 백분위(p50/p95/p99)를 집계한다.
+"""
+
+import asyncio
+import math
+import random
+import time
+from collections import Counter
+from dataclasses import dataclass, field
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Tuple
+
+# (가중치, 가상 사용자 번호를 받아 한 번 실행하는 코루틴 함수)
+Operation = Tuple[float, Callable[[int], Awaitable[Any]]]
+
+
+class LoadError(Exception):
+    """작업 실패 (응답 코드 등 집계용 사유 포함)"""
+
+    def __init__(self, reason: str) -> None:
+        super().__init__(reason)
+        self.reason = reason
+
+
+def percentile(values: List[float], q: float) -> float:
+    """nearest-rank 백분위 (q: 0~100)"""
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    rank = max(1, math.ceil(q / 100 * len(ordered)))
+    return ordered[rank - 1]
+
+
+@dataclass
+class OperationStats:
+    name: str
+    latencies: List[float] = field(default_factory=list)  # 성공한 요청 (초)
+    errors: Counter = field(default_factory=Counter)
+
+    @property
+    def count(self) -> int:
+        return len(self.latencies) + sum(self.errors.values())
+
+    def summary(self, elapsed: float) -> Dict[str, Any]:
+        return {
+            "requests": self.count,
+            "errors": dict(self.errors),
+            "throughput": self.count / elapsed if elapsed else 0.0,
+            "p50_ms": percentile(self.latencies, 50) * 1000,
+            "p95_ms": percentile(self.latencies, 95) * 1000,
+            "p99_ms": percentile(self.latencies, 99) * 1000,
+        }
+
+
+@dataclass
+class LoadReport:
+    elapsed: float
+    concurrency: int
+    operations: Dict[str, OperationStats]
+
+    @property
+    def total(self) -> OperationStats:
+        total = OperationStats("total")
+        for stats in self.operations.values():
+            total.latencies.extend(stats.latencies)
+            total.errors.update(stats.errors)
+        return total
+
+    @property
+    def throughput(self) -> float:
+        return self.total.count / self.elapsed if self.elapsed else 0.0
+
+    def as_dict(self) -> Dict[str, Any]:
+        return {
+            "elapsed": self.elapsed,
+            "concurrency": self.concurrency,
+            "operations": {
+                name: stats.summary(self.elapsed)
+                for name, stats in self.operations.items()
+            },
+            "total": self.total.summary(self.elapsed),
+        }
+
+    def format(self) -> str:
+        lines = [
+            f"📊 {self.concurrency} virtual users, {self.elapsed:.1f}s",
+            f"{'operation':<12}{'reqs':>7}{'errors':>8}{'req/s':>9}"
+            f"{'p50 ms':>10}{'p95 ms':>10}{'p99 ms':>10}",
+        ]
+        for stats in [*self.operations.values(), self.total]:
+            row = stats.summary(self.elapsed)
+            lines.append(
+                f"{stats.name:<12}{row['requests']:>7}"
+                f"{sum(stats.errors.values()):>8}{row['throughput']:>9.2f}"
+                f"{row['p50_ms']:>10.1f}{row['p95_ms']:>10.1f}{row['p99_ms']:>10.1f}"
+            )
+        errors = self.total.errors
+        if errors:
+            lines.append(
+                "errors: " + ", ".join(f"{k}={v}" for k, v in errors.most_common())
+            )
+        return "\n".join(lines)
+
+
+async def run_load(
+    operations: Dict[str, Operation],
+    concurrency: int,
+    requests: Optional[int] = None,
+    duration: Optional[float] = None,
+    seed: Optional[int] = 0,
+) -> LoadReport:
+    """가상 사용자 concurrency 명이 작업을 골라 실행
+
+    ``requests`` 건을 모두 보내거나 ``duration`` 초가 지나면 멈춘다 (둘 다 주면
+    먼저 도달한 쪽). 작업 선택 순서는 ``seed`` 로 고정된다.
+    """
+    if requests is None and duration is None:
+        raise ValueError("requests or duration is required")
+
+    rng = random.Random(seed)
+    names = list(operations)
+    weights = [operations[name][0] for name in names]
+    stats = {name: OperationStats(name) for name in names}
+    remaining = requests
+    started = time.perf_counter()
+    deadline = started + duration if duration is not None else math.inf
+
+    def _next() -> Optional[str]:
+        nonlocal remaining
+        if time.perf_counter() >= deadline or remaining == 0:
+            return None
+        if remaining is not None:
+            remaining -= 1
+        return rng.choices(names, weights)[0]
+
+    async def _worker(user: int) -> None:
+        while (name := _next()) is not None:
+            call_started = time.perf_counter()
+            try:
+                await operations[name][1](user)
+            except LoadError as e:
+                stats[name].errors[e.reason] += 1
+            except Exception as e:
+                stats[name].errors[type(e).__name__] += 1
+            else:
+                stats[name].latencies.append(time.perf_counter() - call_started)
+
+    await asyncio.gather(*(_worker(user) for user in range(concurrency)))
+    return LoadReport(
+        elapsed=time.perf_counter() - started,
+        concurrency=concurrency,
+        operations=stats,
+    )
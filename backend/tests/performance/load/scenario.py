@@ -0,0 +1,193 @@
+"""
+API 부하 시나리오 (커리큘럼 생성 / 피드백 / 피드 / 학습 통계 혼합)
+
+가상 사용자마다 계정을 만들어 로그인하고, 피드백 대상이 될 커리큘럼과 요약을
+미리 준비한 뒤 ``mix`` 비율대로 API 를 호출한다.
+"""
+
+import asyncio
+from dataclasses import dataclass, field
+from typing import Any, Dict, List, Optional
+
+import aiohttp
+
+from tests.performance.load.runner import LoadError, Operation
+
+DEFAULT_MIX = {"generate": 1.0, "feedback": 2.0, "feed": 5.0, "stats": 2.0}
+PASSWORD = "!!LoadTest123"
+SUMMARY = (
+    "이번 주에는 파이썬의 리스트와 딕셔너리를 비교했다. 리스트는 순서가 있고 인덱스로 "
+    "접근하며, 딕셔너리는 키로 값을 찾는다. for 문으로 리스트를 순회하고 컴프리헨션으로 "
+    "새 리스트를 만드는 예제를 직접 작성해 보았고, 딕셔너리의 get 과 items 사용법도 정리했다."
+)
+TOPICS = ["Python 기초", "React 개발", "SQL 마스터", "Docker 컨테이너", "알고리즘 분석"]
+
+
+def parse_mix(spec: str) -> Dict[str, float]:
+    """``generate=1,feedback=2,feed=5,stats=2`` 형태의 작업 비율"""
+    mix: Dict[str, float] = {}
+    for part in spec.split(","):
+        name, _, weight = part.partition("=")
+        if name.strip() not in DEFAULT_MIX:
+            raise ValueError(f"Unknown operation: {name}")
+        mix[name.strip()] = float(weight or 1)
+    return mix
+
+
+@dataclass
+class VirtualUser:
+    email: str
+    token: str = ""
+    curriculum_id: str = ""
+    summary_id: str = ""
+
+    @property
+    def headers(self) -> Dict[str, str]:
+        return {"Authorization": f"Bearer {self.token}"}
+
+
+@dataclass
+class AppScenario:
+    base_url: str
+    users: int
+    mix: Dict[str, float] = field(default_factory=lambda: dict(DEFAULT_MIX))
+    period: int = 4
+    run_id: str = "load"
+
+    def __post_init__(self) -> None:
+        self.session: Optional[aiohttp.ClientSession] = None
+        self.virtual_users: List[VirtualUser] = []
+        self._generated = 0
+
+    def _url(self, path: str) -> str:
+        return f"{self.base_url.rstrip('/')}/api/v1{path}"
+
+    async def _request(
+        self,
+        method: str,
+        path: str,
+        user: Optional[VirtualUser] = None,
+        expected: tuple = (200, 201, 204),
+        **kwargs: Any,
+    ) -> Any:
+        assert self.session is not None
+        headers = user.headers if user else {}
+        async with self.session.request(
+            method, self._url(path), headers=headers, **kwargs
+        ) as response:
+            if response.status not in expected:
+                raise LoadError(f"{method} {response.status}")
+            if response.status == 204:
+                return None
+            return await response.json()
+
+    async def setup(self) -> None:
+        """계정 생성/로그인, 피드백용 커리큘럼과 요약 준비 (측정 제외)"""
+        self.session = aiohttp.ClientSession(
+            connector=aiohttp.TCPConnector(limit=0),
+            timeout=aiohttp.ClientTimeout(total=300),
+        )
+        self.virtual_users = [
+            VirtualUser(email=f"{self.run_id}-{i:03d}@loadtest.local")
+            for i in range(self.users)
+        ]
+        await asyncio.gather(*(self._prepare(user) for user in self.virtual_users))
+
+    async def _prepare(self, user: VirtualUser) -> None:
+        await self._request(
+            "POST",
+            "/auth/signup",
+            expected=(200, 201, 400, 409),  # 이미 있는 계정은 재사용
+            json={
+                "name": user.email.split("@")[0][:32],
+                "email": user.email,
+                "password": PASSWORD,
+            },
+        )
+        token = await self._request(
+            "POST",
+            "/auth/login",
+            data={"username": user.email, "password": PASSWORD},
+        )
+        user.token = token["access_token"]
+
+        curriculum = await self._request(
+            "POST",
+            "/curriculums",
+            user,
+            json={
+                "title": "부하 테스트 커리큘럼",
+                "week_schedules": [
+                    {
+                        "week_number": 1,
+                        "title": "리스트와 딕셔너리",
+                        "lessons": ["리스트", "딕셔너리"],
+                    }
+                ],
+                "visibility": "PUBLIC",
+            },
+        )
+        user.curriculum_id = curriculum["id"]
+        summary = await self._request(
+            "POST",
+            f"/curriculums/{user.curriculum_id}/weeks/1/summaries",
+            user,
+            json={"content": SUMMARY},
+        )
+        user.summary_id = summary["id"]
+
+    async def teardown(self) -> None:
+        """준비한 커리큘럼 삭제 후 세션 종료"""
+        try:
+            await asyncio.gather(
+                *(
+                    self._request("DELETE", f"/curriculums/{user.curriculum_id}", user)
+                    for user in self.virtual_users
+                    if user.curriculum_id
+                ),
+                return_exceptions=True,
+            )
+        finally:
+            if self.session is not None:
+                await self.session.close()
+
+    async def generate(self, index: int) -> None:
+        user = self.virtual_users[index % len(self.virtual_users)]
+        self._generated += 1
+        n = self._generated
+        # 목표를 매번 달리해 응답 캐시 적중 없이 측정
+        goal = f"{TOPICS[n % len(TOPICS)]} {self.run_id}-{n}"
+        curriculum = await self._request(
+            "POST",
+            "/curriculums/generate",
+            user,
+            json={
+                "goal": goal,
+                "period": self.period,
+                "difficulty": "beginner",
+                "details": "부하 테스트",
+            },
+        )
+        # 사용자당 커리큘럼 개수 제한이 있으므로 바로 삭제 (삭제도 측정에 포함)
+        await self._request("DELETE", f"/curriculums/{curriculum['id']}", user)
+
+    async def feedback(self, index: int) -> None:
+        user = self.virtual_users[index % len(self.virtual_users)]
+        await self._request(
+            "POST", f"/summaries/{user.summary_id}/feedbacks/generate", user, json={}
+        )
+
+    async def feed(self, index: int) -> None:
+        user = self.virtual_users[index % len(self.virtual_users)]
+        await self._request("GET", "/feed/public", user)
+
+    async def stats(self, index: int) -> None:
+        user = self.virtual_users[index % len(self.virtual_users)]
+        await self._request("GET", "/users/me/learning/stats", user)
+
+    def operations(self) -> Dict[str, Operation]:
+        return {
+            name: (weight, getattr(self, name))
+            for name, weight in self.mix.items()
+            if weight > 0
+        }
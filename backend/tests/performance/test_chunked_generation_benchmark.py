@@ -0,0 +1,177 @@
+"""
+긴 커리큘럼 분할 생성 벤치마크
+
+출력 토큰 수에 비례해 지연되는 mock LLM으로 24주 커리큘럼을 생성하며
+한 번에 생성하는 기존 방식과 개요 + 구간별 동시 생성 방식의 소요 시간을 비교합니다.
+LLM 호출은 디스패처를 거치므로 구간을 아무리 넓게 펼쳐도 mock 에 동시에 도착하는
+호출 수는 디스패처 동시 실행 제한을 넘지 않아야 합니다.
+"""
+
+import asyncio
+import json
+import time
+from typing import Any, Dict, List, Tuple
+from unittest.mock import AsyncMock
+
+import pytest
+
+from app.common.llm.dispatcher import DispatchedLLMClient, LLMDispatcher
+from app.common.llm.llm_client_repo import ILLMClientRepository
+from app.modules.curriculum.application.dto.curriculum_dto import (
+    GenerateCurriculumCommand,
+)
+from app.modules.curriculum.application.service.curriculum_service import (
+    CurriculumService,
+)
+from app.modules.curriculum.domain.repository.curriculum_repo import (
+    ICurriculumRepository,
+)
+from app.modules.curriculum.domain.service.curriculum_domain_service import (
+    CurriculumDomainService,
+)
+from app.modules.curriculum.domain.vo.difficulty import Difficulty
+from app.modules.social.domain.repository.follow_repo import IFollowRepository
+
+PERIOD = 24
+FIRST_TOKEN_LATENCY = 0.02  # 첫 토큰까지 지연 (초)
+PER_TOKEN_LATENCY = 0.0005  # 출력 토큰당 지연 (초)
+CHARS_PER_TOKEN = 2  # 한국어 기준 대략치
+MAX_CONCURRENCY = 8  # 디스패처 동시 실행 제한 (LLM_MAX_CONCURRENCY 기본값)
+
+
+def _week(n: int) -> Dict[str, Any]:
+    return {
+        "week_number": n,
+        "title": f"{n}주차 핵심 주제",
+        "lessons": [f"{n}주차 레슨{k}: 개념 정리와 예제 실습 과제 수행" for k in range(1, 4)],
+    }
+
+
+class SlowMockLLMClient(ILLMClientRepository):
+    """출력 길이에 비례해 응답이 늦어지는 mock LLM"""
+
+    def __init__(self) -> None:
+        self.calls = 0
+        self.in_flight = 0
+        self.peak_in_flight = 0
+
+    async def _respond(self, result: Any) -> Any:
+        self.calls += 1
+        self.in_flight += 1
+        self.peak_in_flight = max(self.peak_in_flight, self.in_flight)
+        try:
+            tokens = len(json.dumps(result, ensure_ascii=False)) / CHARS_PER_TOKEN
+            await asyncio.sleep(FIRST_TOKEN_LATENCY + tokens * PER_TOKEN_LATENCY)
+            return result
+        finally:
+            self.in_flight -= 1
+
+    async def generate_curriculum(
+        self, goal: str, period: int, difficulty: str, details: str
+    ) -> Dict[str, Any]:
+        return await self._respond(
+            {"title": goal, "schedule": [_week(n) for n in range(1, period + 1)]}
+        )
+
+    async def generate_curriculum_outline(
+        self, goal: str, period: int, difficulty: str, details: str
+    ) -> Dict[str, Any]:
+        return await self._respond(
+            {
+                "title": goal,
+                "schedule": [
+                    {"week_number": n, "title": _week(n)["title"]}
+                    for n in range(1, period + 1)
+                ],
+            }
+        )
+
+    async def expand_curriculum_weeks(
+        self,
+        goal: str,
+        difficulty: str,
+        details: str,
+        outline: List[Dict[str, Any]],
+        start_week: int,
+        end_week: int,
+    ) -> Dict[str, Any]:
+        return await self._respond(
+            {"schedule": [_week(n) for n in range(start_week, end_week + 1)]}
+        )
+
+    async def generate_feedback(
+        self, lessons: List[str], summary_content: str
+    ) -> Dict[str, Any]:
+        raise NotImplementedError
+
+
+def _service(llm_client: ILLMClientRepository, **kwargs: Any) -> CurriculumService:
+    repo = AsyncMock(spec=ICurriculumRepository)
+    repo.count_by_owner.return_value = 0
+    return CurriculumService(
+        curriculum_repo=repo,
+        curriculum_domain_service=CurriculumDomainService(repo),
+        llm_client=llm_client,
+        follow_repo=AsyncMock(spec=IFollowRepository),
+        **kwargs,
+    )
+
+
+async def _measure(
+    max_concurrency: int = MAX_CONCURRENCY, **kwargs: Any
+) -> Tuple[float, int, int, int]:
+    llm_client = SlowMockLLMClient()
+    dispatcher = LLMDispatcher(
+        max_concurrency=max_concurrency,
+        max_queued_per_user=kwargs.get("chunk_concurrency", 1),
+    )
+    service = _service(DispatchedLLMClient(llm_client, dispatcher), **kwargs)
+    command = GenerateCurriculumCommand(
+        owner_id="user_123",
+        goal="백엔드 개발자 로드맵",
+        period=PERIOD,
+        difficulty=Difficulty.INTERMEDIATE,
+        details="",
+    )
+
+    started = time.perf_counter()
+    result = await service.generate_curriculum(command)
+    elapsed = time.perf_counter() - started
+    return (
+        elapsed,
+        len(result.week_schedules),
+        llm_client.calls,
+        llm_client.peak_in_flight,
+    )
+
+
+@pytest.mark.asyncio
+async def test_chunked_generation_wall_clock() -> None:
+    single, single_weeks, _, _ = await _measure()
+    chunked, chunked_weeks, chunked_calls, chunked_peak = await _measure(
+        chunked_min_period=9, chunk_size=4, chunk_concurrency=3
+    )
+    wide, wide_weeks, _, wide_peak = await _measure(
+        chunked_min_period=9, chunk_size=4, chunk_concurrency=6
+    )
+    # 디스패처 제한이 구간 동시성보다 작으면 제한까지만 동시에 호출
+    limited, limited_weeks, _, limited_peak = await _measure(
+        max_concurrency=3, chunked_min_period=9, chunk_size=4, chunk_concurrency=6
+    )
+
+    print(
+        f"\n📊 {PERIOD}주 생성 | single call: {single * 1000:.0f}ms | "
+        f"chunked (4주 x 동시 3): {chunked * 1000:.0f}ms "
+        f"({single / chunked:.2f}x, LLM 호출 {chunked_calls}회) | "
+        f"chunked (4주 x 동시 6): {wide * 1000:.0f}ms ({single / wide:.2f}x) | "
+        f"chunked (4주 x 동시 6, 디스패처 3): {limited * 1000:.0f}ms "
+        f"(최대 동시 호출 {limited_peak})"
+    )
+
+    assert single_weeks == chunked_weeks == wide_weeks == limited_weeks == PERIOD
+    assert chunked_calls == 1 + PERIOD // 4
+    assert chunked < single * 0.8
+    assert wide < chunked
+    assert chunked_peak == 3
+    assert wide_peak == 6
+    assert limited_peak <= 3
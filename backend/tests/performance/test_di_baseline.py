@@ -1,4 +1,5 @@
 import pytest
+from app.common.db.unit_of_work import UnitOfWork
 from app.core.di_container import Container
 from app.utils.performance_monitor import memory_profile
 
@@ -13,9 +14,10 @@ async def test_container_initialization():
 async def test_service_creation_loop():
     container = Container()
     services = []
-    for i in range(50):
-        user_service = container.user_service()
-        curriculum_service = container.curriculum_service()
-        services.extend([user_service, curriculum_service])
+    async with UnitOfWork():
+        for i in range(50):
+            user_service = container.user_service()
+            curriculum_service = container.curriculum_service()
+            services.extend([user_service, curriculum_service])
 
     return len(services)
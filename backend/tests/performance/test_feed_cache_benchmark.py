@@ -0,0 +1,157 @@
+"""
+피드 캐시 읽기 경로 마이크로 벤치마크
+
+로컬 Redis 대역(FakeRedis)에 왕복당 지연을 주고
+아이템별 GET 방식과 파이프라인(MGET + ZCARD) 방식의 지연을 비교합니다.
+"""
+
+import json
+import statistics
+import time
+from datetime import datetime, timedelta, timezone
+from typing import Awaitable, Callable, List
+
+import pytest
+
+from app.common.cache.redis_client import redis_client
+from app.modules.feed.domain.entity.feed_item import FeedItem
+from app.modules.feed.domain.vo.feed_filter import FeedFilter
+from app.modules.feed.infrastructure.repository.feed_repo import FeedRepository
+from tests.conftest import FakeRedis
+
+ROUND_TRIP_LATENCY = 0.0005  # 0.5ms (같은 AZ 내 Redis 왕복 수준)
+REPEAT = 5
+
+
+async def _per_item_read(repo: FeedRepository, feed_filter: FeedFilter) -> int:
+    """기존 방식: ZREVRANGE + 아이템별 GET + ZCARD"""
+    start = feed_filter.offset
+    end = start + feed_filter.limit - 1
+    curriculum_ids = await redis_client.zrevrange(repo.SORTED_SET_KEY, start, end)
+    items = []
+    for curriculum_id in curriculum_ids:
+        cached = await redis_client.get(f"{repo.CACHE_KEY_PREFIX}:item:{curriculum_id}")
+        if cached:
+            items.append(FeedItem.from_dict(json.loads(cached)))
+    await redis_client.redis.zcard(repo.SORTED_SET_KEY)  # type: ignore
+    return len(items)
+
+
+async def _pipelined_read(repo: FeedRepository, feed_filter: FeedFilter) -> int:
+    """개선 방식: ZREVRANGE + (MGET, ZCARD) 파이프라인"""
+    cached = await repo._get_from_cache(feed_filter)
+    assert cached is not None
+    return len(cached[1])
+
+
+async def _measure(
+    read: Callable[[FeedRepository, FeedFilter], Awaitable[int]],
+    repo: FeedRepository,
+    feed_filter: FeedFilter,
+    fake: FakeRedis,
+) -> tuple[float, int]:
+    durations: List[float] = []
+    for _ in range(REPEAT):
+        fake.round_trips = 0
+        started = time.perf_counter()
+        count = await read(repo, feed_filter)
+        durations.append(time.perf_counter() - started)
+        assert count == feed_filter.limit
+    return statistics.median(durations) * 1000, fake.round_trips
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("items_per_page", [20, 50])
+async def test_feed_cache_read_latency(
+    fake_redis: FakeRedis, items_per_page: int
+) -> None:
+    repo = FeedRepository(session=None)  # type: ignore
+    now = datetime.now(timezone.utc)
+    for i in range(100):
+        updated_at = now - timedelta(minutes=i)
+        await repo.cache_feed_item(
+            FeedItem(
+                curriculum_id=f"curriculum_{i:03d}",
+                title=f"커리큘럼 {i}",
+                owner_id="user",
+                owner_name="User",
+                total_weeks=4,
+                total_lessons=12,
+                created_at=updated_at,
+                updated_at=updated_at,
+                score=updated_at.timestamp(),
+                tags=["python", "backend"],
+            )
+        )
+
+    # 인덱스 구성 완료 표시
+    await fake_redis.set(
+        repo.META_KEY, json.dumps({"expires_at": time.time() + 3600, "delta": 0.0})
+    )
+
+    fake_redis.latency = ROUND_TRIP_LATENCY
+    feed_filter = FeedFilter(page=1, items_per_page=items_per_page)
+
+    before_ms, before_trips = await _measure(
+        _per_item_read, repo, feed_filter, fake_redis
+    )
+    after_ms, after_trips = await _measure(
+        _pipelined_read, repo, feed_filter, fake_redis
+    )
+
+    print(
+        f"\n📊 items_per_page={items_per_page} | "
+        f"per-item: {before_ms:.2f}ms ({before_trips} round trips) | "
+        f"pipelined: {after_ms:.2f}ms ({after_trips} round trips)"
+    )
+
+    assert before_trips == items_per_page + 2
+    assert after_trips == 2
+    assert after_ms < before_ms
+
+
+@pytest.mark.asyncio
+async def test_feed_cache_warm_up_write_latency(fake_redis: FakeRedis) -> None:
+    repo = FeedRepository(session=None)  # type: ignore
+    now = datetime.now(timezone.utc)
+    feed_items = [
+        FeedItem(
+            curriculum_id=f"curriculum_{i:03d}",
+            title=f"커리큘럼 {i}",
+            owner_id="user",
+            owner_name="User",
+            total_weeks=4,
+            total_lessons=12,
+            created_at=now - timedelta(minutes=i),
+            updated_at=now - timedelta(minutes=i),
+            score=(now - timedelta(minutes=i)).timestamp(),
+        )
+        for i in range(200)
+    ]
+    fake_redis.latency = ROUND_TRIP_LATENCY
+
+    # 기존 방식: 아이템마다 SET + ZADD
+    started = time.perf_counter()
+    for item in feed_items:
+        key = f"{repo.CACHE_KEY_PREFIX}:item:{item.curriculum_id}"
+        await redis_client.set(key, json.dumps(item.to_dict()), ex=300)
+        await redis_client.zadd(repo.SORTED_SET_KEY, {item.curriculum_id: item.feed_score})
+    before_ms = (time.perf_counter() - started) * 1000
+    before_trips = fake_redis.round_trips
+
+    # 개선 방식: 한 번의 트랜잭션
+    fake_redis.round_trips = 0
+    started = time.perf_counter()
+    await repo.cache_feed_items(feed_items)
+    after_ms = (time.perf_counter() - started) * 1000
+    after_trips = fake_redis.round_trips
+
+    print(
+        f"\n📊 warm-up 200 items | "
+        f"per-item: {before_ms:.2f}ms ({before_trips} round trips) | "
+        f"batched: {after_ms:.2f}ms ({after_trips} round trips)"
+    )
+
+    assert before_trips == 400
+    assert after_trips == 1
+    assert after_ms < before_ms
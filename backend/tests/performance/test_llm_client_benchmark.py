@@ -0,0 +1,114 @@
+"""
+OpenAILLMClient HTTP 연결 재사용 마이크로 벤치마크
+
+로컬 mock completions 서버를 띄우고 요청마다 세션을 새로 만드는 기존 방식과
+연결 풀 세션을 재사용하는 방식의 호출당 오버헤드와 TCP 연결 수를 비교합니다.
+"""
+
+import statistics
+import time
+from typing import Any, AsyncIterator, Dict, List, Set
+
+import aiohttp
+import pytest
+import pytest_asyncio
+from aiohttp import web
+
+from app.common.llm.openai_client import OpenAILLMClient
+
+REQUESTS = 50
+REPEAT = 3
+
+
+class MockCompletionsServer:
+    """OpenAI chat completions 응답을 흉내내는 로컬 서버"""
+
+    def __init__(self) -> None:
+        self.connections: Set[Any] = set()
+        self.runner: web.AppRunner
+        self.url = ""
+
+    async def _handle(self, request: web.Request) -> web.Response:
+        # 같은 TCP 연결이면 같은 transport 객체
+        self.connections.add(request.transport)
+        return web.json_response(
+            {"choices": [{"message": {"role": "assistant", "content": "{}"}}]}
+        )
+
+    async def start(self) -> None:
+        app = web.Application()
+        app.router.add_post("/v1/chat/completions", self._handle)
+        self.runner = web.AppRunner(app)
+        await self.runner.setup()
+        site = web.TCPSite(self.runner, "127.0.0.1", 0)
+        await site.start()
+        port = site._server.sockets[0].getsockname()[1]  # type: ignore
+        self.url = f"http://127.0.0.1:{port}/v1/chat/completions"
+
+    async def stop(self) -> None:
+        await self.runner.cleanup()
+
+
+@pytest_asyncio.fixture
+async def mock_server() -> AsyncIterator[MockCompletionsServer]:
+    server = MockCompletionsServer()
+    await server.start()
+    yield server
+    await server.stop()
+
+
+async def _per_call_session(client: OpenAILLMClient) -> str:
+    """기존 방식: 호출마다 ClientSession 생성/종료"""
+    payload: Dict[str, Any] = {
+        "model": client.model,
+        "messages": [{"role": "user", "content": "ping"}],
+        "max_tokens": 10,
+    }
+    async with aiohttp.ClientSession(
+        timeout=aiohttp.ClientTimeout(total=10.0)
+    ) as session:
+        async with session.post(client.endpoint, json=payload) as response:
+            response.raise_for_status()
+            data = await response.json()
+            return data["choices"][0]["message"]["content"]
+
+
+async def _pooled_session(client: OpenAILLMClient) -> str:
+    """개선 방식: 클라이언트가 소유한 연결 풀 세션 재사용"""
+    return await client._make_request(prompt="ping", role_content="", max_tokens=10)
+
+
+async def _measure(call: Any, client: OpenAILLMClient) -> float:
+    durations: List[float] = []
+    for _ in range(REPEAT):
+        started = time.perf_counter()
+        for _ in range(REQUESTS):
+            assert await call(client) == "{}"
+        durations.append((time.perf_counter() - started) / REQUESTS)
+    return statistics.median(durations) * 1000
+
+
+@pytest.mark.asyncio
+async def test_llm_client_connection_reuse(
+    mock_server: MockCompletionsServer,
+) -> None:
+    client = OpenAILLMClient(api_key="test", endpoint=mock_server.url)
+    try:
+        before_ms = await _measure(_per_call_session, client)
+        before_connections = len(mock_server.connections)
+
+        mock_server.connections.clear()
+        after_ms = await _measure(_pooled_session, client)
+        after_connections = len(mock_server.connections)
+    finally:
+        await client.close()
+
+    print(
+        f"\n📊 {REQUESTS * REPEAT} calls | "
+        f"per-call session: {before_ms:.3f}ms/call ({before_connections} connections) | "
+        f"pooled session: {after_ms:.3f}ms/call ({after_connections} connections)"
+    )
+
+    assert before_connections == REQUESTS * REPEAT
+    assert after_connections == 1
+    assert after_ms < before_ms
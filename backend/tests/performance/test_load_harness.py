@@ -0,0 +1,107 @@
+"""
+부하 테스트 도구 검증
+
+mock LLM 서버에 실제 LLM 클라이언트(LangChain)로 생성/피드백 요청을 섞어 보내고
+설정한 지연 분포대로 처리량과 p50/p95/p99 가 나오는지 확인합니다.
+앱 전체 측정은 ``python -m tests.performance.load --boot`` 로 실행합니다.
+"""
+
+import random
+from typing import Any, AsyncIterator
+
+import pytest
+import pytest_asyncio
+
+from app.common.llm.langchain_client import LangChainLLMClient
+from tests.performance.load.mock_llm_server import (
+    LatencyDistribution,
+    MockCompletionsServer,
+)
+from tests.performance.load.runner import percentile, run_load
+from tests.performance.load.scenario import parse_mix
+
+LATENCY = 0.05
+CONCURRENCY = 10
+REQUESTS = 100
+# 전체 테스트 실행 중 CPU 경쟁을 감안한 절대 지연 상한 (LATENCY 의 배수)
+MAX_LATENCY_FACTOR = 40
+
+
+@pytest_asyncio.fixture
+async def mock_server() -> AsyncIterator[MockCompletionsServer]:
+    server = MockCompletionsServer(latency=LatencyDistribution("constant", LATENCY))
+    await server.start()
+    yield server
+    await server.stop()
+
+
+def test_latency_distribution() -> None:
+    """지연 분포 설정 파싱과 표본 분포 확인"""
+    rng = random.Random(0)
+    lognormal = LatencyDistribution.parse("lognormal:1.0,0.5")
+    samples = [lognormal.sample(rng) for _ in range(5000)]
+
+    assert percentile(samples, 50) == pytest.approx(1.0, rel=0.05)
+    assert percentile(samples, 99) > 2.5  # 긴 꼬리
+    assert LatencyDistribution.parse("constant:0.2").sample(rng) == 0.2
+    assert 0.5 <= LatencyDistribution.parse("uniform:0.5,2").sample(rng) <= 2.0
+    with pytest.raises(ValueError):
+        LatencyDistribution.parse("pareto:1")
+    assert parse_mix("generate=1,feed=3") == {"generate": 1.0, "feed": 3.0}
+
+
+@pytest.mark.asyncio
+async def test_llm_mix_against_mock_server(
+    mock_server: MockCompletionsServer,
+) -> None:
+    """생성/피드백 혼합 부하의 처리량과 지연 백분위 집계"""
+    client = LangChainLLMClient(api_key="test", endpoint=mock_server.url)
+
+    async def generate(user: int) -> Any:
+        result = await client.generate_curriculum(
+            goal=f"Python {user}", period=4, difficulty="beginner", details=""
+        )
+        assert len(result["schedule"]) == 4
+
+    async def feedback(user: int) -> Any:
+        result = await client.generate_feedback(["리스트"], "리스트를 정리했다.")
+        assert result["score"] == 7.2
+
+    report = await run_load(
+        {"generate": (1.0, generate), "feedback": (3.0, feedback)},
+        concurrency=CONCURRENCY,
+        requests=REQUESTS,
+    )
+
+    print(f"\n{report.format()}")
+    total = report.total
+    assert total.count == REQUESTS and not total.errors
+    assert report.operations["feedback"].count > report.operations["generate"].count
+    assert mock_server.requests == REQUESTS
+    assert mock_server.peak_in_flight == CONCURRENCY
+
+    summary = total.summary(report.elapsed)
+    assert LATENCY * 1000 <= summary["p50_ms"] <= summary["p95_ms"]
+    # 꼬리는 중앙값 대비로 보고 (CPU 경쟁으로 전체가 같이 느려지는 경우),
+    # 모든 요청이 똑같이 느려지는 회귀는 절대 상한으로 잡는다
+    assert summary["p95_ms"] <= summary["p99_ms"] < summary["p50_ms"] * 5
+    assert summary["p99_ms"] < LATENCY * 1000 * MAX_LATENCY_FACTOR
+    # 동시 요청이 지연을 겹쳐 가리는지 (직렬이면 초당 1/LATENCY 건)
+    assert report.throughput > 1 / LATENCY
+
+
+@pytest.mark.asyncio
+async def test_errors_are_counted(mock_server: MockCompletionsServer) -> None:
+    """mock LLM 실패는 지연 표본에서 빼고 오류로 집계"""
+    mock_server.error_rate = 0.3
+    client = LangChainLLMClient(api_key="test", endpoint=mock_server.url)
+
+    async def feedback(user: int) -> Any:
+        await client.generate_feedback(["리스트"], "리스트를 정리했다.")
+
+    report = await run_load({"feedback": (1.0, feedback)}, concurrency=5, requests=50)
+
+    stats = report.operations["feedback"]
+    assert stats.count == 50
+    assert 5 <= sum(stats.errors.values()) <= 25
+    assert len(stats.latencies) == 50 - sum(stats.errors.values())
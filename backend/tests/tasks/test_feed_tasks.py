@@ -0,0 +1,162 @@
+import asyncio
+from contextlib import asynccontextmanager
+from typing import Any, AsyncIterator
+from unittest.mock import AsyncMock, Mock
+
+import pytest
+from pytest_mock import MockerFixture
+
+from app.common.monitoring.metrics import (
+    feed_cache_indexed_items_gauge,
+    feed_cache_refresh_total,
+    feed_cache_refresher_leader_gauge,
+    feed_cache_warmed_items_gauge,
+)
+from app.modules.feed.infrastructure.repository.feed_repo import FeedRepository
+from app.tasks.feed_tasks import FeedCacheRefresher
+from tests.conftest import FakeRedis
+
+
+@asynccontextmanager
+async def _session_factory() -> AsyncIterator[Any]:
+    yield Mock()
+
+
+@pytest.fixture
+def warm_up_cache(mocker: MockerFixture) -> AsyncMock:
+    return mocker.patch.object(
+        FeedRepository,
+        "warm_up_cache",
+        AsyncMock(return_value={"indexed_items": 42, "warmed_items": 10}),
+    )
+
+
+def _refresher() -> FeedCacheRefresher:
+    return FeedCacheRefresher(
+        session_factory=_session_factory, interval=60, warm_up_size=10
+    )
+
+
+class TestFeedCacheRefresher:
+    """FeedCacheRefresher 테스트"""
+
+    @pytest.mark.asyncio
+    async def test_leader_refreshes_and_records_metrics(
+        self, fake_redis: FakeRedis, warm_up_cache: AsyncMock
+    ) -> None:
+        """리더가 워밍업을 실행하고 아이템 수 메트릭을 기록하는지 테스트"""
+        # Given
+        refresher = _refresher()
+        success_before = feed_cache_refresh_total.labels(status="success")._value.get()
+
+        # When
+        stats = await refresher.refresh_once()
+
+        # Then
+        assert stats == {"indexed_items": 42, "warmed_items": 10}
+        warm_up_cache.assert_awaited_once_with(limit=10)
+        assert refresher.is_leader
+        assert fake_redis.strings[FeedCacheRefresher.LEADER_KEY] == refresher._token
+        assert feed_cache_refresh_total.labels(status="success")._value.get() == (
+            success_before + 1
+        )
+        assert feed_cache_indexed_items_gauge._value.get() == 42
+        assert feed_cache_warmed_items_gauge._value.get() == 10
+        assert feed_cache_refresher_leader_gauge._value.get() == 1
+
+    @pytest.mark.asyncio
+    async def test_only_one_worker_refreshes(
+        self, fake_redis: FakeRedis, warm_up_cache: AsyncMock
+    ) -> None:
+        """여러 워커 중 리더 한 곳만 갱신하는지 테스트"""
+        # Given
+        workers = [_refresher() for _ in range(3)]
+
+        # When
+        results = await asyncio.gather(*(w.refresh_once() for w in workers))
+
+        # Then
+        assert sum(1 for r in results if r is not None) == 1
+        assert sum(1 for w in workers if w.is_leader) == 1
+        warm_up_cache.assert_awaited_once()
+
+    @pytest.mark.asyncio
+    async def test_leader_renews_lease(
+        self, fake_redis: FakeRedis, warm_up_cache: AsyncMock
+    ) -> None:
+        """리더가 다음 주기에도 임대를 연장하며 계속 갱신하는지 테스트"""
+        # Given
+        leader, follower = _refresher(), _refresher()
+        await leader.refresh_once()
+        token = leader._token
+
+        # When
+        await follower.refresh_once()
+        await leader.refresh_once()
+
+        # Then
+        assert leader._token == token
+        assert not follower.is_leader
+        assert warm_up_cache.await_count == 2
+        assert await fake_redis.ttl(FeedCacheRefresher.LEADER_KEY) == 120
+
+    @pytest.mark.asyncio
+    async def test_stop_releases_lease(
+        self, fake_redis: FakeRedis, warm_up_cache: AsyncMock
+    ) -> None:
+        """중지 시 임대를 반납해 다른 워커가 이어받는지 테스트"""
+        # Given
+        leader, follower = _refresher(), _refresher()
+        await leader.start()
+        for _ in range(10):  # 첫 갱신이 끝날 때까지 양보
+            await asyncio.sleep(0)
+        assert leader.is_leader
+        warm_up_cache.assert_awaited_once()
+
+        # When
+        await leader.stop()
+        stats = await follower.refresh_once()
+
+        # Then
+        assert not leader.is_leader
+        assert stats is not None
+        assert follower.is_leader
+
+    @pytest.mark.asyncio
+    async def test_lost_lease_is_reacquired_by_other_worker(
+        self, fake_redis: FakeRedis, warm_up_cache: AsyncMock
+    ) -> None:
+        """임대가 만료되면 리더가 물러나고 다른 워커가 리더가 되는지 테스트"""
+        # Given
+        leader, follower = _refresher(), _refresher()
+        await leader.refresh_once()
+        await fake_redis.delete(FeedCacheRefresher.LEADER_KEY)  # 임대 만료
+
+        # When
+        await follower.refresh_once()
+        stats = await leader.refresh_once()
+
+        # Then
+        assert stats is None
+        assert not leader.is_leader
+        assert follower.is_leader
+
+    @pytest.mark.asyncio
+    async def test_failed_refresh_records_failure(
+        self, fake_redis: FakeRedis, warm_up_cache: AsyncMock
+    ) -> None:
+        """워밍업 실패 시 실패 메트릭만 기록하는지 테스트"""
+        # Given
+        warm_up_cache.return_value = None
+        refresher = _refresher()
+        failure_before = feed_cache_refresh_total.labels(status="failure")._value.get()
+
+        # When
+        stats = await refresher.refresh_once()
+
+        # Then
+        assert stats is None
+        assert refresher.is_leader
+        assert feed_cache_refresh_total.labels(status="failure")._value.get() == (
+            failure_before + 1
+        )